@@ -0,0 +1,217 @@
+"""
+can_aio.py
+asyncio CAN I/O mode — RX decode, consumers and TX on one event-loop thread.
+
+Selected with can_rx.RX_MODE = "asyncio". Decoding still goes through
+can_rx.handle_frame(), so `can_rx.latest` and register_temp_handler() behave
+exactly as in the threaded mode.
+
+Backpressure:
+  RX        bounded queue (RX_QUEUE_DEPTH). When it fills, the socket is
+            removed from the loop until the dispatcher drains it to half —
+            the kernel socket buffer absorbs the burst meanwhile.
+  consumers each has its own bounded queue. drop=True consumers (telemetry,
+            UI mirrors) lose the frame and bump a counter; drop=False
+            consumers (loggers) make the dispatcher wait for them.
+  TX        bounded queue (TX_QUEUE_DEPTH); send() never blocks the caller,
+            a full queue counts as a TX drop.
+
+A heartbeat task beats watchdog "rx" every HEARTBEAT_S, so a loop blocked
+by a handler or consumer shows up as an RX stall. The loop thread is not
+restarted; the watchdog only reports it.
+"""
+
+import asyncio
+import threading
+
+import can
+import can_rx
+import metrics
+import rt
+import watchdog
+
+RX_QUEUE_DEPTH = 512
+TX_QUEUE_DEPTH = 64
+CONSUMER_QUEUE_DEPTH = 128
+HEARTBEAT_S = 0.5
+
+
+class _Consumer:
+    def __init__(self, name: str, fn, depth: int, drop: bool):
+        self.name = name
+        self.fn = fn
+        self.depth = depth
+        self.drop = drop
+        self.queue: asyncio.Queue | None = None
+        self.dropped = 0
+
+
+class AsyncCanIO:
+    """
+    Owns the bus on a single asyncio loop thread.
+
+    Consumers are `async def fn(msg)` coroutines registered with
+    add_consumer() before start(). send() has the same signature as
+    can.BusABC.send(), so an AsyncCanIO can be handed to anything that
+    only transmits (TempService, TCScreen).
+    """
+
+    def __init__(self, bus: can.BusABC):
+        self._bus = bus
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._consumers: list[_Consumer] = []
+        self._rx: asyncio.Queue | None = None
+        self._tx: asyncio.Queue | None = None
+        self._fd = -1
+        self._paused = False
+        self._started = threading.Event()
+
+        self.rx_frames = 0
+        self.rx_pauses = 0
+        self.tx_frames = 0
+        self.tx_dropped = 0
+        self.tx_errors = 0
+
+    # ── Registration ──────────────────────────────────────────
+    def add_consumer(
+        self, name: str, fn, depth: int = CONSUMER_QUEUE_DEPTH, drop: bool = True
+    ) -> None:
+        """Register `async def fn(msg)`; runs on the loop after decoding."""
+        if self._loop is not None:
+            raise RuntimeError("add_consumer() must be called before start()")
+        self._consumers.append(_Consumer(name, fn, depth, drop))
+
+    @property
+    def dropped(self) -> dict:
+        return {c.name: c.dropped for c in self._consumers}
+
+    # ── TX ────────────────────────────────────────────────────
+    def send(self, msg: can.Message, timeout: float | None = None) -> None:
+        """Thread-safe, non-blocking. Queues the frame for the TX coroutine."""
+        if self._loop is None:
+            raise can.CanError("asyncio CAN I/O not started")
+        self._loop.call_soon_threadsafe(self._enqueue_tx, msg)
+
+    async def send_async(self, msg: can.Message) -> None:
+        """For coroutines on the loop: waits for room in the TX queue."""
+        await self._tx.put(msg)
+
+    def _enqueue_tx(self, msg: can.Message) -> None:
+        try:
+            self._tx.put_nowait(msg)
+        except asyncio.QueueFull:
+            self.tx_dropped += 1
+
+    async def _tx_task(self) -> None:
+        while True:
+            msg = await self._tx.get()
+            try:
+                self._bus.send(msg)
+                self.tx_frames += 1
+            except can.CanError as e:
+                self.tx_errors += 1
+                metrics.tx_error("aio")
+                print(f"[AIO] CAN TX error on 0x{msg.arbitration_id:03X}: {e}")
+
+    # ── RX ────────────────────────────────────────────────────
+    def _on_readable(self) -> None:
+        while not self._rx.full():
+            msg = self._bus.recv(timeout=0)
+            if msg is None:
+                return
+            self._rx.put_nowait(msg)
+        self._loop.remove_reader(self._fd)
+        self._paused = True
+        self.rx_pauses += 1
+
+    async def _notifier_pump(self) -> None:
+        """Fallback for buses without a pollable fd (e.g. python-can 'virtual')."""
+        reader = can.AsyncBufferedReader()
+        can.Notifier(self._bus, [reader], loop=self._loop)
+        async for msg in reader:
+            await self._rx.put(msg)
+
+    async def _dispatch_task(self) -> None:
+        rx = self._rx
+        resume_at = RX_QUEUE_DEPTH // 2
+        while True:
+            msg = await rx.get()
+            self.rx_frames += 1
+            can_rx.handle_frame(msg)
+
+            for c in self._consumers:
+                if c.drop:
+                    try:
+                        c.queue.put_nowait(msg)
+                    except asyncio.QueueFull:
+                        c.dropped += 1
+                else:
+                    await c.queue.put(msg)
+
+            if self._paused and rx.qsize() <= resume_at:
+                self._paused = False
+                self._loop.add_reader(self._fd, self._on_readable)
+
+    async def _consumer_task(self, c: _Consumer) -> None:
+        while True:
+            msg = await c.queue.get()
+            try:
+                await c.fn(msg)
+            except Exception as e:
+                print(f"[AIO] consumer '{c.name}' failed: {e}")
+
+    async def _heartbeat_task(self) -> None:
+        while True:
+            watchdog.beat("rx")
+            await asyncio.sleep(HEARTBEAT_S)
+
+    # ── Loop thread ──────────────────────────────────────────
+    async def _main(self) -> None:
+        self._rx = asyncio.Queue(RX_QUEUE_DEPTH)
+        self._tx = asyncio.Queue(TX_QUEUE_DEPTH)
+        tasks = [self._dispatch_task(), self._tx_task(), self._heartbeat_task()]
+        for c in self._consumers:
+            c.queue = asyncio.Queue(c.depth)
+            tasks.append(self._consumer_task(c))
+
+        try:
+            self._fd = self._bus.fileno()
+        except NotImplementedError:
+            self._fd = -1
+        if self._fd >= 0:
+            self._loop.add_reader(self._fd, self._on_readable)
+        else:
+            tasks.append(self._notifier_pump())
+
+        self._started.set()
+        await asyncio.gather(*tasks)
+
+    def _run(self) -> None:
+        rt.apply("rx")
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._main())
+
+    def start(self) -> threading.Thread:
+        """Spawn the daemon loop thread; returns once queues exist."""
+        self._loop = asyncio.new_event_loop()
+        t = threading.Thread(target=self._run, name="can-aio", daemon=True)
+        t.start()
+        self._started.wait()
+        return t
+
+
+def start(bus: can.BusABC) -> AsyncCanIO:
+    """asyncio counterpart of can_rx.start(); returns the running AsyncCanIO."""
+    can_rx.open_outputs()
+    aio = AsyncCanIO(bus)
+    t = aio.start()
+    watchdog.watch("rx", watchdog.RX_STALL_S, alive=t.is_alive)
+    metrics.gauge("can_rx_queue_depth", "Frames waiting for the asyncio dispatcher",
+                  fn=lambda: aio._rx.qsize())
+    metrics.counter("can_rx_pauses_total", "Times a full RX queue paused the socket",
+                    fn=lambda: aio.rx_pauses)
+    metrics.counter("can_tx_dropped_total", "Frames dropped on a full TX queue",
+                    fn=lambda: aio.tx_dropped)
+    metrics.counter("can_consumer_dropped_total", "Frames a full consumer queue dropped",
+                    fn=lambda: aio.dropped, label="consumer")
+    return aio
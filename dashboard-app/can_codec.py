@@ -0,0 +1,1700 @@
+# AUTO-GENERATED by tools/gen_can_codec.py — do not edit.
+# Sources:
+#   dbc/pedal_v0_1.dbc
+#   dbc/dashboard_v0_1.dbc
+#   dbc/20250206_CM_not_oil-cooled_CAN_DB.dbc
+"""
+can_codec.py
+Generated CAN decoders/encoders — one straight-line function per message.
+
+  decode_<msg>(data) -> tuple in MESSAGES[id].fields order
+                        (callers check len(data) >= MESSAGES[id].min_len)
+  encode_<msg>(**signals) -> bytes
+  sig_<signal>(data)  -> one signal (None on an inactive mux page)
+"""
+
+import struct
+from collections import namedtuple
+
+MessageInfo = namedtuple(
+    "MessageInfo", "frame_id name dlc min_len cycle_ms sender fields decode encode"
+)
+SignalInfo = namedtuple(
+    "SignalInfo",
+    "name frame_id start length signed scale offset minimum maximum unit min_len decode",
+)
+
+_LE_B = struct.Struct('<B')
+_LE_BB = struct.Struct('<BB')
+_LE_BBB = struct.Struct('<BBB')
+_LE_BBBBBBB = struct.Struct('<BBBBBBB')
+_LE_BBhhh = struct.Struct('<BBhhh')
+_LE_H = struct.Struct('<H')
+_LE_H2xh = struct.Struct('<H2xh')
+_LE_HH = struct.Struct('<HH')
+_LE_HHHH = struct.Struct('<HHHH')
+_LE_Hhhh = struct.Struct('<Hhhh')
+_LE_I = struct.Struct('<I')
+_LE_IB = struct.Struct('<IB')
+_LE_Q = struct.Struct('<Q')
+_LE_h = struct.Struct('<h')
+_LE_hh = struct.Struct('<hh')
+_LE_hh2xh = struct.Struct('<hh2xh')
+_LE_hhI = struct.Struct('<hhI')
+_LE_hhhh = struct.Struct('<hhhh')
+
+
+def decode_m160_temperature_set_1(data):
+    """0x0A0 M160_Temperature_Set_1 -> MESSAGES[0x0A0].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m160_temperature_set_1(INV_Module_A_Temp=0, INV_Module_B_Temp=0, INV_Module_C_Temp=0, INV_Gate_Driver_Board_Temp=0):
+    """0x0A0 M160_Temperature_Set_1 -> 8 bytes"""
+    w = (
+        (round(INV_Module_A_Temp / 0.1) & 0xFFFF) |
+        ((round(INV_Module_B_Temp / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Module_C_Temp / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Gate_Driver_Board_Temp / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_module_a_temp(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_module_b_temp(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_module_c_temp(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_gate_driver_board_temp(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m161_temperature_set_2(data):
+    """0x0A1 M161_Temperature_Set_2 -> MESSAGES[0x0A1].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m161_temperature_set_2(INV_Control_Board_Temp=0, INV_RTD1_Temperature=0, INV_RTD2_Temperature=0, INV_Hot_Spot_Temp_Motor=0):
+    """0x0A1 M161_Temperature_Set_2 -> 8 bytes"""
+    w = (
+        (round(INV_Control_Board_Temp / 0.1) & 0xFFFF) |
+        ((round(INV_RTD1_Temperature / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_RTD2_Temperature / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Hot_Spot_Temp_Motor / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_control_board_temp(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_rtd1_temperature(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_rtd2_temperature(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_hot_spot_temp_motor(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m162_temperature_set_3(data):
+    """0x0A2 M162_Temperature_Set_3 -> MESSAGES[0x0A2].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m162_temperature_set_3(INV_Coolant_Temp=0, INV_Hot_Spot_Temp_Inverter=0, INV_Motor_Temp=0, INV_Torque_Shudder=0):
+    """0x0A2 M162_Temperature_Set_3 -> 8 bytes"""
+    w = (
+        (round(INV_Coolant_Temp / 0.1) & 0xFFFF) |
+        ((round(INV_Hot_Spot_Temp_Inverter / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Motor_Temp / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Torque_Shudder / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_coolant_temp(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_hot_spot_temp_inverter(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_motor_temp(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_torque_shudder(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m163_analog_input_voltages(data):
+    """0x0A3 M163_Analog_Input_Voltages -> MESSAGES[0x0A3].fields"""
+    w = _LE_Q.unpack_from(data)[0]
+    return (
+        (w & 0x3FF) * 0.01,
+        ((w >> 10) & 0x3FF) * 0.01,
+        ((w >> 20) & 0x3FF) * 0.01,
+        ((w >> 32) & 0x3FF) * 0.01,
+        ((w >> 42) & 0x3FF) * 0.01,
+        ((w >> 52) & 0x3FF) * 0.01,
+    )
+
+
+def encode_m163_analog_input_voltages(INV_Analog_Input_1=0, INV_Analog_Input_2=0, INV_Analog_Input_3=0, INV_Analog_Input_4=0, INV_Analog_Input_5=0, INV_Analog_Input_6=0):
+    """0x0A3 M163_Analog_Input_Voltages -> 8 bytes"""
+    w = (
+        (round(INV_Analog_Input_1 / 0.01) & 0x3FF) |
+        ((round(INV_Analog_Input_2 / 0.01) & 0x3FF) << 10) |
+        ((round(INV_Analog_Input_3 / 0.01) & 0x3FF) << 20) |
+        ((round(INV_Analog_Input_4 / 0.01) & 0x3FF) << 32) |
+        ((round(INV_Analog_Input_5 / 0.01) & 0x3FF) << 42) |
+        ((round(INV_Analog_Input_6 / 0.01) & 0x3FF) << 52)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_analog_input_1(data):
+    return (_LE_H.unpack_from(data)[0] & 0x3FF) * 0.01
+
+
+def sig_inv_analog_input_2(data):
+    return ((_LE_H.unpack_from(data, 1)[0] >> 2) & 0x3FF) * 0.01
+
+
+def sig_inv_analog_input_3(data):
+    return ((_LE_H.unpack_from(data, 2)[0] >> 4) & 0x3FF) * 0.01
+
+
+def sig_inv_analog_input_4(data):
+    return (_LE_H.unpack_from(data, 4)[0] & 0x3FF) * 0.01
+
+
+def sig_inv_analog_input_5(data):
+    return ((_LE_H.unpack_from(data, 5)[0] >> 2) & 0x3FF) * 0.01
+
+
+def sig_inv_analog_input_6(data):
+    return ((_LE_H.unpack_from(data, 6)[0] >> 4) & 0x3FF) * 0.01
+
+
+def decode_m164_digital_input_status(data):
+    """0x0A4 M164_Digital_Input_Status -> MESSAGES[0x0A4].fields"""
+    w = _LE_Q.unpack_from(data)[0]
+    return (
+        (w & 0x1),
+        ((w >> 8) & 0x1),
+        ((w >> 16) & 0x1),
+        ((w >> 24) & 0x1),
+        ((w >> 32) & 0x1),
+        ((w >> 40) & 0x1),
+        ((w >> 48) & 0x1),
+        ((w >> 56) & 0x1),
+    )
+
+
+def encode_m164_digital_input_status(INV_Digital_Input_1=0, INV_Digital_Input_2=0, INV_Digital_Input_3=0, INV_Digital_Input_4=0, INV_Digital_Input_5=0, INV_Digital_Input_6=0, INV_Digital_Input_7=0, INV_Digital_Input_8=0):
+    """0x0A4 M164_Digital_Input_Status -> 8 bytes"""
+    w = (
+        (round(INV_Digital_Input_1) & 0x1) |
+        ((round(INV_Digital_Input_2) & 0x1) << 8) |
+        ((round(INV_Digital_Input_3) & 0x1) << 16) |
+        ((round(INV_Digital_Input_4) & 0x1) << 24) |
+        ((round(INV_Digital_Input_5) & 0x1) << 32) |
+        ((round(INV_Digital_Input_6) & 0x1) << 40) |
+        ((round(INV_Digital_Input_7) & 0x1) << 48) |
+        ((round(INV_Digital_Input_8) & 0x1) << 56)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_digital_input_1(data):
+    return (_LE_B.unpack_from(data)[0] & 0x1)
+
+
+def sig_inv_digital_input_2(data):
+    return (_LE_B.unpack_from(data, 1)[0] & 0x1)
+
+
+def sig_inv_digital_input_3(data):
+    return (_LE_B.unpack_from(data, 2)[0] & 0x1)
+
+
+def sig_inv_digital_input_4(data):
+    return (_LE_B.unpack_from(data, 3)[0] & 0x1)
+
+
+def sig_inv_digital_input_5(data):
+    return (_LE_B.unpack_from(data, 4)[0] & 0x1)
+
+
+def sig_inv_digital_input_6(data):
+    return (_LE_B.unpack_from(data, 5)[0] & 0x1)
+
+
+def sig_inv_digital_input_7(data):
+    return (_LE_B.unpack_from(data, 6)[0] & 0x1)
+
+
+def sig_inv_digital_input_8(data):
+    return (_LE_B.unpack_from(data, 7)[0] & 0x1)
+
+
+def decode_m165_motor_position_info(data):
+    """0x0A5 M165_Motor_Position_Info -> MESSAGES[0x0A5].fields"""
+    r0H, r2h, r4h, r6h = _LE_Hhhh.unpack_from(data)
+    return (
+        r0H * 0.1,
+        r2h,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m165_motor_position_info(INV_Motor_Angle_Electrical=0, INV_Motor_Speed=0, INV_Electrical_Output_Frequency=0, INV_Delta_Resolver_Filtered=0):
+    """0x0A5 M165_Motor_Position_Info -> 8 bytes"""
+    w = (
+        (round(INV_Motor_Angle_Electrical / 0.1) & 0xFFFF) |
+        ((round(INV_Motor_Speed) & 0xFFFF) << 16) |
+        ((round(INV_Electrical_Output_Frequency / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Delta_Resolver_Filtered / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_motor_angle_electrical(data):
+    return _LE_H.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_motor_speed(data):
+    return _LE_h.unpack_from(data, 2)[0]
+
+
+def sig_inv_electrical_output_frequency(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_delta_resolver_filtered(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m166_current_info(data):
+    """0x0A6 M166_Current_Info -> MESSAGES[0x0A6].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m166_current_info(INV_Phase_A_Current=0, INV_Phase_B_Current=0, INV_Phase_C_Current=0, INV_DC_Bus_Current=0):
+    """0x0A6 M166_Current_Info -> 8 bytes"""
+    w = (
+        (round(INV_Phase_A_Current / 0.1) & 0xFFFF) |
+        ((round(INV_Phase_B_Current / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Phase_C_Current / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_DC_Bus_Current / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_phase_a_current(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_phase_b_current(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_phase_c_current(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_dc_bus_current(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m167_voltage_info(data):
+    """0x0A7 M167_Voltage_Info -> MESSAGES[0x0A7].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m167_voltage_info(INV_DC_Bus_Voltage=0, INV_Output_Voltage=0, INV_VAB_Vd_Voltage=0, INV_VBC_Vq_Voltage=0):
+    """0x0A7 M167_Voltage_Info -> 8 bytes"""
+    w = (
+        (round(INV_DC_Bus_Voltage / 0.1) & 0xFFFF) |
+        ((round(INV_Output_Voltage / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_VAB_Vd_Voltage / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_VBC_Vq_Voltage / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_dc_bus_voltage(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_output_voltage(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_vab_vd_voltage(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_vbc_vq_voltage(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m168_flux_id_iq_info(data):
+    """0x0A8 M168_Flux_ID_IQ_Info -> MESSAGES[0x0A8].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m168_flux_id_iq_info(INV_Vd_ff=0, INV_Vq_ff=0, INV_Id=0, INV_Iq=0):
+    """0x0A8 M168_Flux_ID_IQ_Info -> 8 bytes"""
+    w = (
+        (round(INV_Vd_ff / 0.1) & 0xFFFF) |
+        ((round(INV_Vq_ff / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Id / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Iq / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_vd_ff(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_vq_ff(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_id(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_iq(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m169_internal_voltages(data):
+    """0x0A9 M169_Internal_Voltages -> MESSAGES[0x0A9].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.01,
+        r2h * 0.01,
+        r4h * 0.01,
+        r6h * 0.01,
+    )
+
+
+def encode_m169_internal_voltages(INV_Ref_Voltage_1_5=0, INV_Ref_Voltage_2_5=0, INV_Ref_Voltage_5_0=0, INV_Ref_Voltage_12_0=0):
+    """0x0A9 M169_Internal_Voltages -> 8 bytes"""
+    w = (
+        (round(INV_Ref_Voltage_1_5 / 0.01) & 0xFFFF) |
+        ((round(INV_Ref_Voltage_2_5 / 0.01) & 0xFFFF) << 16) |
+        ((round(INV_Ref_Voltage_5_0 / 0.01) & 0xFFFF) << 32) |
+        ((round(INV_Ref_Voltage_12_0 / 0.01) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_ref_voltage_1_5(data):
+    return _LE_h.unpack_from(data)[0] * 0.01
+
+
+def sig_inv_ref_voltage_2_5(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.01
+
+
+def sig_inv_ref_voltage_5_0(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.01
+
+
+def sig_inv_ref_voltage_12_0(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.01
+
+
+def decode_m170_internal_states(data):
+    """0x0AA M170_Internal_States -> MESSAGES[0x0AA].fields"""
+    r0B, r1B, r2B = _LE_BBB.unpack_from(data)
+    w = int.from_bytes(data[3:8], "little")
+    return (
+        r0B,
+        r1B,
+        r2B,
+        (w & 0x1),
+        ((w >> 1) & 0x1),
+        ((w >> 2) & 0x1),
+        ((w >> 3) & 0x1),
+        ((w >> 4) & 0x1),
+        ((w >> 5) & 0x1),
+        ((w >> 8) & 0x1),
+        ((w >> 9) & 0x1),
+        ((w >> 10) & 0x7),
+        ((w >> 13) & 0x7),
+        ((w >> 16) & 0x1),
+        ((w >> 20) & 0xF),
+        ((w >> 24) & 0x1),
+        ((w >> 25) & 0x1),
+        ((w >> 26) & 0x1),
+        ((w >> 28) & 0x1),
+        ((w >> 29) & 0x1),
+        ((w >> 30) & 0x1),
+        ((w >> 31) & 0x1),
+        ((w >> 32) & 0x1),
+        ((w >> 33) & 0x1),
+        ((w >> 34) & 0x1),
+        ((w >> 35) & 0x1),
+        ((w >> 36) & 0x1),
+        ((w >> 37) & 0x1),
+        ((w >> 38) & 0x1),
+        ((w >> 39) & 0x1),
+    )
+
+
+def encode_m170_internal_states(INV_VSM_State=0, INV_PWM_Frequency=0, INV_Inverter_State=0, INV_Relay_1_Status=0, INV_Relay_2_Status=0, INV_Relay_3_Status=0, INV_Relay_4_Status=0, INV_Relay_5_Status=0, INV_Relay_6_Status=0, INV_Inverter_Run_Mode=0, INV_Self_Sensing_Assist_Enable=0, INV_ASC_State=0, INV_Inverter_Discharge_State=0, INV_Inverter_Command_Mode=0, INV_Rolling_Counter=0, INV_Inverter_Enable_State=0, INV_Burst_Model_Mode=0, INV_BMS_Limiting_Regen_Torque=0, INV_Limit_Motor_Temp_Derate=0, INV_Limit_Hot_Spot_Motor=0, INV_Key_Switch_Start_Status=0, INV_Inverter_Enable_Lockout=0, INV_Direction_Command=0, INV_BMS_Active=0, INV_BMS_Limiting_Motor_Torque=0, INV_Limit_Max_Speed=0, INV_Limit_Hot_Spot_Inverter=0, INV_Low_Speed_Limiting=0, INV_Limit_Coolant_Derating=0, INV_Limit_Stall_Burst_Model=0):
+    """0x0AA M170_Internal_States -> 8 bytes"""
+    w = (
+        (round(INV_VSM_State) & 0xFF) |
+        ((round(INV_PWM_Frequency) & 0xFF) << 8) |
+        ((round(INV_Inverter_State) & 0xFF) << 16) |
+        ((round(INV_Relay_1_Status) & 0x1) << 24) |
+        ((round(INV_Relay_2_Status) & 0x1) << 25) |
+        ((round(INV_Relay_3_Status) & 0x1) << 26) |
+        ((round(INV_Relay_4_Status) & 0x1) << 27) |
+        ((round(INV_Relay_5_Status) & 0x1) << 28) |
+        ((round(INV_Relay_6_Status) & 0x1) << 29) |
+        ((round(INV_Inverter_Run_Mode) & 0x1) << 32) |
+        ((round(INV_Self_Sensing_Assist_Enable) & 0x1) << 33) |
+        ((round(INV_ASC_State) & 0x7) << 34) |
+        ((round(INV_Inverter_Discharge_State) & 0x7) << 37) |
+        ((round(INV_Inverter_Command_Mode) & 0x1) << 40) |
+        ((round(INV_Rolling_Counter) & 0xF) << 44) |
+        ((round(INV_Inverter_Enable_State) & 0x1) << 48) |
+        ((round(INV_Burst_Model_Mode) & 0x1) << 49) |
+        ((round(INV_BMS_Limiting_Regen_Torque) & 0x1) << 50) |
+        ((round(INV_Limit_Motor_Temp_Derate) & 0x1) << 52) |
+        ((round(INV_Limit_Hot_Spot_Motor) & 0x1) << 53) |
+        ((round(INV_Key_Switch_Start_Status) & 0x1) << 54) |
+        ((round(INV_Inverter_Enable_Lockout) & 0x1) << 55) |
+        ((round(INV_Direction_Command) & 0x1) << 56) |
+        ((round(INV_BMS_Active) & 0x1) << 57) |
+        ((round(INV_BMS_Limiting_Motor_Torque) & 0x1) << 58) |
+        ((round(INV_Limit_Max_Speed) & 0x1) << 59) |
+        ((round(INV_Limit_Hot_Spot_Inverter) & 0x1) << 60) |
+        ((round(INV_Low_Speed_Limiting) & 0x1) << 61) |
+        ((round(INV_Limit_Coolant_Derating) & 0x1) << 62) |
+        ((round(INV_Limit_Stall_Burst_Model) & 0x1) << 63)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_vsm_state(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_inv_pwm_frequency(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def sig_inv_inverter_state(data):
+    return _LE_B.unpack_from(data, 2)[0]
+
+
+def sig_inv_relay_1_status(data):
+    return (_LE_B.unpack_from(data, 3)[0] & 0x1)
+
+
+def sig_inv_relay_2_status(data):
+    return ((_LE_B.unpack_from(data, 3)[0] >> 1) & 0x1)
+
+
+def sig_inv_relay_3_status(data):
+    return ((_LE_B.unpack_from(data, 3)[0] >> 2) & 0x1)
+
+
+def sig_inv_relay_4_status(data):
+    return ((_LE_B.unpack_from(data, 3)[0] >> 3) & 0x1)
+
+
+def sig_inv_relay_5_status(data):
+    return ((_LE_B.unpack_from(data, 3)[0] >> 4) & 0x1)
+
+
+def sig_inv_relay_6_status(data):
+    return ((_LE_B.unpack_from(data, 3)[0] >> 5) & 0x1)
+
+
+def sig_inv_inverter_run_mode(data):
+    return (_LE_B.unpack_from(data, 4)[0] & 0x1)
+
+
+def sig_inv_self_sensing_assist_enable(data):
+    return ((_LE_B.unpack_from(data, 4)[0] >> 1) & 0x1)
+
+
+def sig_inv_asc_state(data):
+    return ((_LE_B.unpack_from(data, 4)[0] >> 2) & 0x7)
+
+
+def sig_inv_inverter_discharge_state(data):
+    return ((_LE_B.unpack_from(data, 4)[0] >> 5) & 0x7)
+
+
+def sig_inv_inverter_command_mode(data):
+    return (_LE_B.unpack_from(data, 5)[0] & 0x1)
+
+
+def sig_inv_rolling_counter(data):
+    return ((_LE_B.unpack_from(data, 5)[0] >> 4) & 0xF)
+
+
+def sig_inv_inverter_enable_state(data):
+    return (_LE_B.unpack_from(data, 6)[0] & 0x1)
+
+
+def sig_inv_burst_model_mode(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 1) & 0x1)
+
+
+def sig_inv_bms_limiting_regen_torque(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 2) & 0x1)
+
+
+def sig_inv_limit_motor_temp_derate(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 4) & 0x1)
+
+
+def sig_inv_limit_hot_spot_motor(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 5) & 0x1)
+
+
+def sig_inv_key_switch_start_status(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 6) & 0x1)
+
+
+def sig_inv_inverter_enable_lockout(data):
+    return ((_LE_B.unpack_from(data, 6)[0] >> 7) & 0x1)
+
+
+def sig_inv_direction_command(data):
+    return (_LE_B.unpack_from(data, 7)[0] & 0x1)
+
+
+def sig_inv_bms_active(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 1) & 0x1)
+
+
+def sig_inv_bms_limiting_motor_torque(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 2) & 0x1)
+
+
+def sig_inv_limit_max_speed(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 3) & 0x1)
+
+
+def sig_inv_limit_hot_spot_inverter(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 4) & 0x1)
+
+
+def sig_inv_low_speed_limiting(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 5) & 0x1)
+
+
+def sig_inv_limit_coolant_derating(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 6) & 0x1)
+
+
+def sig_inv_limit_stall_burst_model(data):
+    return ((_LE_B.unpack_from(data, 7)[0] >> 7) & 0x1)
+
+
+def decode_m171_fault_codes(data):
+    """0x0AB M171_Fault_Codes -> MESSAGES[0x0AB].fields"""
+    r0H, r2H, r4H, r6H = _LE_HHHH.unpack_from(data)
+    return (
+        r0H,
+        r2H,
+        r4H,
+        r6H,
+    )
+
+
+def encode_m171_fault_codes(INV_Post_Fault_Lo=0, INV_Post_Fault_Hi=0, INV_Run_Fault_Lo=0, INV_Run_Fault_Hi=0):
+    """0x0AB M171_Fault_Codes -> 8 bytes"""
+    w = (
+        (round(INV_Post_Fault_Lo) & 0xFFFF) |
+        ((round(INV_Post_Fault_Hi) & 0xFFFF) << 16) |
+        ((round(INV_Run_Fault_Lo) & 0xFFFF) << 32) |
+        ((round(INV_Run_Fault_Hi) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_post_fault_lo(data):
+    return _LE_H.unpack_from(data)[0]
+
+
+def sig_inv_post_fault_hi(data):
+    return _LE_H.unpack_from(data, 2)[0]
+
+
+def sig_inv_run_fault_lo(data):
+    return _LE_H.unpack_from(data, 4)[0]
+
+
+def sig_inv_run_fault_hi(data):
+    return _LE_H.unpack_from(data, 6)[0]
+
+
+def decode_m172_torque_and_timer_info(data):
+    """0x0AC M172_Torque_And_Timer_Info -> MESSAGES[0x0AC].fields"""
+    r0h, r2h, r4I = _LE_hhI.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4I * 0.003,
+    )
+
+
+def encode_m172_torque_and_timer_info(INV_Commanded_Torque=0, INV_Torque_Feedback=0, INV_Power_On_Timer=0):
+    """0x0AC M172_Torque_And_Timer_Info -> 8 bytes"""
+    w = (
+        (round(INV_Commanded_Torque / 0.1) & 0xFFFF) |
+        ((round(INV_Torque_Feedback / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Power_On_Timer / 0.003) & 0xFFFFFFFF) << 32)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_commanded_torque(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_torque_feedback(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_power_on_timer(data):
+    return _LE_I.unpack_from(data, 4)[0] * 0.003
+
+
+def decode_m173_modulation_and_flux_info(data):
+    """0x0AD M173_Modulation_And_Flux_Info -> MESSAGES[0x0AD].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.0001,
+        r2h * 0.1,
+        r4h * 0.1,
+        r6h * 0.1,
+    )
+
+
+def encode_m173_modulation_and_flux_info(INV_Modulation_Index=0, INV_Flux_Weakening_Output=0, INV_Id_Command=0, INV_Iq_Command=0):
+    """0x0AD M173_Modulation_And_Flux_Info -> 8 bytes"""
+    w = (
+        (round(INV_Modulation_Index / 0.0001) & 0xFFFF) |
+        ((round(INV_Flux_Weakening_Output / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Id_Command / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Iq_Command / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_modulation_index(data):
+    return _LE_h.unpack_from(data)[0] * 0.0001
+
+
+def sig_inv_flux_weakening_output(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_id_command(data):
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_iq_command(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m174_firmware_info(data):
+    """0x0AE M174_Firmware_Info -> MESSAGES[0x0AE].fields"""
+    r0H, r2H, r4H, r6H = _LE_HHHH.unpack_from(data)
+    return (
+        r0H,
+        r2H,
+        r4H,
+        r6H,
+    )
+
+
+def encode_m174_firmware_info(INV_Project_Code_EEP_Ver=0, INV_SW_Version=0, INV_DateCode_MMDD=0, INV_DateCode_YYYY=0):
+    """0x0AE M174_Firmware_Info -> 8 bytes"""
+    w = (
+        (round(INV_Project_Code_EEP_Ver) & 0xFFFF) |
+        ((round(INV_SW_Version) & 0xFFFF) << 16) |
+        ((round(INV_DateCode_MMDD) & 0xFFFF) << 32) |
+        ((round(INV_DateCode_YYYY) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_project_code_eep_ver(data):
+    return _LE_H.unpack_from(data)[0]
+
+
+def sig_inv_sw_version(data):
+    return _LE_H.unpack_from(data, 2)[0]
+
+
+def sig_inv_datecode_mmdd(data):
+    return _LE_H.unpack_from(data, 4)[0]
+
+
+def sig_inv_datecode_yyyy(data):
+    return _LE_H.unpack_from(data, 6)[0]
+
+
+def decode_m175_diag_data_message(data):
+    """0x0AF M175_Diag_Data_Message -> MESSAGES[0x0AF].fields"""
+    r0B, r1B, r2h, r4h, r6h = _LE_BBhhh.unpack_from(data)
+    r2H = _LE_H.unpack_from(data, 2)[0]
+    r4H = _LE_H.unpack_from(data, 4)[0]
+    r6H = _LE_H.unpack_from(data, 6)[0]
+    page = r1B
+    return (
+        r0B,
+        page,
+        r2h * 0.1 if page == 0 else None,
+        r2h if page == 1 else None,
+        r2h * 0.1 if page == 2 else None,
+        r2h * 0.1 if page == 3 else None,
+        r2h * 0.1 if page == 4 else None,
+        r2H if page == 5 else None,
+        r4h * 0.1 if page == 0 else None,
+        r4h * 0.1 if page == 1 else None,
+        r4h * 0.1 if page == 2 else None,
+        r4h * 0.0001 if page == 3 else None,
+        r4h * 0.1 if page == 4 else None,
+        r4H if page == 5 else None,
+        r6h if page == 0 else None,
+        r6h * 0.1 if page == 1 else None,
+        r6h * 0.1 if page == 2 else None,
+        r6h * 0.1 if page == 3 else None,
+        r6h * 0.1 if page == 4 else None,
+        r6H if page == 5 else None,
+    )
+
+
+def encode_m175_diag_data_message(INV_Diag_Record=0, INV_Diag_Segment=0, INV_Diag_Gamma_Resolver=0, INV_Diag_Cos_Used=0, INV_Diag_Ic=0, INV_Diag_Id_cmd=0, INV_Diag_Vq_Cmd=0, INV_Diag_PWM_Freq=0, INV_Diag_Gamma_Observer=0, INV_Diag_Ia=0, INV_Diag_Vdc=0, INV_Diag_Mod_Index=0, INV_Diag_Vd_Cmd=0, INV_Diag_Run_Faults_Lo=0, INV_Diag_Sin_Used=0, INV_Diag_Ib=0, INV_Diag_Iq_cmd=0, INV_Diag_FW_Output=0, INV_Diag_Vqs_Cmd=0, INV_Diag_Run_Faults_Hi=0):
+    """0x0AF M175_Diag_Data_Message -> 8 bytes"""
+    w = (
+        (round(INV_Diag_Record) & 0xFF) |
+        ((round(INV_Diag_Segment) & 0xFF) << 8) |
+        ((round(INV_Diag_Gamma_Resolver / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Diag_Cos_Used) & 0xFFFF) << 16) |
+        ((round(INV_Diag_Ic / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Diag_Id_cmd / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Diag_Vq_Cmd / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Diag_PWM_Freq) & 0xFFFF) << 16) |
+        ((round(INV_Diag_Gamma_Observer / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Ia / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Vdc / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Mod_Index / 0.0001) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Vd_Cmd / 0.1) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Run_Faults_Lo) & 0xFFFF) << 32) |
+        ((round(INV_Diag_Sin_Used) & 0xFFFF) << 48) |
+        ((round(INV_Diag_Ib / 0.1) & 0xFFFF) << 48) |
+        ((round(INV_Diag_Iq_cmd / 0.1) & 0xFFFF) << 48) |
+        ((round(INV_Diag_FW_Output / 0.1) & 0xFFFF) << 48) |
+        ((round(INV_Diag_Vqs_Cmd / 0.1) & 0xFFFF) << 48) |
+        ((round(INV_Diag_Run_Faults_Hi) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_diag_record(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_inv_diag_segment(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def sig_inv_diag_gamma_resolver(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 0:
+        return None
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_diag_cos_used(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 1:
+        return None
+    return _LE_h.unpack_from(data, 2)[0]
+
+
+def sig_inv_diag_ic(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 2:
+        return None
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_diag_id_cmd(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 3:
+        return None
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_diag_vq_cmd(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 4:
+        return None
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_diag_pwm_freq(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 5:
+        return None
+    return _LE_H.unpack_from(data, 2)[0]
+
+
+def sig_inv_diag_gamma_observer(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 0:
+        return None
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_diag_ia(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 1:
+        return None
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_diag_vdc(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 2:
+        return None
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_diag_mod_index(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 3:
+        return None
+    return _LE_h.unpack_from(data, 4)[0] * 0.0001
+
+
+def sig_inv_diag_vd_cmd(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 4:
+        return None
+    return _LE_h.unpack_from(data, 4)[0] * 0.1
+
+
+def sig_inv_diag_run_faults_lo(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 5:
+        return None
+    return _LE_H.unpack_from(data, 4)[0]
+
+
+def sig_inv_diag_sin_used(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 0:
+        return None
+    return _LE_h.unpack_from(data, 6)[0]
+
+
+def sig_inv_diag_ib(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 1:
+        return None
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def sig_inv_diag_iq_cmd(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 2:
+        return None
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def sig_inv_diag_fw_output(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 3:
+        return None
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def sig_inv_diag_vqs_cmd(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 4:
+        return None
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def sig_inv_diag_run_faults_hi(data):
+    if (_LE_B.unpack_from(data, 1)[0] & 0xFF) != 5:
+        return None
+    return _LE_H.unpack_from(data, 6)[0]
+
+
+def decode_m176_fast_info(data):
+    """0x0B0 M176_Fast_Info -> MESSAGES[0x0B0].fields"""
+    r0h, r2h, r4h, r6h = _LE_hhhh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+        r4h,
+        r6h * 0.1,
+    )
+
+
+def encode_m176_fast_info(INV_Fast_Torque_Command=0, INV_Fast_Torque_Feedback=0, INV_Fast_Motor_Speed=0, INV_Fast_DC_Bus_Voltage=0):
+    """0x0B0 M176_Fast_Info -> 8 bytes"""
+    w = (
+        (round(INV_Fast_Torque_Command / 0.1) & 0xFFFF) |
+        ((round(INV_Fast_Torque_Feedback / 0.1) & 0xFFFF) << 16) |
+        ((round(INV_Fast_Motor_Speed) & 0xFFFF) << 32) |
+        ((round(INV_Fast_DC_Bus_Voltage / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_fast_torque_command(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_fast_torque_feedback(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def sig_inv_fast_motor_speed(data):
+    return _LE_h.unpack_from(data, 4)[0]
+
+
+def sig_inv_fast_dc_bus_voltage(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m177_torque_capability(data):
+    """0x0B1 M177_Torque_Capability -> MESSAGES[0x0B1].fields"""
+    r0h, r2h = _LE_hh.unpack_from(data)
+    return (
+        r0h * 0.1,
+        r2h * 0.1,
+    )
+
+
+def encode_m177_torque_capability(INV_Torque_Capability_Motor=0, INV_Torque_Capability_Regen=0):
+    """0x0B1 M177_Torque_Capability -> 8 bytes"""
+    w = (
+        (round(INV_Torque_Capability_Motor / 0.1) & 0xFFFF) |
+        ((round(INV_Torque_Capability_Regen / 0.1) & 0xFFFF) << 16)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_torque_capability_motor(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_inv_torque_capability_regen(data):
+    return _LE_h.unpack_from(data, 2)[0] * 0.1
+
+
+def decode_m192_command_message(data):
+    """0x0C0 M192_Command_Message -> MESSAGES[0x0C0].fields"""
+    r0h, r2h, r6h = _LE_hh2xh.unpack_from(data)
+    w = _LE_H.unpack_from(data, 4)[0]
+    return (
+        r0h * 0.1,
+        r2h,
+        (w & 0x1),
+        ((w >> 8) & 0x1),
+        ((w >> 9) & 0x1),
+        ((w >> 10) & 0x1),
+        ((w >> 12) & 0xF),
+        r6h * 0.1,
+    )
+
+
+def encode_m192_command_message(VCU_INV_Torque_Command=0, VCU_INV_Speed_Command=0, VCU_INV_Direction_Command=0, VCU_INV_Inverter_Enable=0, VCU_INV_Inverter_Discharge=0, VCU_INV_Speed_Mode_Enable=0, VCU_INV_Rolling_Counter=0, VCU_INV_Torque_Limit_Command=0):
+    """0x0C0 M192_Command_Message -> 8 bytes"""
+    w = (
+        (round(VCU_INV_Torque_Command / 0.1) & 0xFFFF) |
+        ((round(VCU_INV_Speed_Command) & 0xFFFF) << 16) |
+        ((round(VCU_INV_Direction_Command) & 0x1) << 32) |
+        ((round(VCU_INV_Inverter_Enable) & 0x1) << 40) |
+        ((round(VCU_INV_Inverter_Discharge) & 0x1) << 41) |
+        ((round(VCU_INV_Speed_Mode_Enable) & 0x1) << 42) |
+        ((round(VCU_INV_Rolling_Counter) & 0xF) << 44) |
+        ((round(VCU_INV_Torque_Limit_Command / 0.1) & 0xFFFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_vcu_inv_torque_command(data):
+    return _LE_h.unpack_from(data)[0] * 0.1
+
+
+def sig_vcu_inv_speed_command(data):
+    return _LE_h.unpack_from(data, 2)[0]
+
+
+def sig_vcu_inv_direction_command(data):
+    return (_LE_B.unpack_from(data, 4)[0] & 0x1)
+
+
+def sig_vcu_inv_inverter_enable(data):
+    return (_LE_B.unpack_from(data, 5)[0] & 0x1)
+
+
+def sig_vcu_inv_inverter_discharge(data):
+    return ((_LE_B.unpack_from(data, 5)[0] >> 1) & 0x1)
+
+
+def sig_vcu_inv_speed_mode_enable(data):
+    return ((_LE_B.unpack_from(data, 5)[0] >> 2) & 0x1)
+
+
+def sig_vcu_inv_rolling_counter(data):
+    return ((_LE_B.unpack_from(data, 5)[0] >> 4) & 0xF)
+
+
+def sig_vcu_inv_torque_limit_command(data):
+    return _LE_h.unpack_from(data, 6)[0] * 0.1
+
+
+def decode_m193_read_write_param_command(data):
+    """0x0C1 M193_Read_Write_Param_Command -> MESSAGES[0x0C1].fields"""
+    r0H, r4h = _LE_H2xh.unpack_from(data)
+    w = _LE_B.unpack_from(data, 2)[0]
+    return (
+        r0H,
+        (w & 0x1),
+        r4h,
+    )
+
+
+def encode_m193_read_write_param_command(VCU_INV_Parameter_Address=0, VCU_INV_Parameter_RW_Command=0, VCU_INV_Parameter_Data=0):
+    """0x0C1 M193_Read_Write_Param_Command -> 8 bytes"""
+    w = (
+        (round(VCU_INV_Parameter_Address) & 0xFFFF) |
+        ((round(VCU_INV_Parameter_RW_Command) & 0x1) << 16) |
+        ((round(VCU_INV_Parameter_Data) & 0xFFFF) << 32)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_vcu_inv_parameter_address(data):
+    return _LE_H.unpack_from(data)[0]
+
+
+def sig_vcu_inv_parameter_rw_command(data):
+    return (_LE_B.unpack_from(data, 2)[0] & 0x1)
+
+
+def sig_vcu_inv_parameter_data(data):
+    return _LE_h.unpack_from(data, 4)[0]
+
+
+def decode_m194_read_write_param_response(data):
+    """0x0C2 M194_Read_Write_Param_Response -> MESSAGES[0x0C2].fields"""
+    r0H, r4h = _LE_H2xh.unpack_from(data)
+    w = _LE_B.unpack_from(data, 2)[0]
+    return (
+        r0H,
+        (w & 0x1),
+        r4h,
+    )
+
+
+def encode_m194_read_write_param_response(INV_Parameter_Response_Addr=0, INV_Parameter_Response_Write_OK=0, INV_Parameter_Response_Data=0):
+    """0x0C2 M194_Read_Write_Param_Response -> 8 bytes"""
+    w = (
+        (round(INV_Parameter_Response_Addr) & 0xFFFF) |
+        ((round(INV_Parameter_Response_Write_OK) & 0x1) << 16) |
+        ((round(INV_Parameter_Response_Data) & 0xFFFF) << 32)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_inv_parameter_response_addr(data):
+    return _LE_H.unpack_from(data)[0]
+
+
+def sig_inv_parameter_response_write_ok(data):
+    return (_LE_B.unpack_from(data, 2)[0] & 0x1)
+
+
+def sig_inv_parameter_response_data(data):
+    return _LE_h.unpack_from(data, 4)[0]
+
+
+def decode_pedal_processed(data):
+    """0x101 Pedal_Processed -> MESSAGES[0x101].fields"""
+    r0B, r1B, r2B = _LE_BBB.unpack_from(data)
+    w = _LE_B.unpack_from(data, 3)[0]
+    return (
+        r0B * 0.39215686274509803,
+        r1B * 0.39215686274509803,
+        r2B,
+        (w & 0xF),
+    )
+
+
+def encode_pedal_processed(APPS_pct=0, Brake_pct=0, StatusBits=0, Counter=0):
+    """0x101 Pedal_Processed -> 8 bytes"""
+    w = (
+        (round(APPS_pct / 0.39215686274509803) & 0xFF) |
+        ((round(Brake_pct / 0.39215686274509803) & 0xFF) << 8) |
+        ((round(StatusBits) & 0xFF) << 16) |
+        ((round(Counter) & 0xF) << 24)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_apps_pct(data):
+    return _LE_B.unpack_from(data)[0] * 0.39215686274509803
+
+
+def sig_brake_pct(data):
+    return _LE_B.unpack_from(data, 1)[0] * 0.39215686274509803
+
+
+def sig_statusbits(data):
+    return _LE_B.unpack_from(data, 2)[0]
+
+
+def sig_counter(data):
+    return (_LE_B.unpack_from(data, 3)[0] & 0xF)
+
+
+def decode_heartbeat(data):
+    """0x102 Heartbeat -> MESSAGES[0x102].fields"""
+    r0I, r4B = _LE_IB.unpack_from(data)
+    return (
+        r0I,
+        r4B,
+    )
+
+
+def encode_heartbeat(HB_Uptime=0, HB_FW_Tag=0):
+    """0x102 Heartbeat -> 8 bytes"""
+    w = (
+        (round(HB_Uptime) & 0xFFFFFFFF) |
+        ((round(HB_FW_Tag) & 0xFF) << 32)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_hb_uptime(data):
+    return _LE_I.unpack_from(data)[0]
+
+
+def sig_hb_fw_tag(data):
+    return _LE_B.unpack_from(data, 4)[0]
+
+
+def decode_vehicle_speed(data):
+    """0x110 Vehicle_Speed -> MESSAGES[0x110].fields"""
+    r0B, = _LE_B.unpack_from(data)
+    w = _LE_B.unpack_from(data, 2)[0]
+    return (
+        r0B,
+        (w & 0xF),
+    )
+
+
+def encode_vehicle_speed(Speed_kph=0, Speed_Counter=0):
+    """0x110 Vehicle_Speed -> 4 bytes"""
+    w = (
+        (round(Speed_kph) & 0xFF) |
+        ((round(Speed_Counter) & 0xF) << 16)
+    )
+    return w.to_bytes(4, "little")
+
+
+def sig_speed_kph(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_speed_counter(data):
+    return (_LE_B.unpack_from(data, 2)[0] & 0xF)
+
+
+def decode_battery_state(data):
+    """0x111 Battery_State -> MESSAGES[0x111].fields"""
+    r0B, r1B = _LE_BB.unpack_from(data)
+    w = _LE_B.unpack_from(data, 3)[0]
+    return (
+        r0B,
+        r1B,
+        (w & 0xF),
+    )
+
+
+def encode_battery_state(Batt_SOC=0, Batt_Pack_Temp=0, Batt_Counter=0):
+    """0x111 Battery_State -> 4 bytes"""
+    w = (
+        (round(Batt_SOC) & 0xFF) |
+        ((round(Batt_Pack_Temp) & 0xFF) << 8) |
+        ((round(Batt_Counter) & 0xF) << 24)
+    )
+    return w.to_bytes(4, "little")
+
+
+def sig_batt_soc(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_batt_pack_temp(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def sig_batt_counter(data):
+    return (_LE_B.unpack_from(data, 3)[0] & 0xF)
+
+
+def decode_temps_misc(data):
+    """0x112 Temps_Misc -> MESSAGES[0x112].fields"""
+    r0B, r1B = _LE_BB.unpack_from(data)
+    w = _LE_B.unpack_from(data, 3)[0]
+    return (
+        r0B,
+        r1B,
+        (w & 0xF),
+    )
+
+
+def encode_temps_misc(Water_Temp=0, Inverter_Temp=0, Temps_Counter=0):
+    """0x112 Temps_Misc -> 4 bytes"""
+    w = (
+        (round(Water_Temp) & 0xFF) |
+        ((round(Inverter_Temp) & 0xFF) << 8) |
+        ((round(Temps_Counter) & 0xF) << 24)
+    )
+    return w.to_bytes(4, "little")
+
+
+def sig_water_temp(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_inverter_temp(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def sig_temps_counter(data):
+    return (_LE_B.unpack_from(data, 3)[0] & 0xF)
+
+
+def decode_tc_command(data):
+    """0x120 TC_Command -> MESSAGES[0x120].fields"""
+    r0B, r1B = _LE_BB.unpack_from(data)
+    return (
+        r0B,
+        r1B,
+    )
+
+
+def encode_tc_command(TC_Level=0, TC_Magic=0):
+    """0x120 TC_Command -> 8 bytes"""
+    w = (
+        (round(TC_Level) & 0xFF) |
+        ((round(TC_Magic) & 0xFF) << 8)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_tc_level(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_tc_magic(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def decode_tc_status(data):
+    """0x121 TC_Status -> MESSAGES[0x121].fields"""
+    r0B, = _LE_B.unpack_from(data)
+    return (r0B,)
+
+
+def encode_tc_status(TC_Level_Applied=0):
+    """0x121 TC_Status -> 2 bytes"""
+    w = (
+        (round(TC_Level_Applied) & 0xFF)
+    )
+    return w.to_bytes(2, "little")
+
+
+def sig_tc_level_applied(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def decode_temp_config(data):
+    """0x130 Temp_Config -> MESSAGES[0x130].fields"""
+    r0B, r1B, r2B = _LE_BBB.unpack_from(data)
+    return (
+        r0B,
+        r1B,
+        r2B,
+    )
+
+
+def encode_temp_config(Temp_Thresh_Motor=0, Temp_Thresh_Inverter=0, Temp_Force_Mask=0):
+    """0x130 Temp_Config -> 8 bytes"""
+    w = (
+        (round(Temp_Thresh_Motor) & 0xFF) |
+        ((round(Temp_Thresh_Inverter) & 0xFF) << 8) |
+        ((round(Temp_Force_Mask) & 0xFF) << 16)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_temp_thresh_motor(data):
+    return _LE_B.unpack_from(data)[0]
+
+
+def sig_temp_thresh_inverter(data):
+    return _LE_B.unpack_from(data, 1)[0]
+
+
+def sig_temp_force_mask(data):
+    return _LE_B.unpack_from(data, 2)[0]
+
+
+def decode_temp_status(data):
+    """0x131 Temp_Status -> MESSAGES[0x131].fields"""
+    r0B, r1B, r2B, r3B, r4B, r5B, r6B = _LE_BBBBBBB.unpack_from(data)
+    return (
+        r0B + -50,
+        r1B + -50,
+        r2B,
+        r3B,
+        r4B,
+        r5B,
+        r6B,
+    )
+
+
+def encode_temp_status(Temp_NTC_Motor=0, Temp_NTC_Inverter=0, Temp_Thresh_Motor_Applied=0, Temp_Thresh_Inverter_Applied=0, Temp_Fan_Mask=0, Temp_Fault_Mask=0, Temp_Force_Mask_Applied=0):
+    """0x131 Temp_Status -> 8 bytes"""
+    w = (
+        (round((Temp_NTC_Motor - -50) / 1) & 0xFF) |
+        ((round((Temp_NTC_Inverter - -50) / 1) & 0xFF) << 8) |
+        ((round(Temp_Thresh_Motor_Applied) & 0xFF) << 16) |
+        ((round(Temp_Thresh_Inverter_Applied) & 0xFF) << 24) |
+        ((round(Temp_Fan_Mask) & 0xFF) << 32) |
+        ((round(Temp_Fault_Mask) & 0xFF) << 40) |
+        ((round(Temp_Force_Mask_Applied) & 0xFF) << 48)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_temp_ntc_motor(data):
+    return _LE_B.unpack_from(data)[0] + -50
+
+
+def sig_temp_ntc_inverter(data):
+    return _LE_B.unpack_from(data, 1)[0] + -50
+
+
+def sig_temp_thresh_motor_applied(data):
+    return _LE_B.unpack_from(data, 2)[0]
+
+
+def sig_temp_thresh_inverter_applied(data):
+    return _LE_B.unpack_from(data, 3)[0]
+
+
+def sig_temp_fan_mask(data):
+    return _LE_B.unpack_from(data, 4)[0]
+
+
+def sig_temp_fault_mask(data):
+    return _LE_B.unpack_from(data, 5)[0]
+
+
+def sig_temp_force_mask_applied(data):
+    return _LE_B.unpack_from(data, 6)[0]
+
+
+def decode_bms_current_limit(data):
+    """0x202 BMS_Current_Limit -> MESSAGES[0x202].fields"""
+    r0H, r2H = _LE_HH.unpack_from(data)
+    return (
+        r0H,
+        r2H,
+    )
+
+
+def encode_bms_current_limit(BMS_Max_Discharge_Current=0, BMS_Max_Charge_Current=0):
+    """0x202 BMS_Current_Limit -> 8 bytes"""
+    w = (
+        (round(BMS_Max_Discharge_Current) & 0xFFFF) |
+        ((round(BMS_Max_Charge_Current) & 0xFFFF) << 16)
+    )
+    return w.to_bytes(8, "little")
+
+
+def sig_bms_max_discharge_current(data):
+    return _LE_H.unpack_from(data)[0]
+
+
+def sig_bms_max_charge_current(data):
+    return _LE_H.unpack_from(data, 2)[0]
+
+
+MESSAGES = {
+    0x0A0: MessageInfo(0x0A0, 'M160_Temperature_Set_1', 8, 8, 100, 'INV', ('INV_Module_A_Temp', 'INV_Module_B_Temp', 'INV_Module_C_Temp', 'INV_Gate_Driver_Board_Temp',), decode_m160_temperature_set_1, encode_m160_temperature_set_1),
+    0x0A1: MessageInfo(0x0A1, 'M161_Temperature_Set_2', 8, 8, 100, 'INV', ('INV_Control_Board_Temp', 'INV_RTD1_Temperature', 'INV_RTD2_Temperature', 'INV_Hot_Spot_Temp_Motor',), decode_m161_temperature_set_2, encode_m161_temperature_set_2),
+    0x0A2: MessageInfo(0x0A2, 'M162_Temperature_Set_3', 8, 8, 100, 'INV', ('INV_Coolant_Temp', 'INV_Hot_Spot_Temp_Inverter', 'INV_Motor_Temp', 'INV_Torque_Shudder',), decode_m162_temperature_set_3, encode_m162_temperature_set_3),
+    0x0A3: MessageInfo(0x0A3, 'M163_Analog_Input_Voltages', 8, 8, 10, 'INV', ('INV_Analog_Input_1', 'INV_Analog_Input_2', 'INV_Analog_Input_3', 'INV_Analog_Input_4', 'INV_Analog_Input_5', 'INV_Analog_Input_6',), decode_m163_analog_input_voltages, encode_m163_analog_input_voltages),
+    0x0A4: MessageInfo(0x0A4, 'M164_Digital_Input_Status', 8, 8, 10, 'INV', ('INV_Digital_Input_1', 'INV_Digital_Input_2', 'INV_Digital_Input_3', 'INV_Digital_Input_4', 'INV_Digital_Input_5', 'INV_Digital_Input_6', 'INV_Digital_Input_7', 'INV_Digital_Input_8',), decode_m164_digital_input_status, encode_m164_digital_input_status),
+    0x0A5: MessageInfo(0x0A5, 'M165_Motor_Position_Info', 8, 8, 10, 'INV', ('INV_Motor_Angle_Electrical', 'INV_Motor_Speed', 'INV_Electrical_Output_Frequency', 'INV_Delta_Resolver_Filtered',), decode_m165_motor_position_info, encode_m165_motor_position_info),
+    0x0A6: MessageInfo(0x0A6, 'M166_Current_Info', 8, 8, 10, 'INV', ('INV_Phase_A_Current', 'INV_Phase_B_Current', 'INV_Phase_C_Current', 'INV_DC_Bus_Current',), decode_m166_current_info, encode_m166_current_info),
+    0x0A7: MessageInfo(0x0A7, 'M167_Voltage_Info', 8, 8, 10, 'INV', ('INV_DC_Bus_Voltage', 'INV_Output_Voltage', 'INV_VAB_Vd_Voltage', 'INV_VBC_Vq_Voltage',), decode_m167_voltage_info, encode_m167_voltage_info),
+    0x0A8: MessageInfo(0x0A8, 'M168_Flux_ID_IQ_Info', 8, 8, 10, 'INV', ('INV_Vd_ff', 'INV_Vq_ff', 'INV_Id', 'INV_Iq',), decode_m168_flux_id_iq_info, encode_m168_flux_id_iq_info),
+    0x0A9: MessageInfo(0x0A9, 'M169_Internal_Voltages', 8, 8, 100, 'INV', ('INV_Ref_Voltage_1_5', 'INV_Ref_Voltage_2_5', 'INV_Ref_Voltage_5_0', 'INV_Ref_Voltage_12_0',), decode_m169_internal_voltages, encode_m169_internal_voltages),
+    0x0AA: MessageInfo(0x0AA, 'M170_Internal_States', 8, 8, 10, 'INV', ('INV_VSM_State', 'INV_PWM_Frequency', 'INV_Inverter_State', 'INV_Relay_1_Status', 'INV_Relay_2_Status', 'INV_Relay_3_Status', 'INV_Relay_4_Status', 'INV_Relay_5_Status', 'INV_Relay_6_Status', 'INV_Inverter_Run_Mode', 'INV_Self_Sensing_Assist_Enable', 'INV_ASC_State', 'INV_Inverter_Discharge_State', 'INV_Inverter_Command_Mode', 'INV_Rolling_Counter', 'INV_Inverter_Enable_State', 'INV_Burst_Model_Mode', 'INV_BMS_Limiting_Regen_Torque', 'INV_Limit_Motor_Temp_Derate', 'INV_Limit_Hot_Spot_Motor', 'INV_Key_Switch_Start_Status', 'INV_Inverter_Enable_Lockout', 'INV_Direction_Command', 'INV_BMS_Active', 'INV_BMS_Limiting_Motor_Torque', 'INV_Limit_Max_Speed', 'INV_Limit_Hot_Spot_Inverter', 'INV_Low_Speed_Limiting', 'INV_Limit_Coolant_Derating', 'INV_Limit_Stall_Burst_Model',), decode_m170_internal_states, encode_m170_internal_states),
+    0x0AB: MessageInfo(0x0AB, 'M171_Fault_Codes', 8, 8, 10, 'INV', ('INV_Post_Fault_Lo', 'INV_Post_Fault_Hi', 'INV_Run_Fault_Lo', 'INV_Run_Fault_Hi',), decode_m171_fault_codes, encode_m171_fault_codes),
+    0x0AC: MessageInfo(0x0AC, 'M172_Torque_And_Timer_Info', 8, 8, 10, 'INV', ('INV_Commanded_Torque', 'INV_Torque_Feedback', 'INV_Power_On_Timer',), decode_m172_torque_and_timer_info, encode_m172_torque_and_timer_info),
+    0x0AD: MessageInfo(0x0AD, 'M173_Modulation_And_Flux_Info', 8, 8, 10, 'INV', ('INV_Modulation_Index', 'INV_Flux_Weakening_Output', 'INV_Id_Command', 'INV_Iq_Command',), decode_m173_modulation_and_flux_info, encode_m173_modulation_and_flux_info),
+    0x0AE: MessageInfo(0x0AE, 'M174_Firmware_Info', 8, 8, 100, 'INV', ('INV_Project_Code_EEP_Ver', 'INV_SW_Version', 'INV_DateCode_MMDD', 'INV_DateCode_YYYY',), decode_m174_firmware_info, encode_m174_firmware_info),
+    0x0AF: MessageInfo(0x0AF, 'M175_Diag_Data_Message', 8, 8, 10, 'INV', ('INV_Diag_Record', 'INV_Diag_Segment', 'INV_Diag_Gamma_Resolver', 'INV_Diag_Cos_Used', 'INV_Diag_Ic', 'INV_Diag_Id_cmd', 'INV_Diag_Vq_Cmd', 'INV_Diag_PWM_Freq', 'INV_Diag_Gamma_Observer', 'INV_Diag_Ia', 'INV_Diag_Vdc', 'INV_Diag_Mod_Index', 'INV_Diag_Vd_Cmd', 'INV_Diag_Run_Faults_Lo', 'INV_Diag_Sin_Used', 'INV_Diag_Ib', 'INV_Diag_Iq_cmd', 'INV_Diag_FW_Output', 'INV_Diag_Vqs_Cmd', 'INV_Diag_Run_Faults_Hi',), decode_m175_diag_data_message, encode_m175_diag_data_message),
+    0x0B0: MessageInfo(0x0B0, 'M176_Fast_Info', 8, 8, 3, 'INV', ('INV_Fast_Torque_Command', 'INV_Fast_Torque_Feedback', 'INV_Fast_Motor_Speed', 'INV_Fast_DC_Bus_Voltage',), decode_m176_fast_info, encode_m176_fast_info),
+    0x0B1: MessageInfo(0x0B1, 'M177_Torque_Capability', 8, 4, 10, 'INV', ('INV_Torque_Capability_Motor', 'INV_Torque_Capability_Regen',), decode_m177_torque_capability, encode_m177_torque_capability),
+    0x0C0: MessageInfo(0x0C0, 'M192_Command_Message', 8, 8, 10, 'VCU', ('VCU_INV_Torque_Command', 'VCU_INV_Speed_Command', 'VCU_INV_Direction_Command', 'VCU_INV_Inverter_Enable', 'VCU_INV_Inverter_Discharge', 'VCU_INV_Speed_Mode_Enable', 'VCU_INV_Rolling_Counter', 'VCU_INV_Torque_Limit_Command',), decode_m192_command_message, encode_m192_command_message),
+    0x0C1: MessageInfo(0x0C1, 'M193_Read_Write_Param_Command', 8, 6, 0, 'VCU', ('VCU_INV_Parameter_Address', 'VCU_INV_Parameter_RW_Command', 'VCU_INV_Parameter_Data',), decode_m193_read_write_param_command, encode_m193_read_write_param_command),
+    0x0C2: MessageInfo(0x0C2, 'M194_Read_Write_Param_Response', 8, 6, 0, 'INV', ('INV_Parameter_Response_Addr', 'INV_Parameter_Response_Write_OK', 'INV_Parameter_Response_Data',), decode_m194_read_write_param_response, encode_m194_read_write_param_response),
+    0x101: MessageInfo(0x101, 'Pedal_Processed', 8, 4, 10, 'MCU', ('APPS_pct', 'Brake_pct', 'StatusBits', 'Counter',), decode_pedal_processed, encode_pedal_processed),
+    0x102: MessageInfo(0x102, 'Heartbeat', 8, 5, 200, 'MCU', ('HB_Uptime', 'HB_FW_Tag',), decode_heartbeat, encode_heartbeat),
+    0x110: MessageInfo(0x110, 'Vehicle_Speed', 4, 3, 20, 'MCU', ('Speed_kph', 'Speed_Counter',), decode_vehicle_speed, encode_vehicle_speed),
+    0x111: MessageInfo(0x111, 'Battery_State', 4, 4, 100, 'MCU', ('Batt_SOC', 'Batt_Pack_Temp', 'Batt_Counter',), decode_battery_state, encode_battery_state),
+    0x112: MessageInfo(0x112, 'Temps_Misc', 4, 4, 100, 'MCU', ('Water_Temp', 'Inverter_Temp', 'Temps_Counter',), decode_temps_misc, encode_temps_misc),
+    0x120: MessageInfo(0x120, 'TC_Command', 8, 2, 0, 'Dashboard', ('TC_Level', 'TC_Magic',), decode_tc_command, encode_tc_command),
+    0x121: MessageInfo(0x121, 'TC_Status', 2, 1, 100, 'MCU', ('TC_Level_Applied',), decode_tc_status, encode_tc_status),
+    0x130: MessageInfo(0x130, 'Temp_Config', 8, 3, 0, 'Dashboard', ('Temp_Thresh_Motor', 'Temp_Thresh_Inverter', 'Temp_Force_Mask',), decode_temp_config, encode_temp_config),
+    0x131: MessageInfo(0x131, 'Temp_Status', 8, 7, 100, 'TEMP', ('Temp_NTC_Motor', 'Temp_NTC_Inverter', 'Temp_Thresh_Motor_Applied', 'Temp_Thresh_Inverter_Applied', 'Temp_Fan_Mask', 'Temp_Fault_Mask', 'Temp_Force_Mask_Applied',), decode_temp_status, encode_temp_status),
+    0x202: MessageInfo(0x202, 'BMS_Current_Limit', 8, 4, 0, 'BMS', ('BMS_Max_Discharge_Current', 'BMS_Max_Charge_Current',), decode_bms_current_limit, encode_bms_current_limit),
+}
+
+SIGNALS = {
+    'INV_Module_A_Temp': SignalInfo('INV_Module_A_Temp', 0x0A0, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 2, sig_inv_module_a_temp),
+    'INV_Module_B_Temp': SignalInfo('INV_Module_B_Temp', 0x0A0, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 4, sig_inv_module_b_temp),
+    'INV_Module_C_Temp': SignalInfo('INV_Module_C_Temp', 0x0A0, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 6, sig_inv_module_c_temp),
+    'INV_Gate_Driver_Board_Temp': SignalInfo('INV_Gate_Driver_Board_Temp', 0x0A0, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 8, sig_inv_gate_driver_board_temp),
+    'INV_Control_Board_Temp': SignalInfo('INV_Control_Board_Temp', 0x0A1, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 2, sig_inv_control_board_temp),
+    'INV_RTD1_Temperature': SignalInfo('INV_RTD1_Temperature', 0x0A1, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 4, sig_inv_rtd1_temperature),
+    'INV_RTD2_Temperature': SignalInfo('INV_RTD2_Temperature', 0x0A1, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 6, sig_inv_rtd2_temperature),
+    'INV_Hot_Spot_Temp_Motor': SignalInfo('INV_Hot_Spot_Temp_Motor', 0x0A1, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 8, sig_inv_hot_spot_temp_motor),
+    'INV_Coolant_Temp': SignalInfo('INV_Coolant_Temp', 0x0A2, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 2, sig_inv_coolant_temp),
+    'INV_Hot_Spot_Temp_Inverter': SignalInfo('INV_Hot_Spot_Temp_Inverter', 0x0A2, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 4, sig_inv_hot_spot_temp_inverter),
+    'INV_Motor_Temp': SignalInfo('INV_Motor_Temp', 0x0A2, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'temperature:C', 6, sig_inv_motor_temp),
+    'INV_Torque_Shudder': SignalInfo('INV_Torque_Shudder', 0x0A2, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 8, sig_inv_torque_shudder),
+    'INV_Analog_Input_1': SignalInfo('INV_Analog_Input_1', 0x0A3, 0, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 2, sig_inv_analog_input_1),
+    'INV_Analog_Input_2': SignalInfo('INV_Analog_Input_2', 0x0A3, 10, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 3, sig_inv_analog_input_2),
+    'INV_Analog_Input_3': SignalInfo('INV_Analog_Input_3', 0x0A3, 20, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 4, sig_inv_analog_input_3),
+    'INV_Analog_Input_4': SignalInfo('INV_Analog_Input_4', 0x0A3, 32, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 6, sig_inv_analog_input_4),
+    'INV_Analog_Input_5': SignalInfo('INV_Analog_Input_5', 0x0A3, 42, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 7, sig_inv_analog_input_5),
+    'INV_Analog_Input_6': SignalInfo('INV_Analog_Input_6', 0x0A3, 52, 10, False, 0.01, 0, 0, 10.23, 'voltage:V', 8, sig_inv_analog_input_6),
+    'INV_Digital_Input_1': SignalInfo('INV_Digital_Input_1', 0x0A4, 0, 1, False, 1, 0, 0, 1, '', 1, sig_inv_digital_input_1),
+    'INV_Digital_Input_2': SignalInfo('INV_Digital_Input_2', 0x0A4, 8, 1, False, 1, 0, 0, 1, '', 2, sig_inv_digital_input_2),
+    'INV_Digital_Input_3': SignalInfo('INV_Digital_Input_3', 0x0A4, 16, 1, False, 1, 0, 0, 1, '', 3, sig_inv_digital_input_3),
+    'INV_Digital_Input_4': SignalInfo('INV_Digital_Input_4', 0x0A4, 24, 1, False, 1, 0, 0, 1, '', 4, sig_inv_digital_input_4),
+    'INV_Digital_Input_5': SignalInfo('INV_Digital_Input_5', 0x0A4, 32, 1, False, 1, 0, 0, 1, '', 5, sig_inv_digital_input_5),
+    'INV_Digital_Input_6': SignalInfo('INV_Digital_Input_6', 0x0A4, 40, 1, False, 1, 0, 0, 1, '', 6, sig_inv_digital_input_6),
+    'INV_Digital_Input_7': SignalInfo('INV_Digital_Input_7', 0x0A4, 48, 1, False, 1, 0, 0, 1, '', 7, sig_inv_digital_input_7),
+    'INV_Digital_Input_8': SignalInfo('INV_Digital_Input_8', 0x0A4, 56, 1, False, 1, 0, 0, 1, '', 8, sig_inv_digital_input_8),
+    'INV_Motor_Angle_Electrical': SignalInfo('INV_Motor_Angle_Electrical', 0x0A5, 0, 16, False, 0.1, 0, 0, 6553.5, 'angle:deg', 2, sig_inv_motor_angle_electrical),
+    'INV_Motor_Speed': SignalInfo('INV_Motor_Speed', 0x0A5, 16, 16, True, 1, 0, -32768, 32767, 'angular_speed:rpm', 4, sig_inv_motor_speed),
+    'INV_Electrical_Output_Frequency': SignalInfo('INV_Electrical_Output_Frequency', 0x0A5, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'frequency:Hz', 6, sig_inv_electrical_output_frequency),
+    'INV_Delta_Resolver_Filtered': SignalInfo('INV_Delta_Resolver_Filtered', 0x0A5, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'angle:deg', 8, sig_inv_delta_resolver_filtered),
+    'INV_Phase_A_Current': SignalInfo('INV_Phase_A_Current', 0x0A6, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 2, sig_inv_phase_a_current),
+    'INV_Phase_B_Current': SignalInfo('INV_Phase_B_Current', 0x0A6, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 4, sig_inv_phase_b_current),
+    'INV_Phase_C_Current': SignalInfo('INV_Phase_C_Current', 0x0A6, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 6, sig_inv_phase_c_current),
+    'INV_DC_Bus_Current': SignalInfo('INV_DC_Bus_Current', 0x0A6, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 8, sig_inv_dc_bus_current),
+    'INV_DC_Bus_Voltage': SignalInfo('INV_DC_Bus_Voltage', 0x0A7, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'voltage:V', 2, sig_inv_dc_bus_voltage),
+    'INV_Output_Voltage': SignalInfo('INV_Output_Voltage', 0x0A7, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'voltage:V', 4, sig_inv_output_voltage),
+    'INV_VAB_Vd_Voltage': SignalInfo('INV_VAB_Vd_Voltage', 0x0A7, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'voltage:V', 6, sig_inv_vab_vd_voltage),
+    'INV_VBC_Vq_Voltage': SignalInfo('INV_VBC_Vq_Voltage', 0x0A7, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'voltage:V', 8, sig_inv_vbc_vq_voltage),
+    'INV_Vd_ff': SignalInfo('INV_Vd_ff', 0x0A8, 0, 16, True, 0.1, 0, -3276.7, 3276.7, 'voltage:V', 2, sig_inv_vd_ff),
+    'INV_Vq_ff': SignalInfo('INV_Vq_ff', 0x0A8, 16, 16, True, 0.1, 0, -3276.7, 3276.7, 'voltage:V', 4, sig_inv_vq_ff),
+    'INV_Id': SignalInfo('INV_Id', 0x0A8, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 6, sig_inv_id),
+    'INV_Iq': SignalInfo('INV_Iq', 0x0A8, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 8, sig_inv_iq),
+    'INV_Ref_Voltage_1_5': SignalInfo('INV_Ref_Voltage_1_5', 0x0A9, 0, 16, True, 0.01, 0, -327.68, 327.67, 'voltage:V', 2, sig_inv_ref_voltage_1_5),
+    'INV_Ref_Voltage_2_5': SignalInfo('INV_Ref_Voltage_2_5', 0x0A9, 16, 16, True, 0.01, 0, -327.68, 327.67, 'voltage:V', 4, sig_inv_ref_voltage_2_5),
+    'INV_Ref_Voltage_5_0': SignalInfo('INV_Ref_Voltage_5_0', 0x0A9, 32, 16, True, 0.01, 0, -327.68, 327.67, 'voltage:V', 6, sig_inv_ref_voltage_5_0),
+    'INV_Ref_Voltage_12_0': SignalInfo('INV_Ref_Voltage_12_0', 0x0A9, 48, 16, True, 0.01, 0, -327.68, 327.67, 'voltage:V', 8, sig_inv_ref_voltage_12_0),
+    'INV_VSM_State': SignalInfo('INV_VSM_State', 0x0AA, 0, 8, False, 1, 0, 0, 15, '', 1, sig_inv_vsm_state),
+    'INV_PWM_Frequency': SignalInfo('INV_PWM_Frequency', 0x0AA, 8, 8, False, 1, 0, 0, 255, '', 2, sig_inv_pwm_frequency),
+    'INV_Inverter_State': SignalInfo('INV_Inverter_State', 0x0AA, 16, 8, False, 1, 0, 0, 255, '', 3, sig_inv_inverter_state),
+    'INV_Relay_1_Status': SignalInfo('INV_Relay_1_Status', 0x0AA, 24, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_1_status),
+    'INV_Relay_2_Status': SignalInfo('INV_Relay_2_Status', 0x0AA, 25, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_2_status),
+    'INV_Relay_3_Status': SignalInfo('INV_Relay_3_Status', 0x0AA, 26, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_3_status),
+    'INV_Relay_4_Status': SignalInfo('INV_Relay_4_Status', 0x0AA, 27, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_4_status),
+    'INV_Relay_5_Status': SignalInfo('INV_Relay_5_Status', 0x0AA, 28, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_5_status),
+    'INV_Relay_6_Status': SignalInfo('INV_Relay_6_Status', 0x0AA, 29, 1, False, 1, 0, 0, 1, '', 4, sig_inv_relay_6_status),
+    'INV_Inverter_Run_Mode': SignalInfo('INV_Inverter_Run_Mode', 0x0AA, 32, 1, False, 1, 0, 0, 1, '', 5, sig_inv_inverter_run_mode),
+    'INV_Self_Sensing_Assist_Enable': SignalInfo('INV_Self_Sensing_Assist_Enable', 0x0AA, 33, 1, False, 1, 0, 0, 1, '', 5, sig_inv_self_sensing_assist_enable),
+    'INV_ASC_State': SignalInfo('INV_ASC_State', 0x0AA, 34, 3, False, 1, 0, 0, 0, '', 5, sig_inv_asc_state),
+    'INV_Inverter_Discharge_State': SignalInfo('INV_Inverter_Discharge_State', 0x0AA, 37, 3, False, 1, 0, 0, 7, '', 5, sig_inv_inverter_discharge_state),
+    'INV_Inverter_Command_Mode': SignalInfo('INV_Inverter_Command_Mode', 0x0AA, 40, 1, False, 1, 0, 0, 1, '', 6, sig_inv_inverter_command_mode),
+    'INV_Rolling_Counter': SignalInfo('INV_Rolling_Counter', 0x0AA, 44, 4, False, 1, 0, 0, 15, '', 6, sig_inv_rolling_counter),
+    'INV_Inverter_Enable_State': SignalInfo('INV_Inverter_Enable_State', 0x0AA, 48, 1, False, 1, 0, 0, 1, '', 7, sig_inv_inverter_enable_state),
+    'INV_Burst_Model_Mode': SignalInfo('INV_Burst_Model_Mode', 0x0AA, 49, 1, False, 1, 0, 0, 1, '', 7, sig_inv_burst_model_mode),
+    'INV_BMS_Limiting_Regen_Torque': SignalInfo('INV_BMS_Limiting_Regen_Torque', 0x0AA, 50, 1, False, 1, 0, 0, 0, '', 7, sig_inv_bms_limiting_regen_torque),
+    'INV_Limit_Motor_Temp_Derate': SignalInfo('INV_Limit_Motor_Temp_Derate', 0x0AA, 52, 1, False, 1, 0, 0, 0, '', 7, sig_inv_limit_motor_temp_derate),
+    'INV_Limit_Hot_Spot_Motor': SignalInfo('INV_Limit_Hot_Spot_Motor', 0x0AA, 53, 1, False, 1, 0, 0, 0, '', 7, sig_inv_limit_hot_spot_motor),
+    'INV_Key_Switch_Start_Status': SignalInfo('INV_Key_Switch_Start_Status', 0x0AA, 54, 1, False, 1, 0, 0, 1, '', 7, sig_inv_key_switch_start_status),
+    'INV_Inverter_Enable_Lockout': SignalInfo('INV_Inverter_Enable_Lockout', 0x0AA, 55, 1, False, 1, 0, 0, 1, '', 7, sig_inv_inverter_enable_lockout),
+    'INV_Direction_Command': SignalInfo('INV_Direction_Command', 0x0AA, 56, 1, False, 1, 0, 0, 1, '', 8, sig_inv_direction_command),
+    'INV_BMS_Active': SignalInfo('INV_BMS_Active', 0x0AA, 57, 1, False, 1, 0, 0, 1, '', 8, sig_inv_bms_active),
+    'INV_BMS_Limiting_Motor_Torque': SignalInfo('INV_BMS_Limiting_Motor_Torque', 0x0AA, 58, 1, False, 1, 0, 0, 1, '', 8, sig_inv_bms_limiting_motor_torque),
+    'INV_Limit_Max_Speed': SignalInfo('INV_Limit_Max_Speed', 0x0AA, 59, 1, False, 1, 0, 0, 1, '', 8, sig_inv_limit_max_speed),
+    'INV_Limit_Hot_Spot_Inverter': SignalInfo('INV_Limit_Hot_Spot_Inverter', 0x0AA, 60, 1, False, 1, 0, 0, 1, '', 8, sig_inv_limit_hot_spot_inverter),
+    'INV_Low_Speed_Limiting': SignalInfo('INV_Low_Speed_Limiting', 0x0AA, 61, 1, False, 1, 0, 0, 1, '', 8, sig_inv_low_speed_limiting),
+    'INV_Limit_Coolant_Derating': SignalInfo('INV_Limit_Coolant_Derating', 0x0AA, 62, 1, False, 1, 0, 0, 1, '', 8, sig_inv_limit_coolant_derating),
+    'INV_Limit_Stall_Burst_Model': SignalInfo('INV_Limit_Stall_Burst_Model', 0x0AA, 63, 1, False, 1, 0, 0, 1, '', 8, sig_inv_limit_stall_burst_model),
+    'INV_Post_Fault_Lo': SignalInfo('INV_Post_Fault_Lo', 0x0AB, 0, 16, False, 1, 0, 0, 65535, '', 2, sig_inv_post_fault_lo),
+    'INV_Post_Fault_Hi': SignalInfo('INV_Post_Fault_Hi', 0x0AB, 16, 16, False, 1, 0, 0, 65535, '', 4, sig_inv_post_fault_hi),
+    'INV_Run_Fault_Lo': SignalInfo('INV_Run_Fault_Lo', 0x0AB, 32, 16, False, 1, 0, 0, 65535, '', 6, sig_inv_run_fault_lo),
+    'INV_Run_Fault_Hi': SignalInfo('INV_Run_Fault_Hi', 0x0AB, 48, 16, False, 1, 0, 0, 65535, '', 8, sig_inv_run_fault_hi),
+    'INV_Commanded_Torque': SignalInfo('INV_Commanded_Torque', 0x0AC, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 2, sig_inv_commanded_torque),
+    'INV_Torque_Feedback': SignalInfo('INV_Torque_Feedback', 0x0AC, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 4, sig_inv_torque_feedback),
+    'INV_Power_On_Timer': SignalInfo('INV_Power_On_Timer', 0x0AC, 32, 32, False, 0.003, 0, 0, 12884800, 'time:second', 8, sig_inv_power_on_timer),
+    'INV_Modulation_Index': SignalInfo('INV_Modulation_Index', 0x0AD, 0, 16, True, 0.0001, 0, -3.2768, 3.2767, '', 2, sig_inv_modulation_index),
+    'INV_Flux_Weakening_Output': SignalInfo('INV_Flux_Weakening_Output', 0x0AD, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 4, sig_inv_flux_weakening_output),
+    'INV_Id_Command': SignalInfo('INV_Id_Command', 0x0AD, 32, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 6, sig_inv_id_command),
+    'INV_Iq_Command': SignalInfo('INV_Iq_Command', 0x0AD, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'current:A', 8, sig_inv_iq_command),
+    'INV_Project_Code_EEP_Ver': SignalInfo('INV_Project_Code_EEP_Ver', 0x0AE, 0, 16, False, 1, 0, 0, 65535, '', 2, sig_inv_project_code_eep_ver),
+    'INV_SW_Version': SignalInfo('INV_SW_Version', 0x0AE, 16, 16, False, 1, 0, 0, 65535, '', 4, sig_inv_sw_version),
+    'INV_DateCode_MMDD': SignalInfo('INV_DateCode_MMDD', 0x0AE, 32, 16, False, 1, 0, 0, 65535, '', 6, sig_inv_datecode_mmdd),
+    'INV_DateCode_YYYY': SignalInfo('INV_DateCode_YYYY', 0x0AE, 48, 16, False, 1, 0, 0, 65535, '', 8, sig_inv_datecode_yyyy),
+    'INV_Diag_Record': SignalInfo('INV_Diag_Record', 0x0AF, 0, 8, False, 1, 0, 0, 160, '', 1, sig_inv_diag_record),
+    'INV_Diag_Segment': SignalInfo('INV_Diag_Segment', 0x0AF, 8, 8, False, 1, 0, 0, 5, '', 2, sig_inv_diag_segment),
+    'INV_Diag_Gamma_Resolver': SignalInfo('INV_Diag_Gamma_Resolver', 0x0AF, 16, 16, True, 0.1, 0, 0, 360, 'angle:deg', 4, sig_inv_diag_gamma_resolver),
+    'INV_Diag_Cos_Used': SignalInfo('INV_Diag_Cos_Used', 0x0AF, 16, 16, True, 1, 0, -5, 5, 'voltage:V', 4, sig_inv_diag_cos_used),
+    'INV_Diag_Ic': SignalInfo('INV_Diag_Ic', 0x0AF, 16, 16, True, 0.1, 0, -2000, 2000, 'current:A', 4, sig_inv_diag_ic),
+    'INV_Diag_Id_cmd': SignalInfo('INV_Diag_Id_cmd', 0x0AF, 16, 16, True, 0.1, 0, -2000, 2000, 'current:A', 4, sig_inv_diag_id_cmd),
+    'INV_Diag_Vq_Cmd': SignalInfo('INV_Diag_Vq_Cmd', 0x0AF, 16, 16, True, 0.1, 0, -1000, 1000, 'voltage:V', 4, sig_inv_diag_vq_cmd),
+    'INV_Diag_PWM_Freq': SignalInfo('INV_Diag_PWM_Freq', 0x0AF, 16, 16, False, 1, 0, 0, 24, 'frequency:kHz', 4, sig_inv_diag_pwm_freq),
+    'INV_Diag_Gamma_Observer': SignalInfo('INV_Diag_Gamma_Observer', 0x0AF, 32, 16, True, 0.1, 0, 0, 360, 'angle:deg', 6, sig_inv_diag_gamma_observer),
+    'INV_Diag_Ia': SignalInfo('INV_Diag_Ia', 0x0AF, 32, 16, True, 0.1, 0, -2000, 2000, 'current:A', 6, sig_inv_diag_ia),
+    'INV_Diag_Vdc': SignalInfo('INV_Diag_Vdc', 0x0AF, 32, 16, True, 0.1, 0, 0, 1000, 'voltage:V', 6, sig_inv_diag_vdc),
+    'INV_Diag_Mod_Index': SignalInfo('INV_Diag_Mod_Index', 0x0AF, 32, 16, True, 0.0001, 0, 0, 2, '', 6, sig_inv_diag_mod_index),
+    'INV_Diag_Vd_Cmd': SignalInfo('INV_Diag_Vd_Cmd', 0x0AF, 32, 16, True, 0.1, 0, -1000, 1000, 'voltage:V', 6, sig_inv_diag_vd_cmd),
+    'INV_Diag_Run_Faults_Lo': SignalInfo('INV_Diag_Run_Faults_Lo', 0x0AF, 32, 16, False, 1, 0, 0, 65535, '', 6, sig_inv_diag_run_faults_lo),
+    'INV_Diag_Sin_Used': SignalInfo('INV_Diag_Sin_Used', 0x0AF, 48, 16, True, 1, 0, -5, 5, 'voltage:V', 8, sig_inv_diag_sin_used),
+    'INV_Diag_Ib': SignalInfo('INV_Diag_Ib', 0x0AF, 48, 16, True, 0.1, 0, -2000, 2000, 'current:A', 8, sig_inv_diag_ib),
+    'INV_Diag_Iq_cmd': SignalInfo('INV_Diag_Iq_cmd', 0x0AF, 48, 16, True, 0.1, 0, -2000, 2000, 'current:A', 8, sig_inv_diag_iq_cmd),
+    'INV_Diag_FW_Output': SignalInfo('INV_Diag_FW_Output', 0x0AF, 48, 16, True, 0.1, 0, -2000, 2000, 'current:A', 8, sig_inv_diag_fw_output),
+    'INV_Diag_Vqs_Cmd': SignalInfo('INV_Diag_Vqs_Cmd', 0x0AF, 48, 16, True, 0.1, 0, -1000, 1000, 'voltage:V', 8, sig_inv_diag_vqs_cmd),
+    'INV_Diag_Run_Faults_Hi': SignalInfo('INV_Diag_Run_Faults_Hi', 0x0AF, 48, 16, False, 1, 0, 0, 65535, '', 8, sig_inv_diag_run_faults_hi),
+    'INV_Fast_Torque_Command': SignalInfo('INV_Fast_Torque_Command', 0x0B0, 0, 16, True, 0.1, 0, -3276.8, 32767.7, 'torque:N.m', 2, sig_inv_fast_torque_command),
+    'INV_Fast_Torque_Feedback': SignalInfo('INV_Fast_Torque_Feedback', 0x0B0, 16, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 4, sig_inv_fast_torque_feedback),
+    'INV_Fast_Motor_Speed': SignalInfo('INV_Fast_Motor_Speed', 0x0B0, 32, 16, True, 1, 0, -32768, 32767, 'angular_speed:rpm', 6, sig_inv_fast_motor_speed),
+    'INV_Fast_DC_Bus_Voltage': SignalInfo('INV_Fast_DC_Bus_Voltage', 0x0B0, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'voltage:V', 8, sig_inv_fast_dc_bus_voltage),
+    'INV_Torque_Capability_Motor': SignalInfo('INV_Torque_Capability_Motor', 0x0B1, 0, 16, True, 0.1, 0, 0, 3276.7, 'torque:N.m', 2, sig_inv_torque_capability_motor),
+    'INV_Torque_Capability_Regen': SignalInfo('INV_Torque_Capability_Regen', 0x0B1, 16, 16, True, 0.1, 0, -3276.8, 0, 'torque:N.m', 4, sig_inv_torque_capability_regen),
+    'VCU_INV_Torque_Command': SignalInfo('VCU_INV_Torque_Command', 0x0C0, 0, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 2, sig_vcu_inv_torque_command),
+    'VCU_INV_Speed_Command': SignalInfo('VCU_INV_Speed_Command', 0x0C0, 16, 16, True, 1, 0, -32768, 32767, 'angular_speed:rpm', 4, sig_vcu_inv_speed_command),
+    'VCU_INV_Direction_Command': SignalInfo('VCU_INV_Direction_Command', 0x0C0, 32, 1, False, 1, 0, 0, 1, '', 5, sig_vcu_inv_direction_command),
+    'VCU_INV_Inverter_Enable': SignalInfo('VCU_INV_Inverter_Enable', 0x0C0, 40, 1, False, 1, 0, 0, 1, '', 6, sig_vcu_inv_inverter_enable),
+    'VCU_INV_Inverter_Discharge': SignalInfo('VCU_INV_Inverter_Discharge', 0x0C0, 41, 1, False, 1, 0, 0, 1, '', 6, sig_vcu_inv_inverter_discharge),
+    'VCU_INV_Speed_Mode_Enable': SignalInfo('VCU_INV_Speed_Mode_Enable', 0x0C0, 42, 1, False, 1, 0, 0, 1, '', 6, sig_vcu_inv_speed_mode_enable),
+    'VCU_INV_Rolling_Counter': SignalInfo('VCU_INV_Rolling_Counter', 0x0C0, 44, 4, False, 1, 0, 0, 15, '', 6, sig_vcu_inv_rolling_counter),
+    'VCU_INV_Torque_Limit_Command': SignalInfo('VCU_INV_Torque_Limit_Command', 0x0C0, 48, 16, True, 0.1, 0, -3276.8, 3276.7, 'torque:N.m', 8, sig_vcu_inv_torque_limit_command),
+    'VCU_INV_Parameter_Address': SignalInfo('VCU_INV_Parameter_Address', 0x0C1, 0, 16, False, 1, 0, 0, 65535, '', 2, sig_vcu_inv_parameter_address),
+    'VCU_INV_Parameter_RW_Command': SignalInfo('VCU_INV_Parameter_RW_Command', 0x0C1, 16, 1, False, 1, 0, 0, 1, '', 3, sig_vcu_inv_parameter_rw_command),
+    'VCU_INV_Parameter_Data': SignalInfo('VCU_INV_Parameter_Data', 0x0C1, 32, 16, True, 1, 0, -32768, 32767, '', 6, sig_vcu_inv_parameter_data),
+    'INV_Parameter_Response_Addr': SignalInfo('INV_Parameter_Response_Addr', 0x0C2, 0, 16, False, 1, 0, 0, 65535, '', 2, sig_inv_parameter_response_addr),
+    'INV_Parameter_Response_Write_OK': SignalInfo('INV_Parameter_Response_Write_OK', 0x0C2, 16, 1, False, 1, 0, 0, 1, '', 3, sig_inv_parameter_response_write_ok),
+    'INV_Parameter_Response_Data': SignalInfo('INV_Parameter_Response_Data', 0x0C2, 32, 16, True, 1, 0, -32768, 32767, '', 6, sig_inv_parameter_response_data),
+    'APPS_pct': SignalInfo('APPS_pct', 0x101, 0, 8, False, 0.39215686274509803, 0, 0, 100, '%', 1, sig_apps_pct),
+    'Brake_pct': SignalInfo('Brake_pct', 0x101, 8, 8, False, 0.39215686274509803, 0, 0, 100, '%', 2, sig_brake_pct),
+    'StatusBits': SignalInfo('StatusBits', 0x101, 16, 8, False, 1, 0, 0, 255, '', 3, sig_statusbits),
+    'Counter': SignalInfo('Counter', 0x101, 24, 4, False, 1, 0, 0, 15, '', 4, sig_counter),
+    'HB_Uptime': SignalInfo('HB_Uptime', 0x102, 0, 32, False, 1, 0, 0, 4294967295, 's', 4, sig_hb_uptime),
+    'HB_FW_Tag': SignalInfo('HB_FW_Tag', 0x102, 32, 8, False, 1, 0, 0, 255, '', 5, sig_hb_fw_tag),
+    'Speed_kph': SignalInfo('Speed_kph', 0x110, 0, 8, False, 1, 0, 0, 255, 'km/h', 1, sig_speed_kph),
+    'Speed_Counter': SignalInfo('Speed_Counter', 0x110, 16, 4, False, 1, 0, 0, 15, '', 3, sig_speed_counter),
+    'Batt_SOC': SignalInfo('Batt_SOC', 0x111, 0, 8, False, 1, 0, 0, 100, '%', 1, sig_batt_soc),
+    'Batt_Pack_Temp': SignalInfo('Batt_Pack_Temp', 0x111, 8, 8, False, 1, 0, 0, 255, 'C', 2, sig_batt_pack_temp),
+    'Batt_Counter': SignalInfo('Batt_Counter', 0x111, 24, 4, False, 1, 0, 0, 15, '', 4, sig_batt_counter),
+    'Water_Temp': SignalInfo('Water_Temp', 0x112, 0, 8, False, 1, 0, 0, 255, 'C', 1, sig_water_temp),
+    'Inverter_Temp': SignalInfo('Inverter_Temp', 0x112, 8, 8, False, 1, 0, 0, 255, 'C', 2, sig_inverter_temp),
+    'Temps_Counter': SignalInfo('Temps_Counter', 0x112, 24, 4, False, 1, 0, 0, 15, '', 4, sig_temps_counter),
+    'TC_Level': SignalInfo('TC_Level', 0x120, 0, 8, False, 1, 0, 1, 10, '', 1, sig_tc_level),
+    'TC_Magic': SignalInfo('TC_Magic', 0x120, 8, 8, False, 1, 0, 0, 255, '', 2, sig_tc_magic),
+    'TC_Level_Applied': SignalInfo('TC_Level_Applied', 0x121, 0, 8, False, 1, 0, 0, 10, '', 1, sig_tc_level_applied),
+    'Temp_Thresh_Motor': SignalInfo('Temp_Thresh_Motor', 0x130, 0, 8, False, 1, 0, 0, 255, 'C', 1, sig_temp_thresh_motor),
+    'Temp_Thresh_Inverter': SignalInfo('Temp_Thresh_Inverter', 0x130, 8, 8, False, 1, 0, 0, 255, 'C', 2, sig_temp_thresh_inverter),
+    'Temp_Force_Mask': SignalInfo('Temp_Force_Mask', 0x130, 16, 8, False, 1, 0, 0, 3, '', 3, sig_temp_force_mask),
+    'Temp_NTC_Motor': SignalInfo('Temp_NTC_Motor', 0x131, 0, 8, False, 1, -50, -50, 205, 'C', 1, sig_temp_ntc_motor),
+    'Temp_NTC_Inverter': SignalInfo('Temp_NTC_Inverter', 0x131, 8, 8, False, 1, -50, -50, 205, 'C', 2, sig_temp_ntc_inverter),
+    'Temp_Thresh_Motor_Applied': SignalInfo('Temp_Thresh_Motor_Applied', 0x131, 16, 8, False, 1, 0, 0, 255, 'C', 3, sig_temp_thresh_motor_applied),
+    'Temp_Thresh_Inverter_Applied': SignalInfo('Temp_Thresh_Inverter_Applied', 0x131, 24, 8, False, 1, 0, 0, 255, 'C', 4, sig_temp_thresh_inverter_applied),
+    'Temp_Fan_Mask': SignalInfo('Temp_Fan_Mask', 0x131, 32, 8, False, 1, 0, 0, 3, '', 5, sig_temp_fan_mask),
+    'Temp_Fault_Mask': SignalInfo('Temp_Fault_Mask', 0x131, 40, 8, False, 1, 0, 0, 255, '', 6, sig_temp_fault_mask),
+    'Temp_Force_Mask_Applied': SignalInfo('Temp_Force_Mask_Applied', 0x131, 48, 8, False, 1, 0, 0, 3, '', 7, sig_temp_force_mask_applied),
+    'BMS_Max_Discharge_Current': SignalInfo('BMS_Max_Discharge_Current', 0x202, 0, 16, False, 1, 0, 0, 1000, 'current:A', 2, sig_bms_max_discharge_current),
+    'BMS_Max_Charge_Current': SignalInfo('BMS_Max_Charge_Current', 0x202, 16, 16, False, 1, 0, 0, 1000, 'current:A', 4, sig_bms_max_charge_current),
+}
+
+CHOICES = {
+    'INV_VSM_State': {0: 'VSM Start State', 1: 'Pre-Charge Init state', 2: 'pre-charge active state', 3: 'pre-charge complete state', 4: 'VSM wait state', 5: 'VSM ready state', 6: 'Motor Running State', 7: 'blink fault code state', 14: 'Shutdown state for Key Switch Mode 1', 15: 'Reset the inverter'},
+    'INV_Inverter_State': {0: 'Power up', 1: 'Stop', 2: 'Open Loop', 3: 'Closed Loop', 4: 'Internal State', 5: 'Internal State', 6: 'Internal State', 7: 'Internal State', 8: 'Idle Run', 9: 'Idle Stop', 10: 'Internal State', 11: 'Intern State', 12: 'Internal State'},
+    'INV_ASC_State': {0: 'ASC_Disabled', 1: 'ASC_Enabled', 2: 'ASC_Pending', 3: 'ASC_Delay', 4: 'ASC_Active', 5: 'ASC_Complete', 6: 'ASC_Blocked', 7: 'ASC_Suppressed'},
+    'INV_Inverter_Discharge_State': {0: 'Disabled', 1: 'Enabled', 2: 'Speed Check', 3: 'Active', 4: 'Complete', 5: 'Error', 6: 'Override', 7: 'Timeout'},
+    'INV_Burst_Model_Mode': {0: 'Stall', 1: 'High Speed'},
+    'INV_Limit_Stall_Burst_Model': {0: 'Not Limiting', 1: 'Limiting'},
+    'VCU_INV_Direction_Command': {0: 'CW', 1: 'CCW'},
+    'VCU_INV_Inverter_Enable': {0: 'Turn the inverter OFF', 1: 'Turn the Inverter ON'},
+    'VCU_INV_Inverter_Discharge': {0: 'Discharge Disable', 1: 'Discharge Enable (if EEPROM parameter is set)'},
+}
+
+
+def decode(frame_id: int, data) -> dict:
+    """Generic dict decode (diagnostics, offline tools); skips inactive mux pages."""
+    m = MESSAGES[frame_id]
+    return {k: v for k, v in zip(m.fields, m.decode(data)) if v is not None}
@@ -0,0 +1,87 @@
+"""
+can_ids.py
+CAN ID allocation table — every frame the dashboard sends or receives.
+
+One row per ID. Importing this module fails if two rows (or a row and a
+reserved block) claim the same ID, so a new frame cannot quietly reuse an
+existing one — 0x120 used to be both the TC command and the temperature
+controller status. Names are the DBC message names;
+`python tools/gen_can_codec.py --check` verifies them against dbc/.
+
+Request/confirm pairs sit next to each other: a config frame at N, the
+status frame that echoes what was applied at N + 1.
+"""
+
+from typing import NamedTuple
+
+
+class Alloc(NamedTuple):
+    frame_id: int
+    name: str  # DBC message name
+    sender: str
+    note: str
+
+
+# ── Allocations ───────────────────────────────────────────────────────────
+PEDAL_PROCESSED = 0x101
+HEARTBEAT = 0x102
+VEHICLE_SPEED = 0x110
+BATTERY_STATE = 0x111
+TEMPS_MISC = 0x112
+TC_COMMAND = 0x120
+TC_STATUS = 0x121
+TEMP_CONFIG = 0x130
+TEMP_STATUS = 0x131
+BMS_CURRENT_LIMIT = 0x202
+
+INV_TEMPERATURE_2 = 0xA1  # M161, hot spot motor
+INV_TEMPERATURE_3 = 0xA2  # M162, hot spot inverter
+INV_PARAM_COMMAND = 0xC1  # M193, read/write EEPROM parameter
+INV_PARAM_RESPONSE = 0xC2  # M194
+
+TABLE = (
+    Alloc(PEDAL_PROCESSED, "Pedal_Processed", "MCU", "APPS/brake + plausibility bits"),
+    Alloc(HEARTBEAT, "Heartbeat", "MCU", "uptime + firmware tag"),
+    Alloc(VEHICLE_SPEED, "Vehicle_Speed", "MCU", ""),
+    Alloc(BATTERY_STATE, "Battery_State", "MCU", ""),
+    Alloc(TEMPS_MISC, "Temps_Misc", "MCU", ""),
+    Alloc(TC_COMMAND, "TC_Command", "Dashboard", "TC level request"),
+    Alloc(TC_STATUS, "TC_Status", "MCU", "echoes the applied TC level"),
+    Alloc(TEMP_CONFIG, "Temp_Config", "Dashboard", "fan thresholds + force mask"),
+    Alloc(TEMP_STATUS, "Temp_Status", "TEMP", "NTC temps, fans, faults, applied config"),
+    Alloc(BMS_CURRENT_LIMIT, "BMS_Current_Limit", "BMS", ""),
+)
+
+# Blocks owned by a third-party DBC; individual IDs are not listed above.
+RESERVED = (
+    (0x0A0, 0x0B1, "Cascadia broadcast M160–M177"),
+    (0x0C0, 0x0C2, "Cascadia command / parameter M192–M194"),
+)
+
+
+def owner(frame_id: int) -> str | None:
+    """Name of the allocation (or reserved block) that owns `frame_id`."""
+    for a in TABLE:
+        if a.frame_id == frame_id:
+            return a.name
+    for lo, hi, what in RESERVED:
+        if lo <= frame_id <= hi:
+            return what
+    return None
+
+
+def _check() -> None:
+    seen: dict[int, str] = {}
+    for a in TABLE:
+        if a.frame_id in seen:
+            raise ValueError(
+                f"CAN ID 0x{a.frame_id:03X} allocated twice: "
+                f"{seen[a.frame_id]} and {a.name}"
+            )
+        seen[a.frame_id] = a.name
+        for lo, hi, what in RESERVED:
+            if lo <= a.frame_id <= hi:
+                raise ValueError(f"{a.name} 0x{a.frame_id:03X} is inside {what}")
+
+
+_check()
@@ -0,0 +1,207 @@
+"""
+can_index.py
+Time / ID index for recorded CAN logs, stored next to the log as
+<log>.idx.npz.
+
+A log is cut into blocks of about BLOCK_RECORDS records (binary .nfscan)
+or BLOCK_BYTES bytes (candump -l, on line starts). For each block the index
+keeps its offset (record index or byte offset), its first and last
+timestamp, and the frame IDs in it. IDs are stored as posting lists, one
+sorted array of block numbers per ID. A query returns the offset ranges
+that can hold matching frames, so readers seek straight to them. Filtering
+inside those ranges is still the reader's job.
+
+    idx = can_index.load("run.nfscan")          # rebuilt + saved if missing/stale
+    for a, b in idx.ranges(t0=t - 5, t1=t, ids={0x101}):
+        recs = can_log.open_log("run.nfscan")[a:b]
+
+can_log.Writer builds the index while recording and saves it on close. A
+log cut short by a crash gets its index rebuilt on the first load(). The
+rebuild is one streaming pass with constant memory.
+"""
+
+import mmap
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+import can_log
+
+BLOCK_RECORDS = 4096
+BLOCK_BYTES = 256 * 1024
+SUFFIX = ".idx.npz"
+VERSION = 1
+
+
+class Index(NamedTuple):
+    kind: str  # "binary" | "candump"
+    size: int  # log size the index was built from (staleness check)
+    start: np.ndarray  # block -> first offset (records or bytes); + end sentinel
+    t0: np.ndarray  # block -> first timestamp
+    t1: np.ndarray  # block -> last timestamp
+    ids: np.ndarray  # sorted frame IDs seen
+    post_ptr: np.ndarray  # ids[i]'s blocks are post[post_ptr[i]:post_ptr[i + 1]]
+    post: np.ndarray  # concatenated block numbers
+    counts: np.ndarray  # frames per ID
+
+    @property
+    def blocks(self) -> int:
+        return len(self.t0)
+
+    def blocks_for(self, t0: float | None = None, t1: float | None = None,
+                   ids=None) -> np.ndarray:
+        """Sorted block numbers that may hold frames in [t0, t1] with an ID in `ids`."""
+        # Block time ranges are compared, not binary-searched: a log merged
+        # from several interfaces is only roughly time-ordered.
+        keep = np.ones(self.blocks, bool)
+        if t0 is not None:
+            keep &= self.t1 >= t0
+        if t1 is not None:
+            keep &= self.t0 <= t1
+        if ids is not None:
+            hit = np.zeros(self.blocks, bool)
+            for fid in ids:
+                i = int(np.searchsorted(self.ids, fid))
+                if i < len(self.ids) and self.ids[i] == fid:
+                    hit[self.post[self.post_ptr[i]:self.post_ptr[i + 1]]] = True
+            keep &= hit
+        return np.flatnonzero(keep)
+
+    def ranges(self, t0: float | None = None, t1: float | None = None,
+               ids=None) -> list[tuple[int, int]]:
+        """Offset ranges [a, b) to read, adjacent blocks merged."""
+        out: list[tuple[int, int]] = []
+        for b in self.blocks_for(t0, t1, ids).tolist():
+            a, e = int(self.start[b]), int(self.start[b + 1])
+            if out and out[-1][1] == a:
+                out[-1] = (out[-1][0], e)
+            else:
+                out.append((a, e))
+        return out
+
+    def save(self, log_path: str) -> str:
+        path = log_path + SUFFIX
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, version=VERSION, kind=self.kind, size=self.size,
+                 start=self.start, t0=self.t0, t1=self.t1, ids=self.ids,
+                 post_ptr=self.post_ptr, post=self.post, counts=self.counts)
+        os.replace(tmp, path)
+        return path
+
+
+class IndexBuilder:
+    """Streaming: add() consecutive runs of frames, finish() once."""
+
+    def __init__(self, kind: str, block: int):
+        self.kind = kind
+        self.block = block
+        self._start: list[int] = []
+        self._t0: list[float] = []
+        self._t1: list[float] = []
+        self._post: dict[int, list[int]] = {}
+        self._counts: dict[int, int] = {}
+        self._cur = None  # [start, end, t0, t1, {ids}]
+        self._end = 0
+
+    def add(self, start: int, stop: int, t: np.ndarray, ids: np.ndarray) -> None:
+        if len(t) == 0:
+            return
+        c = self._cur
+        lo, hi = float(t.min()), float(t.max())
+        if c is None:
+            c = self._cur = [start, stop, lo, hi, set()]
+        c[1] = stop
+        c[2] = min(c[2], lo)
+        c[3] = max(c[3], hi)
+        u, n = np.unique(ids, return_counts=True)
+        c[4].update(u.tolist())
+        for fid, k in zip(u.tolist(), n.tolist()):
+            self._counts[fid] = self._counts.get(fid, 0) + k
+        if stop - c[0] >= self.block:
+            self._close()
+
+    def _close(self) -> None:
+        c, self._cur = self._cur, None
+        if c is None:
+            return
+        b = len(self._start)
+        self._start.append(c[0])
+        self._t0.append(c[2])
+        self._t1.append(c[3])
+        for fid in c[4]:
+            self._post.setdefault(fid, []).append(b)
+        self._end = c[1]
+
+    def finish(self, size: int) -> Index:
+        self._close()
+        ids = np.array(sorted(self._post), np.uint32)
+        lists = [self._post[int(i)] for i in ids]
+        ptr = np.zeros(len(ids) + 1, np.int64)
+        ptr[1:] = np.cumsum([len(p) for p in lists])
+        return Index(
+            self.kind, size,
+            np.array(self._start + [self._end], np.int64),
+            np.array(self._t0, np.float64), np.array(self._t1, np.float64),
+            ids, ptr,
+            np.array([b for p in lists for b in p], np.uint32),
+            np.array([self._counts[int(i)] for i in ids], np.int64),
+        )
+
+
+def _scan_candump(m, a: int, b: int) -> tuple[np.ndarray, np.ndarray]:
+    """Timestamps and IDs of the lines in m[a:b] (the rest is not parsed)."""
+    ts, ids = [], []
+    for line in m[a:b].splitlines():
+        try:
+            stamp, _, frame = line.split(b" ", 2)
+            ts.append(float(stamp[1:-1]))
+            ids.append(int(frame[:frame.index(b"#")], 16))
+        except ValueError:
+            continue
+    return np.asarray(ts, np.float64), np.asarray(ids, np.uint32)
+
+
+def build(path: str) -> Index:
+    """One streaming pass over the log."""
+    size = os.path.getsize(path)
+    if can_log.is_binary(path):
+        recs = can_log.open_log(path)
+        bld = IndexBuilder("binary", BLOCK_RECORDS)
+        for a in range(0, len(recs), BLOCK_RECORDS):
+            r = recs[a:a + BLOCK_RECORDS]
+            bld.add(a, a + len(r), r["t"], r["id"])
+        return bld.finish(size)
+    bld = IndexBuilder("candump", BLOCK_BYTES)
+    if size == 0:
+        return bld.finish(size)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        a = 0
+        while a < size:
+            nl = m.find(b"\n", min(a + BLOCK_BYTES, size) - 1)
+            b = size if nl < 0 else nl + 1
+            t, ids = _scan_candump(m, a, b)
+            bld.add(a, b, t, ids)
+            a = b
+    return bld.finish(size)
+
+
+def load(path: str, rebuild: bool = True) -> Index | None:
+    """The saved index if it matches the log, else (rebuild=True) a fresh
+    one, saved for next time."""
+    ipath = path + SUFFIX
+    try:
+        z = np.load(ipath)
+        if int(z["version"]) == VERSION and int(z["size"]) == os.path.getsize(path):
+            return Index(str(z["kind"]), int(z["size"]), z["start"], z["t0"], z["t1"],
+                         z["ids"], z["post_ptr"], z["post"], z["counts"])
+    except (OSError, KeyError, ValueError):
+        pass
+    if not rebuild:
+        return None
+    idx = build(path)
+    try:
+        idx.save(path)
+    except OSError as e:
+        print(f"[INDEX] could not save {ipath}: {e}")
+    return idx
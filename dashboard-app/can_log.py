@@ -0,0 +1,187 @@
+"""
+can_log.py
+Binary CAN log: fixed-size records that NumPy can memory-map directly.
+
+    header  16 bytes   b"NFSCAN01", record size (u32 LE), reserved (u32)
+    record  24 bytes   t (f8, s since the epoch), id (u4), dlc (u1),
+                       flags (u1: 1 extended, 2 error, 4 remote), pad (u2),
+                       data (8 × u1, zero-padded)
+
+A record never straddles a write, so a log cut off by a power loss is
+still valid up to the last whole record. Readers slice records directly:
+
+    recs = can_log.open_log("2025-06-01_1203.nfscan")   # np.memmap, no copy
+    pedal = recs[recs["id"] == 0x101]
+
+The dashboard records every received frame when DASH_CAN_LOG names a
+directory (see can_rx.py). write() only fills a block of FLUSH_RECORDS
+records in memory. Full blocks go to a writer thread, as in columnar.py,
+so the RX thread never waits on the SD card. The writer thread writes each
+block with one write() call and feeds the time / ID index (can_index.py).
+The index is saved next to the log on close(). If the writer falls
+QUEUE_BLOCKS behind, blocks are dropped and counted. A write error, such as
+a full card, stops the recording: `error` is set and later frames are
+ignored. Decoding carries on.
+"""
+
+import os
+import queue
+import threading
+import time
+
+import can
+import numpy as np
+
+import can_index
+
+MAGIC = b"NFSCAN01"
+HEADER_SIZE = 16
+RECORD = np.dtype([
+    ("t", "<f8"),
+    ("id", "<u4"),
+    ("dlc", "u1"),
+    ("flags", "u1"),
+    ("pad", "<u2"),
+    ("data", "u1", (8,)),
+])
+SUFFIX = ".nfscan"
+FLUSH_RECORDS = 512
+QUEUE_BLOCKS = 64  # 32k frames, ~8 s of a busy bus
+
+F_EXTENDED = 1
+F_ERROR = 2
+F_REMOTE = 4
+
+
+def header() -> bytes:
+    return MAGIC + RECORD.itemsize.to_bytes(4, "little") + bytes(4)
+
+
+def is_binary(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def open_log(path: str) -> np.ndarray:
+    """Memory-map a log's records (read-only). Empty array if no records."""
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE)
+    if head[:8] != MAGIC or int.from_bytes(head[8:12], "little") != RECORD.itemsize:
+        raise ValueError(f"{path}: not an {MAGIC.decode()} log")
+    n = (os.path.getsize(path) - HEADER_SIZE) // RECORD.itemsize
+    if n == 0:
+        return np.zeros(0, RECORD)
+    return np.memmap(path, dtype=RECORD, mode="r", offset=HEADER_SIZE, shape=(n,))
+
+
+def parse_candump(buf) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """'(1700000000.123456) can0 101#0A1B2C' lines -> t, id, dlc, N×8 data."""
+    ts, ids, dlcs, rows = [], [], [], []
+    for line in bytes(buf).splitlines():
+        try:
+            stamp, _, frame = line.split(b" ", 2)
+            fid, _, payload = frame.strip().partition(b"#")
+            if payload[:1] in (b"R", b"#"):  # remote / CAN FD: not on this bus
+                continue
+            data = bytes.fromhex(payload.decode())[:8]
+            ts.append(float(stamp[1:-1]))
+            ids.append(int(fid, 16))
+        except ValueError:
+            continue
+        dlcs.append(len(data))
+        rows.append(data.ljust(8, b"\0"))
+    data = np.frombuffer(b"".join(rows), np.uint8).reshape(-1, 8)
+    return (np.asarray(ts, np.float64), np.asarray(ids, np.uint32),
+            np.asarray(dlcs, np.uint8), data)
+
+
+class Writer:
+    """Append frames to a new log. write() runs on the RX thread, the file
+    I/O on the writer thread; close() once at the end."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "wb")
+        self._f.write(header())
+        self._buf = np.zeros(FLUSH_RECORDS, RECORD)
+        self._n = 0
+        self.records = 0  # written to disk
+        self.dropped = 0  # records lost to a full queue
+        self.error: OSError | None = None
+        self._index = can_index.IndexBuilder("binary", can_index.BLOCK_RECORDS)
+        self._q: queue.Queue = queue.Queue(QUEUE_BLOCKS)
+        self._thread = threading.Thread(target=self._run, name="can-log", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def in_dir(cls, directory: str) -> "Writer":
+        os.makedirs(directory, exist_ok=True)
+        name = time.strftime("%Y-%m-%d_%H%M%S") + SUFFIX
+        return cls(os.path.join(directory, name))
+
+    def write(self, msg: can.Message) -> None:
+        if self.error is not None:
+            return
+        r = self._buf[self._n]
+        r["t"] = msg.timestamp or time.time()
+        r["id"] = msg.arbitration_id
+        dlc = min(len(msg.data), 8)
+        r["dlc"] = dlc
+        r["flags"] = ((F_EXTENDED if msg.is_extended_id else 0)
+                      | (F_ERROR if msg.is_error_frame else 0)
+                      | (F_REMOTE if msg.is_remote_frame else 0))
+        d = r["data"]
+        d[:dlc] = msg.data[:dlc]
+        d[dlc:] = 0
+        self._n += 1
+        if self._n == FLUSH_RECORDS:
+            self._hand(block=False)
+
+    def fail(self, e: Exception) -> None:
+        """Stop recording; the dashboard keeps running."""
+        if self.error is None:
+            self.error = e
+            print(f"[LOG] recording stopped after {self.records} frames: {e}")
+
+    def _hand(self, block: bool) -> None:
+        b = self._buf[: self._n]
+        self._buf = np.zeros(FLUSH_RECORDS, RECORD)
+        self._n = 0
+        try:
+            self._q.put(b, block=block)
+        except queue.Full:
+            self.dropped += len(b)
+            print(f"[LOG] writer behind, dropped {len(b)} frames")
+
+    def flush(self) -> None:
+        """Hand over the partial block and wait until everything is on disk."""
+        if self._n:
+            self._hand(block=True)
+        self._q.join()
+
+    def close(self) -> None:
+        self.flush()
+        self._q.put(None)
+        self._thread.join()
+        try:
+            self._f.close()
+            if self.error is None:
+                self._index.finish(os.path.getsize(self.path)).save(self.path)
+        except OSError as e:
+            self.fail(e)
+
+    def _run(self) -> None:
+        while True:
+            b = self._q.get()
+            try:
+                if b is None:
+                    return
+                if self.error is None:
+                    self._f.write(b.data)
+                    self._f.flush()
+                    self._index.add(self.records, self.records + len(b), b["t"], b["id"])
+                    self.records += len(b)
+            except OSError as e:
+                self.fail(e)
+            finally:
+                self._q.task_done()
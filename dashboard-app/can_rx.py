@@ -1,26 +1,47 @@
+import os
 import threading
 import time
 
 import can
-
-# ===== CAN message map (custom) =====
+import can_codec
+import can_ids
+import can_log
+import clock
+import columnar
+import filters
+import history
+import latency_probe
+import metrics
+import plausibility
+import rt
+import signal_bus
+import watchdog
+
+# ===== CAN message map (custom) — dbc/dashboard_v0_1.dbc, decoded by can_codec =====
+# IDs are allocated in can_ids.py.
 # 0x101 Pedal_Processed:  [0]=APPS% (0-255), [1]=Brake% (0-255), [2]=StatusBits, [3]=Counter(0..15)
 # 0x110 Vehicle_Speed:    [0]=Speed_kph (0-255), [1]=reserved, [2]=Counter, [3]=reserved
 # 0x111 Battery_State:    [0]=SOC% (0-100), [1]=PackTemp_C (0..255 for now), [2]=reserved, [3]=Counter
 # 0x112 Temps_Misc:       [0]=WaterTemp_C, [1]=InverterTemp_C, [2]=reserved, [3]=Counter
 # 0x102 Heartbeat:        [0..3]=Uptime seconds (LSB first), [4]=FW tag (8-bit), [5..7]=reserved
 # 0x120 TC_Command (TX):  [0]=TC level (1..10), [1]=0x01 magic, [2..7]=reserved
-ID_PEDAL = 0x101
-ID_SPEED = 0x110
-ID_BATT = 0x111
-ID_TEMPS = 0x112
-ID_HB = 0x102
+# 0x121 TC_Status:        [0]=TC level applied (TCService)
+ID_PEDAL = can_ids.PEDAL_PROCESSED
+ID_SPEED = can_ids.VEHICLE_SPEED
+ID_BATT = can_ids.BATTERY_STATE
+ID_TEMPS = can_ids.TEMPS_MISC
+ID_HB = can_ids.HEARTBEAT
 
-D_M161 = 0xA1  # Cascadia hot spot motor
-ID_M162 = 0xA2  # Cascadia hot spot inverter
+ID_TEMP_STATUS = can_ids.TEMP_STATUS  # Temp controller Arduino → RPi (TempService)
+ID_M161 = can_ids.INV_TEMPERATURE_2  # Cascadia temperature set 2 (hot spot motor)
+ID_M162 = can_ids.INV_TEMPERATURE_3  # Cascadia temperature set 3 (hot spot inverter)
 
 
-BUS_CHANNEL = "vcan0"  # change to "can0" on the Pi
+BUS_CHANNEL = os.environ.get("DASH_CAN_CHANNEL", "vcan0")  # "can0" on the Pi
+BUS_INTERFACE = os.environ.get("DASH_CAN_INTERFACE", "socketcan")
+RX_MODE = "thread"  # "thread" = blocking recv loop, "asyncio" = can_aio.py
+LOG_DIR = os.environ.get("DASH_CAN_LOG")  # record every frame (can_log.py) here
+COLS_DIR = os.environ.get("DASH_COLS")  # export decoded signals (columnar.py) here
 
 latest = {
     "apps_pct": 0.0,
@@ -33,8 +54,72 @@ latest = {
     "water_temp": 0.0,  # °C
     "inv_temp": 0.0,  # °C
     "uptime": 0,  # seconds
+    "plaus_faults": 0,  # StatusBits layout, from the dashboard's own checks
+    "watchdog": (),  # names of stalled loops (watchdog.py)
+}
+
+# Publish deadbands — changes smaller than this don't wake the UI.
+DEADBANDS = {
+    "apps_pct": 0.5,
+    "brake": 0.5,
+    "speed": 0.5,
+    "battery": 0.5,
+    "battery_temp": 0.5,
+    "water_temp": 0.5,
+    "inv_temp": 0.5,
+    "motor_temp": 0.5,
+    "motor_hotspot_temp": 0.5,
+    "coolant_temp": 0.5,
+}
+
+# Decode-stage smoothing (see filters.py), applied before the deadband.
+_TEMP_U8 = (("median", 3), ("ema", 0.35), ("hysteresis", 0.6))
+_TEMP_CASCADIA = (("ema", 0.3), ("hysteresis", 0.6))
+FILTERS = {
+    "battery_temp": _TEMP_U8,
+    "water_temp": _TEMP_U8,
+    "inv_temp": _TEMP_U8,
+    "inv_hotspot_temp": _TEMP_CASCADIA,
+    "motor_temp": _TEMP_CASCADIA,
+    "motor_hotspot_temp": _TEMP_CASCADIA,
+    "coolant_temp": _TEMP_CASCADIA,
+    "battery": (("median", 3), ("rate", 2.0), ("hysteresis", 0.6)),  # SOC %/s
+}
+
+# Trend history (history.py), recorded after filtering: name -> samples/s.
+HISTORY = {
+    "battery": 10,
+    "speed": 50,
+    "battery_temp": 10,
+    "water_temp": 10,
+    "inv_temp": 10,
+    "inv_hotspot_temp": 10,  # M161 / M162, published by InverterService per frame
+    "motor_temp": 10,
+    "motor_hotspot_temp": 10,
+    "coolant_temp": 10,
 }
 
+# Columnar export (columnar.py): decoded values before filtering.
+COLUMNS = (
+    "apps_pct",
+    "brake",
+    "status_bits",
+    "speed",
+    "battery",
+    "battery_temp",
+    "water_temp",
+    "inv_temp",
+    "inv_hotspot_temp",
+    "motor_temp",
+    "motor_hotspot_temp",
+    "coolant_temp",
+)
+
+signals = signal_bus.SignalBus(DEADBANDS)
+_filters = filters.build_all(FILTERS)
+trends = history.HistoryStore(HISTORY)
+plaus = plausibility.Engine(plausibility.RULES)
+
 _last_counters = {}
 _last_log_time = {
     ID_PEDAL: 0.0,
@@ -56,13 +141,66 @@ summary_last = 0.0
 summary_interval = 1.0  # 1 Hz
 
 
-_temp_handler = None
+# Time source for filters and log throttling; set_clock() for simulation.
+_clock = clock.SYSTEM
+
+# arbitration id -> [fn(msg), ...], called on the RX thread
+_handlers: dict[int, list] = {}
+
+# Recording / column export: opened by open_outputs() when RX starts, so
+# importing can_rx creates no files and starts no threads.
+_log: can_log.Writer | None = None
+_cols: columnar.Exporter | None = None
+# Column samples are stamped with the bus timestamp of the frame being
+# decoded (epoch s, as in the .nfscan recording), set by handle_frame().
+_frame_t = 0.0
+
+_frames = metrics.counter("can_frames_total", "CAN frames received and decoded")
+_frame_errors = metrics.counter("can_frame_errors_total", "Frames whose decoding raised")
+
+# RX thread (thread mode); restart() replaces it, and a superseded loop
+# exits when it sees that _rx_gen moved on.
+_bus: can.BusABC | None = None
+_rx_thread: threading.Thread | None = None
+_rx_gen = 0
+
+
+def set_clock(c) -> None:
+    """Use `c` (clock.VirtualClock in scenario runs) instead of wall time."""
+    global _clock, summary_last
+    _clock = c
+    summary_last = 0.0
+    for aid in _last_log_time:
+        _last_log_time[aid] = 0.0
+
+
+def register_handler(arbids, fn) -> None:
+    """Route every frame whose ID is in `arbids` to fn(msg)."""
+    for aid in arbids:
+        _handlers.setdefault(aid, []).append(fn)
 
 
 def register_temp_handler(fn):
     """Call once from main.py to route temp-relevant frames to TempService."""
-    global _temp_handler
-    _temp_handler = fn
+    register_handler((ID_TEMP_STATUS, ID_M161, ID_M162), fn)
+
+
+def publish(name: str, value) -> None:
+    """Filter, store in `latest`, record history and notify subscribers
+    (deadband-filtered). Plausibility rules and the column export see the
+    value before filtering; columns take the current frame's timestamp."""
+    if plaus.feed(name, value, _clock.now()):
+        publish("plaus_faults", plaus.faults)
+    if _cols is not None:
+        _cols.append(name, value, _frame_t)
+    f = _filters.get(name)
+    if f is not None:
+        value = f(value, _clock.now())
+    h = trends.get(name)
+    if h is not None and value is not None:
+        h.append(_clock.now(), value)
+    latest[name] = value
+    signals.publish(name, value)
 
 
 def _check_counter(arbid: int, ctr: int) -> bool:
@@ -78,7 +216,7 @@ def _check_counter(arbid: int, ctr: int) -> bool:
 
 
 def _throttled(arbid: int) -> bool:
-    now = time.time()
+    now = _clock.now()
     last = _last_log_time.get(arbid, 0.0)
     if now - last >= _LOG_INTERVAL.get(arbid, 0.5):
         _last_log_time[arbid] = now
@@ -86,132 +224,173 @@ def _throttled(arbid: int) -> bool:
     return False
 
 
-def can_rx_loop(bus: can.BusABC) -> None:
-    global summary_last
-    while True:
-        msg = bus.recv(timeout=1.0)
-        if msg is None:
-            continue
-
-        try:
-            if msg.arbitration_id == ID_PEDAL and len(msg.data) >= 4:
-                apps = msg.data[0] * 100.0 / 255.0
-                brake = msg.data[1] * 100.0 / 255.0
-                stat = msg.data[2]
-                ctr = msg.data[3] & 0x0F
-
-                latest["apps_pct"] = apps
-                latest["brake"] = brake
-                latest["status_bits"] = stat
-                ok = _check_counter(ID_PEDAL, ctr)
-                latest["can_counter_ok"] = latest["can_counter_ok"] and ok
-
-                if _throttled(ID_PEDAL):
-                    print(
-                        f"[101 PEDAL] APPS={apps:5.1f}%  Brake={brake:5.1f}%  "
-                        f"Stat=0x{stat:02X} Ctr={ctr} OK={ok}"
-                    )
-
-            elif msg.arbitration_id == ID_SPEED and len(msg.data) >= 3:
-                spd = msg.data[0]
-                ctr = msg.data[2] & 0x0F
-                latest["speed"] = float(spd)
-                ok = _check_counter(ID_SPEED, ctr)
-                latest["can_counter_ok"] = latest["can_counter_ok"] and ok
-
-                if _throttled(ID_SPEED):
-                    print(f"[110 SPEED] {spd:3d} km/h  Ctr={ctr} OK={ok}")
-
-            elif msg.arbitration_id == ID_BATT and len(msg.data) >= 4:
-                soc = msg.data[0]
-                temp = msg.data[1]
-                ctr = msg.data[3] & 0x0F
-                latest["battery"] = float(soc)
-                latest["battery_temp"] = float(temp)
-                ok = _check_counter(ID_BATT, ctr)
-                latest["can_counter_ok"] = latest["can_counter_ok"] and ok
-
-                if _throttled(ID_BATT):
-                    print(
-                        f"[111 BATT ] SOC={soc:3d}%  PackTemp={temp:3d}°C  Ctr={ctr} OK={ok}"
-                    )
-
-            elif msg.arbitration_id == ID_TEMPS and len(msg.data) >= 4:
-                water = msg.data[0]
-                inv = msg.data[1]
-                ctr = msg.data[3] & 0x0F
-                latest["water_temp"] = float(water)
-                latest["inv_temp"] = float(inv)
-                ok = _check_counter(ID_TEMPS, ctr)
-                latest["can_counter_ok"] = latest["can_counter_ok"] and ok
-
-                if _throttled(ID_TEMPS):
-                    print(
-                        f"[112 TEMPS] Water={water:3d}°C  Inverter={inv:3d}°C  Ctr={ctr} OK={ok}"
-                    )
-
-            elif msg.arbitration_id == ID_HB and len(msg.data) >= 5:
-                up = (
-                    msg.data[0]
-                    | (msg.data[1] << 8)
-                    | (msg.data[2] << 16)
-                    | (msg.data[3] << 24)
-                )
-                latest["uptime"] = up
-
-                if _throttled(ID_HB):
-                    print(f"[102 HB   ] Uptime={up:6d}s FW=0x{msg.data[4]:02X}")
-
-            # In can_rx_loop(), add these two blocks alongside the existing elif chain:
-
-            elif msg.arbitration_id == 0x120 and len(msg.data) >= 7:
-                # Temp controller Arduino → RPi
-                # Handled by TempService directly; we just forward it.
-                if _temp_handler is not None:
-                    _temp_handler(msg)
-
-            elif msg.arbitration_id == 0x162 and len(msg.data) >= 8:
-                # Cascadia M162: Motor + Inverter + Coolant temps (0.1°C scale, int16 LE)
-                motor_raw = int.from_bytes(msg.data[4:6], "little", signed=True)
-                inv_raw = int.from_bytes(msg.data[2:4], "little", signed=True)
-                coolant_raw = int.from_bytes(msg.data[0:2], "little", signed=True)
-                latest["motor_temp"] = motor_raw * 0.1
-                latest["inv_temp"] = inv_raw * 0.1
-                latest["coolant_temp"] = coolant_raw * 0.1
-
-            # 1 Hz summary
-            now = time.time()
-            if now - summary_last >= summary_interval:
-                summary_last = now
-                print(
-                    "  ── SUMMARY ───────────────────────────────────────────────────"
-                )
-                print(
-                    f"    APPS={latest['apps_pct']:5.1f}%  Brake={latest['brake']:5.1f}%"
-                    f"  Speed={latest['speed']:5.1f} km/h  SOC={latest['battery']:3.0f}%"
-                )
+def handle_frame(msg: can.Message) -> None:
+    """Decode one received frame into `latest` and forward to handlers."""
+    global summary_last, _frame_t
+    _frames.inc()
+    _frame_t = msg.timestamp or time.time()
+    if _log is not None:
+        try:  # recording must never stop decoding
+            _log.write(msg)
+        except Exception as e:
+            _log.fail(e)
+    try:
+        if msg.arbitration_id == ID_PEDAL and len(msg.data) >= 4:
+            apps, brake, stat, ctr = can_codec.decode_pedal_processed(msg.data)
+
+            publish("apps_pct", apps)
+            publish("brake", brake)
+            publish("status_bits", stat)
+            ok = _check_counter(ID_PEDAL, ctr)
+            publish("can_counter_ok", latest["can_counter_ok"] and ok)
+
+            if _throttled(ID_PEDAL):
                 print(
-                    f"    Temps → Pack={latest['battery_temp']:3.0f}°C  "
-                    f"Water={latest['water_temp']:3.0f}°C  Inverter={latest['inv_temp']:3.0f}°C"
+                    f"[101 PEDAL] APPS={apps:5.1f}%  Brake={brake:5.1f}%  "
+                    f"Stat=0x{stat:02X} Ctr={ctr} OK={ok}"
                 )
+
+        elif msg.arbitration_id == ID_SPEED and len(msg.data) >= 3:
+            spd, ctr = can_codec.decode_vehicle_speed(msg.data)
+            publish("speed", float(spd))
+            ok = _check_counter(ID_SPEED, ctr)
+            publish("can_counter_ok", latest["can_counter_ok"] and ok)
+
+            if _throttled(ID_SPEED):
+                print(f"[110 SPEED] {spd:3d} km/h  Ctr={ctr} OK={ok}")
+
+        elif msg.arbitration_id == ID_BATT and len(msg.data) >= 4:
+            soc, temp, ctr = can_codec.decode_battery_state(msg.data)
+            publish("battery", float(soc))
+            publish("battery_temp", float(temp))
+            ok = _check_counter(ID_BATT, ctr)
+            publish("can_counter_ok", latest["can_counter_ok"] and ok)
+
+            if _throttled(ID_BATT):
                 print(
-                    f"    StatusBits=0x{latest['status_bits']:02X}  "
-                    f"CAN_OK={latest['can_counter_ok']}  Uptime={latest['uptime']}s"
+                    f"[111 BATT ] SOC={soc:3d}%  PackTemp={temp:3d}°C  Ctr={ctr} OK={ok}"
                 )
+
+        elif msg.arbitration_id == ID_TEMPS and len(msg.data) >= 4:
+            water, inv, ctr = can_codec.decode_temps_misc(msg.data)
+            publish("water_temp", float(water))
+            publish("inv_temp", float(inv))
+            ok = _check_counter(ID_TEMPS, ctr)
+            publish("can_counter_ok", latest["can_counter_ok"] and ok)
+
+            if _throttled(ID_TEMPS):
                 print(
-                    "  ──────────────────────────────────────────────────────────────"
+                    f"[112 TEMPS] Water={water:3d}°C  Inverter={inv:3d}°C  Ctr={ctr} OK={ok}"
                 )
 
-        except Exception as e:
+        elif msg.arbitration_id == ID_HB and len(msg.data) >= 5:
+            up, fw = can_codec.decode_heartbeat(msg.data)
+            publish("uptime", up)
+
+            if _throttled(ID_HB):
+                print(f"[102 HB   ] Uptime={up:6d}s FW=0x{fw:02X}")
+
+        else:
+            # Temp controller, Cascadia inverter, BMS … — owned by services.
+            for fn in _handlers.get(msg.arbitration_id, ()):
+                fn(msg)
+
+        if latency_probe.ENABLED:
+            latency_probe.on_frame(msg, latest)
+
+        # 1 Hz summary
+        now = _clock.now()
+        if now - summary_last >= summary_interval:
+            summary_last = now
+            print(
+                "  ── SUMMARY ───────────────────────────────────────────────────"
+            )
+            print(
+                f"    APPS={latest['apps_pct']:5.1f}%  Brake={latest['brake']:5.1f}%"
+                f"  Speed={latest['speed']:5.1f} km/h  SOC={latest['battery']:3.0f}%"
+            )
             print(
-                f"[ERROR] Failed to parse frame 0x{msg.arbitration_id:03X} ({msg}): {e}"
+                f"    Temps → Pack={latest['battery_temp']:3.0f}°C  "
+                f"Water={latest['water_temp']:3.0f}°C  Inverter={latest['inv_temp']:3.0f}°C"
             )
+            print(
+                f"    StatusBits=0x{latest['status_bits']:02X}  "
+                f"CAN_OK={latest['can_counter_ok']}  Uptime={latest['uptime']}s"
+            )
+            print(
+                "  ──────────────────────────────────────────────────────────────"
+            )
+
+    except Exception as e:
+        _frame_errors.inc()
+        print(
+            f"[ERROR] Failed to parse frame 0x{msg.arbitration_id:03X} ({msg}): {e}"
+        )
+
 
-        time.sleep(0.001)
+def open_outputs() -> None:
+    """Start the recording (DASH_CAN_LOG) and the column export (DASH_COLS),
+    if configured. start() and can_aio.start() call it."""
+    global _log, _cols
+    if LOG_DIR and _log is None:
+        _log = can_log.Writer.in_dir(LOG_DIR)
+        print(f"[LOG] Recording CAN to {_log.path}")
+    if COLS_DIR and _cols is None:
+        _cols = columnar.Exporter(COLS_DIR, COLUMNS)
+        print(f"[COLS] Exporting {len(COLUMNS)} signals to {COLS_DIR}")
+        metrics.gauge("columnar_queue_chunks", "Column chunks waiting for the writer thread",
+                      fn=lambda: _cols._q.qsize())
+        metrics.counter("columnar_dropped_samples_total", "Column samples dropped (writer behind)",
+                        fn=lambda: _cols.dropped)
+
+
+def close_log() -> None:
+    """Flush and close the recording and the column export, if any (main.py,
+    on exit)."""
+    if _log is not None:
+        _log.close()
+        print(f"[LOG] {_log.records} frames written to {_log.path}"
+              + (f", {_log.dropped} dropped" if _log.dropped else "")
+              + (f" (stopped: {_log.error})" if _log.error else ""))
+    if _cols is not None:
+        _cols.close()
+        print(f"[COLS] {_cols.samples} samples written to {COLS_DIR}"
+              + (f", {_cols.dropped} dropped" if _cols.dropped else ""))
+
+
+def can_rx_loop(bus: can.BusABC, gen: int = 0) -> None:
+    rt.apply("rx")
+    try:
+        while gen == _rx_gen:
+            watchdog.beat("rx")
+            msg = bus.recv(timeout=1.0)
+            if msg is None:
+                continue
+            handle_frame(msg)
+            time.sleep(0.001)
+    except Exception as e:  # bus errors: the watchdog sees the thread die
+        print(f"[RX] receive loop died: {e!r}")
 
 
 def start(bus: can.BusABC) -> threading.Thread:
-    """Spawn and return the daemon RX thread."""
-    t = threading.Thread(target=can_rx_loop, args=(bus,), daemon=True)
-    t.start()
-    return t
+    """Spawn and return the daemon RX thread, watched by watchdog.py."""
+    global _bus, _rx_thread
+    open_outputs()
+    _bus = bus
+    _rx_thread = threading.Thread(target=can_rx_loop, args=(bus, _rx_gen),
+                                  name="can-rx", daemon=True)
+    _rx_thread.start()
+    watchdog.watch("rx", watchdog.RX_STALL_S,
+                   alive=lambda: _rx_thread.is_alive(), restart=restart)
+    return _rx_thread
+
+
+def restart() -> threading.Thread:
+    """Replace the RX thread (watchdog). A thread stuck inside recv() or a
+    handler cannot be killed; it exits at its next iteration instead."""
+    global _rx_gen, _rx_thread
+    _rx_gen += 1
+    _rx_thread = threading.Thread(target=can_rx_loop, args=(_bus, _rx_gen),
+                                  name="can-rx", daemon=True)
+    _rx_thread.start()
+    return _rx_thread
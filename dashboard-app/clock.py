@@ -0,0 +1,53 @@
+"""
+clock.py
+One time source for the services and the CAN decode path.
+
+Everything that needs "now" takes a clock (default SYSTEM) instead of calling
+time.monotonic() / time.time() / pygame ticks itself, so a scenario can run
+on a VirtualClock far faster than real time:
+
+    vc = clock.VirtualClock()
+    svc = StartupService(clock=vc)
+    vc.advance(0.25)        # time only moves when told to
+    svc.tick()
+
+Only elapsed time matters to the callers; the epoch is arbitrary.
+"""
+
+import time
+
+
+class MonotonicClock:
+    __slots__ = ()
+
+    def now(self) -> float:
+        """Seconds, monotonic."""
+        return time.monotonic()
+
+    def now_ms(self) -> int:
+        return int(time.monotonic() * 1000)
+
+
+class VirtualClock:
+    __slots__ = ("t",)
+
+    def __init__(self, start: float = 0.0):
+        self.t = start
+
+    def now(self) -> float:
+        return self.t
+
+    def now_ms(self) -> int:
+        return int(self.t * 1000)
+
+    def advance(self, dt: float) -> float:
+        self.t += dt
+        return self.t
+
+    def set(self, t: float) -> None:
+        if t < self.t:
+            raise ValueError("VirtualClock cannot go backwards")
+        self.t = t
+
+
+SYSTEM = MonotonicClock()
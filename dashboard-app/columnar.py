@@ -0,0 +1,211 @@
+"""
+columnar.py
+Decoded signals written as chunked NumPy columns, for analysis tools.
+
+    <dir>/<signal>/000042.t.npy   float64 timestamps, s since the epoch
+                                  (the CAN frame's timestamp, live and offline)
+    <dir>/<signal>/000042.v.npy   float32 values
+    <dir>/<signal>/chunks.npy     CHUNK_STATS: seq, n, t0, t1, lo, hi per chunk
+
+Producers append samples into per-signal buffers. A chunk is cut every
+CHUNK_SAMPLES samples or CHUNK_SECONDS seconds, whichever comes first. It
+goes through a bounded queue to one writer thread, which does all the file
+I/O. Live (can_rx, DASH_COLS) the queue never blocks the RX thread: if the
+disk falls behind, whole chunks are dropped and counted. Offline
+(tools/log_analyze.py --cols) block=True waits instead.
+
+Each chunk's two files are complete before its row is added to chunks.npy.
+A reader that goes by chunks.npy therefore never sees a half-written
+chunk, even while the car is running. Chunks are memory-mapped one at a
+time:
+
+    t, v = columnar.read("cols", "motor_temp", t0=start, t1=start + 60)
+    hot = columnar.chunks("cols", "motor_temp")
+    hot = hot[hot["hi"] > 90]            # skip chunks by their stats
+
+Reopening a directory appends after the chunks already there.
+"""
+
+import os
+import queue
+import threading
+
+import numpy as np
+
+CHUNK_SAMPLES = 16384
+CHUNK_SECONDS = 60.0
+QUEUE_CHUNKS = 64
+STATS_FILE = "chunks.npy"
+CHUNK_STATS = np.dtype([
+    ("seq", "<u4"),
+    ("n", "<u4"),
+    ("t0", "<f8"),
+    ("t1", "<f8"),
+    ("lo", "<f8"),
+    ("hi", "<f8"),
+])
+
+
+def _chunk_path(directory: str, name: str, seq: int, col: str) -> str:
+    return os.path.join(directory, name, f"{seq:06d}.{col}.npy")
+
+
+def _save(path: str, arr: np.ndarray) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, path)
+
+
+# ── Writing ──────────────────────────────────────────────────────────────────
+class _Column:
+    __slots__ = ("t", "v", "n", "t0", "seq")
+
+    def __init__(self, size: int, seq: int):
+        self.t = np.empty(size, np.float64)
+        self.v = np.empty(size, np.float32)
+        self.n = 0
+        self.t0 = 0.0
+        self.seq = seq
+
+
+class Exporter:
+    """append() / extend() from the producer thread (one thread per signal),
+    close() once at the end."""
+
+    def __init__(self, directory: str, signals=None, chunk: int = CHUNK_SAMPLES,
+                 seconds: float = CHUNK_SECONDS, block: bool = False):
+        self.dir = directory
+        self.signals = frozenset(signals) if signals is not None else None
+        self.chunk = chunk
+        self.seconds = seconds
+        self.block = block
+        self.samples = 0  # written to disk
+        self.dropped = 0  # samples lost to a full queue
+        os.makedirs(directory, exist_ok=True)
+        self._cols: dict[str, _Column] = {}
+        self._stats: dict[str, np.ndarray] = {}  # writer thread only
+        self._q: queue.Queue = queue.Queue(QUEUE_CHUNKS)
+        self._thread = threading.Thread(target=self._run, name="columnar", daemon=True)
+        self._thread.start()
+
+    def _open(self, name: str) -> _Column:
+        os.makedirs(os.path.join(self.dir, name), exist_ok=True)
+        old = chunks(self.dir, name)
+        c = self._cols[name] = _Column(self.chunk, int(old["seq"].max()) + 1 if len(old) else 0)
+        return c
+
+    def append(self, name: str, value, t: float) -> None:
+        if value is None or (self.signals is not None and name not in self.signals):
+            return
+        c = self._cols.get(name) or self._open(name)
+        if c.n == 0:
+            c.t0 = t
+        c.t[c.n] = t
+        c.v[c.n] = value
+        c.n += 1
+        if c.n == self.chunk or t - c.t0 >= self.seconds:
+            self._hand(name, c)
+
+    def extend(self, name: str, t: np.ndarray, v: np.ndarray) -> None:
+        """Whole arrays at once (offline export)."""
+        if self.signals is not None and name not in self.signals:
+            return
+        c = self._cols.get(name) or self._open(name)
+        i = 0
+        while i < len(t):
+            if c.n == 0:
+                c.t0 = float(t[i])
+            k = min(len(t) - i, self.chunk - c.n)
+            c.t[c.n:c.n + k] = t[i:i + k]
+            c.v[c.n:c.n + k] = v[i:i + k]
+            c.n += k
+            i += k
+            if c.n == self.chunk:
+                self._hand(name, c)
+
+    def _hand(self, name: str, c: _Column) -> None:
+        item = (name, c.seq, c.t[:c.n].copy(), c.v[:c.n].copy())
+        c.seq += 1
+        c.n = 0
+        try:
+            self._q.put(item, block=self.block)
+        except queue.Full:
+            self.dropped += len(item[2])
+            print(f"[COLS] writer behind, dropped {len(item[2])} samples of {name}")
+
+    def flush(self) -> None:
+        """Cut every partial chunk and wait until all are on disk."""
+        for name, c in list(self._cols.items()):
+            if c.n:
+                self._hand(name, c)
+        self._q.join()
+
+    def close(self) -> None:
+        self.flush()
+        self._q.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._q.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except OSError as e:
+                print(f"[COLS] write failed: {e}")
+            finally:
+                self._q.task_done()
+
+    def _write(self, name: str, seq: int, t: np.ndarray, v: np.ndarray) -> None:
+        _save(_chunk_path(self.dir, name, seq, "t"), t)
+        _save(_chunk_path(self.dir, name, seq, "v"), v)
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = chunks(self.dir, name)
+        finite = v[np.isfinite(v)]
+        row = np.array([(seq, len(t), t[0], t[-1],
+                         finite.min() if len(finite) else np.nan,
+                         finite.max() if len(finite) else np.nan)], CHUNK_STATS)
+        stats = self._stats[name] = np.concatenate((stats, row))
+        _save(os.path.join(self.dir, name, STATS_FILE), stats)
+        self.samples += len(t)
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+def signals(directory: str) -> list[str]:
+    return sorted(n for n in os.listdir(directory)
+                  if os.path.isfile(os.path.join(directory, n, STATS_FILE)))
+
+
+def chunks(directory: str, name: str) -> np.ndarray:
+    """Per-chunk stats (CHUNK_STATS), in write order; empty if none yet."""
+    try:
+        return np.load(os.path.join(directory, name, STATS_FILE))
+    except FileNotFoundError:
+        return np.zeros(0, CHUNK_STATS)
+
+
+def read(directory: str, name: str, t0: float | None = None,
+         t1: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """(t, v) in [t0, t1]. Only the chunks whose span overlaps are mapped."""
+    st = chunks(directory, name)
+    if t0 is not None:
+        st = st[st["t1"] >= t0]
+    if t1 is not None:
+        st = st[st["t0"] <= t1]
+    ts, vs = [], []
+    for seq in st["seq"].tolist():
+        t = np.load(_chunk_path(directory, name, seq, "t"), mmap_mode="r")
+        v = np.load(_chunk_path(directory, name, seq, "v"), mmap_mode="r")
+        ok = np.ones(len(t), bool)
+        if t0 is not None:
+            ok &= t >= t0
+        if t1 is not None:
+            ok &= t <= t1
+        ts.append(t[ok])
+        vs.append(v[ok])
+    if not ts:
+        return np.zeros(0, np.float64), np.zeros(0, np.float32)
+    return np.concatenate(ts), np.concatenate(vs)
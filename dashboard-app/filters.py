@@ -0,0 +1,143 @@
+"""
+filters.py
+Per-signal smoothing applied in the decode stage, before publish.
+
+Filters are declared as specs next to the decoders and built once:
+
+    FILTERS = {
+        "water_temp": (("median", 3), ("ema", 0.3), ("hysteresis", 0.4)),
+    }
+    chains = filters.build_all(FILTERS)
+    y = chains["water_temp"](x, now)
+
+Every stage keeps fixed, preallocated state (__slots__, fixed-size window);
+step(x, t) does no allocation once warmed up. `t` is seconds (only the rate
+limiter uses it).
+
+  ("ema", alpha)              exponential moving average, 0 < alpha <= 1
+  ("median", n)               median of the last n samples (n small, odd)
+  ("rate", units_per_s)       slew-rate limit
+  ("hysteresis", band[, step]) quantise to `step` (default 1 = displayed
+                              integer) and hold until the input moves more
+                              than step/2 + band away from the shown value
+"""
+
+
+class Ema:
+    __slots__ = ("alpha", "y")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.y = None
+
+    def step(self, x: float, t: float) -> float:
+        y = self.y
+        y = x if y is None else y + self.alpha * (x - y)
+        self.y = y
+        return y
+
+    def reset(self) -> None:
+        self.y = None
+
+
+class Median:
+    __slots__ = ("n", "buf", "scratch", "idx", "count")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.buf = [0.0] * n
+        self.scratch = [0.0] * n
+        self.idx = 0
+        self.count = 0
+
+    def step(self, x: float, t: float) -> float:
+        self.buf[self.idx] = x
+        self.idx = (self.idx + 1) % self.n
+        if self.count < self.n:
+            self.count += 1
+            return sorted(self.buf[: self.count])[self.count // 2]  # warm-up only
+        s = self.scratch
+        s[:] = self.buf  # same length: copies in place
+        s.sort()
+        return s[self.n // 2]
+
+    def reset(self) -> None:
+        self.idx = 0
+        self.count = 0
+
+
+class RateLimit:
+    __slots__ = ("rate", "y", "t")
+
+    def __init__(self, units_per_s: float):
+        self.rate = units_per_s
+        self.y = None
+        self.t = 0.0
+
+    def step(self, x: float, t: float) -> float:
+        y = self.y
+        if y is None:
+            y = x
+        else:
+            lim = self.rate * max(0.0, t - self.t)
+            d = x - y
+            y = y + (lim if d > lim else -lim if d < -lim else d)
+        self.y = y
+        self.t = t
+        return y
+
+    def reset(self) -> None:
+        self.y = None
+
+
+class Hysteresis:
+    __slots__ = ("band", "step_size", "y")
+
+    def __init__(self, band: float, step: float = 1.0):
+        self.band = band
+        self.step_size = step
+        self.y = None
+
+    def step(self, x: float, t: float) -> float:
+        q = self.step_size
+        y = self.y
+        if y is None or abs(x - y) > q * 0.5 + self.band:
+            y = round(x / q) * q
+            self.y = y
+        return y
+
+    def reset(self) -> None:
+        self.y = None
+
+
+_KINDS = {
+    "ema": Ema,
+    "median": Median,
+    "rate": RateLimit,
+    "hysteresis": Hysteresis,
+}
+
+
+class FilterChain:
+    __slots__ = ("stages",)
+
+    def __init__(self, stages):
+        self.stages = tuple(stages)
+
+    def __call__(self, x: float, t: float) -> float:
+        for s in self.stages:
+            x = s.step(x, t)
+        return x
+
+    def reset(self) -> None:
+        for s in self.stages:
+            s.reset()
+
+
+def build(spec) -> FilterChain:
+    """(("ema", 0.3), ("hysteresis", 0.4)) -> FilterChain with fresh state."""
+    return FilterChain(_KINDS[kind](*args) for kind, *args in spec)
+
+
+def build_all(specs: dict) -> dict:
+    return {name: build(spec) for name, spec in specs.items()}
@@ -0,0 +1,233 @@
+"""
+frame_capture.py
+Capture of the rendered dashboard for remote viewing and bug reports. It is
+inert unless DASH_CAPTURE names a directory.
+
+main.py creates the FrameCapture at the top, before any thread starts, so
+the worker is forked from a single-threaded process. The spawn start method
+would re-run main.py in the child. Imports must therefore start no threads:
+can_rx opens its recorder and column export in start(), not at import.
+If a thread is running anyway, a warning names it. main.py then calls on_flip(screen)
+after every display.flip(). At most DASH_CAPTURE_FPS times a second, the UI
+thread copies the surface's pixel buffer into a free slot of a
+shared-memory ring (about 0.3 ms for 800x480) and queues the slot number.
+That is the whole cost on the UI thread. If no slot is free because the
+worker is behind, the frame is skipped and counted.
+
+A worker process does the rest:
+  - It rebuilds a surface from the slot with the display's pixel masks.
+  - Delta: a frame identical to the previous one is not encoded again.
+    Only flipped frames arrive anyway, so a static screen costs nothing.
+  - It encodes with pygame.image.save: DASH_CAPTURE_FORMAT=jpg (default,
+    about 2 ms) or png (lossless, about 30 ms).
+  - Rolling buffer: <dir>/<time>.jpg, keeping the newest
+    DASH_CAPTURE_KEEP files.
+  - MJPEG: http://127.0.0.1:DASH_CAPTURE_PORT/ serves
+    multipart/x-mixed-replace and works in any browser. A single frame is
+    at /frame.jpg.
+
+Attach the buffer directory to a bug report to show what was on screen.
+"""
+
+import io
+import os
+import queue
+import threading
+import time
+from multiprocessing import get_context, shared_memory
+
+DIR = os.environ.get("DASH_CAPTURE")
+ENABLED = bool(DIR)
+FPS = float(os.environ.get("DASH_CAPTURE_FPS", "5"))
+FORMAT = os.environ.get("DASH_CAPTURE_FORMAT", "jpg").lower()
+KEEP = int(os.environ.get("DASH_CAPTURE_KEEP", "600"))  # 2 min at 5 fps
+PORT = int(os.environ.get("DASH_CAPTURE_PORT", "8090"))  # 0 = no MJPEG server
+SLOTS = 3
+
+
+class FrameCapture:
+    """UI side. on_flip() is the only call in the frame loop."""
+
+    def __init__(self, size: tuple[int, int], directory: str | None = DIR,
+                 fps: float = FPS, fmt: str = FORMAT, keep: int = KEEP, port: int = PORT):
+        self.nbytes = size[0] * size[1] * 4  # slot size: up to 32 bpp
+        self.period = 1.0 / fps
+        self._due = 0.0
+        self._geometry = None  # (size, pitch, bitsize, masks) of the surface
+        others = [t.name for t in threading.enumerate() if t is not threading.current_thread()]
+        if others:
+            print(f"[CAPTURE] forking with threads running: {', '.join(others)}")
+        self._shm = shared_memory.SharedMemory(create=True, size=self.nbytes * SLOTS)
+        ctx = get_context("fork")
+        self._jobs = ctx.Queue(SLOTS)
+        self._free = ctx.Queue(SLOTS)
+        for i in range(SLOTS):
+            self._free.put(i)
+        self._proc = ctx.Process(
+            target=_worker, name="frame-capture", daemon=True,
+            args=(self._shm, self._jobs, self._free, self.nbytes, directory, fmt,
+                  keep, port))
+        self._proc.start()
+        self.copies = 0
+        self.skipped = 0  # worker behind: no free slot
+        self.copy_s = 0.0
+
+    def on_flip(self, surface) -> None:
+        now = time.monotonic()
+        if now < self._due:
+            return
+        self._due = max(self._due + self.period, now)
+        if self._geometry is None:
+            n = surface.get_pitch() * surface.get_height()
+            if n > self.nbytes:
+                print(f"[CAPTURE] surface of {n} bytes does not fit a {self.nbytes}-byte slot")
+                self._due = float("inf")
+                return
+            self._geometry = (surface.get_size(), surface.get_pitch(),
+                              surface.get_bitsize(), surface.get_masks())
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            self.skipped += 1
+            return
+        t0 = time.perf_counter()
+        px = memoryview(surface.get_buffer()).cast("B")
+        off = slot * self.nbytes
+        self._shm.buf[off:off + len(px)] = px
+        self._jobs.put_nowait((slot, time.time(), self._geometry))
+        self.copy_s += time.perf_counter() - t0
+        self.copies += 1
+
+    def close(self) -> None:
+        try:
+            self._jobs.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self._proc.join(timeout=3.0)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._shm.close()
+        self._shm.unlink()
+        if self.copies:
+            print(f"[CAPTURE] {self.copies} frames, copy "
+                  f"{self.copy_s / self.copies * 1000:.2f} ms avg, {self.skipped} skipped")
+
+
+# ── Worker process ───────────────────────────────────────────────────────────
+class _Stream:
+    """Latest JPEG for the MJPEG clients (worker process, any thread)."""
+
+    def __init__(self):
+        self.cv = threading.Condition()
+        self.jpeg = b""
+        self.n = 0
+
+    def publish(self, jpeg: bytes) -> None:
+        with self.cv:
+            self.jpeg = jpeg
+            self.n += 1
+            self.cv.notify_all()
+
+
+def _serve(stream: _Stream, port: int) -> None:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == "/frame.jpg":
+                with stream.cv:
+                    body = stream.jpeg
+                self.send_response(200 if body else 503)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            if self.path != "/":
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            seen = -1
+            try:
+                while True:
+                    with stream.cv:
+                        # A slow viewer skips straight to the newest frame.
+                        stream.cv.wait_for(lambda: stream.n != seen, timeout=5.0)
+                        seen, body = stream.n, stream.jpeg
+                    if not body:
+                        continue
+                    self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n"
+                                     + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                                     + body + b"\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    except OSError as e:
+        print(f"[CAPTURE] MJPEG server on port {port} failed: {e}")
+        return
+    server.daemon_threads = True
+    print(f"[CAPTURE] MJPEG stream on http://127.0.0.1:{port}/")
+    server.serve_forever()
+
+
+def _worker(shm, jobs, free, slot_bytes, directory, fmt, keep, port) -> None:
+    import pygame
+
+    try:
+        os.nice(10)  # encoding yields to the UI and RX
+    except OSError:
+        pass
+    surf = None  # shm: the parent's mapping, inherited through fork
+    stream = _Stream()
+    if port:
+        threading.Thread(target=_serve, args=(stream, port), daemon=True).start()
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    ring = sorted(f for f in os.listdir(directory) if f.endswith("." + fmt)) if directory else []
+    last = None
+    encoded = repeated = 0
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        slot, t, (size, pitch, bitsize, masks) = job
+        off = slot * slot_bytes
+        px = bytes(shm.buf[off:off + pitch * size[1]])
+        free.put(slot)
+        if px == last:
+            repeated += 1
+            continue
+        last = px
+        if surf is None or surf.get_size() != size:
+            surf = pygame.Surface(size, 0, bitsize, masks)
+        surf.get_buffer().write(px, 0)
+        jpeg = None
+        if port or fmt == "jpg":
+            f = io.BytesIO()
+            pygame.image.save(surf, f, "frame.jpg")
+            jpeg = f.getvalue()
+            stream.publish(jpeg)
+        if directory:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(t)) + f".{int(t * 1000) % 1000:03d}"
+            path = os.path.join(directory, f"{stamp}.{fmt}")
+            if fmt == "jpg":
+                with open(path, "wb") as out:
+                    out.write(jpeg)
+            else:
+                pygame.image.save(surf, path)
+            ring.append(os.path.basename(path))
+            while len(ring) > keep:
+                try:
+                    os.remove(os.path.join(directory, ring.pop(0)))
+                except OSError:
+                    pass
+        encoded += 1
+    print(f"[CAPTURE] worker: {encoded} encoded, {repeated} unchanged frames skipped")
@@ -0,0 +1,154 @@
+"""
+gc_control.py
+Keeps garbage-collector pauses out of the frame loop.
+
+Every frame allocates summary dicts, text surfaces, Rects and f-strings, and
+every CAN frame a Message; sooner or later one of those allocations triggers
+a generational collection mid-frame. Modes (DASH_GC_MODE):
+
+  default   interpreter untouched
+  tuned     gc.freeze() the start-up heap (fonts, screens, codec tables) so
+            collections never rescan it, and raise the thresholds
+            (DASH_GC_THRESHOLDS, default 10000,20,100): fewer, still short,
+            pauses
+  manual    freeze, then gc.disable(); end_frame() collects in the idle time
+            before the next frame, picking the oldest generation whose last
+            measured pause fits the time left. If the loop never idles, a
+            gen-0 collection is forced after HARD_LIMIT allocations so memory
+            stays bounded.
+
+DASH_GC_STATS=1 installs a gc.callbacks hook that times every collection and
+prints a "[GC] ..." line every STATS_INTERVAL_S. The line shows pauses that
+landed inside a frame (the stutter) apart from idle ones, and the container
+allocations per frame (gen-0 count growth; gc tracks net allocations of
+container objects only).
+
+The same hook feeds the dash_gc_pause_seconds histogram (metrics.py), and is
+also installed when a metrics export is configured.
+"""
+
+import gc
+import os
+import time
+
+import metrics
+
+MODE = os.environ.get("DASH_GC_MODE", "default").lower()
+THRESHOLDS = tuple(int(v) for v in
+                   os.environ.get("DASH_GC_THRESHOLDS", "10000,20,100").split(","))
+STATS = os.environ.get("DASH_GC_STATS") == "1"
+STATS_INTERVAL_S = 10.0
+
+IDLE_MIN_S = 0.002  # don't start a collection with less idle time than this
+IDLE_MIN_ALLOCS = 500  # gen-0 count worth collecting
+HARD_LIMIT = 200_000  # manual mode: collect gen 0 regardless past this
+COST_MARGIN = 1.5  # pause estimate safety factor
+
+# generation -> last measured pause (s); seeded pessimistically
+_cost = [0.001, 0.003, 0.02]
+_in_idle = False
+
+# ── Instrumentation ──────────────────────────────────────────────────────────
+_t_start = 0.0
+_pauses: list[tuple[int, float, bool]] = []  # (generation, s, idle)
+_allocs: list[int] = []  # per frame
+_collected_allocs = 0  # gen-0 count consumed by collections this frame
+_count_mark = 0
+_last_report = 0.0
+_pause_hist = metrics.histogram(
+    "gc_pause_seconds", "Garbage-collector pauses, all generations and threads",
+    (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1))
+
+
+def _callback(phase: str, info: dict) -> None:
+    global _t_start, _collected_allocs
+    if phase == "start":
+        _collected_allocs += gc.get_count()[0]
+        _t_start = time.perf_counter()
+    else:
+        dt = time.perf_counter() - _t_start
+        _pause_hist.observe(dt)
+        if STATS:
+            _pauses.append((info["generation"], dt, _in_idle))
+
+
+# ── Control ──────────────────────────────────────────────────────────────────
+def setup() -> None:
+    """Call once, after start-up and right before the UI loop."""
+    global _count_mark, _last_report
+    if MODE in ("tuned", "manual"):
+        gc.collect()  # don't freeze start-up garbage
+        gc.freeze()
+        if MODE == "tuned":
+            gc.set_threshold(*THRESHOLDS)
+        else:
+            gc.disable()
+        print(f"[GC] mode={MODE}, {gc.get_freeze_count()} objects frozen"
+              + (f", thresholds {THRESHOLDS}" if MODE == "tuned" else ""))
+    elif MODE != "default":
+        print(f"[GC] unknown DASH_GC_MODE {MODE!r}, leaving gc alone")
+    if (STATS or metrics.PORT or metrics.TEXTFILE) and _callback not in gc.callbacks:
+        gc.callbacks.append(_callback)
+    _count_mark = gc.get_count()[0]
+    _last_report = time.monotonic()
+
+
+def _collect(gen: int, idle: bool) -> None:
+    global _in_idle
+    _in_idle = idle
+    t = time.perf_counter()
+    gc.collect(gen)
+    _cost[gen] = time.perf_counter() - t
+    _in_idle = False
+
+
+def end_frame(deadline: float) -> None:
+    """UI thread, after the frame was drawn and before sleeping until
+    `deadline` (time.monotonic()) for the next one."""
+    global _collected_allocs, _count_mark
+    if MODE == "manual":
+        count0, count1, count2 = gc.get_count()
+        left = deadline - time.monotonic()
+        if left >= IDLE_MIN_S:
+            if count2 >= THRESHOLDS[2] and _cost[2] * COST_MARGIN < left:
+                _collect(2, True)
+            elif count1 >= THRESHOLDS[1] and _cost[1] * COST_MARGIN < left:
+                _collect(1, True)
+            elif count0 >= IDLE_MIN_ALLOCS and _cost[0] * COST_MARGIN < left:
+                _collect(0, True)
+        if gc.get_count()[0] >= HARD_LIMIT:
+            _collect(0, False)
+
+    if not STATS:
+        return
+    count0 = gc.get_count()[0]
+    _allocs.append(count0 - _count_mark + _collected_allocs)
+    _collected_allocs = 0
+    _count_mark = count0
+    now = time.monotonic()
+    if now - _last_report >= STATS_INTERVAL_S:
+        report(now)
+
+
+def _ms(xs: list[float], q: float) -> float:
+    return xs[min(len(xs) - 1, int(q * (len(xs) - 1) + 0.5))] * 1000.0 if xs else 0.0
+
+
+def report(now: float | None = None) -> None:
+    """Print and reset the instrumentation window."""
+    global _last_report
+    now = time.monotonic() if now is None else now
+    frames = len(_allocs)
+    if STATS and frames:
+        allocs = sorted(_allocs)
+        in_frame = sorted(p for _, p, idle in _pauses if not idle)
+        idle = sorted(p for _, p, i in _pauses if i)
+        gens = [sum(1 for g, _, i in _pauses if g == n and not i) for n in range(3)]
+        print(f"[GC] {now - _last_report:.0f} s, {frames} frames: "
+              f"alloc/frame p50 {allocs[frames // 2]} max {allocs[-1]}; "
+              f"in-frame pauses {len(in_frame)} (gen {gens[0]}/{gens[1]}/{gens[2]}, "
+              f"p99 {_ms(in_frame, 0.99):.2f} max {_ms(in_frame, 1.0):.2f} ms); "
+              f"idle {len(idle)} (max {_ms(idle, 1.0):.2f} ms)")
+    _pauses.clear()
+    _allocs.clear()
+    _last_report = now
@@ -0,0 +1,180 @@
+"""
+history.py
+Per-signal time series for trend widgets: fixed-size NumPy ring buffers.
+
+Each signal keeps
+  raw     the last RAW_SECONDS of samples (t, value), sized from the signal's
+          expected rate
+  tiers   min / max / mean per bucket at TIERS widths (1 s, 10 s, 1 min),
+          each a ring of TIER_BUCKETS entries, updated as samples arrive
+
+All arrays are allocated up front; append() does O(1) work per tier and no
+allocation. A bucket's slot is its index (floor(t / width)) modulo the ring
+size, so locating any time range is index arithmetic; reads copy only the
+buckets asked for. Buckets with no samples read as NaN.
+
+    store = HistoryStore({"water_temp": 10})   # name -> samples/s
+    store.append("water_temp", t, 61.5)        # RX thread (can_rx.publish)
+    h = store.get("water_temp")
+    lo, hi, mean, last = h.window(10.0, 60)    # last 60 10-s buckets
+"""
+
+import math
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+RAW_SECONDS = 60.0
+TIERS = (1.0, 10.0, 60.0)  # bucket widths, s
+TIER_BUCKETS = {1.0: 600, 10.0: 360, 60.0: 240}  # 10 min, 1 h, 4 h
+
+
+class Window(NamedTuple):
+    lo: np.ndarray
+    hi: np.ndarray
+    mean: np.ndarray
+    last: int  # bucket index of the final entry (time = last * width)
+
+
+class _Tier:
+    __slots__ = ("width", "cap", "lo", "hi", "sum", "n", "first", "head",
+                 "cur", "c_lo", "c_hi", "c_sum", "c_n")
+
+    def __init__(self, width: float, cap: int):
+        self.width = width
+        self.cap = cap
+        self.lo = np.full(cap, np.nan, np.float32)
+        self.hi = np.full(cap, np.nan, np.float32)
+        self.sum = np.zeros(cap, np.float64)
+        self.n = np.zeros(cap, np.int32)
+        self.first = None  # bucket of the first sample
+        self.head = None  # last committed bucket index
+        self.cur = None  # bucket being accumulated
+        self.c_lo = self.c_hi = self.c_sum = 0.0
+        self.c_n = 0
+
+    def _clear(self, first: int, last: int) -> None:
+        """Mark buckets first..last (inclusive) empty."""
+        count = min(last - first + 1, self.cap)
+        if count <= 0:
+            return
+        s = first % self.cap
+        for a, b in ((s, min(s + count, self.cap)), (0, max(0, s + count - self.cap))):
+            self.lo[a:b] = np.nan
+            self.hi[a:b] = np.nan
+            self.sum[a:b] = 0.0
+            self.n[a:b] = 0
+
+    def add(self, t: float, v: float) -> None:
+        b = math.floor(t / self.width)
+        if b != self.cur:
+            if self.cur is not None:
+                if b < self.cur:
+                    return  # clock went backwards; drop
+                s = self.cur % self.cap
+                self.lo[s], self.hi[s] = self.c_lo, self.c_hi
+                self.sum[s], self.n[s] = self.c_sum, self.c_n
+                self.head = self.cur
+                self._clear(self.cur + 1, b - 1)
+            else:
+                self.first = b
+            self.cur = b
+            self.c_lo = self.c_hi = self.c_sum = v
+            self.c_n = 1
+            return
+        if v < self.c_lo:
+            self.c_lo = v
+        elif v > self.c_hi:
+            self.c_hi = v
+        self.c_sum += v
+        self.c_n += 1
+
+    def window(self, count: int, last: int | None, partial: bool) -> Window:
+        count = min(count, self.cap)
+        newest = self.cur if partial else self.head
+        end = newest if last is None else last
+        if newest is None or end is None:
+            nan = np.full(count, np.nan, np.float32)
+            return Window(nan, nan.copy(), nan.copy(), -1 if end is None else end)
+        start = end - count + 1
+        idx = np.arange(start, end + 1) % self.cap
+        lo, hi, n = self.lo[idx], self.hi[idx], self.n[idx]
+        mean = np.full(count, np.nan, np.float32)
+        np.divide(self.sum[idx], n, out=mean, where=n > 0, casting="unsafe")
+        # before the first sample, overwritten since, or not reached yet
+        oldest = max(self.first, newest - self.cap + 1)
+        if start < oldest:
+            k = min(count, oldest - start)
+            lo[:k] = hi[:k] = mean[:k] = np.nan
+        if end > newest:
+            k = min(count, end - newest)
+            lo[-k:] = hi[-k:] = mean[-k:] = np.nan
+        if start <= self.cur <= end and partial:  # bucket still filling
+            i = self.cur - start
+            lo[i], hi[i] = self.c_lo, self.c_hi
+            mean[i] = self.c_sum / self.c_n
+        return Window(lo, hi, mean, end)
+
+
+class SignalHistory:
+    def __init__(self, rate_hz: float):
+        self.cap = max(16, int(RAW_SECONDS * rate_hz * 1.25))
+        self.t = np.zeros(self.cap, np.float64)
+        self.v = np.zeros(self.cap, np.float32)
+        self.count = 0  # samples ever appended
+        self.tiers = {w: _Tier(w, TIER_BUCKETS[w]) for w in TIERS}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self.t.nbytes + self.v.nbytes + sum(
+            x.lo.nbytes + x.hi.nbytes + x.sum.nbytes + x.n.nbytes
+            for x in self.tiers.values())
+
+    def append(self, t: float, v: float) -> None:
+        with self._lock:
+            i = self.count % self.cap
+            self.t[i] = t
+            self.v[i] = v
+            self.count += 1
+            for tier in self.tiers.values():
+                tier.add(t, v)
+
+    def raw(self, since: float) -> tuple[np.ndarray, np.ndarray]:
+        """Samples with t >= since, oldest first (copies)."""
+        with self._lock:
+            n = min(self.count, self.cap)
+            s = self.count % self.cap if self.count > self.cap else 0
+            # oldest-first is [s:n] then [0:s]; both segments are sorted
+            if s and since <= self.t[n - 1]:
+                k = s + int(np.searchsorted(self.t[s:n], since))
+                return (np.concatenate((self.t[k:n], self.t[:s])),
+                        np.concatenate((self.v[k:n], self.v[:s])))
+            k = int(np.searchsorted(self.t[:s or n], since))
+            return self.t[k:s or n].copy(), self.v[k:s or n].copy()
+
+    def window(self, width: float, count: int, last: int | None = None,
+               partial: bool = True) -> Window:
+        """`count` buckets of the `width` tier ending at bucket `last`
+        (default: the newest sample's). Buckets past the newest sample read
+        as NaN. `partial` includes the bucket still filling."""
+        with self._lock:
+            return self.tiers[width].window(count, last, partial)
+
+
+class HistoryStore:
+    def __init__(self, spec: dict[str, float]):
+        self._series = {name: SignalHistory(hz) for name, hz in spec.items()}
+
+    def get(self, name: str) -> SignalHistory | None:
+        return self._series.get(name)
+
+    def append(self, name: str, t: float, v) -> None:
+        h = self._series.get(name)
+        if h is not None and v is not None:
+            h.append(t, float(v))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(h.nbytes for h in self._series.values())
@@ -0,0 +1,74 @@
+"""
+latency_probe.py
+CAN-to-pixel latency tagging — inert unless DASH_LATENCY_PROBE=1.
+
+tools/latency_harness.py sends frames carrying a sequence number in bytes
+the DBC leaves reserved (Pedal_Processed [4..5], Vehicle_Speed [1] and [3]).
+can_rx calls on_frame() after decoding, which stores (seq, receive time)
+next to the value in `latest` under "seq:<signal>". main.py draws from a
+copy of `latest` and calls on_flip() once display.flip() returns: the probe
+records the flip time, the (seq, t_rx) the copy held and a CRC of each
+REGIONS rectangle read back through pygame.surfarray, so the harness can
+check the pixels against the value it sent.
+"""
+
+import os
+import time
+import zlib
+from typing import NamedTuple
+
+import can
+import can_ids
+
+ENABLED = os.environ.get("DASH_LATENCY_PROBE") == "1"
+
+# frame id -> (signals decoded from it, sequence number from the payload)
+SEQ_FIELDS = {
+    can_ids.PEDAL_PROCESSED: (("apps_pct", "brake"),
+                              lambda d: d[4] | d[5] << 8 if len(d) >= 6 else None),
+    can_ids.VEHICLE_SPEED: (("speed",),
+                            lambda d: d[1] | d[3] << 8 if len(d) >= 4 else None),
+}
+
+REGIONS: dict[str, tuple] = {}  # signal -> (x, y, w, h); set by the harness
+
+
+class Shown(NamedTuple):
+    t: float  # time.monotonic() after flip
+    seq: dict  # signal -> (seq, t_rx) the drawn values came from
+    value: dict  # signal -> value drawn
+    crc: dict  # signal -> CRC32 of its REGIONS rectangle
+
+
+frames: list[Shown] = []
+
+
+def on_frame(msg: can.Message, latest: dict) -> None:
+    """RX thread, after the frame's values were published."""
+    spec = SEQ_FIELDS.get(msg.arbitration_id)
+    if spec is None:
+        return
+    names, seq_of = spec
+    seq = seq_of(msg.data)
+    if seq is None:
+        return
+    t = time.monotonic()
+    for name in names:
+        latest["seq:" + name] = (seq, t)
+
+
+def on_flip(surface, view: dict) -> None:
+    """UI thread, right after display.flip() showed `view`."""
+    import pygame  # only when probing: keeps can_rx importable headless
+
+    t = time.monotonic()
+    seq, value, crc = {}, {}, {}
+    for name, rect in REGIONS.items():
+        tag = view.get("seq:" + name)
+        if tag is None:
+            continue
+        seq[name] = tag
+        value[name] = view.get(name)
+        px = pygame.surfarray.array3d(surface.subsurface(rect))
+        crc[name] = zlib.crc32(px.tobytes())
+    frames.append(Shown(t, seq, value, crc))
@@ -2,36 +2,91 @@
 main.py
 """
 
+import time
+
 import can
+import can_aio
 import can_rx
+import frame_capture
+import gc_control
+import latency_probe
+import metrics
 import pygame
+import rt
+import watchdog
+from service.inverter import InverterService
+from service.inverter_params import ParamClient
+from service.tc import TCService
+from service.telemetry import TelemetryPublisher
 from service.temp_service import TempService
 from service.tsal import TSALService
+from service.web_mirror import WebMirror
 from ui.dashboard import DashboardScreen
+from ui.diag import DiagScreen
 from ui.menu import MenuScreen
 from ui.tc import TCScreen
 from ui.temp_control import TempControlScreen
 
+rt.setup_process()  # mlock / GIL switch interval, if configured (rt.py)
+W, H = 800, 480
+# Forked before any thread starts (frame_capture.py); off unless DASH_CAPTURE.
+capture = frame_capture.FrameCapture((W, H)) if frame_capture.ENABLED else None
+
 # ---------------------------------------------------------------------------
 # CAN bus
 # ---------------------------------------------------------------------------
 print(f"[INIT] Opening SocketCAN bus on '{can_rx.BUS_CHANNEL}'...")
-BUS = can.interface.Bus(channel=can_rx.BUS_CHANNEL, bustype="socketcan")
-print("[INIT] Bus is up. Starting RX thread...")
-can_rx.start(BUS)
+BUS = can.interface.Bus(channel=can_rx.BUS_CHANNEL, interface=can_rx.BUS_INTERFACE)
+if can_rx.RX_MODE == "asyncio":
+    print("[INIT] Bus is up. Starting asyncio CAN I/O loop...")
+    TX = can_aio.start(BUS)
+else:
+    print("[INIT] Bus is up. Starting RX thread...")
+    can_rx.start(BUS)
+    TX = BUS
 
 # ---------------------------------------------------------------------------
 # Services
 # ---------------------------------------------------------------------------
-temp_svc = TempService(bus=BUS)
+temp_svc = TempService(bus=TX)
 can_rx.register_temp_handler(temp_svc.on_can_frame)
-tsal_svc = TSALService()
+inv_svc = InverterService(publish=can_rx.publish)  # temps, per received frame
+can_rx.register_handler(inv_svc.frame_ids, inv_svc.on_can_frame)
+tc_svc = TCService(bus=TX)
+can_rx.register_handler(tc_svc.frame_ids, tc_svc.on_can_frame)
+params = ParamClient(bus=TX)
+can_rx.register_handler(params.frame_ids, params.on_can_frame)
+tsal_svc = TSALService().start()
+telemetry = TelemetryPublisher(can_rx.latest).start()  # off unless DASH_TELEMETRY
+if telemetry.target is not None:
+    print(f"[INIT] Telemetry uplink to {telemetry.target[0]}:{telemetry.target[1]}")
+mirror = WebMirror(can_rx.latest).start()  # off unless DASH_WEB
+if mirror.port is not None:
+    print(f"[INIT] Web mirror on http://{mirror.bind[0]}:{mirror.port}/")
+
+# ---------------------------------------------------------------------------
+# Watchdog and metrics
+# ---------------------------------------------------------------------------
+watchdog.on_change = lambda faults: can_rx.publish("watchdog", faults)
+frame_time = metrics.histogram(
+    "ui_frame_seconds", "UI frame work, events to flip (without the tick sleep)",
+    (0.002, 0.005, 0.01, 0.015, 0.02, 0.025, 0.033, 0.05, 0.1, 0.25))
+if telemetry.target is not None:
+    metrics.counter("telemetry_packets_total", "Telemetry packets sent",
+                    fn=lambda: telemetry.packets)
+    metrics.counter("telemetry_throttled_total", "Telemetry ticks cut by the byte budget",
+                    fn=lambda: telemetry.throttled)
+if mirror.port is not None:
+    metrics.gauge("web_clients", "Connected web mirror clients", fn=lambda: mirror.clients)
+if capture is not None:
+    metrics.counter("capture_skipped_total", "Captures skipped, worker behind",
+                    fn=lambda: capture.skipped)
+metrics.start()  # off unless DASH_METRICS_PORT / DASH_METRICS_FILE
 
 # ---------------------------------------------------------------------------
 # Pygame
 # ---------------------------------------------------------------------------
 pygame.init()
-W, H = 800, 480
 screen = pygame.display.set_mode((W, H))
 pygame.display.set_caption("NFS Dashboard")
 clock = pygame.time.Clock()
@@ -40,34 +95,85 @@ clock = pygame.time.Clock()
 # Screen registry
 # ---------------------------------------------------------------------------
 screens: dict = {
-    "dashboard": DashboardScreen(tsal=tsal_svc),
+    "dashboard": DashboardScreen(tsal=tsal_svc, trends=can_rx.trends, temp=temp_svc),
     "menu": MenuScreen(),
-    "tc": TCScreen(bus=BUS),
-    "temp": TempControlScreen(bus=BUS, service=temp_svc),
+    "tc": TCScreen(service=tc_svc),
+    "temp": TempControlScreen(bus=TX, service=temp_svc, trends=can_rx.trends),
+    "diag": DiagScreen(params),
 }
 current: str = "dashboard"
 
+# One subscription per screen; only the active one receives change bits.
+subs: dict = {
+    name: can_rx.signals.subscribe(getattr(scr, "SIGNALS", ()))
+    for name, scr in screens.items()
+}
+can_rx.signals.activate(subs[current])
+temp_seen = -1  # TempState.version last published
+
 # ---------------------------------------------------------------------------
 # Main loop
 # ---------------------------------------------------------------------------
+watchdog.watch("ui", watchdog.UI_STALL_S)
+watchdog.start()
+# Last, so the threads started above don't inherit the UI's CPU / priority.
+rt.apply("ui")
+gc_control.setup()  # freeze start-up heap / GC mode, if configured
 print("[INIT] UI loop started.")
+FPS = 30
 running = True
 while running:
+    frame_t0 = time.monotonic()
+    watchdog.beat("ui")
+    redraw = False
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
             continue
+        # Input can change screen-local state (hover, level, theme).
+        redraw = True
         result = screens[current].handle_event(event)
         if result and result in screens:
             print(f"[NAV] {current} -> {result}")
             current = result
+            can_rx.signals.activate(subs[current])
+
+    can_rx.publish("tsal_state", tsal_svc.state)
+    can_rx.publish("tsal_relay", tsal_svc.relay_on)
+    # Config requests: retry / expire, then show delivery state.
+    temp_svc.poll()
+    tc_svc.poll()
+    can_rx.publish("tc_req", tc_svc.result())
+    params.poll()
+    can_rx.publish("param_rev", params.revision)
+
+    temp_state = temp_svc.state
+    if temp_state.version != temp_seen:
+        temp_seen = temp_state.version
+        can_rx.publish("temp_state", temp_state)
+    can_rx.publish("temp_stale", temp_svc.is_stale)
+    can_rx.publish("trend_tick", int(frame_t0))  # trend graphs scroll once a second
 
-    tsal_svc.tick(pygame.time.get_ticks())
-    can_rx.latest.update(temp_svc.summary())
-    screens[current].draw(screen, can_rx.latest)
-    pygame.display.flip()
-    clock.tick(30)
+    if subs[current].take() or redraw:
+        # Probe: draw from a copy so the tagged sequence numbers match the pixels.
+        view = dict(can_rx.latest) if latency_probe.ENABLED else can_rx.latest
+        screens[current].draw(screen, view)
+        pygame.display.flip()
+        if latency_probe.ENABLED:
+            latency_probe.on_flip(screen, view)
+        if capture is not None:
+            capture.on_flip(screen)
+    frame_time.observe(time.monotonic() - frame_t0)
+    gc_control.end_frame(frame_t0 + 1.0 / FPS)
+    clock.tick(FPS)
 
+watchdog.stop()
 tsal_svc.cleanup()
+telemetry.stop()
+mirror.stop()
+if capture is not None:
+    capture.close()
+can_rx.close_log()
+gc_control.report()
 pygame.quit()
 print("[EXIT] Dashboard closed.")
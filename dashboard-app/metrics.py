@@ -0,0 +1,206 @@
+"""
+metrics.py
+Counters, gauges and histograms in the Prometheus text format (version
+0.0.4), for watching the dashboard from a laptop or a node_exporter.
+
+Two kinds of source:
+  - Event metrics are updated where the event happens: Counter.inc() or
+    Histogram.observe(). That is one attribute add, or a bisect and two
+    adds, on the thread that owns the event.
+  - Callback metrics read a counter that already exists, such as
+    AsyncCanIO.tx_errors, Exporter.dropped or the RX queue depth. The
+    function runs only when the metrics are rendered, so the hot path pays
+    nothing. It returns a number, or {label value: number} for a labelled
+    family.
+
+Updates take no lock. With the GIL, an increment racing a render can at
+worst be seen one scrape late.
+
+Export (both off by default):
+  DASH_METRICS_PORT=9108            GET http://127.0.0.1:9108/metrics
+  DASH_METRICS_FILE=/var/lib/node_exporter/dash.prom
+                                    rewritten atomically every
+                                    TEXTFILE_INTERVAL_S (node_exporter
+                                    textfile collector)
+"""
+
+import bisect
+import os
+import threading
+import time
+
+PORT = int(os.environ.get("DASH_METRICS_PORT", "0"))
+TEXTFILE = os.environ.get("DASH_METRICS_FILE")
+TEXTFILE_INTERVAL_S = 5.0
+PREFIX = "dash_"
+
+_registry: list = []
+
+
+# ── Metric types ─────────────────────────────────────────────────────────────
+class Counter:
+    """Monotonic count. inc() from any thread, or give `fn` to read one."""
+
+    __slots__ = ("name", "help", "label", "fn", "value")
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, fn=None, label: str | None = None):
+        self.name = PREFIX + name
+        self.help = help
+        self.label = label
+        self.fn = fn
+        self.value = 0
+
+    def inc(self, n: int = 1) -> None:
+        self.value += n
+
+    def samples(self):
+        v = self.value if self.fn is None else self.fn()
+        if isinstance(v, dict):
+            for lv, x in v.items():
+                yield f'{self.name}{{{self.label}="{lv}"}}', x
+        else:
+            yield self.name, v
+
+
+class Gauge(Counter):
+    """Point-in-time value. set() it, or give `fn` to read it at render."""
+
+    __slots__ = ()
+    kind = "gauge"
+
+    def set(self, v: float) -> None:
+        self.value = v
+
+
+class Histogram:
+    """Cumulative-bucket histogram; observe() is O(log buckets)."""
+
+    __slots__ = ("name", "help", "bounds", "counts", "sum", "count")
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, bounds: tuple[float, ...]):
+        self.name = PREFIX + name
+        self.help = help
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, v: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, v)] += 1
+        self.sum += v
+        self.count += 1
+
+    def samples(self):
+        counts = list(self.counts)  # one snapshot; count and sum may lag by an observation
+        acc = 0
+        for le, n in zip(self.bounds, counts):
+            acc += n
+            yield f'{self.name}_bucket{{le="{le:g}"}}', acc
+        yield f'{self.name}_bucket{{le="+Inf"}}', acc + counts[-1]
+        yield f"{self.name}_sum", self.sum
+        yield f"{self.name}_count", acc + counts[-1]
+
+
+# ── Registry ─────────────────────────────────────────────────────────────────
+def counter(name: str, help: str, fn=None, label: str | None = None) -> Counter:
+    m = Counter(name, help, fn, label)
+    _registry.append(m)
+    return m
+
+
+def gauge(name: str, help: str, fn=None, label: str | None = None) -> Gauge:
+    m = Gauge(name, help, fn, label)
+    _registry.append(m)
+    return m
+
+
+def histogram(name: str, help: str, bounds: tuple[float, ...]) -> Histogram:
+    m = Histogram(name, help, bounds)
+    _registry.append(m)
+    return m
+
+
+def render() -> str:
+    """The whole registry as Prometheus text exposition."""
+    out = []
+    for m in _registry:
+        try:
+            samples = list(m.samples())
+        except Exception as e:  # a callback's owner went away; skip, don't fail the scrape
+            print(f"[METRICS] {m.name}: {e}")
+            continue
+        out.append(f"# HELP {m.name} {m.help}")
+        out.append(f"# TYPE {m.name} {m.kind}")
+        for key, v in samples:
+            out.append(f"{key} {float(v):.9g}")
+    return "\n".join(out) + "\n"
+
+
+# ── Export ───────────────────────────────────────────────────────────────────
+def write_textfile(path: str) -> None:
+    """Atomic rewrite: the collector never reads half a file."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+def _serve(port: int) -> None:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    try:
+        server = HTTPServer(("127.0.0.1", port), Handler)
+    except OSError as e:
+        print(f"[METRICS] HTTP endpoint on port {port} failed: {e}")
+        return
+    print(f"[METRICS] http://127.0.0.1:{port}/metrics")
+    server.serve_forever()
+
+
+def _textfile_loop(path: str) -> None:
+    while True:
+        try:
+            write_textfile(path)
+        except OSError as e:
+            print(f"[METRICS] writing {path} failed: {e}")
+        time.sleep(TEXTFILE_INTERVAL_S)
+
+
+def start(port: int = PORT, textfile: str | None = TEXTFILE) -> None:
+    """Start whichever exports are configured (daemon threads)."""
+    if port:
+        threading.Thread(target=_serve, args=(port,), name="metrics-http",
+                         daemon=True).start()
+    if textfile:
+        threading.Thread(target=_textfile_loop, args=(textfile,), name="metrics-file",
+                         daemon=True).start()
+        print(f"[METRICS] writing {textfile} every {TEXTFILE_INTERVAL_S:.0f} s")
+
+
+# ── Shared event metrics ─────────────────────────────────────────────────────
+# Updated from several modules; the rest are registered next to what they count.
+_tx_errors: dict[str, int] = {}
+counter("can_tx_errors_total", "CAN frames the bus refused to send",
+        fn=lambda: dict(_tx_errors), label="source")
+
+
+def tx_error(source: str) -> None:
+    """Count one failed bus.send() from `source` ("cfg", "param", "aio")."""
+    _tx_errors[source] = _tx_errors.get(source, 0) + 1
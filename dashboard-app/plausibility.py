@@ -0,0 +1,233 @@
+"""
+plausibility.py
+Pedal plausibility rules (docs/plausibility.md) checked on the decoded stream.
+
+The MCU owns the safety reaction and reports its verdict in StatusBits; the
+dashboard re-checks what it can see on the bus so a fault shows by name and
+leaves a timestamped event, and the same rules validate recorded sessions.
+APPS agreement needs APPS1/APPS2, and the 2–98 % range check applies to
+the raw sensor signals. Neither is on the bus (apps_pct / brake are 0–100 %
+travel, 0 % = released), so those bits are only ever reported by the MCU.
+
+Rules are declared next to the StatusBits map and compiled once:
+
+    RULES = (("APPS_RATE", 1, "rate", ("apps_pct",), 20.0, 0.010), ...)
+    engine = Engine(RULES)
+    engine.feed("apps_pct", 37.0, t)      # RX thread; True if `faults` changed
+    events = evaluate(RULES, series)      # whole log at once, NumPy
+
+  ("rate", limit, window_s)        |Δ| between samples <= limit per window_s
+                                   (samples closer than window_s get the full
+                                   limit)
+  ("overlap", thresholds, hold_s)  every signal above its threshold for at
+                                   least hold_s
+  ("range", lo, hi)                lo <= value <= hi
+
+A rule is evaluated when its first signal arrives, against the latest value
+of the others, so every check costs a fixed few operations per frame. The
+vectorised form samples the other signals the same way (last value at or
+before each trigger time), so both paths produce the same events.
+"""
+
+import collections
+from typing import NamedTuple
+
+import numpy as np
+
+STATUS_BITS = {
+    0: "APPS_AGREE",
+    1: "APPS_RATE",
+    2: "BRAKE_OVERLAP",
+    3: "RANGE",
+    7: "LATCHED",
+}
+
+# (name, StatusBits bit, kind, signals, *args)
+RULES = (
+    ("APPS_RATE", 1, "rate", ("apps_pct",), 20.0, 0.010),
+    ("BRAKE_OVERLAP", 2, "overlap", ("brake", "apps_pct"), (15.0, 5.0), 0.020),
+)
+
+EVENT_LOG = 256  # events kept in Engine.events
+
+
+class FaultEvent(NamedTuple):
+    t: float
+    rule: str
+    active: bool  # True = raised, False = cleared
+    value: float  # the rule's first signal at t
+
+
+# ── Checks (streaming step + vectorised form) ─────────────────────────────────
+class Rate:
+    __slots__ = ("sig", "limit", "window", "v", "t")
+
+    def __init__(self, signals, limit: float, window_s: float):
+        self.sig = signals[0]
+        self.limit = limit
+        self.window = window_s
+        self.v = None
+        self.t = 0.0
+
+    def step(self, t: float, latest: dict) -> bool:
+        v = latest[self.sig]
+        prev, dt = self.v, t - self.t
+        self.v, self.t = v, t
+        if prev is None:
+            return False
+        return abs(v - prev) > self.limit * max(1.0, dt / self.window)
+
+    def vector(self, t, cols):
+        v = cols[0]
+        bad = np.abs(np.diff(v)) > self.limit * np.maximum(1.0, np.diff(t) / self.window)
+        return np.concatenate(([False], bad))
+
+
+class Overlap:
+    __slots__ = ("sigs", "above", "hold", "since")
+
+    def __init__(self, signals, above: tuple, hold_s: float):
+        self.sigs = tuple(signals)
+        self.above = tuple(above)
+        self.hold = hold_s
+        self.since = None
+
+    def step(self, t: float, latest: dict) -> bool:
+        for s, th in zip(self.sigs, self.above):
+            v = latest.get(s)
+            if v is None or not v > th:
+                self.since = None
+                return False
+        if self.since is None:
+            self.since = t
+        return t - self.since >= self.hold
+
+    def vector(self, t, cols):
+        cond = np.ones(len(t), bool)
+        for v, th in zip(cols, self.above):
+            cond &= v > th
+        idx = np.arange(len(t))
+        starts = cond & ~np.concatenate(([False], cond[:-1]))
+        run_start = np.maximum.accumulate(np.where(starts, idx, 0))
+        return cond & (t - t[run_start] >= self.hold)
+
+
+class Range:
+    __slots__ = ("sig", "lo", "hi")
+
+    def __init__(self, signals, lo: float, hi: float):
+        self.sig = signals[0]
+        self.lo = lo
+        self.hi = hi
+
+    def step(self, t: float, latest: dict) -> bool:
+        return not self.lo <= latest[self.sig] <= self.hi
+
+    def vector(self, t, cols):
+        v = cols[0]
+        return ~((v >= self.lo) & (v <= self.hi))
+
+
+_KINDS = {
+    "rate": Rate,
+    "overlap": Overlap,
+    "range": Range,
+}
+
+
+class Rule:
+    __slots__ = ("name", "bit", "signals", "check", "active")
+
+    def __init__(self, name: str, bit: int, kind: str, signals, *args):
+        self.name = name
+        self.bit = bit
+        self.signals = tuple(signals)
+        self.check = _KINDS[kind](self.signals, *args)
+        self.active = False
+
+
+def compile_rules(spec=RULES) -> list[Rule]:
+    """Declarative tuples -> Rule objects with fresh state."""
+    return [Rule(*r) for r in spec]
+
+
+# ── Streaming ────────────────────────────────────────────────────────────────
+class Engine:
+    """feed() runs on the RX thread; `faults` (StatusBits layout) and
+    `events` are read by the UI."""
+
+    def __init__(self, spec=RULES, on_event=None):
+        self.rules = compile_rules(spec)
+        self._by_trigger: dict[str, tuple] = {}
+        for r in self.rules:
+            self._by_trigger[r.signals[0]] = self._by_trigger.get(r.signals[0], ()) + (r,)
+        self._watched = frozenset(s for r in self.rules for s in r.signals)
+        self.latest: dict = {}
+        self.faults = 0
+        self.events: collections.deque = collections.deque(maxlen=EVENT_LOG)
+        self._on_event = on_event or _print_event
+
+    def feed(self, name: str, value, t: float) -> bool:
+        """Returns True if `faults` changed."""
+        if name not in self._watched:
+            return False
+        self.latest[name] = value
+        changed = False
+        for r in self._by_trigger.get(name, ()):
+            active = r.check.step(t, self.latest)
+            if active != r.active:
+                r.active = active
+                ev = FaultEvent(t, r.name, active, value)
+                self.events.append(ev)
+                self._on_event(ev)
+                changed = True
+        if changed:
+            faults = 0
+            for r in self.rules:
+                if r.active:
+                    faults |= 1 << r.bit
+            self.faults = faults
+        return changed
+
+    def active_names(self) -> list[str]:
+        return [r.name for r in self.rules if r.active]
+
+
+def _print_event(ev: FaultEvent) -> None:
+    print(f"[PLAUS] {'RAISED' if ev.active else 'cleared'} {ev.rule} "
+          f"at t={ev.t:.3f} (value {ev.value:.1f})")
+
+
+def names(bits: int) -> list[str]:
+    """StatusBits-layout mask -> names, lowest bit first."""
+    return [n for b, n in STATUS_BITS.items() if bits & (1 << b)]
+
+
+# ── Vectorised (recorded sessions) ───────────────────────────────────────────
+def evaluate(spec, series: dict) -> list[FaultEvent]:
+    """series: signal -> (t, values) NumPy arrays sorted by t. Returns every
+    raise / clear, ordered by time, as the streaming Engine would emit them."""
+    events = []
+    for r in compile_rules(spec):
+        if r.signals[0] not in series:
+            continue
+        t, v = series[r.signals[0]]
+        if len(t) == 0:
+            continue
+        t = np.asarray(t, np.float64)
+        cols = [np.asarray(v, np.float64)]
+        for s in r.signals[1:]:
+            if s not in series:
+                cols.append(np.full(len(t), np.nan))
+                continue
+            ts, vs = series[s]
+            i = np.searchsorted(ts, t, side="right") - 1
+            col = np.asarray(vs, np.float64)[np.maximum(i, 0)]
+            col[i < 0] = np.nan
+            cols.append(col)
+        active = r.check.vector(t, cols)
+        edges = np.flatnonzero(active != np.concatenate(([False], active[:-1])))
+        events.extend(FaultEvent(float(t[k]), r.name, bool(active[k]), float(cols[0][k]))
+                      for k in edges)
+    events.sort(key=lambda e: e.t)
+    return events
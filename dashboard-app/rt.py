@@ -0,0 +1,129 @@
+"""
+rt.py
+Real-time placement for the dashboard's threads: CPU affinity, SCHED_FIFO /
+SCHED_RR priority, locked memory and the GIL switch interval.
+
+Everything is best-effort. A setting the OS refuses (no CAP_SYS_NICE, no
+RLIMIT_MEMLOCK, not Linux) is logged once as "[RT] ..." and skipped; the
+dashboard runs exactly as before. Configure with the module globals or the
+environment:
+
+  DASH_RT_RX_CPUS=3          RX thread (can_rx / can_aio) pinned to CPU 3
+  DASH_RT_UI_CPUS=2          pygame main loop pinned to CPU 2
+  DASH_RT_POLICY=fifo        fifo | rr | other (default other = unchanged)
+  DASH_RT_RX_PRIO=60         RT priorities (1..99); RX above UI so a frame
+  DASH_RT_UI_PRIO=40         never waits behind a render
+  DASH_RT_MLOCK=1            mlockall(): no page faults after start-up
+  DASH_RT_SWITCH_MS=1        sys.setswitchinterval — how long a thread that
+                             wants the GIL waits for the holder (default 5)
+
+Affinity and policy are per thread: apply() acts on the calling thread, so
+each thread calls it once at the top of its loop. Pair the CPUs with
+isolcpus=/nohz_full= on the Pi kernel command line to keep other processes
+off them. tools/rt_bench.py measures the effect.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+from typing import NamedTuple
+
+
+def _cpus(env: str) -> set[int] | None:
+    v = os.environ.get(env, "").strip()
+    return {int(c) for c in v.split(",") if c.strip()} if v else None
+
+
+RX_CPUS = _cpus("DASH_RT_RX_CPUS")
+UI_CPUS = _cpus("DASH_RT_UI_CPUS")
+POLICY = os.environ.get("DASH_RT_POLICY", "other").lower()
+RX_PRIORITY = int(os.environ.get("DASH_RT_RX_PRIO", "60"))
+UI_PRIORITY = int(os.environ.get("DASH_RT_UI_PRIO", "40"))
+MLOCK = os.environ.get("DASH_RT_MLOCK") == "1"
+SWITCH_MS = float(os.environ.get("DASH_RT_SWITCH_MS", "0")) or None
+
+_POLICIES = {
+    "fifo": getattr(os, "SCHED_FIFO", None),
+    "rr": getattr(os, "SCHED_RR", None),
+    "other": getattr(os, "SCHED_OTHER", None),
+}
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
+
+class Applied(NamedTuple):
+    role: str
+    cpus: frozenset | None  # None = not changed
+    policy: str  # what is in effect
+    priority: int
+    errors: tuple  # settings the OS refused
+
+
+def apply(role: str, cpus: set[int] | None = None, policy: str | None = None,
+          priority: int | None = None, quiet: bool = False) -> Applied:
+    """Pin / prioritise the calling thread. Defaults come from the module
+    globals for role "rx" or "ui"; any other role uses only the arguments."""
+    if role == "rx":
+        cpus = RX_CPUS if cpus is None else cpus
+        priority = RX_PRIORITY if priority is None else priority
+    elif role == "ui":
+        cpus = UI_CPUS if cpus is None else cpus
+        priority = UI_PRIORITY if priority is None else priority
+    policy = (policy or POLICY).lower()
+    priority = priority or 0
+    errors = []
+
+    applied_cpus = None
+    if cpus:
+        try:
+            os.sched_setaffinity(0, cpus)  # 0 = calling thread on Linux
+            applied_cpus = frozenset(os.sched_getaffinity(0))
+        except (AttributeError, OSError, ValueError) as e:
+            errors.append(f"affinity {sorted(cpus)}: {e}")
+
+    in_effect = "other"
+    if policy in ("fifo", "rr"):
+        pol = _POLICIES[policy]
+        try:
+            os.sched_setscheduler(0, pol, os.sched_param(priority))
+            in_effect = policy
+        except (AttributeError, TypeError, OSError) as e:
+            errors.append(f"{policy} priority {priority}: {e}")
+            priority = 0
+    elif policy != "other":
+        errors.append(f"unknown policy {policy!r}")
+    if in_effect == "other":
+        priority = 0
+
+    res = Applied(role, applied_cpus, in_effect, priority, tuple(errors))
+    if not quiet and (cpus or policy != "other"):
+        where = ",".join(map(str, sorted(applied_cpus))) if applied_cpus else "any"
+        print(f"[RT] {role}: cpus={where} policy={in_effect}"
+              + (f"/{priority}" if priority else "")
+              + (f"  (skipped: {'; '.join(errors)})" if errors else ""))
+    return res
+
+
+def lock_memory(quiet: bool = False) -> bool:
+    """mlockall(MCL_CURRENT | MCL_FUTURE). False (logged) if refused."""
+    libc_name = ctypes.util.find_library("c")
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        ok = libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) == 0
+        err = os.strerror(ctypes.get_errno()) if not ok else ""
+    except (OSError, AttributeError) as e:
+        ok, err = False, str(e)
+    if not quiet:
+        print("[RT] memory locked" if ok else f"[RT] mlockall skipped: {err}")
+    return ok
+
+
+def setup_process(quiet: bool = False) -> None:
+    """Process-wide settings (call once from main): mlock, switch interval."""
+    if MLOCK:
+        lock_memory(quiet)
+    if SWITCH_MS:
+        sys.setswitchinterval(SWITCH_MS / 1000.0)
+        if not quiet:
+            print(f"[RT] GIL switch interval {SWITCH_MS:g} ms")
@@ -0,0 +1,157 @@
+"""
+service/config_request.py
+Send-until-confirmed delivery for configuration frames.
+
+bus.send() returning only means the frame left the dashboard. A setting is
+applied when the receiver's status frame echoes it back, so each request
+carries the value we expect to see echoed:
+
+    req = ConfigRequester(bus, on_change=svc._on_config)
+    req.submit("temp_config", msg, expect=(55, 50, 0))
+    req.echo("temp_config", (55, 50, 0))   # from the status-frame handler
+    req.poll()                             # retries / gives up; call often
+
+One request per key is in flight; a newer submit() supersedes the old one.
+An unconfirmed request is re-sent after RETRY_TIMEOUT_S, doubling the wait
+each time, and marked failed after MAX_ATTEMPTS sends. Latency is recorded
+per command: from the last send (round trip) and from the first (total).
+"""
+
+import threading
+from collections import deque
+from typing import Callable, NamedTuple
+
+import can
+import clock
+import metrics
+
+RETRY_TIMEOUT_S = 0.25  # status frames are 100 ms; allow one to be missed
+BACKOFF = 2.0
+MAX_ATTEMPTS = 4
+
+PENDING = "pending"
+OK = "ok"
+FAILED = "failed"
+
+
+class Result(NamedTuple):
+    key: str
+    status: str  # PENDING / OK / FAILED
+    expect: object
+    attempts: int
+    rtt_ms: float | None  # last send -> echo
+    total_ms: float | None  # first send -> echo
+
+
+class _Pending:
+    __slots__ = ("key", "msg", "expect", "first", "last", "attempts", "due")
+
+    def __init__(self, key, msg, expect, now):
+        self.key = key
+        self.msg = msg
+        self.expect = expect
+        self.first = now
+        self.last = now
+        self.attempts = 0
+        self.due = now
+
+
+class ConfigRequester:
+    """submit()/poll() from the UI thread, echo() from the RX thread."""
+
+    def __init__(self, bus, clock=clock.SYSTEM,
+                 timeout_s: float = RETRY_TIMEOUT_S,
+                 max_attempts: int = MAX_ATTEMPTS,
+                 on_change: Callable[[Result], None] | None = None):
+        self._bus = bus
+        self._clock = clock
+        self._timeout = timeout_s
+        self._max = max_attempts
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Pending] = {}
+        self._results: dict[str, Result] = {}
+        self.history: deque[Result] = deque(maxlen=64)  # completed requests
+        self.sent = 0
+        self.retries = 0
+        self.confirmed = 0
+        self.failed = 0
+
+    # ── API ───────────────────────────────────────────────────────
+    def submit(self, key: str, msg: can.Message, expect) -> None:
+        with self._lock:
+            p = self._pending[key] = _Pending(key, msg, expect, self._clock.now())
+        self._send(p)
+
+    def echo(self, key: str, value) -> bool:
+        """Report the state a status frame says is applied. True if it
+        confirmed the pending request for `key`."""
+        with self._lock:
+            p = self._pending.get(key)
+            if p is None or value != p.expect:
+                return False
+            del self._pending[key]
+            now = self._clock.now()
+            res = Result(key, OK, p.expect, p.attempts,
+                         (now - p.last) * 1000.0, (now - p.first) * 1000.0)
+            self.confirmed += 1
+            self._finish(res)
+        self._notify(key)
+        return True
+
+    def poll(self) -> None:
+        now = self._clock.now()
+        resend, gave_up = [], []
+        with self._lock:
+            for key, p in list(self._pending.items()):
+                if now < p.due:
+                    continue
+                if p.attempts >= self._max:
+                    del self._pending[key]
+                    res = Result(key, FAILED, p.expect, p.attempts, None, None)
+                    self.failed += 1
+                    self._finish(res)
+                    gave_up.append(res)
+                else:
+                    resend.append(p)
+        for p in resend:
+            self.retries += 1
+            self._send(p)
+        for res in gave_up:
+            print(f"[CFG] {res.key}={res.expect} not confirmed after "
+                  f"{res.attempts} sends")
+            self._notify(res.key)
+
+    def result(self, key: str) -> Result | None:
+        """Latest state of `key`: pending, or how the last request ended."""
+        return self._results.get(key)
+
+    # ── Internals ─────────────────────────────────────────────────
+    def _send(self, p: _Pending) -> None:
+        now = self._clock.now()
+        with self._lock:
+            if self._pending.get(p.key) is not p:
+                return  # superseded meanwhile
+            p.attempts += 1
+            p.last = now
+            p.due = now + self._timeout * BACKOFF ** (p.attempts - 1)
+            self._results[p.key] = Result(
+                p.key, PENDING, p.expect, p.attempts, None, None
+            )
+        self.sent += 1
+        try:
+            self._bus.send(p.msg)
+        except can.CanError as e:
+            metrics.tx_error("cfg")
+            print(f"[CFG] CAN TX error ({p.key}): {e}")  # retried on timeout
+        self._notify(p.key)
+
+    def _finish(self, res: Result) -> None:
+        self._results[res.key] = res
+        self.history.append(res)
+
+    def _notify(self, key: str) -> None:
+        # Pass the current result, not the one that triggered us: an echo
+        # racing a send must not leave the listener at PENDING.
+        if self._on_change is not None:
+            self._on_change(self._results[key])
@@ -0,0 +1,208 @@
+"""
+service/gpio_input.py
+Edge-triggered, debounced GPIO inputs.
+
+The backend raises an edge callback per pin (RPi.GPIO interrupt thread); the
+callback only timestamps the edge and queues it. A debounce thread waits
+until the pin has been quiet for DEBOUNCE_MS, re-reads the level and, if it
+differs from the last reported level, hands an InputEvent to every listener
+of that pin. Listeners run on the debounce thread and must be quick.
+
+    gpio = gpio_input.get()              # RPi.GPIO if importable, else mock
+    gpio.listen(KEY_PIN, svc.on_input)   # watches the pin on first use
+    gpio.level(KEY_PIN)                  # last debounced level
+
+MockBackend drives the same path on a PC:
+
+    mock = gpio_input.MockBackend()
+    gpio = gpio_input.GpioInput(mock).start()
+    mock.set_level(17, True, bounce=4)   # 4 chatter edges, then settles high
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, NamedTuple
+
+try:
+    import RPi.GPIO as GPIO
+
+    _GPIO_AVAILABLE = True
+except ImportError:
+    _GPIO_AVAILABLE = False
+
+DEBOUNCE_MS = 20
+
+
+class InputEvent(NamedTuple):
+    pin: int
+    level: bool
+    t_edge: float  # monotonic s, first edge of the burst
+    t_stable: float  # monotonic s, level confirmed
+
+
+# ── Backends ──────────────────────────────────────────────────────────────
+class RPiBackend:
+    name = "RPi.GPIO"
+
+    def __init__(self):
+        GPIO.setmode(GPIO.BCM)
+
+    def setup_input(self, pin: int) -> None:
+        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+
+    def read(self, pin: int) -> bool:
+        return bool(GPIO.input(pin))
+
+    def on_edge(self, pin: int, cb: Callable[[int], None]) -> None:
+        GPIO.add_event_detect(pin, GPIO.BOTH, callback=cb)
+
+    def close(self, pins) -> None:
+        for pin in pins:
+            GPIO.remove_event_detect(pin)
+
+
+class MockBackend:
+    """In-memory pins; set_level() fires edge callbacks on the calling thread,
+    like the RPi.GPIO interrupt thread would."""
+
+    name = "mock"
+
+    def __init__(self):
+        self._levels: dict[int, bool] = {}
+        self._cbs: dict[int, Callable[[int], None]] = {}
+
+    def setup_input(self, pin: int) -> None:
+        self._levels.setdefault(pin, False)  # pull-down
+
+    def read(self, pin: int) -> bool:
+        return self._levels.get(pin, False)
+
+    def on_edge(self, pin: int, cb: Callable[[int], None]) -> None:
+        self._cbs[pin] = cb
+
+    def close(self, pins) -> None:
+        for pin in pins:
+            self._cbs.pop(pin, None)
+
+    def set_level(self, pin: int, level: bool, bounce: int = 0,
+                  bounce_gap_s: float = 0.0005) -> None:
+        """Drive `pin` to `level`, chattering `bounce` extra edges first."""
+        cb = self._cbs.get(pin)
+        for i in range(bounce):
+            self._levels[pin] = level if i % 2 == 0 else not level
+            if cb is not None:
+                cb(pin)
+            time.sleep(bounce_gap_s)
+        if self._levels.get(pin, False) != level or bounce:
+            self._levels[pin] = level
+            if cb is not None:
+                cb(pin)
+
+
+# ── Debounced input layer ─────────────────────────────────────────────────
+class GpioInput:
+    def __init__(self, backend=None, debounce_ms: int = DEBOUNCE_MS):
+        if backend is None:
+            backend = RPiBackend() if _GPIO_AVAILABLE else MockBackend()
+        self.backend = backend
+        self._debounce = debounce_ms / 1000.0
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._levels: dict[int, bool] = {}
+        self._listeners: dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.edges = 0
+        self.events = 0
+
+    # ── Setup ─────────────────────────────────────────────────────
+    def watch(self, pin: int) -> None:
+        with self._lock:
+            if pin in self._levels:
+                return
+            self.backend.setup_input(pin)
+            self._levels[pin] = self.backend.read(pin)
+            self.backend.on_edge(pin, self._on_edge)
+
+    def listen(self, pin: int, fn: Callable[[InputEvent], None]) -> None:
+        """Call fn(InputEvent) on every debounced change of `pin`."""
+        self.watch(pin)
+        with self._lock:
+            # copy-on-write: the debounce thread iterates without the lock
+            self._listeners[pin] = self._listeners.get(pin, ()) + (fn,)
+
+    def level(self, pin: int) -> bool:
+        return self._levels.get(pin, False)
+
+    def start(self) -> "GpioInput":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="gpio-debounce", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._q.put((None, 0.0))
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.backend.close(tuple(self._levels))
+
+    # ── Edge path ─────────────────────────────────────────────────
+    def _on_edge(self, pin: int) -> None:
+        # Interrupt context: timestamp and hand off, nothing else.
+        self._q.put((pin, time.monotonic()))
+
+    def _run(self) -> None:
+        pending: dict[int, list] = {}  # pin -> [first_edge, last_edge]
+        q = self._q
+        while True:
+            timeout = None
+            if pending:
+                due = min(p[1] for p in pending.values()) + self._debounce
+                timeout = max(0.0, due - time.monotonic())
+            try:
+                pin, t = q.get(timeout=timeout)
+                if pin is None:
+                    return
+                self.edges += 1
+                p = pending.get(pin)
+                if p is None:
+                    pending[pin] = [t, t]
+                else:
+                    p[1] = t
+                continue  # drain the burst before settling anything
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for pin, (t_first, t_last) in list(pending.items()):
+                if now - t_last < self._debounce:
+                    continue
+                del pending[pin]
+                level = self.backend.read(pin)
+                if level == self._levels.get(pin):
+                    continue  # glitch: bounced back to where it was
+                self._levels[pin] = level
+                self.events += 1
+                ev = InputEvent(pin, level, t_first, now)
+                for fn in self._listeners.get(pin, ()):
+                    try:
+                        fn(ev)
+                    except Exception as e:
+                        print(f"[GPIO] listener error on pin {pin}: {e}")
+
+
+# ── Process-wide instance ─────────────────────────────────────────────────
+_shared: GpioInput | None = None
+
+
+def get() -> GpioInput:
+    """Shared, started GpioInput (startup and TSAL watch the same pins)."""
+    global _shared
+    if _shared is None:
+        _shared = GpioInput().start()
+        print(f"[GPIO] Input layer up ({_shared.backend.name}, "
+              f"{DEBOUNCE_MS} ms debounce)")
+    return _shared
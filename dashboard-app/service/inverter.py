@@ -0,0 +1,110 @@
+"""
+service/inverter.py
+Cascadia inverter (M160–M177) + BMS current limit — lazy decode via can_codec.
+
+on_can_frame() (RX thread) only stores the raw payload of each message.
+Signals are decoded the first time someone asks for them after a new frame
+arrived, then cached until the next frame of that message replaces the
+payload. A 333 Hz M176_Fast_Info therefore costs one dict store per frame
+unless a screen actually shows one of its signals. The exception is the
+messages behind LATEST_MAP: on those, the new values are decoded right away
+and handed to `publish` (can_rx.publish), so filters, trends and the
+column export see each received frame exactly once.
+
+    inv = InverterService(publish=can_rx.publish)
+    can_rx.register_handler(inv.frame_ids, inv.on_can_frame)
+    inv.get("INV_DC_Bus_Voltage")      # -> float | None (None = never seen)
+"""
+
+import can
+import can_codec
+import can_ids
+import clock
+
+# Cascadia broadcast block 0xA0..0xB1 (M160..M177) + BMS_Current_Limit 0x202
+CASCADIA_IDS = tuple(range(0xA0, 0xB2))
+ID_BMS_CURRENT_LIMIT = can_ids.BMS_CURRENT_LIMIT
+
+# latest[] key -> DBC signal, published on every frame that carries it
+LATEST_MAP = {
+    "coolant_temp": "INV_Coolant_Temp",
+    "inv_hotspot_temp": "INV_Hot_Spot_Temp_Inverter",
+    "motor_hotspot_temp": "INV_Hot_Spot_Temp_Motor",
+    "motor_temp": "INV_Motor_Temp",
+}
+
+
+class InverterService:
+    """Thread-safe by construction: RX thread swaps bytes objects, readers
+    only ever see a complete payload."""
+
+    def __init__(self, clock=clock.SYSTEM, publish=None):
+        self._clock = clock
+        self._publish = publish
+        self.frame_ids = tuple(
+            i for i in can_codec.MESSAGES
+            if i in CASCADIA_IDS or i == ID_BMS_CURRENT_LIMIT
+        )
+        self._raw: dict[int, bytes] = {}
+        self._rx_at: dict[int, float] = {}
+        self._cache: dict[str, tuple] = {}  # signal -> (payload, value)
+        self._published: dict[int, list] = {}  # frame id -> [(latest key, signal)]
+        for key, name in LATEST_MAP.items():
+            self._published.setdefault(can_codec.SIGNALS[name].frame_id, []).append((key, name))
+
+    # ── CAN RX ────────────────────────────────────────────────
+    def on_can_frame(self, msg: can.Message) -> None:
+        aid = msg.arbitration_id
+        self._raw[aid] = bytes(msg.data)
+        self._rx_at[aid] = self._clock.now()
+        if self._publish is not None:
+            for key, name in self._published.get(aid, ()):
+                v = self.get(name)
+                if v is not None:
+                    self._publish(key, v)
+
+    # ── Lazy access ──────────────────────────────────────────
+    def get(self, name: str, default=None):
+        sig = can_codec.SIGNALS[name]
+        raw = self._raw.get(sig.frame_id)
+        if raw is None or len(raw) < sig.min_len:
+            return default
+        hit = self._cache.get(name)
+        if hit is not None and hit[0] is raw:
+            return hit[1]
+        val = sig.decode(raw)
+        if val is None:  # inactive mux page
+            return default
+        self._cache[name] = (raw, val)
+        return val
+
+    def get_many(self, names) -> dict:
+        return {n: self.get(n) for n in names}
+
+    def message(self, frame_id: int) -> dict:
+        """Full decode of one message (diagnostics views, logging)."""
+        raw = self._raw.get(frame_id)
+        if raw is None or len(raw) < can_codec.MESSAGES[frame_id].min_len:
+            return {}
+        return can_codec.decode(frame_id, raw)
+
+    def choice(self, name: str) -> str | None:
+        """VAL_ text for enum-like signals (VSM state, inverter state …)."""
+        v = self.get(name)
+        if v is None:
+            return None
+        return can_codec.CHOICES.get(name, {}).get(int(v), str(v))
+
+    def age(self, frame_id: int) -> float:
+        """Seconds since frame_id was last received (inf if never)."""
+        t = self._rx_at.get(frame_id)
+        return float("inf") if t is None else self._clock.now() - t
+
+    def summary(self) -> dict:
+        """Dashboard keys for messages that have actually been received."""
+        out = {}
+        for key, name in LATEST_MAP.items():
+            v = self.get(name)
+            if v is not None:
+                out[key] = v
+        return out
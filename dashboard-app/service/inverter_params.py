@@ -0,0 +1,266 @@
+"""
+service/inverter_params.py
+Cascadia EEPROM parameter client — M193 command (0x0C1) / M194 response (0x0C2).
+
+The inverter answers one M194 per M193 and the response carries the
+parameter address, so requests for different addresses can be pipelined:
+up to WINDOW are in flight at once and each response is matched back by
+address. Two requests for the same address are never in flight together
+(the response would be ambiguous); duplicate reads are merged.
+
+    params = ParamClient(bus=TX)
+    can_rx.register_handler(params.frame_ids, params.on_can_frame)
+    params.read_many(range(100, 200))     # queued, pipelined
+    params.write(141, 0)                  # read-modify-write is up to you
+    params.poll()                         # timeouts / retries; call often
+    params.cached(141)                    # -> int | None
+
+Unanswered requests are re-sent after TIMEOUT_S, up to MAX_ATTEMPTS sends.
+Read values and confirmed writes are cached with their receive time; a failed
+write drops the cached value, invalidate() drops one or all.
+"""
+
+import threading
+from collections import deque
+from typing import Callable, NamedTuple
+
+import can
+import can_codec
+import can_ids
+import clock
+import metrics
+
+WINDOW = 8  # requests in flight
+TIMEOUT_S = 0.1  # Cascadia answers within a few ms
+MAX_ATTEMPTS = 3
+
+# Address range for a full dump (see the Cascadia parameter/EEPROM guide for
+# what lives where; unused addresses just come back as 0).
+DUMP_FIRST = 100
+DUMP_LAST = 499
+
+
+class ParamResult(NamedTuple):
+    addr: int
+    value: int | None  # None on failure
+    ok: bool
+    write: bool
+    attempts: int
+    rtt_ms: float | None  # last send -> response
+
+
+class _Req:
+    __slots__ = ("addr", "write", "value", "attempts", "sent_at", "callbacks")
+
+    def __init__(self, addr: int, write: bool, value: int, cb):
+        self.addr = addr
+        self.write = write
+        self.value = value
+        self.attempts = 0
+        self.sent_at = 0.0
+        self.callbacks = [cb] if cb is not None else []
+
+
+class ParamClient:
+    """read()/write()/poll() from any thread, on_can_frame() on the RX thread."""
+
+    def __init__(self, bus, clock=clock.SYSTEM, window: int = WINDOW,
+                 timeout_s: float = TIMEOUT_S, max_attempts: int = MAX_ATTEMPTS):
+        self._bus = bus
+        self._clock = clock
+        self._window = window
+        self._timeout = timeout_s
+        self._max = max_attempts
+        self._cv = threading.Condition()
+        self._queue: deque[_Req] = deque()
+        self._inflight: dict[int, _Req] = {}
+        self._cache: dict[int, tuple[int, float]] = {}  # addr -> (value, t)
+        self._failed: set[int] = set()
+        self.revision = 0  # bumped on every completed request (UI redraw)
+        self.sent = 0
+        self.retries = 0
+        self.completed = 0
+        self.failures = 0
+        self.stale = 0  # responses nobody was waiting for
+
+    @property
+    def frame_ids(self) -> tuple:
+        return (can_ids.INV_PARAM_RESPONSE,)
+
+    # ── Requests ──────────────────────────────────────────────────
+    def read(self, addr: int, callback: Callable[[ParamResult], None] | None = None):
+        with self._cv:
+            for r in self._queue:  # merge with a queued read of the same addr
+                if r.addr == addr and not r.write:
+                    if callback is not None:
+                        r.callbacks.append(callback)
+                    return
+            self._queue.append(_Req(addr, False, 0, callback))
+        self._pump()
+
+    def read_many(self, addrs, callback=None) -> None:
+        for a in addrs:
+            self.read(a, callback)
+
+    def write(self, addr: int, value: int,
+              callback: Callable[[ParamResult], None] | None = None) -> None:
+        with self._cv:
+            self._queue.append(_Req(addr, True, int(value), callback))
+        self._pump()
+
+    # ── Cache ─────────────────────────────────────────────────────
+    def cached(self, addr: int, max_age: float | None = None) -> int | None:
+        hit = self._cache.get(addr)
+        if hit is None:
+            return None
+        if max_age is not None and self._clock.now() - hit[1] > max_age:
+            return None
+        return hit[0]
+
+    def age(self, addr: int) -> float:
+        hit = self._cache.get(addr)
+        return float("inf") if hit is None else self._clock.now() - hit[1]
+
+    def invalidate(self, addr: int | None = None) -> None:
+        with self._cv:
+            if addr is None:
+                self._cache.clear()
+                self._failed.clear()
+            else:
+                self._cache.pop(addr, None)
+                self._failed.discard(addr)
+            self.revision += 1
+
+    def state(self, addr: int) -> str | None:
+        """"pending", "failed", "ok" or None (never requested)."""
+        with self._cv:  # the RX thread's _pump() deletes from _queue
+            if addr in self._inflight or any(r.addr == addr for r in self._queue):
+                return "pending"
+        if addr in self._failed:
+            return "failed"
+        return "ok" if addr in self._cache else None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._queue or self._inflight)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until every request has completed (tools / scripts).
+        Drives poll() itself; needs the RX path running."""
+        deadline = self._clock.now() + timeout
+        while self.busy:
+            if self._clock.now() > deadline:
+                return False
+            self.poll()
+            with self._cv:
+                self._cv.wait(0.005)
+        return True
+
+    # ── RX / timers ───────────────────────────────────────────────
+    def on_can_frame(self, msg: can.Message) -> None:
+        if msg.arbitration_id != can_ids.INV_PARAM_RESPONSE or msg.dlc < 6:
+            return
+        addr, write_ok, data = can_codec.decode_m194_read_write_param_response(msg.data)
+        now = self._clock.now()
+        with self._cv:
+            r = self._inflight.pop(addr, None)
+            if r is None:
+                self.stale += 1
+                return
+            ok = bool(write_ok) if r.write else True
+            value = (r.value if r.write else data) if ok else None
+            if ok:
+                self._cache[addr] = (value, now)
+                self._failed.discard(addr)
+            else:
+                self._cache.pop(addr, None)
+                self._failed.add(addr)
+            res = ParamResult(addr, value, ok, r.write, r.attempts,
+                              (now - r.sent_at) * 1000.0)
+            self.completed += 1
+            self.revision += 1
+            self._cv.notify_all()
+        self._done(r, res)
+        self._pump()
+
+    def poll(self) -> None:
+        now = self._clock.now()
+        resend, failed = [], []
+        with self._cv:
+            for addr, r in list(self._inflight.items()):
+                if now - r.sent_at < self._timeout:
+                    continue
+                if r.attempts >= self._max:
+                    del self._inflight[addr]
+                    self._failed.add(addr)
+                    self.failures += 1
+                    self.revision += 1
+                    failed.append(r)
+                else:
+                    r.attempts += 1
+                    r.sent_at = now
+                    resend.append(r)
+            if failed:
+                self._cv.notify_all()
+        for r in resend:
+            self.retries += 1
+            self._send(r)
+        for r in failed:
+            print(f"[PARAM] {'write' if r.write else 'read'} {r.addr} "
+                  f"timed out after {r.attempts} sends")
+            self._done(r, ParamResult(r.addr, None, False, r.write, r.attempts, None))
+        if failed:
+            self._pump()
+
+    # ── Internals ─────────────────────────────────────────────────
+    def _pump(self) -> None:
+        """Move queued requests into the window (skipping addresses that
+        already have one in flight) and send them."""
+        now = self._clock.now()
+        out = []
+        with self._cv:
+            i = 0
+            while len(self._inflight) < self._window and i < len(self._queue):
+                r = self._queue[i]
+                if r.addr in self._inflight:
+                    i += 1
+                    continue
+                del self._queue[i]
+                r.attempts = 1
+                r.sent_at = now
+                self._inflight[r.addr] = r
+                out.append(r)
+        for r in out:
+            self._send(r)
+
+    def _send(self, r: _Req) -> None:
+        data = can_codec.encode_m193_read_write_param_command(
+            VCU_INV_Parameter_Address=r.addr,
+            VCU_INV_Parameter_RW_Command=1 if r.write else 0,
+            VCU_INV_Parameter_Data=r.value if r.write else 0,
+        )
+        self.sent += 1
+        try:
+            self._bus.send(can.Message(
+                arbitration_id=can_ids.INV_PARAM_COMMAND, data=data,
+                is_extended_id=False,
+            ))
+        except can.CanError as e:
+            metrics.tx_error("param")
+            print(f"[PARAM] CAN TX error ({r.addr}): {e}")  # retried on timeout
+
+    @staticmethod
+    def _done(r: _Req, res: ParamResult) -> None:
+        for cb in r.callbacks:
+            try:
+                cb(res)
+            except Exception as e:
+                print(f"[PARAM] callback error on {r.addr}: {e}")
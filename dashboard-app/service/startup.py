@@ -3,17 +3,24 @@ service/startup.py
 ------------------
 Pure startup sequence logic — no pygame, no drawing.
 Consumed by ui/startup.py.
+
+Key and TSMS arrive as debounced edge events from service/gpio_input.py
+(on the debounce thread); tick() only advances the sequence.
 """
 
+import clock
+from service import gpio_input
+
 try:
-    import RPi.GPIO as GPIO
+    import RPi.GPIO  # noqa: F401
 
     _GPIO_AVAILABLE = True
-    KEY_PIN = 17
-    TSMS_PIN = 27
 except ImportError:
     _GPIO_AVAILABLE = False
 
+KEY_PIN = 17
+TSMS_PIN = 27
+
 # -- Phases -----------------------------------------------------------------
 PHASE_LV_ON = 0
 PHASE_KEY_WAIT = 1
@@ -29,12 +36,16 @@ READY_HOLD_MS = 1500
 
 
 class StartupService:
-    def __init__(self):
+    def __init__(self, gpio: gpio_input.GpioInput | None = None,
+                 clock=clock.SYSTEM):
+        self._clock = clock
+        if gpio is None and _GPIO_AVAILABLE:
+            gpio = gpio_input.get()
+        self._gpio = gpio
         self.reset()
-        if _GPIO_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setup(KEY_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-            GPIO.setup(TSMS_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        if gpio is not None:
+            gpio.listen(KEY_PIN, self._on_input)
+            gpio.listen(TSMS_PIN, self._on_input)
 
     def inject_key(self):
         self._key_state = True
@@ -61,9 +72,9 @@ class StartupService:
             self._navigate_away = False
         return val
 
-    def tick(self, now_ms: int):
-        self._poll_gpio()
-
+    def tick(self, now_ms: int | None = None):
+        if now_ms is None:
+            now_ms = self._clock.now_ms()
         if self._phase == PHASE_LV_ON:
             self._phase = PHASE_KEY_WAIT
 
@@ -100,12 +111,14 @@ class StartupService:
         self._tsal_last = 0
         self._tsal_blinks = 0
         self._ready_at = 0
-        self._key_state = False
-        self._tsms_state = False
         self._navigate_away = False
-
-    def _poll_gpio(self):
-        if not _GPIO_AVAILABLE:
-            return
-        self._key_state = bool(GPIO.input(KEY_PIN))
-        self._tsms_state = bool(GPIO.input(TSMS_PIN))
+        gpio = self._gpio
+        self._key_state = gpio.level(KEY_PIN) if gpio else False
+        self._tsms_state = gpio.level(TSMS_PIN) if gpio else False
+
+    # ── GPIO events (debounce thread) ─────────────────────────────
+    def _on_input(self, ev: gpio_input.InputEvent):
+        if ev.pin == KEY_PIN:
+            self._key_state = ev.level
+        elif ev.pin == TSMS_PIN:
+            self._tsms_state = ev.level
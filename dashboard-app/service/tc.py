@@ -0,0 +1,61 @@
+"""
+service/tc.py
+Traction control level — request on 0x120, confirmed by 0x121.
+
+The MCU reports the TC level it is actually using in TC_Status (0x121,
+100 ms). set_level() sends TC_Command through a ConfigRequester, which
+re-sends with backoff until TC_Status echoes the level.
+
+    tc = TCService(bus=TX)
+    can_rx.register_handler((can_ids.TC_STATUS,), tc.on_can_frame)
+    tc.set_level(5)
+    tc.result()        # Result(status="pending" | "ok" | "failed", rtt_ms …)
+"""
+
+import can
+import can_codec
+import can_ids
+import clock
+from service.config_request import ConfigRequester, Result
+
+TC_MIN = 1
+TC_MAX = 10
+TC_MAGIC = 0x01  # byte[1] — lets the MCU distinguish TC frames
+CFG_KEY = "tc_level"
+
+
+class TCService:
+    def __init__(self, bus: can.BusABC | None, clock=clock.SYSTEM):
+        self._req = ConfigRequester(bus, clock=clock) if bus is not None else None
+        self.applied: int | None = None  # last level reported by the MCU
+
+    @property
+    def frame_ids(self) -> tuple:
+        return (can_ids.TC_STATUS,)
+
+    def set_level(self, level: int) -> bool:
+        """Queue `level` for delivery; False if there is no bus."""
+        if self._req is None:
+            return False
+        level = max(TC_MIN, min(TC_MAX, int(level)))
+        msg = can.Message(
+            arbitration_id=can_ids.TC_COMMAND,
+            data=can_codec.encode_tc_command(TC_Level=level, TC_Magic=TC_MAGIC),
+            is_extended_id=False,
+        )
+        self._req.submit(CFG_KEY, msg, level)
+        return True
+
+    def on_can_frame(self, msg: can.Message) -> None:
+        if msg.arbitration_id == can_ids.TC_STATUS and msg.dlc >= 1:
+            (level,) = can_codec.decode_tc_status(msg.data)
+            self.applied = level
+            if self._req is not None:
+                self._req.echo(CFG_KEY, level)
+
+    def poll(self) -> None:
+        if self._req is not None:
+            self._req.poll()
+
+    def result(self) -> Result | None:
+        return self._req.result(CFG_KEY) if self._req is not None else None
@@ -0,0 +1,240 @@
+"""
+service/telemetry.py
+Pit-wall uplink: snapshots of the signal store sent over UDP as compact
+binary deltas.
+
+    packet  header  "NT", version (u8), flags (u8: 1 = keyframe), seq (u32),
+                    t (f8, sender time.time()), field count (u8)   17 bytes
+            fields  field id (u8) + value in that field's FIELDS format
+
+Field ids are positions in FIELDS, so sender and receiver share the table
+and no names go on the air. Each packet carries only the fields whose
+encoded value changed since the last packet that actually left the
+socket. Every KEYFRAME_S a keyframe carries all of them. seq increments
+per packet. The receiver counts gaps as losses, and its state stays
+"unsynced" until the next keyframe.
+
+The publisher has its own thread at RATE_HZ. It reads `source` (can_rx.latest)
+one key at a time and never touches the UI loop. A token bucket keeps the
+uplink under BUDGET_BPS bytes/s, UDP/IP header included. A delta that does
+not fit is cut, least recently sent fields first (FIELDS order on ties).
+The fields left out stay pending, so a tight budget degrades to a round
+robin instead of starving the slow signals. A keyframe is sent whole or
+held back until the bucket has room for it. The socket is non-blocking: a
+send the kernel refuses is dropped, and what it carried stays pending too.
+
+  DASH_TELEMETRY=10.0.0.2:5005   enable, send to this host:port
+  DASH_TELEMETRY_HZ=20           packets per second (max)
+  DASH_TELEMETRY_BPS=4000        byte budget per second
+
+tools/telemetry_rx.py is the pit-side receiver (and a loopback self-test).
+"""
+
+import os
+import socket
+import struct
+import threading
+import time
+
+import clock
+
+MAGIC = b"NT"
+VERSION = 1
+HEADER = struct.Struct("<2sBBIdB")
+F_KEYFRAME = 1
+UDP_OVERHEAD = 28  # IPv4 + UDP headers, counted against the budget
+
+# (latest key, struct format); order breaks ties when the budget cuts a packet
+FIELDS = (
+    ("apps_pct", "f"),
+    ("brake", "f"),
+    ("speed", "f"),
+    ("status_bits", "B"),
+    ("plaus_faults", "B"),
+    ("can_counter_ok", "?"),
+    ("battery", "f"),
+    ("motor_temp", "f"),
+    ("inv_hotspot_temp", "f"),
+    ("coolant_temp", "f"),
+    ("inv_temp", "f"),
+    ("water_temp", "f"),
+    ("battery_temp", "f"),
+    ("uptime", "I"),
+)
+_PACK = tuple(struct.Struct("<B" + fmt) for _, fmt in FIELDS)
+_VALUE = tuple(struct.Struct("<" + fmt) for _, fmt in FIELDS)
+KEYFRAME_BYTES = HEADER.size + sum(p.size for p in _PACK) + UDP_OVERHEAD
+
+
+def _target(spec: str | None) -> tuple[str, int] | None:
+    if not spec:
+        return None
+    host, _, port = spec.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+TARGET = _target(os.environ.get("DASH_TELEMETRY"))
+RATE_HZ = float(os.environ.get("DASH_TELEMETRY_HZ", "20"))
+BUDGET_BPS = float(os.environ.get("DASH_TELEMETRY_BPS", "4000"))
+KEYFRAME_S = 1.0
+BURST_S = 0.25  # token bucket depth, in seconds of budget
+
+
+# ── Sender ───────────────────────────────────────────────────────────────────
+class TelemetryPublisher:
+    def __init__(self, source, target: tuple[str, int] | None = TARGET,
+                 rate_hz: float = RATE_HZ, budget_bps: float = BUDGET_BPS,
+                 keyframe_s: float = KEYFRAME_S, clock=clock.SYSTEM):
+        self._src = source
+        self.target = target
+        self.period = 1.0 / rate_hz
+        self.budget = budget_bps
+        self.keyframe_s = keyframe_s
+        self._clock = clock
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._sent: list[bytes | None] = [None] * len(FIELDS)  # last encoding on the air
+        self._sent_at = [0.0] * len(FIELDS)
+        self._depth = max(budget_bps * BURST_S, KEYFRAME_BYTES)
+        self._tokens = self._depth
+        self._refill_at = clock.now()
+        self._key_due = 0.0  # first packet is a keyframe
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.packets = 0
+        self.bytes = 0
+        self.throttled = 0  # ticks cut short or skipped by the budget
+        self.dropped = 0  # packets the socket refused
+
+    def start(self) -> "TelemetryPublisher":
+        if self._thread is None and self.target is not None:
+            self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._sock.close()
+
+    def _run(self) -> None:
+        nxt = self._clock.now()
+        while not self._stop.is_set():
+            self.tick()
+            nxt += self.period
+            now = self._clock.now()
+            if nxt < now:  # stalled: skip the missed ticks
+                nxt = now
+            self._stop.wait(nxt - now)
+
+    def tick(self) -> int:
+        """Build and send one packet; returns its size (0 = nothing sent)."""
+        now = self._clock.now()
+        self._tokens = min(self._depth,
+                           self._tokens + (now - self._refill_at) * self.budget)
+        self._refill_at = now
+        key = now >= self._key_due
+        fields = []
+        for i, (name, _) in enumerate(FIELDS):
+            v = self._src.get(name)
+            if v is None:
+                continue
+            try:
+                b = _PACK[i].pack(i, v)
+            except struct.error:
+                continue
+            if key or b != self._sent[i]:
+                fields.append((i, b))
+        if not fields:
+            return 0
+        room = int(self._tokens) - UDP_OVERHEAD - HEADER.size
+        size = sum(len(b) for _, b in fields)
+        if key:
+            if size > room:
+                self.throttled += 1  # wait for the bucket to hold a whole keyframe
+                return 0
+            n = len(fields)
+        else:
+            if size > room:
+                fields.sort(key=lambda f: self._sent_at[f[0]])
+            n = 0
+            size = 0
+            while n < len(fields) and size + len(fields[n][1]) <= room:
+                size += len(fields[n][1])
+                n += 1
+            if n < len(fields):
+                self.throttled += 1
+                if n == 0:
+                    return 0
+        head = HEADER.pack(MAGIC, VERSION, F_KEYFRAME if key else 0,
+                           self._seq, time.time(), n)
+        pkt = head + b"".join(b for _, b in fields[:n])
+        try:
+            self._sock.sendto(pkt, self.target)
+        except OSError:  # EAGAIN / ENOBUFS when congested, or no route
+            self.dropped += 1  # fields stay pending
+            return 0
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        for i, b in fields[:n]:
+            self._sent[i] = b
+            self._sent_at[i] = now
+        if key:
+            self._key_due = now + self.keyframe_s
+        self._tokens -= len(pkt) + UDP_OVERHEAD
+        self.packets += 1
+        self.bytes += len(pkt) + UDP_OVERHEAD
+        return len(pkt)
+
+
+# ── Receiver ─────────────────────────────────────────────────────────────────
+class TelemetryState:
+    """Rebuilds the sender's state from packets, in any thread."""
+
+    def __init__(self):
+        self.state: dict = {}
+        self.synced = False  # a keyframe arrived and nothing was lost since
+        self.packets = 0
+        self.lost = 0
+        self.late = 0  # reordered / duplicate packets, ignored
+        self.keyframes = 0
+        self.sent_at = 0.0  # sender time of the newest packet
+        self._seq: int | None = None
+
+    def feed(self, pkt: bytes) -> bool:
+        """Apply one packet; returns False if it was malformed or stale."""
+        if len(pkt) < HEADER.size:
+            return False
+        magic, ver, flags, seq, t, n = HEADER.unpack_from(pkt)
+        if magic != MAGIC or ver != VERSION:
+            return False
+        if self._seq is not None:
+            gap = (seq - self._seq - 1) & 0xFFFFFFFF
+            if gap >= 0x80000000:
+                self.late += 1
+                return False
+            if gap:
+                self.lost += gap
+                self.synced = False
+        values = {}
+        off = HEADER.size
+        try:
+            for _ in range(n):
+                i = pkt[off]
+                v = _VALUE[i].unpack_from(pkt, off + 1)[0]
+                values[FIELDS[i][0]] = v
+                off += _PACK[i].size
+        except (IndexError, struct.error):
+            return False
+        self._seq = seq
+        self.packets += 1
+        self.sent_at = t
+        if flags & F_KEYFRAME:
+            self.state = values
+            self.keyframes += 1
+            self.synced = True
+        else:
+            self.state.update(values)
+        return True
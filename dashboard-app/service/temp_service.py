@@ -2,28 +2,49 @@
 services/temp_service.py
 Temperature logic — Motor & Inverter channels.
 
-CAN frame map:
-  RX 0xA1 (M161) → INV_Hot_Spot_Temp_Motor     bytes [6:7] int16 LE x0.1 °C
-  RX 0xA2 (M162) → INV_Hot_Spot_Temp_Inverter  bytes [2:3] int16 LE x0.1 °C
-  RX 0x120       → Arduino status (NTC temps, fan states, faults)
+CAN frame map (IDs from can_ids.py):
+  RX 0xA1 (M161) → INV_Hot_Spot_Temp_Motor     (can_codec, Cascadia DBC)
+  RX 0xA2 (M162) → INV_Hot_Spot_Temp_Inverter  (can_codec, Cascadia DBC)
+  RX 0x131       → Arduino status (NTC temps, fan states, faults) and the
+                   config it has applied (thresholds + force mask)
   TX 0x130       → threshold config + force-on mask to Arduino
                    [0] motor threshold °C
                    [1] inverter threshold °C
                    [2] force bitmask (bit0=motor, bit1=inv)
                    [3..7] reserved
 
+0x130 goes through a ConfigRequester: re-sent with backoff until a 0x131
+echoes the same values; TempState.cfg shows pending / ok (+ latency) / failed.
+
 Indexes: 0 = Motor, 1 = Inverter
+
+NTC (1 °C resolution) and hot-spot (0.1 °C) readings are smoothed per channel
+with the filter specs below before they are stored.
+
+All readable state lives in one immutable TempState. Every update builds a
+new one with version + 1 and swaps `self.state` by reference, so readers
+(UI thread) take no lock and always see a consistent snapshot:
+
+    st = temp_svc.state
+    if st.version != seen: …redraw from st…
 """
 
 import threading
-import time
+from typing import NamedTuple
 
 import can
-
-CAN_ID_M161 = 0xA1
-CAN_ID_M162 = 0xA2
-CAN_ID_RX_STATUS = 0x120
-CAN_ID_TX_CONFIG = 0x130
+import can_codec
+import can_ids
+import clock
+import filters
+from service import config_request
+from service.config_request import ConfigRequester, Result
+
+CAN_ID_M161 = can_ids.INV_TEMPERATURE_2
+CAN_ID_M162 = can_ids.INV_TEMPERATURE_3
+CAN_ID_RX_STATUS = can_ids.TEMP_STATUS
+CAN_ID_TX_CONFIG = can_ids.TEMP_CONFIG
+CFG_KEY = "temp_config"
 
 CH_MOTOR = 0
 CH_INV = 1
@@ -33,46 +54,96 @@ THRESHOLD_MIN = 20
 THRESHOLD_MAX = 150
 THRESHOLD_DEF = 50
 
+NTC_FILTER = (("median", 3), ("ema", 0.3), ("hysteresis", 0.4))
+HOT_SPOT_FILTER = (("ema", 0.3), ("hysteresis", 0.5, 0.1))
+
+
+class TempState(NamedTuple):
+    version: int
+    analog: tuple  # NTC °C per channel, -99 = never received
+    can: tuple  # hot spot °C per channel
+    fan: tuple  # fan running per channel
+    forced: tuple  # force-on per channel
+    thresh: tuple  # fan threshold °C per channel
+    fault: int  # NTC fault bitmask
+    last_rx: float  # clock time of the last status frame
+    cfg: Result | None  # delivery of the last 0x130 config
+
 
 class TempService:
-    """Thread-safe. UI reads public attrs; CAN RX thread calls on_can_frame()."""
+    """Readers use `state` (no lock). Writers — the CAN RX thread via
+    on_can_frame() and the UI via adjust_threshold()/toggle_force() — are
+    serialised by _lock while they build the next state."""
 
-    def __init__(self, bus: can.BusABC):
+    def __init__(self, bus: can.BusABC, clock=clock.SYSTEM):
         self._bus = bus
+        self._clock = clock
         self._lock = threading.Lock()
 
-        self.analog_temp: list[float] = [-99.0] * NUM_CH
-        self.can_temp: list[float] = [-99.0] * NUM_CH
-        self.fan_state: list[bool] = [False] * NUM_CH
-        self.fan_forced: list[bool] = [False] * NUM_CH  # force-on per channel
-        self.fault_mask: int = 0xFF
-        self.thresholds: list[float] = [float(THRESHOLD_DEF)] * NUM_CH
-        self._last_rx: float = 0.0
+        self.state = TempState(
+            version=0,
+            analog=(-99.0,) * NUM_CH,
+            can=(-99.0,) * NUM_CH,
+            fan=(False,) * NUM_CH,
+            forced=(False,) * NUM_CH,
+            thresh=(float(THRESHOLD_DEF),) * NUM_CH,
+            fault=0xFF,
+            last_rx=0.0,
+            cfg=None,
+        )
+        self._req = ConfigRequester(bus, clock=clock, on_change=self._on_cfg)
+
+        self._ntc_filt = [filters.build(NTC_FILTER) for _ in range(NUM_CH)]
+        self._hot_filt = [filters.build(HOT_SPOT_FILTER) for _ in range(NUM_CH)]
 
     # ── CAN RX ────────────────────────────────────────────────
     def on_can_frame(self, msg: can.Message) -> None:
         aid = msg.arbitration_id
 
-        if aid == CAN_ID_RX_STATUS and msg.dlc >= 6:
-            d = msg.data
-            analog = [float(d[i]) - 50.0 for i in range(NUM_CH)]
-            fans = [(d[4] >> i) & 1 == 1 for i in range(NUM_CH)]
-            faults = d[5]
+        if aid == CAN_ID_RX_STATUS and msg.dlc >= 7:
+            ntc_m, ntc_i, thr_m, thr_i, fan_mask, faults, force_mask = (
+                can_codec.decode_temp_status(msg.data)
+            )
+            self._req.echo(CFG_KEY, (thr_m, thr_i, force_mask))
+            now = self._clock.now()
+            analog = []
+            for i, ntc in enumerate((ntc_m, ntc_i)):
+                raw = float(ntc)
+                if faults & (1 << i):  # sensor fault — don't smear garbage
+                    self._ntc_filt[i].reset()
+                    analog.append(raw)
+                else:
+                    analog.append(self._ntc_filt[i](raw, now))
+            analog = tuple(analog)
+            fans = tuple((fan_mask >> i) & 1 == 1 for i in range(NUM_CH))
             with self._lock:
-                self.analog_temp = analog
-                self.fan_state = fans
-                self.fault_mask = faults
-                self._last_rx = time.monotonic()
+                s = self.state
+                if (analog, fans, faults) == (s.analog, s.fan, s.fault):
+                    # nothing visible changed; only refresh the staleness stamp
+                    self.state = s._replace(last_rx=now)
+                else:
+                    self.state = s._replace(
+                        version=s.version + 1,
+                        analog=analog, fan=fans, fault=faults, last_rx=now,
+                    )
 
         elif aid == CAN_ID_M161 and msg.dlc >= 8:
-            raw = int.from_bytes(msg.data[6:8], "little", signed=True)
-            with self._lock:
-                self.can_temp[CH_MOTOR] = raw * 0.1
+            val = can_codec.sig_inv_hot_spot_temp_motor(msg.data)
+            val = self._hot_filt[CH_MOTOR](val, self._clock.now())
+            self._set_can_temp(CH_MOTOR, val)
 
         elif aid == CAN_ID_M162 and msg.dlc >= 4:
-            raw = int.from_bytes(msg.data[2:4], "little", signed=True)
-            with self._lock:
-                self.can_temp[CH_INV] = raw * 0.1
+            val = can_codec.sig_inv_hot_spot_temp_inverter(msg.data)
+            val = self._hot_filt[CH_INV](val, self._clock.now())
+            self._set_can_temp(CH_INV, val)
+
+    def _set_can_temp(self, ch: int, val: float) -> None:
+        with self._lock:
+            s = self.state
+            if s.can[ch] == val:
+                return
+            can_t = s.can[:ch] + (val,) + s.can[ch + 1:]
+            self.state = s._replace(version=s.version + 1, can=can_t)
 
     # ── Force-on toggle ───────────────────────────────────────
     def toggle_force(self, channel: int) -> None:
@@ -80,11 +151,13 @@ class TempService:
         if not (0 <= channel < NUM_CH):
             return
         with self._lock:
-            self.fan_forced[channel] = not self.fan_forced[channel]
-            thresh_copy = list(self.thresholds)
-            forced_copy = list(self.fan_forced)
-        self._send_config(thresh_copy, forced_copy)
-        state = "ON" if forced_copy[channel] else "OFF"
+            s = self.state
+            forced = tuple(
+                not f if i == channel else f for i, f in enumerate(s.forced)
+            )
+            self.state = s = s._replace(version=s.version + 1, forced=forced)
+        self._send_config(s.thresh, s.forced)
+        state = "ON" if s.forced[channel] else "OFF"
         print(f"[TempService] Force ch{channel} → {state}")
 
     # ── Threshold management ──────────────────────────────────
@@ -92,15 +165,15 @@ class TempService:
         if not (0 <= channel < NUM_CH):
             return
         with self._lock:
-            val = max(
-                THRESHOLD_MIN, min(THRESHOLD_MAX, self.thresholds[channel] + delta)
-            )
-            self.thresholds[channel] = val
-            thresh_copy = list(self.thresholds)
-            forced_copy = list(self.fan_forced)
-        self._send_config(thresh_copy, forced_copy)
-
-    def _send_config(self, thresholds: list[float], forced: list[bool]) -> None:
+            s = self.state
+            val = max(THRESHOLD_MIN, min(THRESHOLD_MAX, s.thresh[channel] + delta))
+            if val == s.thresh[channel]:
+                return
+            thresh = s.thresh[:channel] + (float(val),) + s.thresh[channel + 1:]
+            self.state = s = s._replace(version=s.version + 1, thresh=thresh)
+        self._send_config(s.thresh, s.forced)
+
+    def _send_config(self, thresholds, forced) -> None:
         """
         CAN 0x130 — 8 bytes:
           [0] motor threshold °C
@@ -113,28 +186,30 @@ class TempService:
             if f:
                 force_mask |= 1 << i
 
-        data = bytes([int(thresholds[0]), int(thresholds[1]), force_mask]) + bytes(5)
+        data = can_codec.encode_temp_config(
+            Temp_Thresh_Motor=int(thresholds[0]),
+            Temp_Thresh_Inverter=int(thresholds[1]),
+            Temp_Force_Mask=force_mask,
+        )
         msg = can.Message(
             arbitration_id=CAN_ID_TX_CONFIG, data=data, is_extended_id=False
         )
-        try:
-            self._bus.send(msg)
-        except can.CanError as e:
-            print(f"[TempService] CAN TX error: {e}")
+        expect = (int(thresholds[0]), int(thresholds[1]), force_mask)
+        self._req.submit(CFG_KEY, msg, expect)
+
+    def _on_cfg(self, res: Result) -> None:
+        with self._lock:
+            s = self.state
+            self.state = s._replace(version=s.version + 1, cfg=res)
+        if res.status == config_request.OK:
+            print(f"[TempService] Config {res.expect} applied "
+                  f"(rtt {res.rtt_ms:.0f} ms, {res.attempts} send(s))")
+
+    def poll(self) -> None:
+        """Retry / expire unconfirmed config; call once per UI frame."""
+        self._req.poll()
 
     # ── Properties ───────────────────────────────────────────
     @property
     def is_stale(self) -> bool:
-        return (time.monotonic() - self._last_rx) > 2.0
-
-    def summary(self) -> dict:
-        with self._lock:
-            return {
-                "temp_analog": list(self.analog_temp),
-                "temp_can": list(self.can_temp),
-                "temp_fan": list(self.fan_state),
-                "temp_forced": list(self.fan_forced),
-                "temp_thresh": list(self.thresholds),
-                "temp_fault": self.fault_mask,
-                "temp_stale": self.is_stale,
-            }
+        return (self._clock.now() - self.state.last_rx) > 2.0
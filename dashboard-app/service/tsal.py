@@ -1,3 +1,25 @@
+"""
+service/tsal.py
+TSAL relay driver: green steady on LV, red blinking at TSAL_BLINK_HZ on HV.
+
+The relays are driven by a dedicated timer thread that schedules each toggle
+against an absolute deadline (start + n * half period), so the blink neither
+drifts nor quantises to the UI frame rate, and it keeps running when the UI
+loop stalls. The UI only reads `state` / `relay_on`; inject_*() and GPIO
+events wake the thread so a state change reaches the relays immediately.
+
+    tsal = TSALService()
+    tsal.start()
+    tsal.inject_hv()      # red starts blinking on the timer thread
+"""
+
+import threading
+from typing import Callable
+
+import clock
+import rt
+from service import gpio_input
+
 LV_PIN = 17
 HV_PIN = 27
 RELAY_RED_PIN = 22  # red blinking relay
@@ -5,40 +27,79 @@ RELAY_GREEN_PIN = 23  # green steady relay
 
 TSAL_BLINK_HZ = 3.0
 TSAL_BLINK_MS = int(1000 / TSAL_BLINK_HZ / 2)
+TSAL_HALF_PERIOD_S = 1.0 / TSAL_BLINK_HZ / 2
+
+# SCHED_FIFO priority for the timer thread; silently skipped without
+# CAP_SYS_NICE (dev PC) — the absolute deadlines still keep the average exact.
+TIMER_RT_PRIORITY = 50
+
+# LV/HV sense lines are not wired on the car yet; the dashboard injects the
+# state. Set True to follow the debounced GPIO edge events instead.
+SENSE_INPUTS = False
 
 try:
     import RPi.GPIO as GPIO
 
     _GPIO_AVAILABLE = True
     GPIO.setmode(GPIO.BCM)
-    GPIO.setup(LV_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-    GPIO.setup(HV_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
     GPIO.setup(RELAY_RED_PIN, GPIO.OUT, initial=GPIO.HIGH)
     GPIO.setup(RELAY_GREEN_PIN, GPIO.OUT, initial=GPIO.HIGH)
 except ImportError:
     _GPIO_AVAILABLE = False
 
 
+def _gpio_output(pin: int, on: bool) -> None:
+    # Relay board is active-low.
+    if _GPIO_AVAILABLE:
+        GPIO.output(pin, GPIO.LOW if on else GPIO.HIGH)
+
+
 class TSALService:
-    def __init__(self):
+    def __init__(self, gpio: gpio_input.GpioInput | None = None,
+                 output: Callable[[int, bool], None] | None = None,
+                 clock=clock.SYSTEM):
+        self._clock = clock
+        self._out = output or _gpio_output
+        self._cv = threading.Condition()
         self._lv_on = False
         self._hv_on = False
         self._blink_on = False
-        self._last_ms = 0
-
+        self._red = None  # last written relay levels (None = unknown)
+        self._green = None
+        self._next = None  # absolute deadline of the next red toggle
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self.toggles = 0
+        self.missed = 0  # deadlines skipped because the thread woke too late
+        if gpio is None and SENSE_INPUTS and _GPIO_AVAILABLE:
+            gpio = gpio_input.get()
+        if gpio is not None:
+            gpio.listen(LV_PIN, self._on_input)
+            gpio.listen(HV_PIN, self._on_input)
+
+    # ── Inputs (any thread) ───────────────────────────────────────
     def inject_lv(self):
-        self._lv_on = True
+        with self._cv:
+            self._lv_on = True
+            self._cv.notify()
 
     def inject_lv_off(self):
-        self._lv_on = False
-        self._hv_on = False
+        with self._cv:
+            self._lv_on = False
+            self._hv_on = False
+            self._cv.notify()
 
     def inject_hv(self):
-        self._hv_on = True
+        with self._cv:
+            self._hv_on = True
+            self._cv.notify()
 
     def inject_hv_off(self):
-        self._hv_on = False
+        with self._cv:
+            self._hv_on = False
+            self._cv.notify()
 
+    # ── UI view ───────────────────────────────────────────────────
     @property
     def state(self) -> str:
         if self._hv_on:
@@ -51,44 +112,88 @@ class TSALService:
     def relay_on(self) -> bool:
         return self._blink_on
 
-    def tick(self, now_ms: int):
-        self._poll_gpio()
+    # ── Timer thread ──────────────────────────────────────────────
+    def start(self) -> "TSALService":
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="tsal-timer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            with self._cv:
+                self._running = False
+                self._cv.notify()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        rt.apply("tsal", policy="fifo", priority=TIMER_RT_PRIORITY, quiet=True)
+        with self._cv:
+            while self._running:
+                due = self._advance(self._clock.now())
+                timeout = None if due is None else max(0.0, due - self._clock.now())
+                self._cv.wait(timeout)
+
+    def poll(self) -> float | None:
+        """Run the relay logic once at clock.now() without the timer thread
+        (VirtualClock scenarios). Returns the next deadline, if any."""
+        with self._cv:
+            return self._advance(self._clock.now())
+
+    def _advance(self, now: float) -> float | None:
+        """Apply relay outputs for `now`; returns the next deadline (or None
+        when nothing is scheduled). Called with the condition held."""
         if self._hv_on:
             # red blinking, green off
             self._set_green(False)
-            if now_ms - self._last_ms >= TSAL_BLINK_MS:
+            if self._next is None:
+                self._next = now  # first toggle right away
+            if now >= self._next:
                 self._blink_on = not self._blink_on
-                self._last_ms = now_ms
                 self._set_red(self._blink_on)
-        elif self._lv_on:
-            # green steady, red off
-            self._set_red(False)
-            self._blink_on = False
-            self._set_green(True)
-        else:
-            # both off
-            self._set_red(False)
-            self._set_green(False)
-            self._blink_on = False
+                self.toggles += 1
+                self._next += TSAL_HALF_PERIOD_S
+                while self._next <= now:  # stalled past whole half periods
+                    self._next += TSAL_HALF_PERIOD_S
+                    self.missed += 1
+            return self._next
+        self._next = None
+        self._blink_on = False
+        self._set_red(False)
+        # green steady on LV, both off otherwise
+        self._set_green(self._lv_on)
+        return None
 
     def cleanup(self):
+        self.stop()
         if _GPIO_AVAILABLE:
-            self._set_red(False)
-            self._set_green(False)
+            self._out(RELAY_RED_PIN, False)
+            self._out(RELAY_GREEN_PIN, False)
             GPIO.cleanup()
 
-    def _poll_gpio(self):
-        if not _GPIO_AVAILABLE:
-            return
-        # self._lv_on = bool(GPIO.input(LV_PIN))
-        # self._hv_on = bool(GPIO.input(HV_PIN))
+    def _on_input(self, ev: gpio_input.InputEvent):
+        # Debounce thread. Edges only: injected state holds until a real change.
+        if ev.pin == LV_PIN:
+            if ev.level:
+                self.inject_lv()
+            else:
+                self.inject_lv_off()
+        elif ev.pin == HV_PIN:
+            if ev.level:
+                self.inject_hv()
+            else:
+                self.inject_hv_off()
 
     def _set_red(self, on: bool):
-        if not _GPIO_AVAILABLE:
-            return
-        GPIO.output(RELAY_RED_PIN, GPIO.LOW if on else GPIO.HIGH)
+        if self._red != on:
+            self._red = on
+            self._out(RELAY_RED_PIN, on)
 
     def _set_green(self, on: bool):
-        if not _GPIO_AVAILABLE:
-            return
-        GPIO.output(RELAY_GREEN_PIN, GPIO.LOW if on else GPIO.HIGH)
+        if self._green != on:
+            self._green = on
+            self._out(RELAY_GREEN_PIN, on)
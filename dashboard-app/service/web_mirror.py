@@ -0,0 +1,361 @@
+"""
+service/web_mirror.py
+Live values for laptops in the garage: a small HTTP page plus WebSocket
+updates, served from its own asyncio loop thread.
+
+    GET /        the web view (one page, no external assets)
+    GET /state   the full state as JSON
+    GET /ws      WebSocket (RFC 6455, text frames): {"v": version, "d": {...}}
+                 with "full": true when "d" is the whole state
+
+A pump on the loop reads `source` (can_rx.latest) at RATE_HZ. A new version
+is cut when any MIRROR_SIGNALS value changes. Floats are rounded to 2
+decimals so noise below that does not count as a change. A version is
+serialised once, as a ready-made WebSocket frame shared by every client:
+the delta frame right away, the full-state frame on demand, cached until
+the next version.
+
+Backpressure is per client and never queues. The pump writes the delta
+straight into the transport of every client that is exactly one version
+behind. No task switch is involved, just one send() per client. A client
+whose buffered bytes pass WRITE_HIGH_WATER is marked blocked and skipped
+from then on. Its own sender coroutine waits in drain() and then sends one
+full-state frame that coalesces every version it missed. New clients take
+the same full-state path. A client blocked for CLIENT_TIMEOUT_S is
+dropped.
+
+The loop thread runs at normal priority and only holds the GIL briefly per
+version. Use rt.py to give the UI loop priority on the car.
+tools/web_mirror_bench.py loads it with hundreds of clients while timing a
+30 FPS loop.
+
+  DASH_WEB=8080            enable on port 8080 (all interfaces)
+  DASH_WEB=127.0.0.1:8080  or bind one address
+  DASH_WEB_HZ=10           pump rate
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import threading
+import time
+
+MIRROR_SIGNALS = (
+    "apps_pct",
+    "brake",
+    "speed",
+    "status_bits",
+    "plaus_faults",
+    "can_counter_ok",
+    "battery",
+    "battery_temp",
+    "water_temp",
+    "inv_temp",
+    "motor_temp",
+    "inv_hotspot_temp",
+    "coolant_temp",
+    "tsal_state",
+    "uptime",
+)
+
+
+def _bind(spec: str | None) -> tuple[str, int] | None:
+    if not spec:
+        return None
+    host, _, port = spec.rpartition(":")
+    return host or "0.0.0.0", int(port)
+
+
+BIND = _bind(os.environ.get("DASH_WEB"))
+RATE_HZ = float(os.environ.get("DASH_WEB_HZ", "10"))
+CLIENT_TIMEOUT_S = 10.0
+# Per-client buffering before drain() waits: small, so a slow client holds
+# a few stale frames at most and then gets coalesced state.
+SEND_BUFFER = 4 * 1024  # SO_SNDBUF (the kernel doubles it)
+WRITE_HIGH_WATER = 4 * 1024  # transport buffer
+# Clients only send control frames (close, ping), whose payload is at most
+# 125 bytes. Anything longer gets a 1009 close and is never read.
+MAX_CLIENT_FRAME = 125
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_PAGE = b"""<!doctype html>
+<html><head><meta charset="utf-8"><title>NFS Dashboard</title>
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<style>
+body{font-family:system-ui,sans-serif;background:#111;color:#eee;margin:1em}
+table{border-collapse:collapse;font-size:1.3em}td{padding:.2em 1em}
+td:last-child{text-align:right;font-variant-numeric:tabular-nums}
+#st{color:#888;font-size:.9em}.off{color:#e44}
+</style></head><body>
+<h2>NFS Dashboard</h2><div id="st">connecting...</div><table id="t"></table>
+<script>
+const rows = {}, t = document.getElementById("t"), st = document.getElementById("st");
+let n = 0;
+function row(k) {
+  if (!rows[k]) { const r = t.insertRow(); r.insertCell().textContent = k;
+                  rows[k] = r.insertCell(); }
+  return rows[k];
+}
+function connect() {
+  const ws = new WebSocket(`ws://${location.host}/ws`);
+  ws.onmessage = e => {
+    const m = JSON.parse(e.data);
+    for (const [k, v] of Object.entries(m.d)) row(k).textContent = v;
+    st.textContent = `v${m.v} \\u00b7 ${++n} updates`; st.className = "";
+  };
+  ws.onclose = () => { st.textContent = "disconnected, retrying"; st.className = "off";
+                       setTimeout(connect, 1000); };
+}
+connect();
+</script></body></html>
+"""
+
+
+def _frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Unmasked server frame, FIN set."""
+    n = len(payload)
+    if n < 126:
+        head = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 65536:
+        head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return head + payload
+
+
+def _http(status: str, body: bytes, ctype: str) -> bytes:
+    return (f"HTTP/1.1 {status}\r\nContent-Type: {ctype}\r\n"
+            f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\n"
+            f"Connection: close\r\n\r\n").encode() + body
+
+
+class _Client:
+    __slots__ = ("writer", "transport", "version", "wake", "blocked")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.transport = writer.transport
+        self.version = 0
+        self.wake = asyncio.Event()
+        self.blocked = False
+
+
+class WebMirror:
+    def __init__(self, source, bind: tuple[str, int] | None = BIND,
+                 rate_hz: float = RATE_HZ, signals=MIRROR_SIGNALS):
+        self._src = source
+        self.bind = bind
+        self.period = 1.0 / rate_hz
+        self.signals = tuple(signals)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self._clients: set[_Client] = set()
+        self._state: dict = {}
+        self._version = 0
+        self._delta = b""  # frame: version - 1 -> version
+        self._full: bytes | None = None  # frame: whole state at version (lazy)
+        self.port = None  # bound port (bind port 0 picks one)
+        self.peak = 0
+        self.coalesced = 0  # full frames sent to clients that fell behind
+        self.timeouts = 0
+        self.serialise_s = 0.0
+        self.cpu_s = 0.0  # loop thread CPU time, updated by the pump
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    def start(self) -> "WebMirror":
+        if self._thread is None and self.bind is not None:
+            self._thread = threading.Thread(target=self._run, name="web-mirror", daemon=True)
+            self._thread.start()
+            self._started.wait(5.0)
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            server = self._loop.run_until_complete(asyncio.start_server(
+                self._conn, self.bind[0], self.bind[1], backlog=1024))
+        except OSError as e:
+            print(f"[WEB] cannot listen on {self.bind[0]}:{self.bind[1]}: {e}")
+            self._started.set()
+            return
+        self.port = server.sockets[0].getsockname()[1]
+        self._loop.create_task(self._pump())
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            server.close()
+            for c in list(self._clients):
+                c.writer.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for t in tasks:
+                t.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    # ── Versions ──────────────────────────────────────────────────
+    async def _pump(self) -> None:
+        nxt = time.monotonic()
+        while True:
+            self._snapshot()
+            self.cpu_s = time.thread_time()
+            nxt += self.period
+            now = time.monotonic()
+            if nxt < now:
+                nxt = now
+            await asyncio.sleep(nxt - now)
+
+    def _snapshot(self) -> None:
+        changed = {}
+        for name in self.signals:
+            v = self._src.get(name)
+            if v is None:
+                continue
+            if isinstance(v, float):
+                v = round(v, 2)
+            elif not isinstance(v, (bool, int, str)):
+                continue
+            if self._state.get(name) != v:
+                changed[name] = v
+        if not changed:
+            return
+        t0 = time.perf_counter()
+        self._state.update(changed)
+        self._version += 1
+        self._delta = _frame(json.dumps({"v": self._version, "d": changed},
+                                        separators=(",", ":")).encode())
+        self._full = None
+        self.serialise_s += time.perf_counter() - t0
+        v, delta = self._version, self._delta
+        for c in self._clients:
+            if c.blocked:
+                continue
+            if c.version == v - 1:
+                c.transport.write(delta)
+                c.version = v
+                if c.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    c.blocked = True
+                    c.wake.set()
+            else:
+                c.wake.set()
+
+    def _full_frame(self) -> bytes:
+        if self._full is None:
+            t0 = time.perf_counter()
+            self._full = _frame(json.dumps({"v": self._version, "full": True, "d": self._state},
+                                           separators=(",", ":")).encode())
+            self.serialise_s += time.perf_counter() - t0
+        return self._full
+
+    # ── Connections ───────────────────────────────────────────────
+    async def _conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), CLIENT_TIMEOUT_S)
+            lines = head.decode("latin-1").split("\r\n")
+            method, path, _ = (lines[0].split(" ") + ["", ""])[:3]
+            headers = {}
+            for line in lines[1:]:
+                k, _, v = line.partition(":")
+                headers[k.strip().lower()] = v.strip()
+            if method != "GET":
+                writer.write(_http("405 Method Not Allowed", b"", "text/plain"))
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._websocket(reader, writer, headers)
+                return
+            elif path == "/":
+                writer.write(_http("200 OK", _PAGE, "text/html; charset=utf-8"))
+            elif path == "/state":
+                body = json.dumps({"v": self._version, "d": self._state}).encode()
+                writer.write(_http("200 OK", body, "application/json"))
+            else:
+                writer.write(_http("404 Not Found", b"not found\n", "text/plain"))
+            await asyncio.wait_for(writer.drain(), CLIENT_TIMEOUT_S)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                asyncio.TimeoutError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass  # stop(): end quietly, the loop is shutting down
+        finally:
+            writer.close()
+
+    async def _websocket(self, reader, writer, headers: dict) -> None:
+        key = headers.get("sec-websocket-key", "").encode()
+        accept = base64.b64encode(hashlib.sha1(key + _WS_GUID).digest()).decode()
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        c = _Client(writer)
+        self._clients.add(c)
+        self.peak = max(self.peak, len(self._clients))
+        c.wake.set()  # current state right away
+        tasks = [asyncio.ensure_future(self._send_loop(c)),
+                 asyncio.ensure_future(self._recv_loop(reader, writer))]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for t in tasks:
+                t.cancel()
+            self._clients.discard(c)
+
+    async def _send_loop(self, c: _Client) -> None:
+        """New and blocked clients only; the pump serves the rest."""
+        try:
+            while True:
+                await c.wake.wait()
+                c.wake.clear()
+                if c.blocked:
+                    await asyncio.wait_for(c.writer.drain(), CLIENT_TIMEOUT_S)
+                if c.version != self._version:
+                    if c.version:
+                        self.coalesced += 1
+                    c.transport.write(self._full_frame())
+                    c.version = self._version
+                    if c.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                        c.blocked = True
+                        c.wake.set()
+                        continue
+                c.blocked = False
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+        except ConnectionError:
+            pass
+
+    async def _recv_loop(self, reader, writer) -> None:
+        """Client frames: answer pings, stop on close or EOF, ignore the rest.
+        A frame over MAX_CLIENT_FRAME closes the connection unread."""
+        try:
+            while True:
+                b0, b1 = await reader.readexactly(2)
+                n = b1 & 0x7F
+                if n > MAX_CLIENT_FRAME:  # 126 / 127: extended length follows
+                    writer.write(_frame(struct.pack("!H", 1009), 0x8))  # message too big
+                    return
+                mask = await reader.readexactly(4) if b1 & 0x80 else b"\0\0\0\0"
+                data = bytes(x ^ mask[i & 3] for i, x in enumerate(await reader.readexactly(n)))
+                op = b0 & 0x0F
+                if op == 0x8:
+                    writer.write(_frame(data[:2], 0x8))
+                    return
+                if op == 0x9:
+                    writer.write(_frame(data, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
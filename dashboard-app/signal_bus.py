@@ -0,0 +1,95 @@
+"""
+signal_bus.py
+Publish/subscribe between the decoders and the UI.
+
+Decoders publish(name, value); the bus drops the update if it is within the
+signal's deadband of the last published value. Screens declare the signals
+they show (class attribute SIGNALS) and get a Subscription whose dirty
+bitmask has one bit per declared signal. Only the active subscription is in
+the fan-out table, so publishing a signal nobody on screen shows is a dict
+miss.
+
+    sub = bus.subscribe(("speed", "apps_pct"))
+    bus.activate(sub)               # on navigation
+    dirty = sub.take()              # once per frame; 0 = nothing changed
+    if dirty & sub.bit("speed"): …
+"""
+
+import threading
+
+_MISSING = object()
+
+
+class Subscription:
+    def __init__(self, bus: "SignalBus", names):
+        self._bus = bus
+        self.names = tuple(names)
+        self.bits = {n: 1 << i for i, n in enumerate(self.names)}
+        self.all_bits = (1 << len(self.names)) - 1
+        self._dirty = self.all_bits
+
+    def bit(self, name: str) -> int:
+        return self.bits.get(name, 0)
+
+    def take(self) -> int:
+        """Return and clear the dirty mask."""
+        with self._bus._lock:
+            d = self._dirty
+            self._dirty = 0
+        return d
+
+    def mark_all(self) -> None:
+        with self._bus._lock:
+            self._dirty = self.all_bits
+
+
+class SignalBus:
+    """publish() is called from the RX thread, take()/activate() from the UI."""
+
+    def __init__(self, deadbands: dict | None = None):
+        self._lock = threading.Lock()
+        self._deadband: dict[str, float] = dict(deadbands or {})
+        self._values: dict = {}
+        self._live: dict[str, tuple] = {}  # name -> ((sub, bit), ...)
+        self._active: Subscription | None = None
+        self.published = 0
+        self.suppressed = 0
+
+    def set_deadband(self, name: str, band: float) -> None:
+        self._deadband[name] = band
+
+    def subscribe(self, names) -> Subscription:
+        return Subscription(self, names)
+
+    def activate(self, sub: Subscription | None) -> None:
+        """Make `sub` the only live subscription; it starts fully dirty."""
+        live: dict[str, tuple] = {}
+        if sub is not None:
+            for n, b in sub.bits.items():
+                live[n] = live.get(n, ()) + ((sub, b),)
+            sub.mark_all()
+        self._live = live  # swapped by reference; publish() never sees a half-built table
+        self._active = sub
+
+    def get(self, name: str, default=None):
+        return self._values.get(name, default)
+
+    def publish(self, name: str, value) -> bool:
+        """Store `value`; returns False if it was suppressed as unchanged."""
+        prev = self._values.get(name, _MISSING)
+        if prev is not _MISSING:
+            if value == prev:
+                self.suppressed += 1
+                return False
+            band = self._deadband.get(name)
+            if band is not None and abs(value - prev) <= band:
+                self.suppressed += 1
+                return False
+        self._values[name] = value
+        self.published += 1
+        live = self._live.get(name)
+        if live:
+            with self._lock:
+                for sub, bit in live:
+                    sub._dirty |= bit
+        return True
@@ -1,9 +1,12 @@
+import plausibility
 import pygame
 from service.tsal import TSALService
 
 from ui import theme
 from ui.widgets import (
     FONT_MED,
+    FONT_SMALL,
+    TrendGraph,
     draw_banner,
     draw_battery_bar,
     draw_button,
@@ -17,10 +20,50 @@ W, H = 800, 480
 _BTN_THEME = pygame.Rect(560, 240, 90, 45)
 _BTN_MENU = pygame.Rect(560, 295, 90, 45)
 
+# (x, y, w, h) of the live widgets — also read back by tools/latency_harness.py
+APPS_BAR = (0, 0, 50, 405)
+BRAKE_BAR = (750, 0, 50, 405)
+SPEED_BOX = (265, 115, 270, 230)
+
+# Trend strip between the temp boxes and the battery bar: (signal, label, lo, hi)
+_TRENDS = (
+    ("battery_temp", "Pack", 0.0, 70.0),
+    ("water_temp", "Water", 0.0, 120.0),
+    ("inv_hotspot_temp", "Inverter", 0.0, 120.0),
+)
+_TREND_Y, _TREND_H, _TREND_W, _TREND_GAP = 351, 50, 222, 9
+
 
 class DashboardScreen:
-    def __init__(self, tsal: TSALService):  # ← ADD
+    SIGNALS = (
+        "apps_pct",
+        "brake",
+        "speed",
+        "battery",
+        "battery_temp",
+        "water_temp",
+        "inv_temp",
+        "inv_hotspot_temp",
+        "status_bits",
+        "plaus_faults",
+        "can_counter_ok",
+        "watchdog",
+        "tsal_state",
+        "tsal_relay",
+        "trend_tick",
+    )
+
+    def __init__(self, tsal: TSALService, trends=None, temp=None):  # ← ADD
         self._tsal = tsal
+        self._temp = temp  # TempService: inverter fan threshold on the trend
+        self._trends = [
+            TrendGraph(
+                (58 + i * (_TREND_W + _TREND_GAP), _TREND_Y, _TREND_W, _TREND_H),
+                trends.get(name) if trends else None,
+                label, lo, hi,
+            )
+            for i, (name, label, lo, hi) in enumerate(_TRENDS)
+        ]
         self._tsal.inject_lv()
         self._hv_on = False
         self._blink_on = False
@@ -53,20 +96,39 @@ class DashboardScreen:
 
     def draw(self, surface: pygame.Surface, latest: dict) -> None:
         surface.fill(theme.T()["screen_bg"])
-        draw_segment_bar(surface, 0, 0, 50, 405, latest["apps_pct"], mode="heat")
-        draw_segment_bar(surface, 750, 0, 50, 405, latest["brake"], mode="cool")
-        draw_rect_value(surface, 265, 115, 270, 230, latest["speed"], "Speed")
+        draw_segment_bar(surface, *APPS_BAR, latest["apps_pct"], mode="heat")
+        draw_segment_bar(surface, *BRAKE_BAR, latest["brake"], mode="cool")
+        draw_rect_value(surface, *SPEED_BOX, latest["speed"], "Speed")
         draw_temp_box(
             surface, 140, 115, 105, 105, latest["battery_temp"], "Battery temp"
         )
         draw_temp_box(surface, 140, 240, 105, 105, latest["water_temp"], "Water temp")
-        draw_temp_box(surface, 560, 115, 105, 105, latest["inv_temp"], "Inverter temp")
+        inv_temp = latest.get("inv_hotspot_temp", latest["inv_temp"])
+        draw_temp_box(surface, 560, 115, 105, 105, inv_temp, "Inverter temp")
         draw_battery_bar(surface, 0, 405, 800, 75, latest["battery"])
+        if self._temp is not None:
+            self._trends[2].thresholds = (self._temp.state.thresh[1],)
+        for graph, (name, *_) in zip(self._trends, _TRENDS):
+            graph.draw(surface, latest.get(name))
 
         # Status banner
         t = theme.T()
-        if latest["status_bits"] != 0:
+        mcu, own = latest["status_bits"], latest.get("plaus_faults", 0)
+        if mcu or own:
             draw_banner(surface, "FAULT", t["err"], W // 2, 60)
+            parts = []
+            if mcu:
+                parts.append("MCU: " + " ".join(plausibility.names(mcu)))
+            if own:
+                parts.append("DASH: " + " ".join(plausibility.names(own)))
+            why = FONT_SMALL.render("   ".join(parts), True, t["err"])
+            surface.blit(why, why.get_rect(center=(W // 2, 102)))
+        elif latest.get("watchdog"):
+            # A loop stopped beating (watchdog.py): values may be stale.
+            draw_banner(surface, "STALL", t["err"], W // 2, 60)
+            why = FONT_SMALL.render("WATCHDOG: " + " ".join(n.upper() for n in latest["watchdog"]),
+                                    True, t["err"])
+            surface.blit(why, why.get_rect(center=(W // 2, 102)))
         elif not latest["can_counter_ok"]:
             draw_banner(surface, "CAN DROP", t["warn"], W // 2, 60)
         else:
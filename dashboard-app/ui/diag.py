@@ -0,0 +1,130 @@
+"""
+ui/diag.py
+Inverter parameter diagnostics — pages of Cascadia EEPROM parameters.
+
+Read-only view over service/inverter_params.py: READ PAGE fetches the
+addresses shown, DUMP ALL the whole DUMP_FIRST..DUMP_LAST range (pipelined,
+a few seconds on a real inverter). Raw address/value pairs — look the
+meaning up in the Cascadia parameter guide. Writes go through
+ParamClient.write(), not this screen.
+
+  handle_event(event) -> str | None
+  draw(surface, latest)
+"""
+
+import pygame
+
+from service.inverter_params import DUMP_FIRST, DUMP_LAST, ParamClient
+from ui import theme
+
+W, H = 800, 480
+
+_COLS = 5
+_ROWS = 10
+_PER_PAGE = _COLS * _ROWS
+_PAGES = (DUMP_LAST - DUMP_FIRST) // _PER_PAGE + 1
+_CELL_W = 148
+_CELL_H = 27
+_GRID_X = (W - _COLS * _CELL_W) // 2
+_GRID_Y = 86
+
+pygame.font.init()
+_F_TITLE = pygame.font.SysFont("DejaVu Sans", 30, bold=True)
+_F_CELL = pygame.font.SysFont("DejaVu Sans Mono", 15)
+_F_BTN = pygame.font.SysFont("DejaVu Sans", 18, bold=True)
+_F_BACK = pygame.font.SysFont("DejaVu Sans", 20, bold=True)
+_F_STATUS = pygame.font.SysFont("DejaVu Sans Mono", 13)
+
+_BTN_BACK = pygame.Rect(20, 20, 100, 45)
+_BTN_PREV = pygame.Rect(40, 372, 70, 48)
+_BTN_NEXT = pygame.Rect(120, 372, 70, 48)
+_BTN_READ = pygame.Rect(260, 372, 160, 48)
+_BTN_DUMP = pygame.Rect(430, 372, 160, 48)
+_BTN_CLEAR = pygame.Rect(600, 372, 160, 48)
+
+
+def _draw_btn(surface, rect, label, enabled=True):
+    t = theme.T()
+    pygame.draw.rect(surface, t["button_bg"], rect, border_radius=10)
+    pygame.draw.rect(surface, t["border"], rect, width=2, border_radius=10)
+    lbl = _F_BTN.render(label, True, t["button_fg"] if enabled else t["border"])
+    surface.blit(lbl, lbl.get_rect(center=rect.center))
+
+
+class DiagScreen:
+    SIGNALS = ("param_rev",)  # ParamClient.revision (main.py)
+
+    def __init__(self, client: ParamClient):
+        self._client = client
+        self._page = 0
+
+    def _page_addrs(self) -> range:
+        first = DUMP_FIRST + self._page * _PER_PAGE
+        return range(first, min(first + _PER_PAGE, DUMP_LAST + 1))
+
+    def handle_event(self, event: pygame.event.Event) -> str | None:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            p = event.pos
+            if _BTN_BACK.collidepoint(p):
+                return "menu"
+            if _BTN_PREV.collidepoint(p):
+                self._page = (self._page - 1) % _PAGES
+            elif _BTN_NEXT.collidepoint(p):
+                self._page = (self._page + 1) % _PAGES
+            elif _BTN_READ.collidepoint(p):
+                self._client.read_many(self._page_addrs())
+            elif _BTN_DUMP.collidepoint(p) and not self._client.busy:
+                print(f"[PARAM] Dump {DUMP_FIRST}..{DUMP_LAST}")
+                self._client.read_many(range(DUMP_FIRST, DUMP_LAST + 1))
+            elif _BTN_CLEAR.collidepoint(p):
+                self._client.invalidate()
+        return None
+
+    def draw(self, surface: pygame.Surface, latest: dict) -> None:
+        t = theme.T()
+        c = self._client
+        surface.fill(t["screen_bg"])
+
+        title = _F_TITLE.render("Inverter Parameters", True, t["text"])
+        surface.blit(title, title.get_rect(center=(W // 2 + 40, 42)))
+        page = _F_STATUS.render(f"page {self._page + 1}/{_PAGES}", True, t["border"])
+        surface.blit(page, page.get_rect(topright=(W - 20, 20)))
+
+        # Address / value grid, column-major so addresses read downwards
+        for i, addr in enumerate(self._page_addrs()):
+            col, row = divmod(i, _ROWS)
+            x = _GRID_X + col * _CELL_W
+            y = _GRID_Y + row * _CELL_H
+            st = c.state(addr)
+            if st == "pending":
+                val, colour = "…", "warn"
+            elif st == "failed":
+                val, colour = "ERR", "err"
+            elif st == "ok":
+                val, colour = str(c.cached(addr)), "text"
+            else:
+                val, colour = "----", "border"
+            a = _F_CELL.render(f"{addr:4d}", True, t["border"])
+            v = _F_CELL.render(val, True, t[colour])
+            surface.blit(a, (x + 8, y + 4))
+            surface.blit(v, v.get_rect(topright=(x + _CELL_W - 14, y + 4)))
+        grid = pygame.Rect(_GRID_X, _GRID_Y, _COLS * _CELL_W, _ROWS * _CELL_H)
+        pygame.draw.rect(surface, t["border"], grid.inflate(6, 6), width=2,
+                         border_radius=8)
+
+        _draw_btn(surface, _BTN_PREV, "◀")
+        _draw_btn(surface, _BTN_NEXT, "▶")
+        _draw_btn(surface, _BTN_READ, "READ PAGE")
+        _draw_btn(surface, _BTN_DUMP, "DUMP ALL", enabled=not c.busy)
+        _draw_btn(surface, _BTN_CLEAR, "CLEAR CACHE")
+
+        status = (f"in flight {c.in_flight}  queued {c.queued}  "
+                  f"done {c.completed}  retries {c.retries}  failed {c.failures}")
+        colour = "warn" if c.busy else ("err" if c.failures else "text")
+        s = _F_STATUS.render(status, True, t[colour])
+        surface.blit(s, s.get_rect(center=(W // 2, 446)))
+
+        pygame.draw.rect(surface, t["button_bg"], _BTN_BACK, border_radius=10)
+        pygame.draw.rect(surface, t["border"], _BTN_BACK, width=2, border_radius=10)
+        lbl = _F_BACK.render("← Back", True, t["button_fg"])
+        surface.blit(lbl, lbl.get_rect(center=_BTN_BACK.center))
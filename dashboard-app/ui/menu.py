@@ -32,11 +32,17 @@ _CARDS = [
         "target": "temp",
         "icon": "TMP",
     },
+    {
+        "label": "Inverter Params",
+        "sublabel": "Read Cascadia EEPROM",
+        "target": "diag",
+        "icon": "INV",
+    },
 ]
 
-_CARD_W = 200
+_CARD_W = 170
 _CARD_H = 140
-_CARD_GAP = 20
+_CARD_GAP = 14
 _CARD_Y = 160
 _BTN_BACK = pygame.Rect(20, 20, 100, 45)
 
@@ -75,14 +81,24 @@ def _draw_card(surface, rect, card, hovered):
     lbl = _F_LABEL.render(card["label"], True, t["text"])
     surface.blit(lbl, (rect.x + 14, rect.y + 60))
 
-    sub = _F_SUB.render(card["sublabel"], True, t["border"])
-    surface.blit(sub, (rect.x + 14, rect.y + 88))
+    # Sub-label, wrapped to the card width
+    line, y = "", rect.y + 88
+    for word in card["sublabel"].split():
+        trial = f"{line} {word}".strip()
+        if line and _F_SUB.size(trial)[0] > rect.w - 28:
+            surface.blit(_F_SUB.render(line, True, t["border"]), (rect.x + 14, y))
+            line, y = word, y + 15
+        else:
+            line = trial
+    surface.blit(_F_SUB.render(line, True, t["border"]), (rect.x + 14, y))
 
     arrow = _F_LABEL.render("→", True, t["ok"])
     surface.blit(arrow, arrow.get_rect(bottomright=(rect.right - 14, rect.bottom - 12)))
 
 
 class MenuScreen:
+    SIGNALS = ()  # static — redrawn on input only
+
     def __init__(self):
         self._hovered = -1
 
@@ -101,7 +101,7 @@ class StartupScreen:
     # ── draw ──────────────────────────────────────────────────────────────
     def draw(self, surface: pygame.Surface, can_data: dict) -> None:
         self._ensure_fonts()
-        self._svc.tick(pygame.time.get_ticks())
+        self._svc.tick()
 
         surface.fill(_PANEL)
         self._draw_title(surface)
@@ -2,27 +2,25 @@
 ui/tc.py
 Traction Control settings screen.
 
-TC level: integer 1–10, sent on CAN ID 0x120
+TC level: integer 1–10, sent on CAN ID 0x120 by service/tc.py
   [0] = TC level (1..10)
   [1] = 0x01 (magic byte so the MCU knows it's a TC command)
   [2..7] = reserved (0x00)
+The status line shows ✓ only once 0x121 TC_Status echoes the level.
 
   handle_event(event) -> str | None
   draw(surface, latest)
 """
 
 import pygame
-import can
+import can_ids
+from service import config_request
+from service.tc import TC_MAX, TC_MIN, TCService
 from ui import theme
 from ui.widgets import FONT_MED, FONT_SMALL
 
 W, H = 800, 480
 
-ID_TC        = 0x120
-TC_MIN       = 1
-TC_MAX       = 10
-TC_MAGIC     = 0x01   # byte[1] — lets the MCU distinguish TC frames
-
 pygame.font.init()
 _F_TITLE  = pygame.font.SysFont("DejaVu Sans", 42, bold=True)
 _F_VALUE  = pygame.font.Font("assets/fonts/DSEG14Classic-Bold.ttf", 90)
@@ -38,20 +36,16 @@ _BTN_SEND  = pygame.Rect(W // 2 - 110, 360, 220, 55)
 _BTN_BACK  = pygame.Rect(20, 20, 100, 45)
 
 
-def _send_tc(bus: can.BusABC | None, level: int) -> str:
-    """Send the TC level on CAN. Returns a status string."""
-    if bus is None:
-        return f"[NO BUS] TC={level} (not sent)"
-    try:
-        msg = can.Message(
-            arbitration_id=ID_TC,
-            data=[level, TC_MAGIC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
-            is_extended_id=False,
-        )
-        bus.send(msg)
-        return f"Sent TC={level} on 0x{ID_TC:03X}  ✓"
-    except can.CanError as e:
-        return f"CAN error: {e}"
+def _status_line(res) -> tuple[str, str]:
+    """(text, theme colour key) for the last TC request."""
+    if res is None:
+        return "", "text"
+    if res.status == config_request.PENDING:
+        return (f"Sending TC={res.expect} on 0x{can_ids.TC_COMMAND:03X} …"
+                f"  (try {res.attempts})", "warn")
+    if res.status == config_request.OK:
+        return f"TC={res.expect} applied  ✓  ({res.rtt_ms:.0f} ms)", "ok"
+    return f"TC={res.expect} NOT confirmed after {res.attempts} tries", "err"
 
 
 def _draw_round_btn(surface, rect, label, hovered):
@@ -64,16 +58,14 @@ def _draw_round_btn(surface, rect, label, hovered):
 
 
 class TCScreen:
-    def __init__(self, bus: can.BusABC | None = None):
-        self._bus      = bus
+    SIGNALS = ("tc_req",)  # delivery state of the last request (main.py)
+
+    def __init__(self, service: TCService):
+        self._svc      = service
         self._level    = 5          # default TC level
-        self._status   = ""         # last send status message
+        self._status   = ""         # local note (no bus)
         self._hovered  = None       # "minus" | "plus" | "send" | None
 
-    def set_bus(self, bus: can.BusABC) -> None:
-        """Call this after the bus is open so TC can transmit."""
-        self._bus = bus
-
     def handle_event(self, event: pygame.event.Event) -> str | None:
         if event.type == pygame.MOUSEMOTION:
             p = event.pos
@@ -95,8 +87,11 @@ class TCScreen:
                 self._status = ""
 
             elif _BTN_SEND.collidepoint(event.pos):
-                self._status = _send_tc(self._bus, self._level)
-                print(f"[TC] {self._status}")
+                if self._svc.set_level(self._level):
+                    self._status = ""
+                    print(f"[TC] Requested TC={self._level}")
+                else:
+                    self._status = f"[NO BUS] TC={self._level} (not sent)"
 
         return None
 
@@ -142,9 +137,11 @@ class TCScreen:
         surface.blit(slbl, slbl.get_rect(center=_BTN_SEND.center))
 
         # Status line
-        if self._status:
-            col  = t["ok"] if "✓" in self._status else t["err"]
-            stxt = _F_STATUS.render(self._status, True, col)
+        text, col = (self._status, "err") if self._status else _status_line(
+            latest.get("tc_req")
+        )
+        if text:
+            stxt = _F_STATUS.render(text, True, t[col])
             surface.blit(stxt, stxt.get_rect(center=(W // 2, _BTN_SEND.bottom + 18)))
 
         # Back button
@@ -12,7 +12,9 @@ Each card has:
 
 import pygame
 
+from service import config_request
 from ui import theme
+from ui.widgets import TrendGraph
 
 W, H = 800, 480
 
@@ -30,6 +32,8 @@ _BTN_BACK = pygame.Rect(20, 20, 100, 45)
 
 _CH_LABELS = ["Motor", "Inverter"]
 _CH_ICONS = ["MOT", "INV"]
+_CH_TRENDS = ["motor_hotspot_temp", "inv_hotspot_temp"]  # M161 / M162 hot spots (can_rx.HISTORY)
+_TREND_BUCKET_S = 10.0  # one column per 10 s: ~20 min across the card
 
 pygame.font.init()
 _F_TITLE = pygame.font.SysFont("DejaVu Sans", 38, bold=True)
@@ -59,10 +63,20 @@ _CARD_RECTS = _card_rects()
 
 
 class TempControlScreen:
-    def __init__(self, bus, service):
+    SIGNALS = ("temp_state", "temp_stale", "trend_tick")
+
+    def __init__(self, bus, service, trends=None):
         self._bus = bus
         self._svc = service
         self._hov = -1
+        self._trends = [
+            TrendGraph(
+                (r.x + 196, r.y + 92, _CARD_W - 210, 76),
+                trends.get(name) if trends else None,
+                bucket_s=_TREND_BUCKET_S,
+            )
+            for r, name in zip(_CARD_RECTS, _CH_TRENDS)
+        ]
 
         self._btn_minus: list[pygame.Rect] = []
         self._btn_plus: list[pygame.Rect] = []
@@ -113,30 +127,28 @@ class TempControlScreen:
         title = _F_TITLE.render("TEMPERATURES", True, t["text"])
         surface.blit(title, title.get_rect(center=(W // 2, 52)))
 
+        st = latest["temp_state"]
         for i in range(len(_CH_LABELS)):
-            self._draw_card(surface, i, t)
+            self._draw_card(surface, i, t, st)
 
         pygame.draw.rect(surface, t["button_bg"], _BTN_BACK, border_radius=10)
         pygame.draw.rect(surface, t["border"], _BTN_BACK, width=2, border_radius=10)
         lbl = _F_BACK.render("← Back", True, t["button_fg"])
         surface.blit(lbl, lbl.get_rect(center=_BTN_BACK.center))
 
-        hint = _F_HINT.render(
-            "± 5 °C per tap  •  thresholds sent live via CAN 0x130  •  FORCE overrides temp logic",
-            True,
-            t["border"],
-        )
+        hint_txt, hint_col = _cfg_hint(st.cfg, t)
+        hint = _F_HINT.render(hint_txt, True, hint_col)
         surface.blit(hint, hint.get_rect(center=(W // 2, H - 14)))
 
-    def _draw_card(self, surface: pygame.Surface, i: int, t: dict) -> None:
+    def _draw_card(self, surface: pygame.Surface, i: int, t: dict, st) -> None:
+        # One immutable TempState snapshot per frame — all cards agree.
         rect = _CARD_RECTS[i]
-        svc = self._svc
-        ntc = svc.analog_temp[i]
-        hot = svc.can_temp[i]
-        thresh = svc.thresholds[i]
-        fan_on = svc.fan_state[i]
-        forced = svc.fan_forced[i]
-        fault = bool(svc.fault_mask & (1 << i))
+        ntc = st.analog[i]
+        hot = st.can[i]
+        thresh = st.thresh[i]
+        fan_on = st.fan[i]
+        forced = st.forced[i]
+        fault = bool(st.fault & (1 << i))
 
         temps_valid = [v for v in (ntc, hot) if v > -90]
         worst = max(temps_valid) if temps_valid else -99.0
@@ -201,6 +213,11 @@ class TempControlScreen:
             h_str, h_col = f"{hot:+.1f} °C", _temp_col(hot, thresh, t)
         surface.blit(_F_TEMP.render(h_str, True, h_col), (x + 14, y + 168))
 
+        # Trend of the hot spot with the fan threshold overlaid
+        graph = self._trends[i]
+        graph.thresholds = (thresh,)
+        graph.draw(surface)
+
         # Threshold label + value
         thr_y = rect.bottom - _BTN_H - _FORCE_H - 48
         surface.blit(
@@ -235,6 +252,20 @@ class TempControlScreen:
         surface.blit(fs, fs.get_rect(center=fbtn.center))
 
 
+def _cfg_hint(res, t: dict):
+    """Bottom line: how the last 0x130 config fared (echoed in 0x131)."""
+    if res is None:
+        return (
+            "± 5 °C per tap  •  thresholds sent live via CAN 0x130  •  FORCE overrides temp logic",
+            t["border"],
+        )
+    if res.status == config_request.PENDING:
+        return f"0x130 config sent, waiting for controller …  (try {res.attempts})", t["warn"]
+    if res.status == config_request.OK:
+        return f"0x130 config applied by controller  ✓  ({res.rtt_ms:.0f} ms)", t["ok"]
+    return f"0x130 config NOT confirmed after {res.attempts} tries", t["err"]
+
+
 def _temp_col(temp: float, thresh: float, t: dict):
     if temp >= thresh:
         return (255, 80, 80)
@@ -4,9 +4,12 @@ Reusable drawing primitives shared across screens.
 Every function receives the pygame surface as its first argument.
 """
 
+import math
+
+import clock
 import pygame
 
-from ui.theme import T
+from ui.theme import T, is_dark
 
 # ---------------------------------------------------------------------------
 # Fonts — loaded once at import time
@@ -182,3 +185,88 @@ def draw_tsal_indicator(
 
     pygame.draw.circle(surface, colour, rect.center, W_PIL // 2)
     pygame.draw.circle(surface, (255, 255, 255), rect.center, W_PIL // 2, 2)
+
+
+class TrendGraph:
+    """Scrolling trend of one history.SignalHistory tier, one pixel column
+    per bucket: min..max envelope plus the mean.
+
+    The plot lives on the widget's own surface. draw() scrolls it left by
+    the buckets that elapsed since the last call and paints only those
+    columns plus the one still filling, then blits it. `thresholds` are
+    overlaid on the blit, so changing them never repaints the plot. A theme
+    change or a gap wider than the graph repaints everything once.
+    """
+
+    def __init__(
+        self,
+        rect,
+        series,
+        label: str = "",
+        lo: float = 0.0,
+        hi: float = 120.0,
+        bucket_s: float = 1.0,
+        clock=clock.SYSTEM,
+    ):
+        self.rect = pygame.Rect(rect)
+        self.series = series  # history.SignalHistory | None
+        self.label = label
+        self.lo, self.hi = lo, hi
+        self.bucket_s = bucket_s
+        self.thresholds: tuple = ()
+        self._clock = clock
+        self._plot = pygame.Surface(self.rect.size)
+        self._last: int | None = None  # bucket shown in the rightmost column
+        self._dark: bool | None = None  # theme the plot was painted in
+
+    def _y(self, v: float) -> int:
+        h = self.rect.h - 1
+        p = (v - self.lo) / (self.hi - self.lo)
+        return h - int(max(0.0, min(1.0, p)) * h)
+
+    def _paint(self, x0: int, win) -> None:
+        t = T()
+        bg, env, line = t["fill_bg"], t["border"], t["ok"]
+        h = self.rect.h
+        for i, (a, b, m) in enumerate(
+            zip(win.lo.tolist(), win.hi.tolist(), win.mean.tolist())
+        ):
+            x = x0 + i
+            self._plot.fill(bg, (x, 0, 1, h))
+            if math.isnan(m):
+                continue
+            y_lo, y_hi = self._y(a), self._y(b)
+            if y_lo - y_hi > 1:
+                pygame.draw.line(self._plot, env, (x, y_hi), (x, y_lo))
+            self._plot.set_at((x, self._y(m)), line)
+
+    def update(self) -> None:
+        """Bring the plot surface up to the current bucket."""
+        cols = self.rect.w
+        newest = math.floor(self._clock.now() / self.bucket_s)
+        dark = is_dark()
+        if self._last is not None and dark == self._dark and 0 <= newest - self._last < cols:
+            n = newest - self._last
+            if n:
+                self._plot.scroll(-n, 0)
+            x0, count = cols - 1 - n, n + 1  # new columns + the one that was filling
+        else:
+            x0, count = 0, cols
+            self._dark = dark
+        if self.series is None:
+            self._plot.fill(T()["fill_bg"], (x0, 0, count, self.rect.h))
+        else:
+            self._paint(x0, self.series.window(self.bucket_s, count, last=newest))
+        self._last = newest
+
+    def draw(self, surface: pygame.Surface, value: float | None = None) -> None:
+        self.update()
+        t = T()
+        surface.blit(self._plot, self.rect)
+        for thr in self.thresholds:
+            if self.lo < thr < self.hi:
+                y = self.rect.y + self._y(thr)
+                pygame.draw.line(surface, t["err"], (self.rect.x, y), (self.rect.right - 1, y))
+        pygame.draw.rect(surface, t["border"], self.rect, width=1)
+        text = self.label if value is None else f"{self.label} {value:.0f}º"
+        surface.blit(FONT_SMALL.render(text, True, t["text"]), (self.rect.x + 4, self.rect.y + 2))
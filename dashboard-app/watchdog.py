@@ -0,0 +1,144 @@
+"""
+watchdog.py
+Heartbeats for the two loops a driver depends on: the CAN RX loop
+(can_rx.py / can_aio.py) and the pygame frame loop (main.py).
+
+Each loop calls beat(name) once per iteration. That is a single dict store.
+The RX loop beats even on an idle bus, because recv() times out every
+second. A monitor thread checks every CHECK_S. A loop is down when its
+newest beat is older than its stall threshold, or when its `alive()`
+callback says the thread has died. When a loop goes down or recovers:
+  - a "[WATCHDOG] ..." line is printed;
+  - `faults`, a tuple of the down loop names, is passed to on_change.
+    main.py publishes it as the "watchdog" signal, and the dashboard shows
+    a STALL banner for it. A loop stays in `faults` for LATCH_S after it
+    recovers, so that a frozen UI still shows its own stall once it draws
+    again;
+  - if the loop has a restart callback and DASH_WATCHDOG_RESTART is on,
+    the callback runs. This is can_rx.restart() for the RX thread. The
+    next try waits RESTART_BACKOFF_S, which doubles up to
+    RESTART_BACKOFF_MAX_S while the loop stays down.
+
+  DASH_WATCHDOG_RX_S=3       RX stall threshold (s)
+  DASH_WATCHDOG_UI_S=1       UI stall threshold (s)
+  DASH_WATCHDOG_RESTART=1    restart a dead or stalled RX thread (0 = only report)
+
+Ages, stalls and restarts are exported through metrics.py.
+"""
+
+import os
+import threading
+import time
+
+import metrics
+
+RX_STALL_S = float(os.environ.get("DASH_WATCHDOG_RX_S", "3"))
+UI_STALL_S = float(os.environ.get("DASH_WATCHDOG_UI_S", "1"))
+RESTART = os.environ.get("DASH_WATCHDOG_RESTART", "1") == "1"
+CHECK_S = 0.2
+LATCH_S = 5.0
+RESTART_BACKOFF_S = 2.0
+RESTART_BACKOFF_MAX_S = 60.0
+
+_beats: dict[str, float] = {}  # loop name -> time.monotonic() of its last beat
+_loops: dict = {}
+faults: tuple[str, ...] = ()
+on_change = None  # fn(faults), called on the watchdog thread
+_thread: threading.Thread | None = None
+_stop = threading.Event()
+
+
+class _Loop:
+    __slots__ = ("name", "stall_s", "alive", "restart", "down", "down_at",
+                 "clear_at", "retry_at", "backoff", "stalls", "restarts")
+
+    def __init__(self, name, stall_s, alive, restart):
+        self.name = name
+        self.stall_s = stall_s
+        self.alive = alive
+        self.restart = restart
+        self.down = False
+        self.down_at = 0.0
+        self.clear_at = 0.0
+        self.retry_at = 0.0
+        self.backoff = RESTART_BACKOFF_S
+        self.stalls = 0
+        self.restarts = 0
+
+
+def beat(name: str) -> None:
+    _beats[name] = time.monotonic()
+
+
+def watch(name: str, stall_s: float, alive=None, restart=None) -> None:
+    """Register a loop. `alive()` -> bool detects a dead thread sooner than
+    the stall threshold; `restart()` brings the loop back."""
+    _loops[name] = _Loop(name, stall_s, alive, restart)
+    _beats.setdefault(name, time.monotonic())  # grace period until the first beat
+
+
+# ── Monitor ──────────────────────────────────────────────────────────────────
+def check(now: float | None = None) -> tuple[str, ...]:
+    """One pass over the watched loops; returns (and publishes) `faults`."""
+    global faults
+    now = time.monotonic() if now is None else now
+    for w in list(_loops.values()):
+        age = now - _beats.get(w.name, now)
+        dead = w.alive is not None and not w.alive()
+        if dead or age > w.stall_s:
+            if not w.down:
+                w.down, w.down_at = True, now - age  # down since the last beat
+                w.stalls += 1
+                print(f"[WATCHDOG] {w.name} "
+                      + ("thread died" if dead else f"stalled: no heartbeat for {age:.1f} s"))
+            if w.restart is not None and RESTART and now >= w.retry_at:
+                w.retry_at = now + w.backoff
+                w.backoff = min(w.backoff * 2, RESTART_BACKOFF_MAX_S)
+                w.restarts += 1
+                print(f"[WATCHDOG] restarting {w.name} (#{w.restarts})")
+                try:
+                    w.restart()
+                except Exception as e:
+                    print(f"[WATCHDOG] restarting {w.name} failed: {e}")
+        elif w.down:
+            w.down = False
+            w.clear_at = now + LATCH_S
+            w.backoff = RESTART_BACKOFF_S
+            print(f"[WATCHDOG] {w.name} recovered after {now - w.down_at:.1f} s")
+    now_faults = tuple(w.name for w in _loops.values() if w.down or now < w.clear_at)
+    if now_faults != faults:
+        faults = now_faults
+        if on_change is not None:
+            on_change(faults)
+    return faults
+
+
+def _run() -> None:
+    while not _stop.wait(CHECK_S):
+        try:
+            check()
+        except Exception as e:
+            print(f"[WATCHDOG] check failed: {e}")
+
+
+def start() -> None:
+    """Spawn the monitor thread (once, after the loops are registered)."""
+    global _thread
+    if _thread is None:
+        _thread = threading.Thread(target=_run, name="watchdog", daemon=True)
+        _thread.start()
+
+
+def stop() -> None:
+    """Stop monitoring (main.py, on exit, so shutdown isn't reported as a stall)."""
+    _stop.set()
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────────
+metrics.gauge("heartbeat_age_seconds", "Time since each loop's last heartbeat",
+              fn=lambda: {n: time.monotonic() - _beats.get(n, 0.0) for n in _loops},
+              label="loop")
+metrics.counter("watchdog_stalls_total", "Times a loop went down (stall or dead thread)",
+                fn=lambda: {n: w.stalls for n, w in _loops.items()}, label="loop")
+metrics.counter("watchdog_restarts_total", "Restarts the watchdog attempted",
+                fn=lambda: {n: w.restarts for n, w in _loops.items()}, label="loop")
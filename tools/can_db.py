@@ -0,0 +1,221 @@
+"""
+tools/can_db.py
+Minimal DBC reader + generic signal decoder, for build time only.
+
+gen_can_codec.py compiles the DBCs into dashboard-app/can_codec.py with it
+and checks the generated code against it. The dashboard itself never parses
+a DBC.
+
+Only the parts of the DBC format the dashboard needs:
+  BO_  messages, SG_ signals (Intel/Motorola, signed/unsigned, multiplexed),
+  BA_ "GenMsgCycleTime", VAL_ tables. Comments and attributes are skipped.
+
+    db = can_db.load(can_db.CASCADIA_DBC)
+    sig = db.signal("INV_Hot_Spot_Temp_Inverter")
+    sig.decode(msg.data)  # -> float °C, or None if the payload is too short
+"""
+
+import os
+import re
+
+DBC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dbc")
+CASCADIA_DBC = os.path.join(DBC_DIR, "20250206_CM_not_oil-cooled_CAN_DB.dbc")
+PEDAL_DBC = os.path.join(DBC_DIR, "pedal_v0_1.dbc")
+DASHBOARD_DBC = os.path.join(DBC_DIR, "dashboard_v0_1.dbc")
+
+_RE_BO = re.compile(r"^BO_\s+(\d+)\s+(\w+)\s*:\s*(\d+)\s+(\w+)")
+_RE_SG = re.compile(
+    r"^\s*SG_\s+(\w+)\s*(M|m\d+)?\s*:\s*(\d+)\|(\d+)@([01])([+-])\s*"
+    r"\(([^,]+),([^)]+)\)\s*\[([^|]*)\|([^\]]*)\]\s*\"([^\"]*)\""
+)
+_RE_CYCLE = re.compile(r'^BA_\s+"GenMsgCycleTime"\s+BO_\s+(\d+)\s+(\d+)\s*;')
+_RE_VAL = re.compile(r"^VAL_\s+(\d+)\s+(\w+)\s+(.*);")
+_RE_VAL_PAIR = re.compile(r'(-?\d+)\s+"([^"]*)"')
+
+
+def _num(s: str) -> float:
+    v = float(s)
+    return int(v) if v.is_integer() else v
+
+
+class Signal:
+    __slots__ = (
+        "name", "msg_id", "start", "length", "little_endian", "signed",
+        "scale", "offset", "minimum", "maximum", "unit",
+        "is_mux", "mux_id", "mux_signal", "choices", "bits",
+    )
+
+    def __init__(self, name, msg_id, start, length, little_endian, signed,
+                 scale, offset, minimum, maximum, unit, is_mux, mux_id):
+        self.name = name
+        self.msg_id = msg_id
+        self.start = start
+        self.length = length
+        self.little_endian = little_endian
+        self.signed = signed
+        self.scale = scale
+        self.offset = offset
+        self.minimum = minimum
+        self.maximum = maximum
+        self.unit = unit
+        self.is_mux = is_mux  # this signal is the multiplexer switch
+        self.mux_id = mux_id  # only valid when the switch equals this value
+        self.mux_signal: "Signal | None" = None
+        self.choices: dict[int, str] = {}
+        self.bits = self._bit_positions()
+
+    def _bit_positions(self) -> list[int]:
+        """Payload bit index (byte*8 + bit) of each signal bit, LSB first."""
+        if self.little_endian:
+            return [self.start + i for i in range(self.length)]
+        # Motorola: start is the MSB, numbered in the DBC sawtooth layout.
+        bits = []
+        pos = self.start
+        for _ in range(self.length):
+            bits.append(pos)
+            if pos % 8 == 0:
+                pos += 15
+            else:
+                pos -= 1
+        return bits[::-1]
+
+    @property
+    def byte_span(self) -> int:
+        """Bytes of payload needed to decode this signal."""
+        return max(self.bits) // 8 + 1
+
+    def raw(self, data) -> int | None:
+        if len(data) < self.byte_span:
+            return None
+        v = 0
+        for i, b in enumerate(self.bits):
+            if (data[b >> 3] >> (b & 7)) & 1:
+                v |= 1 << i
+        if self.signed and v & (1 << (self.length - 1)):
+            v -= 1 << self.length
+        return v
+
+    def decode(self, data):
+        if self.mux_signal is not None and self.mux_signal.raw(data) != self.mux_id:
+            return None
+        r = self.raw(data)
+        if r is None:
+            return None
+        if self.scale == 1 and self.offset == 0:
+            return r
+        return r * self.scale + self.offset
+
+    def encode_into(self, buf: bytearray, value) -> None:
+        r = int(round((value - self.offset) / self.scale))
+        r &= (1 << self.length) - 1
+        for i, b in enumerate(self.bits):
+            if (r >> i) & 1:
+                buf[b >> 3] |= 1 << (b & 7)
+            else:
+                buf[b >> 3] &= ~(1 << (b & 7)) & 0xFF
+
+
+class Message:
+    __slots__ = ("frame_id", "name", "dlc", "sender", "signals", "cycle_ms")
+
+    def __init__(self, frame_id: int, name: str, dlc: int, sender: str):
+        self.frame_id = frame_id
+        self.name = name
+        self.dlc = dlc
+        self.sender = sender
+        self.signals: list[Signal] = []
+        self.cycle_ms = 0
+
+    def decode(self, data) -> dict:
+        """All signals present in `data` (inactive mux pages are left out)."""
+        out = {}
+        for s in self.signals:
+            v = s.decode(data)
+            if v is not None:
+                out[s.name] = v
+        return out
+
+    def encode(self, values: dict) -> bytes:
+        buf = bytearray(self.dlc)
+        for s in self.signals:
+            if s.name in values:
+                s.encode_into(buf, values[s.name])
+        return bytes(buf)
+
+
+class Database:
+    def __init__(self):
+        self.messages: dict[int, Message] = {}
+        self.signals: dict[str, Signal] = {}
+
+    def message(self, key) -> Message:
+        if isinstance(key, int):
+            return self.messages[key]
+        for m in self.messages.values():
+            if m.name == key:
+                return m
+        raise KeyError(key)
+
+    def signal(self, name: str) -> Signal:
+        return self.signals[name]
+
+    def merge(self, other: "Database") -> "Database":
+        self.messages.update(other.messages)
+        self.signals.update(other.signals)
+        return self
+
+
+def parse(text: str) -> Database:
+    db = Database()
+    cur: Message | None = None
+    for line in text.splitlines():
+        m = _RE_BO.match(line)
+        if m:
+            cur = Message(int(m[1]), m[2], int(m[3]), m[4])
+            db.messages[cur.frame_id] = cur
+            continue
+        m = _RE_SG.match(line)
+        if m and cur is not None:
+            mux = m[2] or ""
+            sig = Signal(
+                name=m[1],
+                msg_id=cur.frame_id,
+                start=int(m[3]),
+                length=int(m[4]),
+                little_endian=m[5] == "1",
+                signed=m[6] == "-",
+                scale=_num(m[7]),
+                offset=_num(m[8]),
+                minimum=_num(m[9]) if m[9].strip() else 0,
+                maximum=_num(m[10]) if m[10].strip() else 0,
+                unit=m[11],
+                is_mux=mux == "M",
+                mux_id=int(mux[1:]) if mux.startswith("m") else None,
+            )
+            cur.signals.append(sig)
+            db.signals[sig.name] = sig
+            continue
+        if not line.startswith(" "):
+            cur = None
+        m = _RE_CYCLE.match(line)
+        if m and int(m[1]) in db.messages:
+            db.messages[int(m[1])].cycle_ms = int(m[2])
+            continue
+        m = _RE_VAL.match(line)
+        if m and m[2] in db.signals:
+            db.signals[m[2]].choices = {
+                int(k): v for k, v in _RE_VAL_PAIR.findall(m[3])
+            }
+
+    for msg in db.messages.values():
+        switch = next((s for s in msg.signals if s.is_mux), None)
+        if switch is not None:
+            for s in msg.signals:
+                if s.mux_id is not None:
+                    s.mux_signal = switch
+    return db
+
+
+def load(path: str) -> Database:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return parse(f.read())
@@ -0,0 +1,4 @@
+"""
+tools/ecusim
+Full-car CAN bench: one process per ECU model on vcan0 (see run.py).
+"""
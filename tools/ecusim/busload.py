@@ -0,0 +1,71 @@
+"""
+tools/ecusim/busload.py
+Bus-load meter: listens to every frame on the bench bus.
+
+Load is bits on the wire over the bitrate. Frame length uses the worst-case
+bit-stuffing bound (classic CAN: 47 + 8n bits + one stuff bit per 4 of the
+34 + 8n stuffable bits), so the figure errs high, like a bus analyser's
+"max" column.
+"""
+
+import time
+from typing import NamedTuple
+
+import can
+
+DEFAULT_BITRATE = 500_000
+
+
+def frame_bits(dlc: int, extended: bool = False) -> int:
+    """Worst-case bits on the wire for one data frame incl. interframe space."""
+    if extended:
+        return 67 + 8 * dlc + (54 + 8 * dlc - 1) // 4
+    return 47 + 8 * dlc + (34 + 8 * dlc - 1) // 4
+
+
+class LoadSample(NamedTuple):
+    t: float  # s from bench start
+    fps: float
+    load_pct: float
+    per_id: dict  # frame id -> frames this interval
+
+
+class LoadMeter:
+    def __init__(self, bitrate: int = DEFAULT_BITRATE):
+        self.bitrate = bitrate
+        self._frames = 0
+        self._bits = 0
+        self._per_id: dict[int, int] = {}
+
+    def add(self, msg: can.Message) -> None:
+        self._frames += 1
+        self._bits += frame_bits(msg.dlc, msg.is_extended_id)
+        self._per_id[msg.arbitration_id] = self._per_id.get(msg.arbitration_id, 0) + 1
+
+    def sample(self, t: float, interval: float) -> LoadSample:
+        s = LoadSample(t, self._frames / interval,
+                       100.0 * self._bits / interval / self.bitrate, self._per_id)
+        self._frames = self._bits = 0
+        self._per_id = {}
+        return s
+
+
+def monitor(channel: str, interface: str, bitrate: int, t0: float,
+            stats, stop, interval: float = 1.0) -> None:
+    """Put a LoadSample on `stats` every `interval` until `stop` is set."""
+    bus = can.Bus(interface=interface, channel=channel)
+    meter = LoadMeter(bitrate)
+    while time.monotonic() < t0:
+        bus.recv(timeout=t0 - time.monotonic())  # discard; count from t0
+    last = t0
+    try:
+        while not stop.is_set():
+            msg = bus.recv(timeout=0.05)
+            if msg is not None and not msg.is_error_frame:
+                meter.add(msg)
+            now = time.monotonic()
+            if now - last >= interval:
+                stats.put(meter.sample(now - t0, now - last))
+                last = now
+    finally:
+        bus.shutdown()
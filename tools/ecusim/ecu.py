@@ -0,0 +1,220 @@
+"""
+tools/ecusim/ecu.py
+ECU model base class, fault hooks and the per-ECU run loop.
+
+A model lists the DBC messages it sends (`tx`) and the IDs it listens to
+(`rx`). run() gives every message its own absolute schedule at the DBC
+GenMsgCycleTime (DEFAULT_CYCLE_MS if the DBC has none), starting at a random
+phase like unsynchronised ECUs on a real car, and asks the model for the
+signal values just before each send. Models react to the frames they
+receive in on_rx() and may answer immediately (request/response frames).
+
+Faults are generic (applied by run() to any message) or model specific
+(interpreted by the model in update()):
+
+  stall   TARGET          message (or "*") not sent
+  silent                  the whole ECU is off the bus
+  drop    TARGET=P        each frame lost with probability P (counters jump)
+  freeze  TARGET          last payload repeated (values and counter stuck)
+  corrupt TARGET=P        one random bit flipped with probability P
+  jitter  TARGET=MS       each send delayed by up to MS milliseconds
+  value   SIGNAL=V        signal forced to V
+
+Spec: ECU:KIND[:TARGET[=VALUE]][@START[+DURATION]] — times in seconds from
+bench start (run.py) or from now (typed at runtime), e.g.
+
+  mcu:stall:Pedal_Processed@10+2     inv:corrupt:M176_Fast_Info=0.01
+  bms:value:BMS_Max_Discharge_Current=20@15+5     temp:silent@30+5
+  inv:fault=0x0400@20+3              (model fault, see models.py)
+"""
+
+import heapq
+import queue
+import random
+import time
+from typing import NamedTuple
+
+import can
+import can_codec
+
+DEFAULT_CYCLE_MS = 100  # DBC messages without GenMsgCycleTime
+STATS_INTERVAL_S = 1.0
+GENERIC_FAULTS = ("stall", "silent", "drop", "freeze", "corrupt", "jitter", "value")
+
+MESSAGES_BY_NAME = {m.name: m for m in can_codec.MESSAGES.values()}
+
+
+class Fault(NamedTuple):
+    ecu: str
+    kind: str
+    target: str  # message or signal name, "*" = all
+    value: float | None
+    start: float  # s from bench start
+    duration: float | None  # None = until the end
+
+    def active(self, t: float) -> bool:
+        return t >= self.start and (self.duration is None
+                                    or t < self.start + self.duration)
+
+    def hits(self, name: str) -> bool:
+        return self.target in ("*", name)
+
+
+def parse_fault(spec: str, now: float = 0.0) -> Fault:
+    """ECU:KIND[:TARGET[=VALUE]][@START[+DURATION]]; START is relative to
+    `now`. Raises ValueError on a malformed spec."""
+    body, _, when = spec.strip().partition("@")
+    parts = body.split(":", 2)
+    if len(parts) < 2:
+        raise ValueError(f"fault {spec!r}: expected ECU:KIND[:TARGET[=VALUE]]")
+    ecu, (kind, eq, v) = parts[0], parts[1].partition("=")  # KIND=V: all targets
+    target, value = "*", None
+    if len(parts) == 3:
+        target, eq, v = parts[2].partition("=")
+    if eq:
+        value = float(int(v, 0)) if v.lower().startswith("0x") else float(v)
+    start, duration = 0.0, None
+    if when:
+        s, plus, d = when.partition("+")
+        start = float(s or 0.0)
+        duration = float(d) if plus else None
+    return Fault(ecu, kind, target, value, now + start, duration)
+
+
+class Ecu:
+    """Subclass per ECU. update() advances the model, signals() returns the
+    encode() keyword arguments for one message, on_rx() handles a received
+    frame and returns any immediate replies."""
+
+    name = ""
+    tx: tuple[str, ...] = ()  # DBC message names
+    rx: tuple[int, ...] = ()  # frame IDs
+    fault_kinds: tuple[str, ...] = ()  # model-specific kinds, see update()
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+
+    def update(self, t: float, dt: float, faults: list[Fault]) -> None:
+        pass
+
+    def signals(self, msg_name: str, t: float) -> dict:
+        return {}
+
+    def on_rx(self, msg: can.Message, t: float) -> list[can.Message]:
+        return []
+
+
+def decode(msg: can.Message) -> dict:
+    """Received frame as {signal: value} (empty if unknown or too short)."""
+    info = can_codec.MESSAGES.get(msg.arbitration_id)
+    if info is None or msg.dlc < info.min_len:
+        return {}
+    return dict(zip(info.fields, info.decode(msg.data)))
+
+
+class Stats(NamedTuple):
+    ecu: str
+    t: float
+    sent: dict  # message name -> frames this interval
+    suppressed: int  # frames withheld by faults
+    rx: int
+    late_max_ms: float  # worst send-vs-schedule slip this interval
+
+
+def run(model_cls, channel: str, interface: str, t0: float, faults: list,
+        ctrl, stats, stop, seed: int = 0) -> None:
+    """One ECU until `stop` is set. `t0` is the shared time.monotonic() of
+    bench start; `ctrl` is a queue of Fault for runtime injection, `stats`
+    receives a Stats every STATS_INTERVAL_S. Runs as a process or thread."""
+    ecu = model_cls(seed)
+    bus = can.Bus(interface=interface, channel=channel)
+    infos = [MESSAGES_BY_NAME[n] for n in ecu.tx]
+    periods = [(i.cycle_ms or DEFAULT_CYCLE_MS) / 1000.0 for i in infos]
+    # (send_at, nominal, index): nominal keeps the schedule drift-free when
+    # jitter moves send_at
+    heap = []
+    for k, p in enumerate(periods):
+        first = t0 + ecu.rng.uniform(0.0, p)
+        heap.append((first, first, k))
+    heapq.heapify(heap)
+    rx_ids = set(ecu.rx)
+    last: dict[str, bytes] = {}
+    sent: dict[str, int] = {}
+    suppressed = rx = 0
+    late_max = 0.0
+    t_model = 0.0
+    next_stats = t0 + STATS_INTERVAL_S
+    faults = list(faults)
+
+    def active(now_t):
+        return [f for f in faults if f.active(now_t)]
+
+    try:
+        while not stop.is_set():
+            try:
+                while True:
+                    faults.append(ctrl.get_nowait())
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            if now >= next_stats:
+                stats.put(Stats(ecu.name, now - t0, sent, suppressed, rx, late_max))
+                sent, suppressed, rx, late_max = {}, 0, 0, 0.0
+                next_stats += STATS_INTERVAL_S
+
+            send_at, nominal, k = heap[0]
+            wait = min(send_at, next_stats) - now
+            if wait > 0:
+                msg = bus.recv(timeout=min(wait, 0.05))
+                if msg is not None and msg.arbitration_id in rx_ids:
+                    rx += 1
+                    on = active(time.monotonic() - t0)
+                    if not any(f.kind == "silent" for f in on):
+                        for reply in ecu.on_rx(msg, time.monotonic() - t0):
+                            bus.send(reply)
+                continue
+
+            heapq.heappop(heap)
+            info = infos[k]
+            t = now - t0
+            on = active(t)
+            nxt = nominal + periods[k]
+            jit = [f for f in on if f.kind == "jitter" and f.hits(info.name)]
+            heapq.heappush(heap, (nxt + ecu.rng.uniform(0.0, jit[0].value / 1000.0)
+                                  if jit and jit[0].value else nxt, nxt, k))
+            late_max = max(late_max, (now - send_at) * 1000.0)
+
+            ecu.update(t, t - t_model, on)
+            t_model = t
+            kw = ecu.signals(info.name, t)
+            if any(f.kind == "silent" or (f.kind == "stall" and f.hits(info.name))
+                   for f in on):
+                suppressed += 1
+                continue
+            for f in on:
+                if f.kind == "value" and f.target in info.fields:
+                    kw[f.target] = f.value
+            data = bytearray(info.encode(**kw))[:info.dlc]
+            for f in on:
+                if not f.hits(info.name):
+                    continue
+                if f.kind == "freeze" and info.name in last:
+                    data = bytearray(last[info.name])
+                elif f.kind == "corrupt" and ecu.rng.random() < (f.value or 1.0):
+                    bit = ecu.rng.randrange(len(data) * 8)
+                    data[bit // 8] ^= 1 << (bit % 8)
+            if any(f.kind == "drop" and f.hits(info.name)
+                   and ecu.rng.random() < (f.value or 1.0) for f in on):
+                suppressed += 1
+                continue
+            if not any(f.kind == "freeze" and f.hits(info.name) for f in on):
+                last[info.name] = bytes(data)
+            try:
+                bus.send(can.Message(arbitration_id=info.frame_id, data=data,
+                                     is_extended_id=False))
+                sent[info.name] = sent.get(info.name, 0) + 1
+            except can.CanError as e:
+                print(f"[{ecu.name.upper()}] TX error on {info.name}: {e}")
+    finally:
+        bus.shutdown()
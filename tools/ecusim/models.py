@@ -0,0 +1,347 @@
+"""
+tools/ecusim/models.py
+ECU models for the bench: MCU (pedal box / VCU), Cascadia inverter, BMS and
+the temperature controller that answers 0x130.
+
+The models only share state through the bus, as on the car:
+
+  MCU   driver pedal cycle -> M192 torque (scaled by the TC level from 0x120)
+        vehicle speed from M165, SOC from M166, temps from M162
+  INV   M192 torque -> motor speed, DC current, heating; answers M193
+  BMS   SOC from M166 -> discharge/charge limits
+  TEMP  NTCs follow the M161/M162 hot spots; fans from the 0x130 thresholds
+        pull them down
+
+Physics is deliberately crude — enough for plausible, coupled numbers.
+"""
+
+import math
+import os
+import sys
+
+import can
+import can_ids
+from ecusim.ecu import Ecu, decode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sim_inverter  # noqa: E402
+
+M165 = 0xA5
+M166 = 0xA6
+M192 = 0xC0
+
+MAX_TORQUE_NM = 230.0
+PACK_AH = 20.0
+PACK_V = 400.0
+KPH_PER_RPM = 0.017  # final drive and wheel radius
+TC_MIN, TC_MAX = 1, 10
+
+
+def _counter(state: dict, key: str) -> int:
+    state[key] = (state.get(key, -1) + 1) & 0x0F
+    return state[key]
+
+
+class Mcu(Ecu):
+    """Pedal box + VCU. The driver repeats a 20 s lap: full throttle, lift,
+    brake, corner; one brake-throttle overlap per lap sets StatusBits."""
+
+    name = "mcu"
+    tx = ("Pedal_Processed", "Vehicle_Speed", "Battery_State", "Temps_Misc",
+          "Heartbeat", "TC_Status", "M192_Command_Message")
+    rx = (can_ids.TC_COMMAND, M165, M166, can_ids.INV_TEMPERATURE_3)
+
+    LAP_S = 20.0
+    OVERLAP = 0x04  # docs/plausibility.md bit2 BRAKE_OVERLAP
+    LATCHED = 0x80
+
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.apps = self.brake = 0.0
+        self.status = 0
+        self.tc = 5
+        self.rpm = 0.0
+        self.dc_a = 0.0
+        self.soc = 85.0
+        self.coolant = 30.0
+        self.inv_hot = 30.0
+        self._ctr = {}
+
+    def update(self, t, dt, faults):
+        lt = t % self.LAP_S
+        if lt < 6.0:
+            apps, brake = 100.0, 0.0
+        elif lt < 8.0:
+            apps, brake = 100.0 * (8.0 - lt) / 2.0, 0.0
+        elif lt < 10.0:
+            apps, brake = 0.0, 70.0 * math.sin(math.pi * (lt - 8.0) / 2.0)
+        elif lt < 10.6:
+            apps, brake = 40.0, 30.0  # overlap
+        else:
+            apps = 45.0 + 25.0 * math.sin(2 * math.pi * 0.4 * lt)
+            brake = 0.0
+        self.apps = max(0.0, min(100.0, apps + self.rng.uniform(-0.5, 0.5)))
+        self.brake = max(0.0, min(100.0, brake + self.rng.uniform(-0.3, 0.3)))
+        if self.brake > 15.0 and self.apps > 25.0:
+            self.status |= self.OVERLAP | self.LATCHED
+        elif self.apps < 5.0:
+            self.status &= ~self.LATCHED
+        if not (self.brake > 15.0 and self.apps > 25.0):
+            self.status &= ~self.OVERLAP
+        self.soc = max(0.0, self.soc - self.dc_a * dt / 3600.0 / PACK_AH * 100.0)
+
+    def torque_cmd(self) -> float:
+        if self.status & self.LATCHED:
+            return 0.0
+        tc_scale = 1.0 - 0.05 * (self.tc - TC_MIN)
+        return MAX_TORQUE_NM * self.apps / 100.0 * tc_scale
+
+    def signals(self, name, t):
+        if name == "Pedal_Processed":
+            return dict(APPS_pct=self.apps, Brake_pct=self.brake,
+                        StatusBits=self.status, Counter=_counter(self._ctr, name))
+        if name == "Vehicle_Speed":
+            return dict(Speed_kph=min(255, self.rpm * KPH_PER_RPM),
+                        Speed_Counter=_counter(self._ctr, name))
+        if name == "Battery_State":
+            return dict(Batt_SOC=self.soc, Batt_Pack_Temp=30 + 0.02 * self.dc_a,
+                        Batt_Counter=_counter(self._ctr, name))
+        if name == "Temps_Misc":
+            return dict(Water_Temp=self.coolant, Inverter_Temp=self.inv_hot,
+                        Temps_Counter=_counter(self._ctr, name))
+        if name == "Heartbeat":
+            return dict(HB_Uptime=int(t), HB_FW_Tag=0x11)
+        if name == "TC_Status":
+            return dict(TC_Level_Applied=self.tc)
+        if name == "M192_Command_Message":
+            return dict(VCU_INV_Torque_Command=self.torque_cmd(),
+                        VCU_INV_Direction_Command=1, VCU_INV_Inverter_Enable=1,
+                        VCU_INV_Rolling_Counter=_counter(self._ctr, name),
+                        VCU_INV_Torque_Limit_Command=MAX_TORQUE_NM)
+        return {}
+
+    def on_rx(self, msg, t):
+        s = decode(msg)
+        if msg.arbitration_id == can_ids.TC_COMMAND:
+            if s.get("TC_Magic") == 0x01:
+                self.tc = max(TC_MIN, min(TC_MAX, int(s["TC_Level"])))
+        elif msg.arbitration_id == M165:
+            self.rpm = s.get("INV_Motor_Speed", self.rpm)
+        elif msg.arbitration_id == M166:
+            self.dc_a = s.get("INV_DC_Bus_Current", self.dc_a)
+        elif msg.arbitration_id == can_ids.INV_TEMPERATURE_3:
+            self.coolant = s.get("INV_Coolant_Temp", self.coolant)
+            self.inv_hot = s.get("INV_Hot_Spot_Temp_Inverter", self.inv_hot)
+        return []
+
+
+class Inverter(Ecu):
+    """Cascadia broadcast set (M160–M177) at the DBC rates, driven by M192.
+    Answers M193 like tools/sim_inverter.py.
+
+    Model fault: inv:fault=CODE — run fault CODE in M171, VSM state 7
+    (blink fault code), zero torque."""
+
+    name = "inv"
+    tx = ("M160_Temperature_Set_1", "M161_Temperature_Set_2",
+          "M162_Temperature_Set_3", "M163_Analog_Input_Voltages",
+          "M164_Digital_Input_Status", "M165_Motor_Position_Info",
+          "M166_Current_Info", "M167_Voltage_Info", "M168_Flux_ID_IQ_Info",
+          "M169_Internal_Voltages", "M170_Internal_States", "M171_Fault_Codes",
+          "M172_Torque_And_Timer_Info", "M173_Modulation_And_Flux_Info",
+          "M174_Firmware_Info", "M175_Diag_Data_Message", "M176_Fast_Info",
+          "M177_Torque_Capability")
+    rx = (M192, can_ids.INV_PARAM_COMMAND)
+    fault_kinds = ("fault",)
+
+    CMD_TIMEOUT_S = 0.5  # no M192 -> torque 0, as the real inverter does
+
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.table = sim_inverter.default_table()
+        self.cmd = 0.0
+        self.cmd_t = -1.0
+        self.torque = 0.0
+        self.rpm = 0.0
+        self.dc_a = 0.0
+        self.vdc = PACK_V
+        self.coolant = 30.0
+        self.hot_inv = 30.0
+        self.hot_motor = 30.0
+        self.run_fault = 0
+        self._ctr = {}
+
+    def update(self, t, dt, faults):
+        codes = [int(f.value or 1) for f in faults if f.kind == "fault"]
+        self.run_fault = codes[0] if codes else 0
+        cmd = self.cmd if t - self.cmd_t < self.CMD_TIMEOUT_S else 0.0
+        if self.run_fault:
+            cmd = 0.0
+        self.torque += (cmd - self.torque) * min(1.0, dt / 0.02)
+        # speed: torque vs. aero/rolling drag
+        acc = self.torque * 8.0 - 4.4e-5 * self.rpm ** 2 - 30.0 * (self.rpm > 0)
+        self.rpm = max(0.0, min(7000.0, self.rpm + acc * dt))
+        power_w = self.torque * self.rpm * 2 * math.pi / 60.0
+        self.dc_a = power_w / max(self.vdc, 1.0) / 0.93
+        self.vdc = PACK_V - 0.08 * self.dc_a
+        # heating ~ I^2, cooling towards coolant
+        k = min(1.0, dt)
+        self.hot_inv += (0.00002 * self.dc_a ** 2 - 0.05 * (self.hot_inv - self.coolant)) * k
+        self.hot_motor += (0.00003 * self.dc_a ** 2 - 0.03 * (self.hot_motor - self.coolant)) * k
+        self.coolant += (0.002 * (self.hot_inv + self.hot_motor - 2 * self.coolant)
+                         - 0.01 * (self.coolant - 25.0)) * k
+
+    def signals(self, name, t):
+        noise = self.rng.uniform(-0.2, 0.2)
+        if name == "M160_Temperature_Set_1":
+            m = self.hot_inv - 5.0 + noise
+            return dict(INV_Module_A_Temp=m, INV_Module_B_Temp=m + 0.4,
+                        INV_Module_C_Temp=m - 0.3,
+                        INV_Gate_Driver_Board_Temp=self.coolant + 8.0)
+        if name == "M161_Temperature_Set_2":
+            return dict(INV_Control_Board_Temp=self.coolant + 10.0,
+                        INV_Hot_Spot_Temp_Motor=self.hot_motor + noise)
+        if name == "M162_Temperature_Set_3":
+            return dict(INV_Coolant_Temp=self.coolant + noise,
+                        INV_Hot_Spot_Temp_Inverter=self.hot_inv + noise,
+                        INV_Motor_Temp=self.hot_motor - 8.0)
+        if name == "M165_Motor_Position_Info":
+            return dict(INV_Motor_Angle_Electrical=(t * self.rpm * 6.0 * 4) % 360,
+                        INV_Motor_Speed=self.rpm,
+                        INV_Electrical_Output_Frequency=self.rpm / 60.0 * 4)
+        if name == "M166_Current_Info":
+            ph = self.torque * 1.6
+            return dict(INV_Phase_A_Current=ph, INV_Phase_B_Current=-ph / 2,
+                        INV_Phase_C_Current=-ph / 2, INV_DC_Bus_Current=self.dc_a)
+        if name == "M167_Voltage_Info":
+            return dict(INV_DC_Bus_Voltage=self.vdc, INV_Output_Voltage=self.vdc * 0.6)
+        if name == "M169_Internal_Voltages":
+            return dict(INV_Ref_Voltage_1_5=1.5, INV_Ref_Voltage_2_5=2.5,
+                        INV_Ref_Voltage_5_0=5.0, INV_Ref_Voltage_12_0=12.0)
+        if name == "M170_Internal_States":
+            running = self.torque > 0.5 or self.rpm > 10
+            return dict(INV_VSM_State=7 if self.run_fault else (6 if running else 5),
+                        INV_Inverter_State=3 if running else 8,
+                        INV_Inverter_Run_Mode=0, INV_Inverter_Enable_State=1,
+                        INV_Direction_Command=1,
+                        INV_Rolling_Counter=_counter(self._ctr, name))
+        if name == "M171_Fault_Codes":
+            return dict(INV_Run_Fault_Lo=self.run_fault & 0xFFFF,
+                        INV_Run_Fault_Hi=self.run_fault >> 16)
+        if name == "M172_Torque_And_Timer_Info":
+            return dict(INV_Commanded_Torque=self.cmd, INV_Torque_Feedback=self.torque,
+                        INV_Power_On_Timer=t)
+        if name == "M174_Firmware_Info":
+            return dict(INV_Project_Code_EEP_Ver=2041, INV_SW_Version=0x1234,
+                        INV_DateCode_MMDD=1015, INV_DateCode_YYYY=2024)
+        if name == "M176_Fast_Info":
+            return dict(INV_Fast_Torque_Command=self.cmd,
+                        INV_Fast_Torque_Feedback=self.torque,
+                        INV_Fast_Motor_Speed=self.rpm, INV_Fast_DC_Bus_Voltage=self.vdc)
+        if name == "M177_Torque_Capability":
+            return dict(INV_Torque_Capability_Motor=MAX_TORQUE_NM,
+                        INV_Torque_Capability_Regen=0)
+        return {}
+
+    def on_rx(self, msg, t):
+        if msg.arbitration_id == M192:
+            s = decode(msg)
+            if s:
+                enabled = s["VCU_INV_Inverter_Enable"]
+                self.cmd = s["VCU_INV_Torque_Command"] if enabled else 0.0
+                self.cmd_t = t
+            return []
+        if msg.arbitration_id == can_ids.INV_PARAM_COMMAND and msg.dlc >= 6:
+            return [can.Message(arbitration_id=can_ids.INV_PARAM_RESPONSE,
+                                data=sim_inverter.answer(self.table, msg.data),
+                                is_extended_id=False)]
+        return []
+
+
+class Bms(Ecu):
+    """Pack model: SOC from the inverter's DC current, current limits derated
+    at low SOC (discharge) and high SOC (charge)."""
+
+    name = "bms"
+    tx = ("BMS_Current_Limit",)
+    rx = (M166,)
+
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.soc = 85.0
+        self.dc_a = 0.0
+
+    def update(self, t, dt, faults):
+        self.soc = max(0.0, self.soc - self.dc_a * dt / 3600.0 / PACK_AH * 100.0)
+
+    def signals(self, name, t):
+        dis = 250.0 if self.soc > 30 else 50.0 + 200.0 * max(0.0, self.soc - 5) / 25.0
+        chg = 60.0 if self.soc < 90 else 60.0 * max(0.0, 100 - self.soc) / 10.0
+        return dict(BMS_Max_Discharge_Current=dis, BMS_Max_Charge_Current=chg)
+
+    def on_rx(self, msg, t):
+        self.dc_a = decode(msg).get("INV_DC_Bus_Current", self.dc_a)
+        return []
+
+
+class TempController(Ecu):
+    """Arduino fan controller. Applies Temp_Config (0x130) and reports it
+    back in Temp_Status (0x131) with its two NTC readings and fan state.
+
+    Model fault: temp:sensor:motor|inverter — open NTC (reads -50 °C, fault
+    bit set, fan forced on)."""
+
+    name = "temp"
+    tx = ("Temp_Status",)
+    rx = (can_ids.TEMP_CONFIG, can_ids.INV_TEMPERATURE_2, can_ids.INV_TEMPERATURE_3)
+    fault_kinds = ("sensor",)
+
+    HYST = 3.0
+    FAN_COOLING = 12.0  # °C the NTC settles below the hot spot with the fan on
+
+    def __init__(self, seed: int = 0):
+        super().__init__(seed)
+        self.thr = [50, 50]
+        self.force = 0
+        self.hot = [30.0, 30.0]  # from M161 / M162
+        self.cool = [0.0, 0.0]
+        self.ntc = [30.0, 30.0]
+        self.fans = 0
+        self.faults = 0
+
+    def update(self, t, dt, faults):
+        self.faults = 0
+        for f in faults:
+            if f.kind == "sensor":
+                self.faults |= {"motor": 1, "inverter": 2}.get(f.target, 3)
+        for ch in (0, 1):
+            bit = 1 << ch
+            target = self.FAN_COOLING if self.fans & bit else 0.0
+            self.cool[ch] += (target - self.cool[ch]) * min(1.0, dt / 8.0)
+            self.ntc[ch] = self.hot[ch] - 5.0 - self.cool[ch] + self.rng.uniform(-0.3, 0.3)
+            on = (self.force & bit or self.faults & bit
+                  or self.ntc[ch] >= self.thr[ch]
+                  or (self.fans & bit and self.ntc[ch] > self.thr[ch] - self.HYST))
+            self.fans = (self.fans | bit) if on else (self.fans & ~bit)
+
+    def signals(self, name, t):
+        ntc = [-50.0 if self.faults & (1 << ch) else self.ntc[ch] for ch in (0, 1)]
+        return dict(Temp_NTC_Motor=ntc[0], Temp_NTC_Inverter=ntc[1],
+                    Temp_Thresh_Motor_Applied=self.thr[0],
+                    Temp_Thresh_Inverter_Applied=self.thr[1],
+                    Temp_Fan_Mask=self.fans, Temp_Fault_Mask=self.faults,
+                    Temp_Force_Mask_Applied=self.force)
+
+    def on_rx(self, msg, t):
+        s = decode(msg)
+        if msg.arbitration_id == can_ids.TEMP_CONFIG and s:
+            self.thr = [int(s["Temp_Thresh_Motor"]), int(s["Temp_Thresh_Inverter"])]
+            self.force = int(s["Temp_Force_Mask"]) & 0x03
+        elif msg.arbitration_id == can_ids.INV_TEMPERATURE_2:
+            self.hot[0] = s.get("INV_Hot_Spot_Temp_Motor", self.hot[0])
+        elif msg.arbitration_id == can_ids.INV_TEMPERATURE_3:
+            self.hot[1] = s.get("INV_Hot_Spot_Temp_Inverter", self.hot[1])
+        return []
+
+
+MODELS = {m.name: m for m in (Mcu, Inverter, Bms, TempController)}
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+tools/ecusim/run.py
+Full-car CAN bench: each ECU model in its own process, plus a bus-load meter.
+
+  sudo ./tools/setup_vcan.sh
+  python tools/ecusim/run.py [--ecus mcu,inv,bms,temp] [--duration 60]
+                             [--fault SPEC ...] [--bitrate 500000]
+  python dashboard-app/main.py          # in another terminal
+
+Models (models.py) send every DBC message they own at its GenMsgCycleTime
+and react to the dashboard: TC_Command changes the MCU's torque scaling and
+TC_Status, Temp_Config changes the fan controller's thresholds and
+Temp_Status, M193 is answered by the inverter. Fault specs are described in
+ecu.py; typing one on stdin while the bench runs injects it immediately:
+
+  mcu:stall:Pedal_Processed@10+2      (stall 0x101 for 2 s at t=10 s)
+
+Once a second a line shows bus load, frames/s per ECU and the worst
+scheduling slip; on exit (Ctrl-C or --duration) a per-ID table compares
+measured rates with the DBC.
+
+--threads runs the ECUs as threads on the python-can "virtual" bus instead
+(no SocketCAN needed — useful on macOS/Windows or CI; the dashboard cannot
+attach to it).
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+import can_codec  # noqa: E402
+from ecusim import busload, ecu  # noqa: E402
+from ecusim.models import MODELS  # noqa: E402
+
+START_DELAY_S = 0.5  # lets every process open its bus before t0
+
+
+def check_fault(f: ecu.Fault) -> None:
+    cls = MODELS.get(f.ecu)
+    if cls is None:
+        raise ValueError(f"unknown ECU {f.ecu!r} (have {', '.join(MODELS)})")
+    if f.kind not in ecu.GENERIC_FAULTS + cls.fault_kinds:
+        raise ValueError(f"{f.ecu}: unknown fault {f.kind!r}")
+    if f.kind in ("stall", "drop", "freeze", "corrupt", "jitter") \
+            and f.target not in ("*",) + cls.tx:
+        raise ValueError(f"{f.ecu} does not send {f.target!r}")
+    if f.kind == "value" and not any(
+            f.target in ecu.MESSAGES_BY_NAME[n].fields for n in cls.tx):
+        raise ValueError(f"{f.ecu} has no signal {f.target!r}")
+
+
+def _stdin_faults(ctrl: dict, t0: float) -> None:
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            f = ecu.parse_fault(line, now=time.monotonic() - t0)
+            check_fault(f)
+        except ValueError as e:
+            print(f"[SIM] {e}")
+            continue
+        ctrl[f.ecu].put(f)
+        print(f"[SIM] injected {f.kind} on {f.ecu}:{f.target} at t={f.start:.1f}s")
+
+
+def _report(samples: list, per_id: dict, elapsed: float, names: list,
+            suppressed: int, late_max: float) -> None:
+    owner = {ecu.MESSAGES_BY_NAME[n].frame_id: e for e in names for n in MODELS[e].tx}
+    print()
+    print(f"  {'ID':>5}  {'message':<32} {'from':<10} {'Hz':>8} {'DBC Hz':>8}")
+    for fid in sorted(per_id):
+        info = can_codec.MESSAGES.get(fid)
+        name = info.name if info else "?"
+        hz = per_id[fid] / elapsed
+        cyc = info.cycle_ms or ecu.DEFAULT_CYCLE_MS if info and fid in owner else 0
+        exp = f"{1000.0 / cyc:8.1f}" if cyc else f"{'-':>8}"
+        print(f"  0x{fid:03X}  {name:<32} {owner.get(fid, '(other)'):<10} "
+              f"{hz:8.1f} {exp}")
+    loads = [s.load_pct for s in samples]
+    print(f"\n  bus load mean {sum(loads) / len(loads):.1f}%  peak {max(loads):.1f}%"
+          f"   frames {sum(per_id.values())} in {elapsed:.1f} s"
+          f"   withheld by faults {suppressed}   worst slip {late_max:.1f} ms")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--channel", default=None, help="default vcan0")
+    ap.add_argument("--interface", default=None, help="default socketcan")
+    ap.add_argument("--ecus", default=",".join(MODELS))
+    ap.add_argument("--duration", type=float, default=0.0, help="s, 0 = until Ctrl-C")
+    ap.add_argument("--bitrate", type=int, default=busload.DEFAULT_BITRATE)
+    ap.add_argument("--fault", action="append", default=[], metavar="SPEC")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--threads", action="store_true",
+                    help="in-process on the python-can virtual bus")
+    args = ap.parse_args()
+
+    names = [n.strip() for n in args.ecus.split(",") if n.strip()]
+    for n in names:
+        if n not in MODELS:
+            ap.error(f"unknown ECU {n!r} (have {', '.join(MODELS)})")
+    try:
+        faults = [ecu.parse_fault(s) for s in args.fault]
+        for f in faults:
+            check_fault(f)
+    except ValueError as e:
+        ap.error(str(e))
+
+    if args.threads:
+        interface, channel = args.interface or "virtual", args.channel or "ecusim"
+        Worker, Queue, Event = threading.Thread, queue.Queue, threading.Event
+    else:
+        interface, channel = args.interface or "socketcan", args.channel or "vcan0"
+        Worker = multiprocessing.Process
+        Queue, Event = multiprocessing.Queue, multiprocessing.Event
+
+    t0 = time.monotonic() + START_DELAY_S
+    stop = Event()
+    stats = Queue()
+    ctrl = {n: Queue() for n in names}
+    workers = [Worker(target=busload.monitor, name="busload", daemon=True,
+                      args=(channel, interface, args.bitrate, t0, stats, stop))]
+    for i, n in enumerate(names):
+        workers.append(Worker(
+            target=ecu.run, name=n, daemon=True,
+            args=(MODELS[n], channel, interface, t0,
+                  [f for f in faults if f.ecu == n], ctrl[n], stats, stop,
+                  args.seed + i),
+        ))
+    for w in workers:
+        w.start()
+    threading.Thread(target=_stdin_faults, args=(ctrl, t0), daemon=True).start()
+    print(f"[SIM] {', '.join(names)} on {interface}:{channel} "
+          f"({'threads' if args.threads else 'processes'}), "
+          f"{args.bitrate // 1000} kbit/s, {len(faults)} scheduled faults")
+
+    samples, per_id, ecu_fps = [], {}, {}
+    suppressed, late_max, slip = 0, 0.0, 0.0
+    try:
+        while args.duration <= 0 or time.monotonic() - t0 < args.duration:
+            try:
+                s = stats.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            if isinstance(s, ecu.Stats):
+                ecu_fps[s.ecu] = sum(s.sent.values())
+                suppressed += s.suppressed
+                slip = max(slip, s.late_max_ms)
+                late_max = max(late_max, s.late_max_ms)
+                continue
+            samples.append(s)
+            for fid, n in s.per_id.items():
+                per_id[fid] = per_id.get(fid, 0) + n
+            peak = max(x.load_pct for x in samples)
+            per = "  ".join(f"{n} {ecu_fps.get(n, 0):4d}" for n in names)
+            print(f"[SIM] {s.t:5.0f}s  load {s.load_pct:5.1f}% (peak {peak:4.1f}%)"
+                  f"  {s.fps:6.0f} fps | {per} | slip {slip:5.1f} ms")
+            slip = 0.0
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        for w in workers:
+            w.join(timeout=2.0)
+    if samples:
+        _report(samples, per_id, samples[-1].t, names, suppressed, late_max)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
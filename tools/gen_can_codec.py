@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+tools/gen_can_codec.py
+Build-time DBC -> Python code generator.
+
+Reads the DBC files below and writes dashboard-app/can_codec.py:
+  decode_<msg>(data) -> tuple   straight-line unpack_from / shift / mask / scale
+  encode_<msg>(**signals)       -> bytes
+  sig_<signal>(data)            single-signal decoder for lazy readers
+  MESSAGES / SIGNALS / CHOICES  metadata tables
+
+The dashboard imports the generated module, so no DBC is parsed at boot.
+
+  python tools/gen_can_codec.py           # regenerate
+  python tools/gen_can_codec.py --check   # file up to date + decoders agree
+                                          # with can_db and cantools on random
+                                          # payloads; every DBC ID allocated
+                                          # in can_ids (needs cantools:
+                                          # requirements-dev.txt)
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, "dashboard-app")
+OUT_PATH = os.path.join(APP_DIR, "can_codec.py")
+sys.path.insert(0, APP_DIR)
+
+import can_db  # noqa: E402
+import can_ids  # noqa: E402
+
+DBC_FILES = [can_db.PEDAL_DBC, can_db.DASHBOARD_DBC, can_db.CASCADIA_DBC]
+
+_FMT = {8: "b", 16: "h", 32: "i", 64: "q"}
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _snake(name: str) -> str:
+    return re.sub(r"[^0-9a-zA-Z]+", "_", name).strip("_").lower()
+
+
+def _aligned(s: can_db.Signal) -> bool:
+    return s.little_endian and s.start % 8 == 0 and s.length in _FMT
+
+
+def _fmt_char(s: can_db.Signal) -> str:
+    c = _FMT[s.length]
+    return c if s.signed else c.upper()
+
+
+def _scaled(expr: str, s: can_db.Signal) -> str:
+    if s.scale != 1:
+        expr = f"{expr} * {s.scale!r}"
+    if s.offset != 0:
+        expr = f"{expr} + {s.offset!r}"
+    return expr
+
+
+def _byte_range(sigs) -> tuple[int, int]:
+    lo = min(min(s.bits) for s in sigs) // 8
+    hi = max(max(s.bits) for s in sigs) // 8 + 1
+    return lo, hi
+
+
+def _shift_in_word(s: can_db.Signal, lo: int, hi: int) -> int:
+    """Bit position of the signal LSB inside the word loaded from [lo, hi)."""
+    p = s.bits[0]
+    if s.little_endian:
+        return p - lo * 8
+    return (hi - 1 - (p >> 3)) * 8 + (p & 7)
+
+
+class _Structs:
+    """Dedups struct.Struct objects across the generated module."""
+
+    def __init__(self):
+        self.names: dict[str, str] = {}
+
+    def get(self, fmt: str) -> str:
+        if fmt not in self.names:
+            tag = "LE" if fmt[0] == "<" else "BE"
+            self.names[fmt] = f"_{tag}_{fmt[1:]}"
+        return self.names[fmt]
+
+
+def _word_load(lo: int, hi: int, little: bool, structs: _Structs) -> str:
+    n = hi - lo
+    order = "little" if little else "big"
+    if n in (1, 2, 4, 8):
+        fmt = ("<" if little else ">") + {1: "B", 2: "H", 4: "I", 8: "Q"}[n]
+        off = f", {lo}" if lo else ""
+        return f"{structs.get(fmt)}.unpack_from(data{off})[0]"
+    return f'int.from_bytes(data[{lo}:{hi}], "{order}")'
+
+
+def _bitfield(word: str, s: can_db.Signal, shift: int) -> str:
+    mask = (1 << s.length) - 1
+    e = f"({word} >> {shift})" if shift else word
+    e = f"({e} & 0x{mask:X})"
+    if s.signed:
+        half = 1 << (s.length - 1)
+        e = f"(({e} ^ 0x{half:X}) - 0x{half:X})"
+    return e
+
+
+def _extract(sigs, structs: _Structs, lines: list[str], indent: str) -> dict:
+    """Emit loads for `sigs`; return {signal name: raw expression}."""
+    exprs: dict[str, str] = {}
+    aligned = sorted((s for s in sigs if _aligned(s)), key=lambda s: s.start)
+    rest = [s for s in sigs if not _aligned(s)]
+
+    if aligned:
+        # one raw slot per (byte offset, format); mux pages share slots
+        slots: dict[tuple[int, str], str] = {}
+        fmt, pos, names, extra = "<", 0, [], []
+        for s in aligned:
+            off, c = s.start // 8, _fmt_char(s)
+            key = (off, c)
+            if key not in slots:
+                var = f"r{off}{c}"
+                slots[key] = var
+                if off >= pos:
+                    if off > pos:
+                        fmt += f"{off - pos}x"
+                    fmt += c
+                    pos = off + s.length // 8
+                    names.append(var)
+                else:
+                    arg = f", {off}" if off else ""
+                    extra.append(f"{indent}{var} = {structs.get('<' + c)}.unpack_from(data{arg})[0]")
+            exprs[s.name] = slots[key]
+        if len(names) == 1:
+            lines.append(f"{indent}{names[0]}, = {structs.get(fmt)}.unpack_from(data)")
+        else:
+            lines.append(
+                f"{indent}{', '.join(names)} = {structs.get(fmt)}.unpack_from(data)"
+            )
+        lines.extend(extra)
+
+    for little, word in ((True, "w"), (False, "wb")):
+        group = [s for s in rest if s.little_endian == little]
+        if not group:
+            continue
+        lo, hi = _byte_range(group)
+        lines.append(f"{indent}{word} = {_word_load(lo, hi, little, structs)}")
+        for s in group:
+            exprs[s.name] = _bitfield(word, s, _shift_in_word(s, lo, hi))
+    return exprs
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+
+def _load_all() -> tuple[can_db.Database, list[str]]:
+    db = can_db.Database()
+    for path in DBC_FILES:
+        part = can_db.load(path)
+        for fid, m in part.messages.items():
+            if fid in db.messages:
+                sys.exit(
+                    f"duplicate frame id 0x{fid:03X}: "
+                    f"{db.messages[fid].name} vs {m.name} ({os.path.basename(path)})"
+                )
+        for name in part.signals:
+            if name in db.signals:
+                sys.exit(f"duplicate signal name {name} ({os.path.basename(path)})")
+        db.merge(part)
+    return db, [os.path.relpath(p, ROOT) for p in DBC_FILES]
+
+
+def _gen_decode(m: can_db.Message, structs: _Structs) -> list[str]:
+    fn = f"decode_{_snake(m.name)}"
+    sigs = sorted(m.signals, key=lambda s: s.start)
+    lines = [
+        f"def {fn}(data):",
+        f'    """0x{m.frame_id:03X} {m.name} -> MESSAGES[0x{m.frame_id:03X}].fields"""',
+    ]
+    exprs = _extract(sigs, structs, lines, "    ")
+    switch = next((s for s in sigs if s.is_mux), None)
+    if switch is not None:
+        lines.append(f"    page = {exprs[switch.name]}")
+        exprs[switch.name] = "page"
+    out = []
+    for s in sigs:
+        e = _scaled(exprs[s.name], s)
+        if s.mux_id is not None:
+            e = f"{e} if page == {s.mux_id} else None"
+        out.append(e)
+    if len(out) == 1:
+        lines.append(f"    return ({out[0]},)")
+    else:
+        lines.append("    return (")
+        lines.extend(f"        {e}," for e in out)
+        lines.append("    )")
+    return lines
+
+
+def _gen_signal(s: can_db.Signal, m: can_db.Message, structs: _Structs) -> list[str]:
+    lines = [f"def sig_{_snake(s.name)}(data):"]
+    if _aligned(s):
+        off = s.start // 8
+        fmt = "<" + _fmt_char(s)
+        arg = f", {off}" if off else ""
+        raw = f"{structs.get(fmt)}.unpack_from(data{arg})[0]"
+    else:
+        lo, hi = _byte_range([s])
+        word = _word_load(lo, hi, s.little_endian, structs)
+        raw = _bitfield(word, s, _shift_in_word(s, lo, hi))
+    if s.mux_signal is not None:
+        sw = s.mux_signal
+        lo, hi = _byte_range([sw])
+        page = _bitfield(_word_load(lo, hi, sw.little_endian, structs), sw,
+                         _shift_in_word(sw, lo, hi))
+        lines.append(f"    if {page} != {s.mux_id}:")
+        lines.append("        return None")
+    lines.append(f"    return {_scaled(raw, s)}")
+    return lines
+
+
+def _gen_encode(m: can_db.Message) -> list[str]:
+    sigs = sorted(m.signals, key=lambda s: s.start)
+    params = ", ".join(f"{s.name}=0" for s in sigs)
+    lines = [
+        f"def encode_{_snake(m.name)}({params}):",
+        f'    """0x{m.frame_id:03X} {m.name} -> {m.dlc} bytes"""',
+    ]
+    le_terms, be_terms = [], []
+    for s in sigs:
+        mask = (1 << s.length) - 1
+        if s.scale == 1 and s.offset == 0:
+            raw = f"round({s.name})"
+        elif s.offset == 0:
+            raw = f"round({s.name} / {s.scale!r})"
+        else:
+            raw = f"round(({s.name} - {s.offset!r}) / {s.scale!r})"
+        if s.little_endian:
+            shift = s.start
+            term = f"(({raw} & 0x{mask:X}) << {shift})" if shift else f"({raw} & 0x{mask:X})"
+            le_terms.append(term)
+        else:
+            shift = _shift_in_word(s, 0, m.dlc)
+            be_terms.append(f"(({raw} & 0x{mask:X}) << {shift})")
+    if le_terms:
+        lines.append("    w = (")
+        lines.extend(f"        {t} |" for t in le_terms[:-1])
+        lines.append(f"        {le_terms[-1]}")
+        lines.append("    )")
+    else:
+        lines.append("    w = 0")
+    if be_terms:
+        lines.append("    wb = (")
+        lines.extend(f"        {t} |" for t in be_terms[:-1])
+        lines.append(f"        {be_terms[-1]}")
+        lines.append("    )")
+        lines.append(f'    w |= int.from_bytes(wb.to_bytes({m.dlc}, "big"), "little")')
+    lines.append(f'    return w.to_bytes({m.dlc}, "little")')
+    return lines
+
+
+def generate() -> str:
+    db, sources = _load_all()
+    structs = _Structs()
+    msgs = sorted(db.messages.values(), key=lambda m: m.frame_id)
+
+    body: list[str] = []
+    for m in msgs:
+        body += [""] + [""] + _gen_decode(m, structs)
+        body += [""] + [""] + _gen_encode(m)
+        for s in sorted(m.signals, key=lambda s: s.start):
+            body += [""] + [""] + _gen_signal(s, m, structs)
+
+    tables = ["", "", "MESSAGES = {"]
+    for m in msgs:
+        sigs = sorted(m.signals, key=lambda s: s.start)
+        fields = ", ".join(repr(s.name) for s in sigs)
+        min_len = max(s.byte_span for s in sigs) if sigs else 0
+        tables.append(
+            f"    0x{m.frame_id:03X}: MessageInfo(0x{m.frame_id:03X}, {m.name!r}, "
+            f"{m.dlc}, {min_len}, {m.cycle_ms}, {m.sender!r}, ({fields},), "
+            f"decode_{_snake(m.name)}, encode_{_snake(m.name)}),"
+        )
+    tables.append("}")
+    tables += ["", "SIGNALS = {"]
+    for m in msgs:
+        for s in sorted(m.signals, key=lambda s: s.start):
+            tables.append(
+                f"    {s.name!r}: SignalInfo({s.name!r}, 0x{m.frame_id:03X}, "
+                f"{s.start}, {s.length}, {s.signed}, {s.scale!r}, {s.offset!r}, "
+                f"{s.minimum!r}, {s.maximum!r}, {s.unit!r}, {s.byte_span}, "
+                f"sig_{_snake(s.name)}),"
+            )
+    tables.append("}")
+    tables += ["", "CHOICES = {"]
+    for m in msgs:
+        for s in sorted(m.signals, key=lambda s: s.start):
+            if s.choices:
+                tables.append(f"    {s.name!r}: {s.choices!r},")
+    tables.append("}")
+
+    head = [
+        "# AUTO-GENERATED by tools/gen_can_codec.py — do not edit.",
+        "# Sources:",
+        *[f"#   {p}" for p in sources],
+        '"""',
+        "can_codec.py",
+        "Generated CAN decoders/encoders — one straight-line function per message.",
+        "",
+        "  decode_<msg>(data) -> tuple in MESSAGES[id].fields order",
+        "                        (callers check len(data) >= MESSAGES[id].min_len)",
+        "  encode_<msg>(**signals) -> bytes",
+        "  sig_<signal>(data)  -> one signal (None on an inactive mux page)",
+        '"""',
+        "",
+        "import struct",
+        "from collections import namedtuple",
+        "",
+        "MessageInfo = namedtuple(",
+        '    "MessageInfo", "frame_id name dlc min_len cycle_ms sender fields decode encode"',
+        ")",
+        "SignalInfo = namedtuple(",
+        '    "SignalInfo",',
+        '    "name frame_id start length signed scale offset minimum maximum unit min_len decode",',
+        ")",
+        "",
+    ]
+    head += [f"{n} = struct.Struct({f!r})" for f, n in sorted(structs.names.items(), key=lambda kv: kv[1])]
+
+    tail = [
+        "",
+        "",
+        "def decode(frame_id: int, data) -> dict:",
+        '    """Generic dict decode (diagnostics, offline tools); skips inactive mux pages."""',
+        "    m = MESSAGES[frame_id]",
+        "    return {k: v for k, v in zip(m.fields, m.decode(data)) if v is not None}",
+    ]
+    return "\n".join(head + body + tables + tail) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Consistency check
+# ---------------------------------------------------------------------------
+
+
+def _close(a, b) -> bool:
+    if a is None or b is None:
+        return a is b
+    return abs(a - b) <= 1e-9 * max(1.0, abs(a), abs(b))
+
+
+def _random_payload(m: can_db.Message, rng: random.Random) -> bytes:
+    buf = bytearray(rng.getrandbits(8) for _ in range(m.dlc))
+    switch = next((s for s in m.signals if s.is_mux), None)
+    if switch is not None:
+        pages = sorted({s.mux_id for s in m.signals if s.mux_id is not None})
+        switch.encode_into(buf, rng.choice(pages))
+    return bytes(buf)
+
+
+def check(rounds: int) -> int:
+    src = generate()
+    errors = 0
+    with open(OUT_PATH, encoding="utf-8") as f:
+        if f.read() != src:
+            print(f"[CHECK] {os.path.relpath(OUT_PATH, ROOT)} is out of date — regenerate")
+            errors += 1
+
+    spec = importlib.util.spec_from_loader("can_codec_check", loader=None)
+    codec = importlib.util.module_from_spec(spec)
+    exec(compile(src, OUT_PATH, "exec"), codec.__dict__)
+
+    try:
+        import cantools
+    except ImportError:
+        cantools = None
+        print("[CHECK] cantools not installed (pip install -r requirements-dev.txt); "
+              "the reference comparison cannot run")
+        errors += 1
+    ref_msgs = {}
+    if cantools is not None:
+        for path in DBC_FILES:
+            for rm in cantools.database.load_file(path, strict=False).messages:
+                ref_msgs[rm.frame_id] = rm
+
+    db, _ = _load_all()
+    rng = random.Random(0xCA5CAD1A)
+    for fid, m in sorted(db.messages.items()):
+        info = codec.MESSAGES[fid]
+        for _ in range(rounds):
+            data = _random_payload(m, rng)
+            want = m.decode(data)
+            got = dict(zip(info.fields, info.decode(data)))
+            for name in info.fields:
+                if not _close(got[name], want.get(name)):
+                    print(f"[CHECK] {m.name}.{name}: codec={got[name]} can_db={want.get(name)} data={data.hex()}")
+                    errors += 1
+                if not _close(codec.SIGNALS[name].decode(data), want.get(name)):
+                    print(f"[CHECK] sig {name}: mismatch on {data.hex()}")
+                    errors += 1
+            if info.encode(**want) != m.encode(want):
+                print(f"[CHECK] encode {m.name}: codec={info.encode(**want).hex()} can_db={m.encode(want).hex()}")
+                errors += 1
+            rm = ref_msgs.get(fid)
+            if rm is not None:
+                ref = rm.decode(data, decode_choices=False)
+                for name, v in ref.items():
+                    if not _close(got[name], v):
+                        print(f"[CHECK] {m.name}.{name}: codec={got[name]} cantools={v}")
+                        errors += 1
+    for a in can_ids.TABLE:
+        m = db.messages.get(a.frame_id)
+        if m is None or m.name != a.name:
+            print(f"[CHECK] can_ids 0x{a.frame_id:03X} {a.name}: DBC has "
+                  f"{m.name if m is not None else 'no message'}")
+            errors += 1
+    for fid, m in sorted(db.messages.items()):
+        if can_ids.owner(fid) is None:
+            print(f"[CHECK] {m.name} 0x{fid:03X} has no entry in can_ids.py")
+            errors += 1
+    print(
+        f"[CHECK] {len(db.messages)} messages, {len(db.signals)} signals, "
+        f"{rounds} payloads each: {'OK' if not errors else f'{errors} error(s)'}"
+    )
+    return 1 if errors else 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    ap.add_argument("--check", action="store_true", help="verify instead of writing")
+    ap.add_argument("--rounds", type=int, default=200, help="payloads per message")
+    args = ap.parse_args()
+    if args.check:
+        return check(args.rounds)
+    src = generate()
+    with open(OUT_PATH, "w", encoding="utf-8") as f:
+        f.write(src)
+    print(f"[GEN] wrote {os.path.relpath(OUT_PATH, ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+tools/gpio_bench.py
+Drive service/gpio_input.py through the mock backend and report debounce
+behaviour — no Raspberry Pi or RPi.GPIO needed.
+
+  1. bounce:  N clean transitions, each preceded by 0..B chatter edges.
+              Every transition must give exactly one event; latency is
+              settle -> listener call (ideally ~DEBOUNCE_MS).
+  2. glitch:  pulses shorter than the debounce window must give no event.
+  3. startup: key -> TSMS through StartupService listeners; reports how
+              long after the edge the service saw the new level.
+
+  python tools/gpio_bench.py [--transitions 200] [--bounce 6] [--debounce-ms 20]
+
+Exits non-zero if an event was lost or a glitch leaked through.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+from service import gpio_input  # noqa: E402
+from service.startup import KEY_PIN, TSMS_PIN, StartupService  # noqa: E402
+
+PIN = 5
+
+
+def _ms(xs) -> str:
+    xs = sorted(xs)
+    p99 = xs[min(len(xs) - 1, int(len(xs) * 0.99))]
+    return (f"min {xs[0] * 1e3:6.2f}  p50 {statistics.median(xs) * 1e3:6.2f}  "
+            f"p99 {p99 * 1e3:6.2f}  max {xs[-1] * 1e3:6.2f} ms")
+
+
+def bench_bounce(n: int, max_bounce: int, debounce_ms: int) -> bool:
+    mock = gpio_input.MockBackend()
+    gpio = gpio_input.GpioInput(mock, debounce_ms=debounce_ms).start()
+    got = threading.Event()
+    seen = []
+    gpio.listen(PIN, lambda ev: (seen.append((time.monotonic(), ev)), got.set()))
+
+    lat, level, lost = [], False, 0
+    for _ in range(n):
+        level = not level
+        got.clear()
+        mock.set_level(PIN, level, bounce=random.randint(0, max_bounce))
+        t_settle = time.monotonic()
+        if not got.wait(1.0):
+            lost += 1
+            continue
+        t_cb, ev = seen[-1]
+        lat.append(t_cb - t_settle)
+        if ev.level != level:
+            lost += 1
+    gpio.stop()
+    print(f"bounce   {n} transitions, {gpio.edges} edges -> {gpio.events} events,"
+          f" lost {lost}")
+    if lat:
+        print(f"         settle->listener  {_ms(lat)}")
+    return lost == 0 and gpio.events == n
+
+
+def bench_glitch(n: int, debounce_ms: int) -> bool:
+    mock = gpio_input.MockBackend()
+    gpio = gpio_input.GpioInput(mock, debounce_ms=debounce_ms).start()
+    gpio.listen(PIN, lambda ev: None)
+    for _ in range(n):
+        mock.set_level(PIN, True)
+        time.sleep(debounce_ms / 4000.0)
+        mock.set_level(PIN, False)
+        time.sleep(debounce_ms * 2 / 1000.0)
+    gpio.stop()
+    print(f"glitch   {n} pulses of {debounce_ms / 4:.0f} ms -> {gpio.events} events")
+    return gpio.events == 0
+
+
+def bench_startup(debounce_ms: int) -> bool:
+    mock = gpio_input.MockBackend()
+    gpio = gpio_input.GpioInput(mock, debounce_ms=debounce_ms).start()
+    svc = StartupService(gpio=gpio)
+    ok = True
+    for pin, attr, label in ((KEY_PIN, "_key_state", "key"),
+                             (TSMS_PIN, "_tsms_state", "tsms")):
+        mock.set_level(pin, True, bounce=4)
+        t0 = time.monotonic()
+        while not getattr(svc, attr) and time.monotonic() - t0 < 1.0:
+            time.sleep(0.0002)
+        dt = time.monotonic() - t0
+        seen = getattr(svc, attr)
+        ok &= seen
+        print(f"startup  {label:<4} seen by service after {dt * 1e3:6.2f} ms"
+              f"{'' if seen else '  (NOT SEEN)'}")
+    gpio.stop()
+    return ok
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--transitions", type=int, default=200)
+    ap.add_argument("--bounce", type=int, default=6, help="max chatter edges")
+    ap.add_argument("--debounce-ms", type=int, default=gpio_input.DEBOUNCE_MS)
+    args = ap.parse_args()
+
+    ok = bench_bounce(args.transitions, args.bounce, args.debounce_ms)
+    ok &= bench_glitch(20, args.debounce_ms)
+    ok &= bench_startup(args.debounce_ms)
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
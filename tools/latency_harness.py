@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+tools/latency_harness.py
+End-to-end CAN-to-pixel latency of the dashboard screen.
+
+Runs dashboard-app/main.py with DASH_LATENCY_PROBE=1 (see latency_probe.py)
+and feeds it Pedal_Processed at 100 Hz and Vehicle_Speed at 50 Hz. Every
+frame carries a sequence number in its reserved bytes; Pedal_Processed also
+carries its send time (bytes [6..7], 0.1 ms units) and the sender logs the
+full timestamp of each sequence number. Values ramp in large steps so every
+frame changes what is drawn.
+
+After each display.flip() the probe reads the APPS bar, brake bar and speed
+box back with pygame.surfarray. The harness redraws each widget off-screen
+for the value the frame was tagged with and compares CRCs. A frame only
+counts once its pixels match. The latency of sequence number k is then
+  t(first confirmed flip showing k or newer) - t_send(k)
+and it is split into CAN->RX (send to can_rx decode) and RX->pixel.
+
+  python tools/latency_harness.py [--seconds 20]            # headless, in-process bus
+  python tools/latency_harness.py --channel vcan0 --display # real bus + window
+
+With --channel the sender is a separate process (time.monotonic() is
+system-wide on Linux). Needs numpy for pygame.surfarray. Exits non-zero if
+fewer than 95 % of flips were confirmed.
+"""
+
+import argparse
+import bisect
+import contextlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "dashboard-app")
+sys.path.insert(0, APP)
+
+PEDAL_HZ = 100
+SPEED_HZ = 50
+WARMUP_S = 1.5  # dashboard start-up before the first frame
+SETTLE_S = 0.5  # sends ignored at the start of the run
+
+
+def apps_value(seq: int) -> float:
+    return (seq * 7.3) % 100.0
+
+
+def brake_value(seq: int) -> float:
+    return (seq * 11.9 + 50.0) % 100.0
+
+
+def speed_value(seq: int) -> int:
+    return (seq * 13) % 200
+
+
+def send(interface: str, channel: str, seconds: float, log) -> None:
+    """Sender (thread or process). Puts {signal: [(seq, t_send), ...]} on `log`."""
+    import can
+    import can_codec
+    import can_ids
+
+    bus = can.Bus(interface=interface, channel=channel)
+    sent = {"apps_pct": [], "brake": [], "speed": []}
+    time.sleep(WARMUP_S)
+    t0 = time.monotonic()
+    due = {can_ids.PEDAL_PROCESSED: t0, can_ids.VEHICLE_SPEED: t0}
+    seq = {can_ids.PEDAL_PROCESSED: 0, can_ids.VEHICLE_SPEED: 0}
+    try:
+        while True:
+            fid = min(due, key=due.get)
+            wait = due[fid] - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            now = time.monotonic()
+            if now - t0 > seconds:
+                break
+            k = seq[fid] = (seq[fid] + 1) & 0xFFFF
+            if fid == can_ids.PEDAL_PROCESSED:
+                data = bytearray(can_codec.encode_pedal_processed(
+                    APPS_pct=apps_value(k), Brake_pct=brake_value(k), Counter=k & 0x0F))
+                stamp = int(now * 10_000) & 0xFFFF
+                data[4:8] = bytes((k & 0xFF, k >> 8, stamp & 0xFF, stamp >> 8))
+                names = ("apps_pct", "brake")
+                due[fid] += 1.0 / PEDAL_HZ
+            else:
+                data = bytearray(can_codec.encode_vehicle_speed(
+                    Speed_kph=speed_value(k), Speed_Counter=k & 0x0F))
+                data[1], data[3] = k & 0xFF, k >> 8
+                names = ("speed",)
+                due[fid] += 1.0 / SPEED_HZ
+            t_send = time.monotonic()
+            bus.send(can.Message(arbitration_id=fid, data=data, is_extended_id=False))
+            for n in names:
+                sent[n].append((k, t_send))
+    finally:
+        bus.shutdown()
+        log.put(sent)
+
+
+def _pct(xs: list, q: float) -> float:
+    return xs[min(len(xs) - 1, int(q * (len(xs) - 1) + 0.5))] if xs else float("nan")
+
+
+def _renderers() -> dict:
+    """signal -> (rect, draw(surface, value)), drawn exactly as ui/dashboard.py
+    does. main.py ends with pygame.quit(), so fonts are re-created first."""
+    import importlib
+
+    import pygame
+
+    from ui import dashboard, widgets
+
+    pygame.init()
+    widgets = importlib.reload(widgets)
+    return {
+        "apps_pct": (dashboard.APPS_BAR, lambda s, v: widgets.draw_segment_bar(
+            s, *dashboard.APPS_BAR, v, mode="heat")),
+        "brake": (dashboard.BRAKE_BAR, lambda s, v: widgets.draw_segment_bar(
+            s, *dashboard.BRAKE_BAR, v, mode="cool")),
+        "speed": (dashboard.SPEED_BOX, lambda s, v: widgets.draw_rect_value(
+            s, *dashboard.SPEED_BOX, v, "Speed")),
+    }
+
+
+def analyse(frames, sent, renderers, surface_size) -> bool:
+    import pygame
+
+    from ui import theme
+
+    scratch = pygame.Surface(surface_size)
+    ref_cache: dict = {}
+
+    def ref_crc(name, value):
+        key = (name, value, theme.is_dark())
+        if key not in ref_cache:
+            scratch.fill(theme.T()["screen_bg"])
+            rect, draw = renderers[name]
+            draw(scratch, value)
+            px = pygame.surfarray.array3d(scratch.subsurface(rect))
+            ref_cache[key] = zlib.crc32(px.tobytes())
+        return ref_cache[key]
+
+    ok_all = True
+    print(f"  {'signal':<9} {'sent':>6} {'shown':>6} {'p50':>7} {'p99':>7} {'max':>7}"
+          f"   {'CAN->RX p50':>11} {'RX->px p50':>10}   unconfirmed")
+    for name in renderers:
+        confirmed = []  # (seq, t_flip, t_rx)
+        bad = 0
+        for f in frames:
+            if name not in f.seq:
+                continue
+            if f.crc[name] == ref_crc(name, f.value[name]):
+                seq, t_rx = f.seq[name]
+                confirmed.append((seq, f.t, t_rx))
+            else:
+                bad += 1
+        total = len(confirmed) + bad
+        if total == 0:
+            print(f"  {name:<9} no frames drawn")
+            ok_all = False
+            continue
+        seqs = [c[0] for c in confirmed]
+        # sequence numbers only grow; keep the first flip for each
+        lat, can_rx_ms, rx_px_ms = [], [], []
+        shown = set(seqs)
+        t_start = sent[name][0][1] + SETTLE_S if sent[name] else 0.0
+        for k, t_send in sent[name]:
+            if t_send < t_start:
+                continue
+            i = bisect.bisect_left(seqs, k)
+            if i == len(seqs):
+                continue  # not drawn before the run ended
+            _, t_flip, t_rx = confirmed[i]
+            lat.append((t_flip - t_send) * 1000.0)
+            if seqs[i] == k:
+                can_rx_ms.append((t_rx - t_send) * 1000.0)
+                rx_px_ms.append((t_flip - t_rx) * 1000.0)
+        lat.sort()
+        can_rx_ms.sort()
+        rx_px_ms.sort()
+        print(f"  {name:<9} {len(sent[name]):6d} {len(shown):6d} "
+              f"{_pct(lat, 0.5):7.1f} {_pct(lat, 0.99):7.1f} {max(lat or [0]):7.1f}"
+              f"   {_pct(can_rx_ms, 0.5):11.2f} {_pct(rx_px_ms, 0.5):10.1f}"
+              f"   {bad}/{total}")
+        if bad > 0.05 * total:
+            ok_all = False
+    print("  (ms; 'shown' = sequence numbers that made it to the screen themselves,"
+          " the rest were superseded before the next flip)")
+    return ok_all
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--seconds", type=float, default=20.0)
+    ap.add_argument("--channel", default=None, help="e.g. vcan0 (default: in-process)")
+    ap.add_argument("--interface", default="socketcan")
+    ap.add_argument("--display", action="store_true", help="real window, not SDL dummy")
+    args = ap.parse_args()
+
+    if args.channel is None:
+        interface, channel = "virtual", "latency"
+    else:
+        interface, channel = args.interface, args.channel
+    os.environ["DASH_LATENCY_PROBE"] = "1"
+    os.environ["DASH_CAN_INTERFACE"] = interface
+    os.environ["DASH_CAN_CHANNEL"] = channel
+    if not args.display:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.chdir(APP)  # assets/ paths are relative
+
+    import latency_probe
+    import pygame
+    from ui import dashboard
+
+    latency_probe.REGIONS = {"apps_pct": dashboard.APPS_BAR,
+                             "brake": dashboard.BRAKE_BAR,
+                             "speed": dashboard.SPEED_BOX}
+
+    if args.channel is None:
+        log = queue.Queue()
+        sender = threading.Thread(target=send, daemon=True,
+                                  args=(interface, channel, args.seconds, log))
+    else:
+        log = multiprocessing.Queue()
+        sender = multiprocessing.Process(target=send, daemon=True,
+                                         args=(interface, channel, args.seconds, log))
+    sender.start()
+
+    def stopper():
+        sender.join()
+        time.sleep(0.3)  # let the last frames reach the screen
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    threading.Thread(target=stopper, daemon=True).start()
+    print(f"[LAT] {args.seconds:g} s on {interface}:{channel}, "
+          f"pedal {PEDAL_HZ} Hz, speed {SPEED_HZ} Hz ...")
+    import runpy
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        runpy.run_path(os.path.join(APP, "main.py"), run_name="__main__")
+    sent = log.get(timeout=5.0)
+
+    print(f"[LAT] {len(latency_probe.frames)} flips recorded")
+    ok = analyse(latency_probe.frames, sent, _renderers(), (800, 480))
+    print("OK" if ok else "FAIL (pixels did not match the tagged values)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+tools/log_analyze.py
+Offline analysis of recorded CAN logs, split into chunks across processes.
+
+Inputs are can_log.py binary logs (.nfscan, memory-mapped) or candump -l
+text logs. Each file is cut into chunks that are decoded in a
+ProcessPoolExecutor:
+  binary   by record offset (--chunk-mb), or by time (--chunk-s; records
+           are time-ordered, so boundaries come from a binary search on the
+           mapped t column)
+  candump  by byte offset, moved to the next line start (--chunk-mb)
+
+Workers decode with the generated can_codec decoders (the DBC) and the IDs
+and counter rule can_rx uses. The parent merges the chunks in order and
+reports:
+  - frames per ID and per-signal count / min / max / mean
+  - counter drops on the IDs can_rx checks (same rule as _check_counter),
+    including drops across chunk boundaries
+  - the plausibility.py fault timeline and the StatusBits the MCU sent
+
+--start / --end / --ids narrow the run to a time window and/or a set of
+frame IDs. The log's index (can_index.py, <log>.idx.npz, built on first
+use) gives the blocks that can hold matching frames, and only those are
+read. Times are epoch seconds, or "+S" for S seconds after the log's first
+frame.
+
+--export picks signals (DBC names) to write with --csv, --npz and/or --cols.
+--cols writes chunked columns (columnar.py) that can be memory-mapped. CPU
+work is per chunk and there is no shared state, so throughput grows with
+--workers until the disk is the limit.
+
+  python tools/log_analyze.py day1/*.nfscan [--workers 8] [--chunk-s 60]
+  python tools/log_analyze.py run.log --export APPS_pct,Speed_kph --npz run.npz
+  python tools/log_analyze.py run.nfscan --start +600 --end +660 --ids 0x101,0x110
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import can_codec  # noqa: E402
+import can_ids  # noqa: E402
+import can_index  # noqa: E402
+import can_log  # noqa: E402
+import columnar  # noqa: E402
+import plausibility  # noqa: E402
+
+# IDs whose rolling counter can_rx checks, and the counter field of each
+COUNTED = {
+    fid: next(f for f in can_codec.MESSAGES[fid].fields if f.endswith("Counter"))
+    for fid in (can_ids.PEDAL_PROCESSED, can_ids.VEHICLE_SPEED, can_ids.BATTERY_STATE,
+                can_ids.TEMPS_MISC)
+}
+PLAUS_SIGNALS = {"APPS_pct": "apps_pct", "Brake_pct": "brake", "StatusBits": "status_bits"}
+
+
+class Chunk(NamedTuple):
+    path: str
+    binary: bool
+    start: int  # record index (binary) or byte offset (candump)
+    stop: int
+    t0: float | None = None  # exact filter inside the chunk (index blocks are coarse)
+    t1: float | None = None
+    ids: tuple | None = None
+
+
+class Stat(NamedTuple):
+    count: int
+    total: float
+    lo: float
+    hi: float
+
+
+class ChunkResult(NamedTuple):
+    frames: int
+    t0: float
+    t1: float
+    per_id: dict  # frame id -> frames
+    stats: dict  # signal -> Stat
+    counters: dict  # frame id -> (first, last, t_first, [(t, prev, now), ...])
+    series: dict  # signal -> (t, values): plausibility inputs + exports
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+def _read(chunk: Chunk):
+    if chunk.binary:
+        r = can_log.open_log(chunk.path)[chunk.start:chunk.stop]
+        ok = (r["flags"] & (can_log.F_ERROR | can_log.F_REMOTE)) == 0
+        r = r[ok]
+        cols = r["t"], r["id"], r["dlc"], r["data"]
+    else:
+        with open(chunk.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            cols = can_log.parse_candump(m[chunk.start:chunk.stop])
+    if chunk.t0 is None and chunk.t1 is None and chunk.ids is None:
+        return cols
+    t, ids = cols[0], cols[1]
+    ok = np.ones(len(t), bool)
+    if chunk.t0 is not None:
+        ok &= t >= chunk.t0
+    if chunk.t1 is not None:
+        ok &= t <= chunk.t1
+    if chunk.ids is not None:
+        ok &= np.isin(ids, chunk.ids)
+    return tuple(c[ok] for c in cols)
+
+
+def _when(spec: str | None, first: float) -> float | None:
+    if spec is None:
+        return None
+    return first + float(spec[1:]) if spec.startswith("+") else float(spec)
+
+
+def plan_selected(path: str, chunk_mb: float, start: str | None, end: str | None,
+                  ids: tuple | None) -> list[Chunk]:
+    """Chunks covering only the index blocks that match the selection."""
+    idx = can_index.load(path)
+    if idx.blocks == 0:
+        return []
+    t0, t1 = _when(start, float(idx.t0.min())), _when(end, float(idx.t0.min()))
+    binary = idx.kind == "binary"
+    unit = can_log.RECORD.itemsize if binary else 1
+    step = max(1, int(chunk_mb * 2**20) // unit)
+    chunks = []
+    for a, b in idx.ranges(t0, t1, ids):
+        # block offsets are record indices or line starts, so any block
+        # boundary is a valid cut; split long ranges at the nearest one
+        cuts = idx.start[(idx.start > a) & (idx.start < b)]
+        bounds = [a]
+        for c in cuts.tolist():
+            if c - bounds[-1] >= step:
+                bounds.append(c)
+        bounds.append(b)
+        chunks += [Chunk(path, binary, x, y, t0, t1, ids) for x, y in zip(bounds, bounds[1:])]
+    return chunks
+
+
+def plan(path: str, chunk_mb: float, chunk_s: float | None) -> list[Chunk]:
+    if can_log.is_binary(path):
+        recs = can_log.open_log(path)
+        n = len(recs)
+        if chunk_s and n:
+            t = recs["t"]
+            edges = np.arange(t[0], t[-1], chunk_s)[1:]
+            bounds = [0, *np.searchsorted(t, edges).tolist(), n]
+        else:
+            step = max(1, int(chunk_mb * 2**20) // can_log.RECORD.itemsize)
+            bounds = [*range(0, n, step), n]
+        return [Chunk(path, True, a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+    size = os.path.getsize(path)
+    step = max(1, int(chunk_mb * 2**20))
+    bounds = [0]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        pos = step
+        while pos < size:
+            nl = m.find(b"\n", pos)
+            if nl < 0:
+                break
+            bounds.append(nl + 1)
+            pos = nl + 1 + step
+    bounds.append(size)
+    return [Chunk(path, False, a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+# ── Worker ───────────────────────────────────────────────────────────────────
+def _columns(m, data: np.ndarray) -> np.ndarray:
+    """Decode rows with the generated decoder -> (rows, fields) float array."""
+    dec = m.decode
+    raw = data.tobytes()
+    rows = [dec(raw[i:i + 8]) for i in range(0, len(raw), 8)]
+    try:
+        return np.array(rows, np.float64).reshape(len(rows), len(m.fields))
+    except TypeError:  # None on inactive mux pages
+        return np.array([[np.nan if v is None else v for v in r] for r in rows],
+                        np.float64).reshape(len(rows), len(m.fields))
+
+
+def analyse_chunk(chunk: Chunk, export: tuple) -> ChunkResult:
+    t, ids, dlc, data = _read(chunk)
+    per_id, stats, counters, series = {}, {}, {}, {}
+    if len(t) == 0:
+        return ChunkResult(0, np.nan, np.nan, per_id, stats, counters, series)
+    uniq, counts = np.unique(ids, return_counts=True)
+    for fid, n in zip(uniq.tolist(), counts.tolist()):
+        per_id[fid] = n
+        m = can_codec.MESSAGES.get(fid)
+        if m is None:
+            continue
+        sel = (ids == fid) & (dlc >= m.min_len)
+        if not sel.any():
+            continue
+        tm = t[sel]
+        cols = _columns(m, data[sel])
+        for j, name in enumerate(m.fields):
+            v = cols[:, j]
+            ok = v[~np.isnan(v)]
+            if len(ok):
+                stats[name] = Stat(len(ok), float(ok.sum()), float(ok.min()), float(ok.max()))
+            if name in export or name in PLAUS_SIGNALS:
+                series[name] = (tm, v)
+        if fid in COUNTED:
+            c = cols[:, m.fields.index(COUNTED[fid])].astype(np.int64)
+            bad = np.flatnonzero(((c[1:] - c[:-1]) & 0x0F) != 1)
+            counters[fid] = (int(c[0]), int(c[-1]), float(tm[0]),
+                             [(float(tm[k + 1]), int(c[k]), int(c[k + 1])) for k in bad])
+    return ChunkResult(len(t), float(t[0]), float(t[-1]), per_id, stats, counters, series)
+
+
+# ── Merge / report ───────────────────────────────────────────────────────────
+def merge(results: list[ChunkResult]) -> dict:
+    per_id, stats, drops, series = {}, {}, {}, {}
+    last_ctr: dict[int, int] = {}
+    for r in results:
+        for fid, n in r.per_id.items():
+            per_id[fid] = per_id.get(fid, 0) + n
+        for name, s in r.stats.items():
+            p = stats.get(name)
+            stats[name] = s if p is None else Stat(
+                p.count + s.count, p.total + s.total, min(p.lo, s.lo), max(p.hi, s.hi))
+        for fid, (first, last, t_first, bad) in r.counters.items():
+            d = drops.setdefault(fid, [])
+            prev = last_ctr.get(fid)
+            if prev is not None and ((first - prev) & 0x0F) != 1:
+                d.append((t_first, prev, first))  # across the chunk boundary
+            d.extend(bad)
+            last_ctr[fid] = last
+        for name, (t, v) in r.series.items():
+            series.setdefault(name, []).append((t, v))
+    series = {n: (np.concatenate([a for a, _ in p]), np.concatenate([b for _, b in p]))
+              for n, p in series.items()}
+    return {"per_id": per_id, "stats": stats, "drops": drops, "series": series}
+
+
+def report(m: dict, show: int) -> None:
+    names = {fid: msg.name for fid, msg in can_codec.MESSAGES.items()}
+    print("\nFrames per ID")
+    for fid in sorted(m["per_id"]):
+        print(f"  0x{fid:03X} {names.get(fid, '?'):<32} {m['per_id'][fid]:10d}")
+
+    print("\nSignals")
+    print(f"  {'signal':<34} {'count':>9} {'min':>10} {'max':>10} {'mean':>10}")
+    for name in sorted(m["stats"]):
+        s = m["stats"][name]
+        print(f"  {name:<34} {s.count:9d} {s.lo:10.2f} {s.hi:10.2f} {s.total / s.count:10.2f}")
+
+    print("\nCounter drops")
+    for fid, d in sorted(m["drops"].items()):
+        print(f"  0x{fid:03X} {names[fid]:<20} {len(d):6d}"
+              + "".join(f"  @{t:.3f} {a}->{b}" for t, a, b in d[:3]))
+
+    sr = m["series"]
+    if "APPS_pct" in sr:
+        events = plausibility.evaluate(
+            plausibility.RULES, {PLAUS_SIGNALS[k]: v for k, v in sr.items() if k in PLAUS_SIGNALS})
+        print(f"\nPlausibility: {sum(e.active for e in events)} faults raised")
+        for e in events[:show]:
+            print(f"  {e.t:.3f}  {'RAISED ' if e.active else 'cleared'} {e.rule}  ({e.value:.1f})")
+        t, st = sr["StatusBits"]
+        st = st.astype(np.int64)
+        for bit, name in plausibility.STATUS_BITS.items():
+            on = (st >> bit) & 1
+            rises = np.flatnonzero(np.diff(np.concatenate(([0], on))) == 1)
+            if len(rises):
+                print(f"  MCU {name:<13} set {len(rises)} times, first at {t[rises[0]]:.3f}")
+
+
+def export(m: dict, names: list[str], csv_path: str | None, npz_path: str | None,
+           cols_dir: str | None = None) -> None:
+    sr = m["series"]
+    missing = [n for n in names if n not in sr]
+    if missing:
+        print(f"[EXPORT] not in log: {', '.join(missing)}")
+    names = [n for n in names if n in sr]
+    if npz_path:
+        np.savez(npz_path, **{f"{n}.t": sr[n][0] for n in names},
+                 **{n: sr[n][1] for n in names})
+        print(f"[EXPORT] {npz_path}: {', '.join(names)}")
+    if csv_path:
+        with open(csv_path, "w") as f:
+            f.write("signal,t,value\n")
+            for n in names:
+                t, v = sr[n]
+                np.savetxt(f, np.column_stack((t, v)), fmt=f"{n},%.6f,%.6g")
+        print(f"[EXPORT] {csv_path}: {', '.join(names)}")
+    if cols_dir:
+        ex = columnar.Exporter(cols_dir, block=True)
+        for n in names:
+            ex.extend(n, *sr[n])
+        ex.close()
+        print(f"[EXPORT] {cols_dir}: {ex.samples} samples of {', '.join(names)}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("logs", nargs="+")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--chunk-mb", type=float, default=32.0)
+    ap.add_argument("--chunk-s", type=float, default=None, help="binary logs: split by time")
+    ap.add_argument("--start", default=None, help="epoch s, or +S from the log's start")
+    ap.add_argument("--end", default=None, help="epoch s, or +S from the log's start")
+    ap.add_argument("--ids", default=None, help="comma-separated frame IDs (0x101,272)")
+    ap.add_argument("--export", default="", help="comma-separated DBC signal names")
+    ap.add_argument("--csv", default=None)
+    ap.add_argument("--npz", default=None)
+    ap.add_argument("--cols", default=None, help="directory for columnar.py chunks")
+    ap.add_argument("--show", type=int, default=10, help="fault events to list")
+    args = ap.parse_args()
+
+    names = [n for n in args.export.split(",") if n]
+    if args.start or args.end or args.ids:
+        ids = tuple(int(x, 0) for x in args.ids.split(",")) if args.ids else None
+        chunks = [c for p in args.logs
+                  for c in plan_selected(p, args.chunk_mb, args.start, args.end, ids)]
+        size = sum((c.stop - c.start) * (can_log.RECORD.itemsize if c.binary else 1)
+                   for c in chunks)
+    else:
+        chunks = [c for p in args.logs for c in plan(p, args.chunk_mb, args.chunk_s)]
+        size = sum(os.path.getsize(p) for p in args.logs)
+    t0 = time.perf_counter()
+    if args.workers <= 1:
+        results = [analyse_chunk(c, tuple(names)) for c in chunks]
+    else:
+        with ProcessPoolExecutor(args.workers) as ex:
+            results = list(ex.map(analyse_chunk, chunks, [tuple(names)] * len(chunks)))
+    dt = time.perf_counter() - t0
+    frames = sum(r.frames for r in results)
+    print(f"{len(args.logs)} log(s), {size / 2**20:.1f} MiB, {frames} frames in "
+          f"{len(chunks)} chunks on {max(1, args.workers)} worker(s): {dt:.2f} s "
+          f"({frames / dt / 1e6:.2f} M frames/s, {size / 2**20 / dt:.0f} MiB/s)")
+    merged = merge(results)
+    report(merged, args.show)
+    if names and (args.csv or args.npz or args.cols):
+        export(merged, names, args.csv, args.npz, args.cols)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+tools/log_replay.py
+Replay a window of a recorded log onto a CAN bus, keeping the original timing.
+
+Reads .nfscan or candump -l logs through their index (can_index.py), so
+going to minute 40 of a long session means reading a few blocks instead of
+scanning up to there. Frames go out with their recorded spacing, divided
+by --speed. Times are epoch seconds, or "+S" for S seconds after the log's
+first frame.
+
+  python tools/log_replay.py run.nfscan --start +2400 --end +2460
+  python tools/log_replay.py run.log --ids 0x101,0x110 --speed 4 --channel vcan0
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import time
+
+import can
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import can_index  # noqa: E402
+import can_log  # noqa: E402
+
+
+def _when(spec: str | None, first: float) -> float | None:
+    if spec is None:
+        return None
+    return first + float(spec[1:]) if spec.startswith("+") else float(spec)
+
+
+def frames(path: str, start: str | None, end: str | None, ids: tuple | None):
+    """Yield (t, id, data, extended) in file order for the selection."""
+    idx = can_index.load(path)
+    if idx.blocks == 0:
+        return
+    first = float(idx.t0.min())
+    t0, t1 = _when(start, first), _when(end, first)
+    ranges = idx.ranges(t0, t1, ids)
+    if idx.kind == "binary":
+        recs = can_log.open_log(path)
+        parts = ((r["t"], r["id"], r["dlc"], r["data"], r["flags"])
+                 for r in (recs[a:b] for a, b in ranges))
+    else:
+        f = open(path, "rb")
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        parts = (can_log.parse_candump(m[a:b]) + (None,) for a, b in ranges)
+    for t, fid, dlc, data, flags in parts:
+        for i in range(len(t)):
+            ti = float(t[i])
+            if (t0 is not None and ti < t0) or (t1 is not None and ti > t1):
+                continue
+            if ids is not None and int(fid[i]) not in ids:
+                continue
+            if flags is not None and flags[i] & (can_log.F_ERROR | can_log.F_REMOTE):
+                continue
+            ext = bool(flags[i] & can_log.F_EXTENDED) if flags is not None else bool(fid[i] > 0x7FF)
+            yield ti, int(fid[i]), bytes(data[i][:dlc[i]]), ext
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("log")
+    ap.add_argument("--start", default=None, help="epoch s, or +S from the log's start")
+    ap.add_argument("--end", default=None, help="epoch s, or +S from the log's start")
+    ap.add_argument("--ids", default=None, help="comma-separated frame IDs (0x101,272)")
+    ap.add_argument("--speed", type=float, default=1.0, help="time scale (2 = twice as fast)")
+    ap.add_argument("--channel", default=os.environ.get("DASH_CAN_CHANNEL", "vcan0"))
+    ap.add_argument("--interface", default=os.environ.get("DASH_CAN_INTERFACE", "socketcan"))
+    args = ap.parse_args()
+
+    ids = frozenset(int(x, 0) for x in args.ids.split(",")) if args.ids else None
+    bus = can.Bus(channel=args.channel, interface=args.interface)
+    sent = 0
+    base = None
+    try:
+        for t, fid, data, ext in frames(args.log, args.start, args.end, ids):
+            if base is None:
+                base = (t, time.perf_counter())
+            delay = base[1] + (t - base[0]) / args.speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            bus.send(can.Message(arbitration_id=fid, data=data, is_extended_id=ext))
+            sent += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.shutdown()
+    span = time.perf_counter() - base[1] if base else 0.0
+    print(f"[REPLAY] {sent} frames in {span:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+tools/plausibility_check.py
+Validate a recorded session against the dashboard's plausibility rules.
+
+Reads Pedal_Processed (0x101) from any log python-can can read (.asc, .blf,
+.log from candump -l, .csv, .trc). It decodes the whole session into NumPy
+arrays and runs plausibility.evaluate(). The report has one line per rule
+(events, total time active, longest episode), then the StatusBits the MCU
+itself reported and the first --show events.
+
+  python tools/plausibility_check.py session.log [more.blf ...] [--show 20]
+  python tools/plausibility_check.py --synthetic 1200
+
+--synthetic generates a session with injected faults. It runs the same rules
+through the streaming Engine (frame by frame, as can_rx does) and through
+evaluate(). It exits non-zero unless both produce identical events and
+every rule fired at least once, so each injected fault kind is known to trip.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import can_ids  # noqa: E402
+import plausibility  # noqa: E402
+
+PCT = 0.39215686274509803  # APPS_pct / Brake_pct scale (DBC)
+
+
+def load_logs(paths) -> tuple[np.ndarray, np.ndarray]:
+    """-> (t, N×4 uint8 payload) of every 0x101 frame, sorted by time."""
+    import can
+
+    ts, rows = [], []
+    for p in paths:
+        for msg in can.LogReader(p):
+            if msg.arbitration_id == can_ids.PEDAL_PROCESSED and len(msg.data) >= 4:
+                ts.append(msg.timestamp)
+                rows.append(bytes(msg.data[:4]))
+    t = np.asarray(ts, np.float64)
+    raw = np.frombuffer(b"".join(rows), np.uint8).reshape(-1, 4)
+    order = np.argsort(t, kind="stable")
+    return t[order], raw[order]
+
+
+def decode(t: np.ndarray, raw: np.ndarray) -> dict:
+    """Vectorised decode_pedal_processed -> signal series."""
+    return {
+        "apps_pct": (t, raw[:, 0] * PCT),
+        "brake": (t, raw[:, 1] * PCT),
+        "status_bits": (t, raw[:, 2].astype(np.int64)),
+    }
+
+
+def synthetic(seconds: float, seed: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """100 Hz pedal session with rate spikes, overlaps and MCU fault bits."""
+    rng = random.Random(seed)
+    n = int(seconds * 100)
+    t = np.arange(n) * 0.010
+    t += np.array([rng.uniform(-0.002, 0.002) for _ in range(n)])  # jitter
+    t.sort()
+    raw = np.zeros((n, 4), np.uint8)
+    apps = brake = 0.0
+    overlap_until = status_until = -1.0
+    for i in range(n):
+        ti = i * 0.010
+        apps += rng.uniform(-1.5, 1.6)
+        if rng.random() < 0.0008:
+            apps += rng.choice((-1, 1)) * rng.uniform(25, 50)  # rate spike
+        brake = max(0.0, brake + rng.uniform(-2.0, 1.5))
+        if rng.random() < 0.0005:
+            overlap_until = ti + rng.uniform(0.005, 0.5)
+        if ti < overlap_until:
+            brake, apps = max(brake, 30.0), max(apps, 20.0)
+        apps = min(100.0, max(0.0, apps))
+        brake = min(100.0, brake)
+        status = 0
+        if rng.random() < 0.0003:
+            status_until = ti + rng.uniform(0.1, 1.0)
+        if ti < status_until:
+            status = 0x04 | 0x80
+        raw[i] = (round(apps / PCT), round(brake / PCT), status, i & 0x0F)
+    return t, raw
+
+
+def summary(events, t_end: float) -> None:
+    print(f"  {'rule':<14} {'events':>6} {'active s':>9} {'longest s':>9}")
+    for name in dict.fromkeys(r[0] for r in plausibility.RULES):
+        evs = [e for e in events if e.rule == name]
+        total = longest = 0.0
+        since = None
+        for e in evs:
+            if e.active:
+                since = e.t
+            elif since is not None:
+                total += e.t - since
+                longest = max(longest, e.t - since)
+                since = None
+        if since is not None:
+            total += t_end - since
+            longest = max(longest, t_end - since)
+        print(f"  {name:<14} {sum(e.active for e in evs):6d} {total:9.3f} {longest:9.3f}")
+
+
+def mcu_bits(t: np.ndarray, status: np.ndarray) -> None:
+    for bit, name in plausibility.STATUS_BITS.items():
+        on = (status >> bit) & 1
+        rises = np.count_nonzero(np.diff(np.concatenate(([0], on))) == 1)
+        if rises:
+            print(f"  MCU {name:<13} set {rises} times, {on.sum() / len(on) * 100:.2f} % of frames")
+
+
+def stream(series: dict) -> list:
+    """Replay through the streaming Engine in can_rx's publish order."""
+    events = []
+    eng = plausibility.Engine(plausibility.RULES, on_event=events.append)
+    t, apps = series["apps_pct"]
+    brake = series["brake"][1]
+    for ti, a, b in zip(t.tolist(), apps.tolist(), brake.tolist()):
+        eng.feed("apps_pct", a, ti)
+        eng.feed("brake", b, ti)
+    return events
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("logs", nargs="*")
+    ap.add_argument("--synthetic", type=float, default=None, metavar="SECONDS")
+    ap.add_argument("--show", type=int, default=10, help="events to list")
+    args = ap.parse_args()
+    if not args.logs and args.synthetic is None:
+        ap.error("give log files or --synthetic SECONDS")
+
+    t0 = time.perf_counter()
+    t, raw = synthetic(args.synthetic) if args.synthetic else load_logs(args.logs)
+    t1 = time.perf_counter()
+    if len(t) == 0:
+        print("no 0x101 Pedal_Processed frames found")
+        return 1
+    series = decode(t, raw)
+    events = plausibility.evaluate(plausibility.RULES, series)
+    t2 = time.perf_counter()
+    print(f"{len(t)} frames, {t[-1] - t[0]:.1f} s of session; "
+          f"load {t1 - t0:.2f} s, rules {(t2 - t1) * 1000:.1f} ms")
+    summary(events, float(t[-1]))
+    mcu_bits(t, series["status_bits"][1])
+    for e in events[:args.show]:
+        print(f"    {e.t - t[0]:10.3f} s  {'RAISED ' if e.active else 'cleared'} {e.rule}"
+              f"  ({e.value:.1f})")
+
+    if args.synthetic:
+        t3 = time.perf_counter()
+        streamed = stream(series)
+        t4 = time.perf_counter()
+
+        def key(e):
+            return (e.t, e.rule, e.active)
+
+        same = sorted(map(key, streamed)) == sorted(map(key, events))
+        print(f"streaming engine: {len(streamed)} events in {t4 - t3:.2f} s "
+              f"({(t4 - t3) / len(t) * 1e6:.1f} µs/frame); "
+              + ("identical to vectorised" if same else "MISMATCH"))
+        silent = [n for n in dict.fromkeys(r[0] for r in plausibility.RULES)
+                  if not any(e.rule == n and e.active for e in events)]
+        if silent:
+            print("rules that never fired: " + " ".join(silent))
+        return 0 if same and not silent else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+tools/rt_bench.py
+Wake-up jitter of a periodic Python thread with and without rt.py settings.
+
+A cyclictest-style thread sleeps to absolute deadlines every --period-ms
+and records how late it woke. This is the same pattern as the RX thread's
+wait for a frame and the UI's frame tick. Each configuration runs in a
+fresh process while the bench keeps the machine busy:
+
+  --load-procs N    CPU-hog processes (other programs on the Pi)
+  --load-threads N  CPU-bound threads inside the measured process (a busy
+                    render loop holding the GIL)
+
+Configurations: baseline; affinity (measured thread on the last CPU, hogs
+on the others); rt (affinity + SCHED_FIFO + mlockall); rt+switch (also
+sys.setswitchinterval 1 ms, the GIL hand-over bound). Settings the OS
+refuses are reported as skipped, and that row then equals the baseline.
+
+  python tools/rt_bench.py [--seconds 5] [--period-ms 1] [--load-procs 2]
+                           [--load-threads 1] [--prio 80]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import rt  # noqa: E402
+
+CONFIGS = {
+    "baseline": {},
+    "affinity": {"pin": True},
+    "rt": {"pin": True, "policy": "fifo", "mlock": True},
+    "rt+switch": {"pin": True, "policy": "fifo", "mlock": True, "switch_ms": 1.0},
+}
+
+
+def _hog(cpus) -> None:
+    if cpus:
+        try:
+            os.sched_setaffinity(0, cpus)
+        except (AttributeError, OSError):
+            pass
+    x = 0
+    while True:
+        x = (x * 31 + 7) & 0xFFFFFF
+
+
+def _cpu_split() -> tuple[set | None, set | None]:
+    """(CPU for the measured thread, CPUs for the hogs)."""
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return None, None
+    if len(cpus) < 2:
+        return {cpus[-1]}, None
+    return {cpus[-1]}, set(cpus[:-1])
+
+
+def child(cfg: dict, seconds: float, period_s: float, load_threads: int,
+          prio: int) -> dict:
+    """Runs in a fresh process; returns the latency summary."""
+    errors = []
+    if cfg.get("mlock") and not rt.lock_memory(quiet=True):
+        errors.append("mlock")
+    if cfg.get("switch_ms"):
+        sys.setswitchinterval(cfg["switch_ms"] / 1000.0)
+
+    stop = threading.Event()
+
+    def busy():  # GIL holder, like rendering
+        x = 0
+        while not stop.is_set():
+            for _ in range(10_000):
+                x = (x * 31 + 7) & 0xFFFFFF
+
+    for _ in range(load_threads):
+        threading.Thread(target=busy, daemon=True).start()
+
+    late = []
+
+    def measure():
+        mine, _ = _cpu_split()
+        res = rt.apply("bench", cpus=mine if cfg.get("pin") else None,
+                       policy=cfg.get("policy", "other"), priority=prio, quiet=True)
+        errors.extend(res.errors)
+        nxt = time.monotonic() + period_s
+        end = nxt + seconds
+        while nxt < end:
+            d = nxt - time.monotonic()
+            if d > 0:
+                time.sleep(d)
+            late.append(time.monotonic() - nxt)
+            nxt += period_s
+
+    t = threading.Thread(target=measure)
+    t.start()
+    t.join()
+    stop.set()
+    late.sort()
+    n = len(late)
+    return {
+        "n": n,
+        "p50": late[n // 2] * 1e6,
+        "p99": late[min(n - 1, int(n * 0.99))] * 1e6,
+        "max": late[-1] * 1e6,
+        "errors": errors,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--period-ms", type=float, default=1.0)
+    ap.add_argument("--load-procs", type=int, default=2)
+    ap.add_argument("--load-threads", type=int, default=1)
+    ap.add_argument("--prio", type=int, default=80)
+    ap.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        cfg = json.loads(args.child)
+        print(json.dumps(child(cfg, args.seconds, args.period_ms / 1000.0,
+                               args.load_threads, args.prio)))
+        return 0
+
+    _, hog_cpus = _cpu_split()
+    print(f"{args.seconds:g} s per config, period {args.period_ms:g} ms, "
+          f"{args.load_procs} hog processes"
+          f"{' on CPUs ' + ','.join(map(str, sorted(hog_cpus))) if hog_cpus else ''}, "
+          f"{args.load_threads} GIL-holding threads, {os.cpu_count()} CPUs")
+    print(f"  {'config':<11} {'p50 µs':>9} {'p99 µs':>9} {'max µs':>9}   notes")
+    for name, cfg in CONFIGS.items():
+        hogs = [multiprocessing.Process(target=_hog, args=(hog_cpus,), daemon=True)
+                for _ in range(args.load_procs)]
+        for h in hogs:
+            h.start()
+        try:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", json.dumps(cfg),
+                 "--seconds", str(args.seconds), "--period-ms", str(args.period_ms),
+                 "--load-threads", str(args.load_threads), "--prio", str(args.prio)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+        finally:
+            for h in hogs:
+                h.terminate()
+                h.join()
+        notes = ("skipped: " + "; ".join(r["errors"])) if r["errors"] else ""
+        print(f"  {name:<11} {r['p50']:9.0f} {r['p99']:9.0f} {r['max']:9.0f}   {notes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+tools/scenario_bench.py
+Run the full startup scenario on a VirtualClock, as fast as Python allows.
+
+  LV on -> key -> TSMS (HV, TSAL relay blinking) -> 6 startup blinks
+        -> READY hold -> dashboard -> first pedal frame decoded
+
+StartupService, TSALService (poll(), no timer thread) and can_rx all read the
+same clock.VirtualClock, which advances one UI frame per step. Each run is
+checked (blink count, READY time, relay toggles, decoded APPS) and the
+throughput is reported as runs/s and virtual-vs-real speed-up.
+
+  python tools/scenario_bench.py [--runs 2000] [--frame-ms 33.3]
+
+Exits non-zero if any run deviates.
+"""
+
+import argparse
+import contextlib
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import can  # noqa: E402
+import can_codec  # noqa: E402
+import can_rx  # noqa: E402
+import clock  # noqa: E402
+from service import startup, tsal  # noqa: E402
+
+
+def expected_s(frame_s: float) -> float:
+    """HV -> dashboard time. StartupService checks its timers once per tick,
+    so every interval rounds up to whole frames; the last startup blink
+    turns on after (2n - 1) half periods, then READY holds."""
+    def frames(ms):
+        return math.ceil(ms / 1000.0 / frame_s - 1e-9) * frame_s
+
+    return (2 * startup.TSAL_BLINKS_REQUIRED - 1) * frames(startup.TSAL_BLINK_MS) \
+        + frames(startup.READY_HOLD_MS)
+
+
+def run_once(frame_s: float) -> tuple[float, int, str | None]:
+    """One scenario; returns (virtual seconds, relay toggles, error)."""
+    vc = clock.VirtualClock()
+    toggles = [0]
+
+    def relay(pin: int, on: bool):
+        if pin == tsal.RELAY_RED_PIN and on:
+            toggles[0] += 1
+
+    svc = startup.StartupService(gpio=None, clock=vc)
+    light = tsal.TSALService(output=relay, clock=vc)
+    can_rx.set_clock(vc)
+
+    def frame():
+        vc.advance(frame_s)
+        svc.tick()
+        light.poll()
+
+    light.inject_lv()
+    frame()
+    svc.inject_key()
+    frame()
+    if svc.phase != startup.PHASE_TSMS_WAIT:
+        return vc.now(), 0, f"key not accepted (phase {svc.phase})"
+    svc.inject_tsms()
+    light.inject_hv()
+    frame()
+    t_hv = vc.now()
+
+    expect = expected_s(frame_s)
+    limit = t_hv + 2 * expect
+    while not svc.wants_dashboard:
+        if vc.now() > limit:
+            return vc.now(), toggles[0], "never reached the dashboard"
+        frame()
+    t_dash = vc.now() - t_hv
+    light.inject_hv_off()
+    light.poll()
+
+    if abs(t_dash - expect) > 2 * frame_s:
+        return t_dash, toggles[0], f"dashboard after {t_dash:.3f}s"
+    expect_on = int(t_dash / (2 * tsal.TSAL_HALF_PERIOD_S)) + 1
+    if abs(toggles[0] - expect_on) > 1:
+        return t_dash, toggles[0], f"{toggles[0]} relay pulses, expected ~{expect_on}"
+
+    data = can_codec.encode_pedal_processed(APPS_pct=50.0, Brake_pct=0.0)
+    can_rx.handle_frame(can.Message(arbitration_id=can_rx.ID_PEDAL, data=data))
+    if abs(can_rx.latest["apps_pct"] - 50.0) > 0.5:
+        return t_dash, toggles[0], f"APPS decoded as {can_rx.latest['apps_pct']}"
+    return t_dash, toggles[0], None
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--runs", type=int, default=2000)
+    ap.add_argument("--frame-ms", type=float, default=1000 / 30)
+    args = ap.parse_args()
+    frame_s = args.frame_ms / 1000.0
+
+    failures = 0
+    virtual = 0.0
+    t0 = time.perf_counter()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        for _ in range(args.runs):
+            t_dash, pulses, err = run_once(frame_s)
+            virtual += t_dash
+            if err is not None:
+                failures += 1
+                if failures <= 5:
+                    print(err, file=sys.stderr)
+    wall = time.perf_counter() - t0
+
+    print(f"{args.runs} runs in {wall:.2f} s  ->  {args.runs / wall:,.0f} runs/s")
+    print(f"virtual {virtual:,.1f} s vs wall {wall:.2f} s  ->  "
+          f"{virtual / wall:,.0f}x real time")
+    print(f"last run: dashboard {t_dash:.3f} s after HV (expected "
+          f"{expected_s(frame_s):.3f}), {pulses} TSAL relay pulses")
+    print("OK" if failures == 0 else f"FAIL ({failures} runs)")
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
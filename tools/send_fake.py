@@ -9,6 +9,15 @@ ID_BATT  = 0x111   # [soc%, pack_temp_C, 0, ctr]
 ID_TEMPS = 0x112   # [water_temp_C, inv_temp_C, 0, ctr]
 ID_HB    = 0x102   # [uptime32le, fw_tag, 0, 0]
 
+# Config round trips (see dashboard-app/can_ids.py): the fake MCU / temp
+# controller apply what the dashboard sends and echo it in their status.
+ID_TC_CMD      = 0x120   # RX [level, 0x01 magic]
+ID_TC_STATUS   = 0x121   # TX [level_applied]
+ID_TEMP_CFG    = 0x130   # RX [thr_motor, thr_inv, force_mask]
+ID_TEMP_STATUS = 0x131   # TX [ntc_m+50, ntc_i+50, thr_m, thr_i, fans, faults, force, 0]
+tc_applied = 5
+temp_cfg = [50, 50, 0]
+
 # ======= SocketCAN bus on vcan0 =======
 bus = can.interface.Bus(channel="vcan0", bustype="socketcan")
 
@@ -169,5 +178,25 @@ while True:
         hb = bytes([up & 0xFF, (up>>8)&0xFF, (up>>16)&0xFF, (up>>24)&0xFF, 0x11, 0, 0, 0])
         bus.send(can.Message(arbitration_id=ID_HB, data=hb, is_extended_id=False))
 
+    # Config frames from the dashboard
+    while True:
+        rx = bus.recv(timeout=0)
+        if rx is None:
+            break
+        if rx.arbitration_id == ID_TC_CMD and len(rx.data) >= 2 and rx.data[1] == 0x01:
+            tc_applied = rx.data[0]
+        elif rx.arbitration_id == ID_TEMP_CFG and len(rx.data) >= 3:
+            temp_cfg = [rx.data[0], rx.data[1], rx.data[2]]
+
+    # TC_STATUS + TEMP_STATUS @10 Hz (echo applied config)
+    if int(t*10) != int((t-0.01)*10):
+        bus.send(can.Message(arbitration_id=ID_TC_STATUS, data=bytes([tc_applied]), is_extended_id=False))
+        ntc_m, ntc_i = water_temp, inv_temp
+        fans = ((ntc_m >= temp_cfg[0] or temp_cfg[2] & 1) and 1) | \
+               ((ntc_i >= temp_cfg[1] or temp_cfg[2] & 2) and 2)
+        data = bytes([int(clamp(ntc_m + 50, 0, 255)), int(clamp(ntc_i + 50, 0, 255)),
+                      temp_cfg[0], temp_cfg[1], fans, 0x00, temp_cfg[2], 0x00])
+        bus.send(can.Message(arbitration_id=ID_TEMP_STATUS, data=data, is_extended_id=False))
+
     # small base sleep; rates above are governed by the if-conditions
     time.sleep(0.01)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+tools/sim_inverter.py
+Simulated Cascadia inverter that answers M193 parameter reads/writes with M194.
+
+Every command is answered `--latency-ms` after it arrives, independently of
+the others (a fixed turnaround, as seen on the real bus), so a pipelined
+client gets proportionally more throughput. `--drop` loses that fraction of
+commands to exercise the client's retries. Addresses DUMP_FIRST..DUMP_LAST
+hold repeatable pseudo-random values; writes to READ_ONLY addresses are
+refused (Write_OK = 0).
+
+  python tools/sim_inverter.py [--channel vcan0] [--latency-ms 2] [--drop 0.0]
+  python tools/sim_inverter.py --bench [--channel vcan0]   # client check
+
+--bench runs the inverter and service/inverter_params.ParamClient on the same
+bus (python-can "virtual" unless --channel is given), dumps the full range
+with window 1 and with the default window, checks every value and one
+write, and prints the throughput of each. Exits non-zero on a mismatch.
+"""
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+import can  # noqa: E402
+import can_codec  # noqa: E402
+import can_ids  # noqa: E402
+from service import inverter_params  # noqa: E402
+from service.inverter_params import DUMP_FIRST, DUMP_LAST, ParamClient  # noqa: E402
+
+READ_ONLY = range(DUMP_FIRST, DUMP_FIRST + 10)  # e.g. firmware/serial block
+
+
+def default_table(seed: int = 193) -> dict[int, int]:
+    rng = random.Random(seed)
+    return {a: rng.randint(-2000, 5000) for a in range(DUMP_FIRST, DUMP_LAST + 1)}
+
+
+def answer(table: dict[int, int], data: bytes) -> bytes:
+    """M194 payload for the M193 command `data`, applying writes to `table`."""
+    addr, write, value = can_codec.decode_m193_read_write_param_command(data)
+    ok = 0
+    if write and addr in table and addr not in READ_ONLY:
+        table[addr] = value
+        ok = 1
+    return can_codec.encode_m194_read_write_param_response(
+        INV_Parameter_Response_Addr=addr,
+        INV_Parameter_Response_Write_OK=ok,
+        INV_Parameter_Response_Data=table.get(addr, 0),
+    )
+
+
+class SimInverter:
+    """Answers M193 on `bus` from a receive thread and a response thread."""
+
+    def __init__(self, bus: can.BusABC, table: dict[int, int] | None = None,
+                 latency_s: float = 0.002, drop: float = 0.0, seed: int = 0):
+        self._bus = bus
+        self.table = dict(default_table() if table is None else table)
+        self._latency = latency_s
+        self._drop = drop
+        self._rng = random.Random(seed)
+        self._due: list[tuple[float, int, bytes]] = []  # (t, seq, data) heap
+        self._seq = 0
+        self._cv = threading.Condition()
+        self._running = False
+        self.commands = 0
+        self.dropped = 0
+
+    def start(self) -> "SimInverter":
+        self._running = True
+        threading.Thread(target=self._rx, daemon=True, name="sim-inv-rx").start()
+        threading.Thread(target=self._tx, daemon=True, name="sim-inv-tx").start()
+        return self
+
+    def stop(self) -> None:
+        self._running = False
+        with self._cv:
+            self._cv.notify_all()
+
+    def _rx(self) -> None:
+        while self._running:
+            msg = self._bus.recv(timeout=0.1)
+            if msg is None or msg.arbitration_id != can_ids.INV_PARAM_COMMAND:
+                continue
+            self.commands += 1
+            if self._drop and self._rng.random() < self._drop:
+                self.dropped += 1
+                continue
+            with self._cv:
+                self._seq += 1
+                heapq.heappush(self._due, (time.monotonic() + self._latency,
+                                           self._seq, answer(self.table, msg.data)))
+                self._cv.notify()
+
+    def _tx(self) -> None:
+        while self._running:
+            with self._cv:
+                while self._running and not self._due:
+                    self._cv.wait()
+                if not self._running:
+                    return
+                t, _, data = self._due[0]
+                wait = t - time.monotonic()
+                if wait > 0:
+                    self._cv.wait(wait)
+                    continue
+                heapq.heappop(self._due)
+            self._bus.send(can.Message(arbitration_id=can_ids.INV_PARAM_RESPONSE,
+                                       data=data, is_extended_id=False))
+
+
+# ── Bench ─────────────────────────────────────────────────────────────────
+def _open(channel: str | None, interface: str | None) -> can.BusABC:
+    if channel is None:
+        return can.Bus(interface="virtual", channel="sim-inverter")
+    return can.Bus(interface=interface or "socketcan", channel=channel)
+
+
+def _dump(client_bus, sim: SimInverter, window: int) -> tuple[float, list[str]]:
+    client = ParamClient(client_bus, window=window)
+    notifier = can.Notifier(client_bus, [client.on_can_frame])
+    errors = []
+    addrs = range(DUMP_FIRST, DUMP_LAST + 1)
+    try:
+        t0 = time.perf_counter()
+        client.read_many(addrs)
+        if not client.wait(timeout=60.0):
+            errors.append(f"window {window}: dump did not finish")
+        wall = time.perf_counter() - t0
+        for a in addrs:
+            if client.cached(a) != sim.table[a]:
+                errors.append(f"window {window}: {a} = {client.cached(a)}, "
+                              f"inverter has {sim.table[a]}")
+        results = []
+        client.write(DUMP_LAST, 1234, results.append)
+        client.write(DUMP_FIRST, 1, results.append)  # read-only
+        client.wait(timeout=5.0)
+        by_addr = {r.addr: r for r in results}
+        if not by_addr.get(DUMP_LAST, None) or not by_addr[DUMP_LAST].ok \
+                or client.cached(DUMP_LAST) != 1234 or sim.table[DUMP_LAST] != 1234:
+            errors.append(f"window {window}: write to {DUMP_LAST} not applied")
+        if by_addr.get(DUMP_FIRST) is None or by_addr[DUMP_FIRST].ok \
+                or client.cached(DUMP_FIRST) is not None:
+            errors.append(f"window {window}: read-only write reported as applied")
+        print(f"  window {window:2d}: {len(addrs)} params in {wall * 1000:7.1f} ms"
+              f"  ->  {len(addrs) / wall:7.0f} params/s   "
+              f"(sent {client.sent}, retries {client.retries}, "
+              f"failed {client.failures})")
+    finally:
+        notifier.stop()
+    return wall, errors
+
+
+def bench(args) -> int:
+    inv_bus = _open(args.channel, args.interface)
+    cli_bus = _open(args.channel, args.interface)
+    sim = SimInverter(inv_bus, latency_s=args.latency_ms / 1000.0,
+                      drop=args.drop).start()
+    print(f"Dump {DUMP_FIRST}..{DUMP_LAST}, inverter turnaround "
+          f"{args.latency_ms:g} ms, drop {args.drop:.0%}")
+    errors = []
+    times = {}
+    for window in (1, inverter_params.WINDOW):
+        sim.table = default_table()
+        times[window], err = _dump(cli_bus, sim, window)
+        errors += err
+    sim.stop()
+    inv_bus.shutdown()
+    cli_bus.shutdown()
+    print(f"  speed-up {times[1] / times[inverter_params.WINDOW]:.1f}x")
+    for e in errors[:5]:
+        print(e, file=sys.stderr)
+    print("OK" if not errors else f"FAIL ({len(errors)} errors)")
+    return 0 if not errors else 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--channel", default=None,
+                    help="CAN channel (default: vcan0, or in-process for --bench)")
+    ap.add_argument("--interface", default=None, help="python-can interface")
+    ap.add_argument("--latency-ms", type=float, default=2.0)
+    ap.add_argument("--drop", type=float, default=0.0)
+    ap.add_argument("--bench", action="store_true")
+    args = ap.parse_args()
+    if args.bench:
+        return bench(args)
+
+    bus = _open(args.channel or "vcan0", args.interface)
+    sim = SimInverter(bus, latency_s=args.latency_ms / 1000.0, drop=args.drop).start()
+    print(f"[SIM] Cascadia parameters {DUMP_FIRST}..{DUMP_LAST} on "
+          f"{args.channel or 'vcan0'}. Ctrl-C to stop.")
+    try:
+        while True:
+            time.sleep(5)
+            print(f"[SIM] {sim.commands} commands, {sim.dropped} dropped")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.stop()
+        bus.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
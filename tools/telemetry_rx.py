@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+tools/telemetry_rx.py
+Pit-side receiver for the dashboard's UDP telemetry (service/telemetry.py).
+
+Listens on a UDP port, rebuilds the full signal state from keyframes and
+deltas, and redraws a status table once a second. The table shows every
+signal, the packet and loss counts, whether the state is synced, and the
+age of the newest packet. Sender and receiver clocks must agree for the age
+to mean anything.
+
+  python tools/telemetry_rx.py --port 5005
+  python tools/telemetry_rx.py --selftest 10 --loss 0.05 --bps 2000
+
+--selftest runs a publisher and this receiver over loopback for N seconds.
+The source is a synthetic signal store that changes at 100 Hz. The
+receiver drops --loss of the packets on purpose. The test checks that the
+byte budget held and that, after the next keyframe, the rebuilt state
+equals what the sender last encoded. It exits non-zero otherwise.
+"""
+
+import argparse
+import math
+import os
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+from service import telemetry  # noqa: E402
+
+
+def show(st: telemetry.TelemetryState) -> None:
+    age = time.time() - st.sent_at if st.sent_at else float("nan")
+    print(f"\n{st.packets} packets, {st.lost} lost, {st.late} late, "
+          f"{st.keyframes} keyframes, {'synced' if st.synced else 'UNSYNCED'}, "
+          f"age {age * 1000:.0f} ms")
+    for name, _ in telemetry.FIELDS:
+        v = st.state.get(name)
+        print(f"  {name:<18} {'-' if v is None else f'{v:.2f}' if isinstance(v, float) else v}")
+
+
+def listen(port: int) -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("0.0.0.0", port))
+    sock.settimeout(0.2)
+    st = telemetry.TelemetryState()
+    shown = time.monotonic()
+    print(f"[TELEM] listening on udp/{port}")
+    try:
+        while True:
+            try:
+                st.feed(sock.recv(2048))
+            except socket.timeout:
+                pass
+            if time.monotonic() - shown >= 1.0:
+                shown = time.monotonic()
+                show(st)
+    except KeyboardInterrupt:
+        return 0
+
+
+# ── Loopback self-test ───────────────────────────────────────────────────────
+def _encoded(source: dict) -> dict:
+    """What the receiver should hold: each value through its wire format."""
+    out = {}
+    for i, (name, fmt) in enumerate(telemetry.FIELDS):
+        if name in source:
+            out[name] = struct.unpack("<" + fmt, struct.pack("<" + fmt, source[name]))[0]
+    return out
+
+
+def selftest(seconds: float, loss: float, bps: float, hz: float) -> int:
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", 0))
+    rx.settimeout(0.5)
+    source = {name: 0.0 for name, fmt in telemetry.FIELDS if fmt == "f"}
+    source.update(status_bits=0, plaus_faults=0, can_counter_ok=True, uptime=0)
+    stop = threading.Event()
+
+    def drive():
+        t0 = time.monotonic()
+        while not stop.is_set():
+            t = time.monotonic() - t0
+            source["apps_pct"] = 50 + 50 * math.sin(t * 3)
+            source["brake"] = max(0.0, 40 * math.sin(t * 1.3))
+            source["speed"] = 60 + 40 * math.sin(t / 4)
+            if random.random() < 0.01:
+                source["status_bits"] = random.choice((0, 0x04, 0x84))
+            source["motor_temp"] = 40 + t  # slow drift: a delta every few ticks
+            source["uptime"] = int(t)
+            time.sleep(0.01)
+
+    pub = telemetry.TelemetryPublisher(source, rx.getsockname(), rate_hz=hz, budget_bps=bps)
+    st = telemetry.TelemetryState()
+    driver = threading.Thread(target=drive, daemon=True)
+    driver.start()
+    pub.start()
+    rng = random.Random(7)
+    end = time.monotonic() + seconds
+    got = 0
+    while time.monotonic() < end:
+        try:
+            pkt = rx.recv(2048)
+        except socket.timeout:
+            continue
+        got += len(pkt) + telemetry.UDP_OVERHEAD
+        if rng.random() >= loss:
+            st.feed(pkt)
+    stop.set()
+    driver.join()
+    # source is frozen now: the next keyframe must reproduce it exactly
+    want = _encoded(source)
+    deadline = time.monotonic() + telemetry.KEYFRAME_S * 3
+    while time.monotonic() < deadline:
+        try:
+            keys = st.keyframes
+            st.feed(rx.recv(2048))
+        except socket.timeout:
+            continue
+        if st.keyframes > keys and st.synced:
+            break
+    pub.stop()
+
+    rate = got / seconds
+    same = st.state == want
+    print(f"{pub.packets} packets sent, {pub.dropped} refused by the socket, "
+          f"{pub.throttled} ticks cut by the budget")
+    print(f"receiver: {st.packets} applied, {st.lost} lost "
+          f"({st.lost / max(1, st.packets + st.lost) * 100:.1f} %), {st.keyframes} keyframes")
+    print(f"bandwidth {rate:.0f} B/s of {bps:.0f} B/s budget; "
+          f"mean packet {pub.bytes / max(1, pub.packets):.0f} B with headers")
+    print("state after keyframe: " + ("identical to sender" if same else f"MISMATCH\n  {st.state}\n  {want}"))
+    ok = same and st.synced and rate <= bps * (1 + telemetry.BURST_S / seconds) + 1
+    return 0 if ok else 1
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--port", type=int, default=5005)
+    ap.add_argument("--selftest", type=float, default=None, metavar="SECONDS")
+    ap.add_argument("--loss", type=float, default=0.0, help="selftest: fraction to drop")
+    ap.add_argument("--bps", type=float, default=telemetry.BUDGET_BPS, help="selftest: budget")
+    ap.add_argument("--hz", type=float, default=telemetry.RATE_HZ, help="selftest: send rate")
+    args = ap.parse_args()
+    if args.selftest:
+        return selftest(args.selftest, args.loss, args.bps, args.hz)
+    return listen(args.port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+tools/tsal_jitter.py
+Measure TSAL red-relay blink timing with a mock relay output.
+
+Runs TSALService's timer thread with HV on, timestamps every relay write and
+reports half-period error against the ideal schedule, plus the drift of the
+last toggle. For comparison the old frame-driven logic (toggle in tick() at
+clock.tick(30)) is replayed over the same duration.
+
+  python tools/tsal_jitter.py [--seconds 5] [--load 2] [--limit-ms 10]
+
+--load N starts N CPU-bound Python threads (GIL contention, like a busy UI
+or decoder); expect errors up to sys.getswitchinterval() (5 ms) then. Exits
+non-zero if the timer thread's p99 error exceeds --limit-ms.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "dashboard-app"))
+
+from service.tsal import (  # noqa: E402
+    RELAY_RED_PIN,
+    TSAL_BLINK_MS,
+    TSAL_HALF_PERIOD_S,
+    TSALService,
+)
+
+
+def _report(label: str, times: list[float]) -> float:
+    """Print stats for red toggle timestamps; returns p99 |error| in ms."""
+    if len(times) < 3:
+        print(f"{label:<12} only {len(times)} toggles")
+        return float("inf")
+    t0 = times[0]
+    errs = sorted(abs(t - (t0 + i * TSAL_HALF_PERIOD_S)) * 1e3
+                  for i, t in enumerate(times))
+    periods = [(b - a) * 1e3 for a, b in zip(times, times[1:])]
+    p99 = errs[min(len(errs) - 1, int(len(errs) * 0.99))]
+    drift = (times[-1] - (t0 + (len(times) - 1) * TSAL_HALF_PERIOD_S)) * 1e3
+    print(f"{label:<12} {len(times):4d} toggles  half-period "
+          f"mean {statistics.fmean(periods):7.2f} ms  "
+          f"sd {statistics.pstdev(periods):5.2f}  "
+          f"err p50 {statistics.median(errs):5.2f} p99 {p99:6.2f} "
+          f"max {errs[-1]:6.2f} ms  drift {drift:+7.2f} ms")
+    return p99
+
+
+def run_timer_thread(seconds: float) -> list[float]:
+    times = []
+
+    def out(pin: int, on: bool):
+        if pin == RELAY_RED_PIN:
+            times.append(time.monotonic())
+
+    svc = TSALService(output=out).start()
+    svc.inject_lv()
+    time.sleep(0.05)
+    times.clear()  # drop the initial relay-off writes
+    svc.inject_hv()
+    time.sleep(seconds)
+    svc.inject_hv_off()
+    svc.stop()
+    if svc.missed:
+        print(f"timer thread missed {svc.missed} deadlines")
+    return times[:-1]  # last write is the hv_off
+
+
+def run_frame_driven(seconds: float, fps: int = 30) -> list[float]:
+    """The pre-timer-thread logic: toggle when >= TSAL_BLINK_MS since last."""
+    times, blink_on, last_ms = [], False, 0
+    start = time.monotonic()
+    next_frame = start
+    while time.monotonic() - start < seconds:
+        now_ms = int((time.monotonic() - start) * 1000)
+        if now_ms - last_ms >= TSAL_BLINK_MS:
+            blink_on = not blink_on
+            last_ms = now_ms
+            times.append(time.monotonic())
+        next_frame += 1.0 / fps
+        time.sleep(max(0.0, next_frame - time.monotonic()))
+    return times
+
+
+def _burn(stop: threading.Event):
+    x = 0
+    while not stop.is_set():
+        x = (x * 31 + 7) % 1000003
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--load", type=int, default=0, help="CPU-bound threads")
+    ap.add_argument("--limit-ms", type=float, default=10.0)
+    args = ap.parse_args()
+
+    stop = threading.Event()
+    for _ in range(args.load):
+        threading.Thread(target=_burn, args=(stop,), daemon=True).start()
+
+    print(f"target half period {TSAL_HALF_PERIOD_S * 1e3:.2f} ms, "
+          f"{args.load} load threads")
+    p99 = _report("timer thread", run_timer_thread(args.seconds))
+    _report("30 fps tick", run_frame_driven(args.seconds))
+    stop.set()
+
+    ok = p99 <= args.limit_ms
+    print("OK" if ok else f"FAIL (p99 > {args.limit_ms} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())